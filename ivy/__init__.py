@@ -783,6 +783,7 @@ from ivy.utils.backend import (
     backend_stack,
     choose_random_backend,
     unset_backend,
+    dynamic_backend_transfer_stats,
 )
 from . import func_wrapper
 from .utils import assertions, exceptions, verbosity
@@ -961,6 +962,7 @@ globals_vars = GlobalsDict(
         "tmp_dir_stack": general.tmp_dir_stack,
         "precise_mode_stack": general.precise_mode_stack,
         "nestable_mode_stack": general.nestable_mode_stack,
+        "container_fusion_mode_stack": general.container_fusion_mode_stack,
         "exception_trace_mode_stack": general.exception_trace_mode_stack,
         "default_dtype_stack": data_type.default_dtype_stack,
         "default_float_dtype_stack": data_type.default_float_dtype_stack,
@@ -1431,6 +1433,7 @@ GLOBAL_PROPS = [
     "nan_policy",
     "array_mode",
     "nestable_mode",
+    "container_fusion_mode",
     "inplace_mode",
     "exception_trace_mode",
     "show_func_wrapper_trace_mode",
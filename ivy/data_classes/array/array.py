@@ -29,6 +29,7 @@ from .sorting import _ArrayWithSorting
 from .statistical import _ArrayWithStatistical
 from .utility import _ArrayWithUtility
 from ivy.func_wrapper import handle_view_indexing
+from ivy.utils.backend.handler import _tracked_arrays
 from .experimental import (
     _ArrayWithSearchingExperimental,
     _ArrayWithActivationsExperimental,
@@ -53,6 +54,25 @@ from .experimental import (
 )
 
 
+class _ArrayData:
+    """
+    The native array wrapped by an ivy.Array, stored on the instance.
+
+    Only setting it goes through the descriptor, which marks the
+    fingerprints of the containers holding the array as stale, while
+    reading it remains a plain instance attribute lookup.
+    """
+
+    def __set__(self, instance, value):
+        state = instance.__dict__
+        state["_data"] = value
+        if "_structure_parents" in state:
+            # the shape and dtype may have changed in containers holding the array
+            from ivy.data_classes.container.base import _structure_changed
+
+            _structure_changed(instance)
+
+
 class Array(
     _ArrayWithActivations,
     _ArrayWithCreation,
@@ -94,6 +114,8 @@ class Array(
     _ArrayWithStatisticalExperimental,
     _ArrayWithUtilityExperimental,
 ):
+    _data = _ArrayData()
+
     def __init__(self, data, dynamic_backend=None):
         _ArrayWithActivations.__init__(self)
         _ArrayWithCreation.__init__(self)
@@ -166,6 +188,7 @@ class Array(
         else:
             self._dynamic_backend = ivy.dynamic_backend
         self.weak_type = False  # to handle 0-D jax front weak typed arrays
+        _tracked_arrays[id(self)] = self
 
     def _view_attributes(self, data):
         self._base = None
@@ -471,6 +494,7 @@ class Array(
         ivy.previous_backend()
 
         self.__dict__ = ivy_array.__dict__
+        _tracked_arrays[id(self)] = self
 
         # TODO: what about placement of the array on the right device ?
         # device = backend.as_native_dev(state["device_str"])
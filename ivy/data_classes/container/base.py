@@ -1,6 +1,7 @@
 """Base Container Object."""
 
 # global
+import importlib
 import inspect
 from itertools import chain
 import re
@@ -9,7 +10,9 @@ import copy
 import termcolor
 import numpy as np
 import json
+import weakref
 
+from ivy.utils.backend.handler import _tracked_containers
 from ivy.utils.exceptions import IvyBackendException, IvyException
 
 
@@ -19,11 +22,17 @@ try:
 except ModuleNotFoundError:
     h5py = None
 import pickle
+import os
 import random
+import tempfile
+import time
 from operator import mul
 from functools import reduce as _reduce
 from typing import Union, Tuple
 from builtins import set
+from collections import OrderedDict, deque
+from collections.abc import Mapping
+from concurrent.futures import ThreadPoolExecutor
 
 # local
 import ivy
@@ -47,6 +56,441 @@ def _repr(x):
         return str(x)
 
 
+# numpy dtype names -> the dtype codes of the safetensors format
+_safetensors_dtypes = {
+    "float64": "F64",
+    "float32": "F32",
+    "float16": "F16",
+    "bfloat16": "BF16",
+    "int64": "I64",
+    "int32": "I32",
+    "int16": "I16",
+    "int8": "I8",
+    "uint64": "U64",
+    "uint32": "U32",
+    "uint16": "U16",
+    "uint8": "U8",
+    "bool": "BOOL",
+}
+_safetensors_np_dtypes = {v: k for k, v in _safetensors_dtypes.items()}
+
+
+def _read_safetensors(filepath):
+    """
+    Read the header of a safetensors file, and memory-map its data.
+
+    The data is mapped copy-on-write, so that arrays viewing it can be
+    updated in place without changing the file.
+    """
+    with open(filepath, "rb") as f:
+        header_size = int.from_bytes(f.read(8), "little")
+        header = json.loads(f.read(header_size))
+    header.pop("__metadata__", None)
+    data_size = max([info["data_offsets"][1] for info in header.values()], default=0)
+    if data_size == 0:
+        return header, np.empty(0, dtype=np.uint8)
+    return header, np.memmap(
+        filepath, dtype=np.uint8, mode="c", offset=8 + header_size, shape=data_size
+    )
+
+
+def _key_chain_has_prefix(key_chain, prefixes):
+    return any(
+        key_chain == prefix or key_chain.startswith(prefix.rstrip("/") + "/")
+        for prefix in prefixes
+    )
+
+
+class _PackedLayout:
+    """
+    Layout of the leaves of packed containers within their flat buffers.
+
+    Each entry holds the buffer group of a leaf, which is its dtype and
+    device, together with the offsets of the leaf in the buffer and its
+    shape.
+    """
+
+    __slots__ = ("entries", "groups", "min_ndim")
+
+    def __init__(self, entries, groups):
+        self.entries = tuple(entries)
+        self.groups = groups
+        self.min_ndim = min((len(entry[3]) for entry in self.entries), default=0)
+
+    def __eq__(self, other):
+        return self is other or (
+            isinstance(other, _PackedLayout) and self.entries == other.entries
+        )
+
+    def __hash__(self):
+        return hash(self.entries)
+
+
+class _Packed:
+    """
+    The flat buffers behind the leaves of a packed container.
+
+    The native views handed out as leaves are registered in ``_packed_natives``,
+    such that containers rebuilt around the same data, for instance by the function
+    wrappers, are still recognized as packed.
+    """
+
+    __slots__ = ("layout", "buffers", "natives", "__weakref__")
+
+    def __init__(self, layout, buffers):
+        self.layout = layout
+        self.buffers = buffers
+        self.natives = ()
+
+    def unpack(self, cont):
+        """Return a container like cont, with the leaves as views into the buffers."""
+        leaves = []
+        for i, (group, start, stop, shape) in enumerate(self.layout.entries):
+            buffer = self.buffers[group]
+            leaf = ivy.Array(
+                ivy.current_backend(buffer).reshape(buffer[start:stop], shape)
+            )
+            # the leaves keep the packed object alive, the registry finds it again
+            # from the data alone
+            leaf._packed = self
+            _packed_natives[id(leaf.data)] = self
+            leaves.append(leaf)
+        self.natives = tuple(leaf.data for leaf in leaves)
+        leaves = iter(leaves)
+
+        def _rebuild(cont):
+            return ivy.Container._cont_trusted(
+                {
+                    k: _rebuild(v) if isinstance(v, ivy.Container) else next(leaves)
+                    for k, v in cont.items()
+                },
+                cont._config,
+            )
+
+        return _rebuild(cont)
+
+
+class _LazyStore:
+    """
+    The materialized leaves of a lazily loaded container.
+
+    At most ``max_materialized`` leaves are held in memory, the least recently used
+    ones are dropped first and read from disk again when next accessed.
+    """
+
+    __slots__ = ("max_materialized", "cache")
+
+    def __init__(self, max_materialized=None):
+        self.max_materialized = max_materialized
+        self.cache = OrderedDict()
+
+    def get(self, leaf):
+        if leaf in self.cache:
+            self.cache.move_to_end(leaf)
+            return self.cache[leaf]
+        ret = leaf.read()
+        self.cache[leaf] = ret
+        if self.max_materialized is not None:
+            while len(self.cache) > self.max_materialized:
+                self.cache.popitem(last=False)
+        return ret
+
+
+class _H5Dataset:
+    """
+    A dataset of an hdf5 file, which opens the file for each read.
+
+    This keeps lazily loaded containers from holding the file open.
+    """
+
+    __slots__ = ("filepath", "name", "shape", "dtype")
+
+    def __init__(self, filepath, dataset):
+        self.filepath = filepath
+        self.name = dataset.name
+        self.shape = dataset.shape
+        self.dtype = dataset.dtype
+
+    def __getitem__(self, query):
+        with h5py.File(self.filepath, "r") as h5_obj:
+            return h5_obj[self.name][query]
+
+
+class _LazyLeaf:
+    """
+    A leaf of a lazily loaded container, backed by an array on disk.
+
+    The source is any array-like supporting numpy indexing without
+    reading the rest of the array, such as an h5py dataset or a numpy
+    memmap. The leaf is materialized as an ivy array when accessed
+    through the container, while indexing it reads only the indexed
+    part.
+    """
+
+    __slots__ = ("_source", "_slice", "_store", "_ivyh", "shape", "dtype")
+
+    def __init__(self, source, store, slice_obj=slice(None), ivyh=None):
+        self._source = source
+        self._slice = slice_obj
+        self._store = store
+        self._ivyh = ivyh
+        # the shape after slicing, found on a zero-strided view to avoid any reads
+        self.shape = (
+            tuple(source.shape)
+            if slice_obj == slice(None)
+            else np.broadcast_to(np.empty((), bool), source.shape)[slice_obj].shape
+        )
+        self.dtype = str(source.dtype)
+
+    def _read(self, query=None):
+        if query is None:
+            data = self._source[... if self._slice == slice(None) else self._slice]
+        elif self._slice == slice(None):
+            data = self._source[query]
+        else:
+            data = self._source[self._slice][query]
+        # views of memory-mapped sources are copied into memory
+        data = np.array(data) if isinstance(data, np.memmap) else np.asarray(data)
+        return ivy.default(self._ivyh, ivy).array(data, dtype=self.dtype)
+
+    def read(self):
+        """Read the whole leaf from disk."""
+        return self._read()
+
+    def materialize(self):
+        """Return the leaf as an ivy array, reading it unless it is cached."""
+        return self._store.get(self)
+
+    def __getitem__(self, query):
+        try:
+            return self._read(query)
+        except (TypeError, ValueError):
+            # indices the source can't read directly, such as unsorted index lists
+            # for h5py datasets
+            return self.materialize()[query]
+
+    def __repr__(self):
+        return "lazy(shape={}, dtype={})".format(self.shape, self.dtype)
+
+
+def _materialize(x):
+    return x.materialize() if isinstance(x, _LazyLeaf) else x
+
+
+def _structure_changed(x):
+    """
+    Mark the fingerprints cached on a container or an array as stale.
+
+    The containers which computed their fingerprints from x are marked
+    as well, up to the roots, and register themselves again when
+    recomputing them.
+    """
+    state = x.__dict__
+    fingerprints = state.get("_fingerprints")
+    if fingerprints:
+        fingerprints.clear()
+    parents = state.pop("_structure_parents", None)
+    if parents:
+        for parent_ref in parents.values():
+            parent = parent_ref()
+            if parent is not None:
+                _structure_changed(parent)
+
+
+def _add_structure_parent(x, parent):
+    # x is a sub-container or an array leaf the fingerprint of parent depends on
+    parents = x.__dict__.get("_structure_parents")
+    if parents is None:
+        parents = x.__dict__["_structure_parents"] = dict()
+    if id(parent) not in parents:
+        parents[id(parent)] = weakref.ref(parent)
+
+
+def _leaf_structure(x, check_types=True, check_shapes=True, check_dtypes=True):
+    # lazy leaves are accessed as ivy arrays
+    if isinstance(x, ivy.Array) or isinstance(x, _LazyLeaf):
+        type_, shape, dtype = ivy.Array, tuple(x.shape), x.dtype
+    elif ivy.is_native_array(x):
+        type_, shape, dtype = type(x), tuple(x.shape), ivy.as_ivy_dtype(x.dtype)
+    else:
+        type_, shape, dtype = type(x), None, None
+    return (
+        type_ if check_types else None,
+        shape if check_shapes else None,
+        dtype if check_dtypes else None,
+    )
+
+
+class _QueueLoader:
+    """
+    Loads the containers of a queue-backed container, one from each queue in order.
+
+    With a positive ``depth``, the next ``depth`` containers after the last one
+    accessed are loaded on a background thread. ``wait_time`` accumulates the time
+    spent blocked in ``get``, and ``compute_time`` the time spent between calls.
+    """
+
+    def __init__(self, queues, timeout, config, depth=0, device=None):
+        self.queues = queues
+        self.timeout = timeout
+        self.config = config
+        self.depth = depth
+        self.device = device
+        self.loaded = dict()
+        self.futures = dict()
+        self.wait_time = 0.0
+        self.compute_time = 0.0
+        self._last_return = None
+        self._pool = None
+        if depth:
+            self._pool = ThreadPoolExecutor(1, thread_name_prefix="ivy_queue_prefetch")
+            weakref.finalize(self, self._pool.shutdown, wait=False, cancel_futures=True)
+            self._prefetch(0)
+
+    def _load(self, i):
+        cont = ivy.Container(
+            self.queues[i].get(timeout=self.timeout), **self.config
+        ).to_ivy()
+        if self.device is not None:
+            cont = cont.to_device(self.device)
+        return cont
+
+    def _prefetch(self, start):
+        for i in range(start, min(start + self.depth, len(self.queues))):
+            if i not in self.loaded and i not in self.futures:
+                self.futures[i] = self._pool.submit(self._load, i)
+
+    def get(self, i):
+        start = time.perf_counter()
+        if self._last_return is not None:
+            self.compute_time += start - self._last_return
+        try:
+            if i in self.loaded:
+                return self.loaded[i]
+            if self._pool is None:
+                cont = self._load(i)
+            else:
+                self._prefetch(i)
+                future = self.futures.pop(i)
+                if future.done() and future.exception() is not None:
+                    # the queue timed out before it was accessed, so wait again
+                    future = self._pool.submit(self._load, i)
+                cont = future.result()
+                self._prefetch(i + 1)
+            self.loaded[i] = cont
+            return cont
+        finally:
+            self._last_return = time.perf_counter()
+            self.wait_time += self._last_return - start
+
+
+def _shuffle_h5_dataset(dataset, permutation, max_memory):
+    """
+    Reorder the rows of an h5py dataset as ``dataset[permutation]``.
+
+    Rows are moved in blocks of at most ``max_memory`` bytes. Each block read from
+    the dataset is split by destination block into a temporary memory-mapped
+    buffer, then each destination block is gathered from the buffer in memory and
+    written back with a single write.
+    """
+    length = dataset.shape[0]
+    row_bytes = max(int(np.prod(dataset.shape[1:])) * dataset.dtype.itemsize, 1)
+    # a block is held twice in memory, once as read and once reordered
+    block_size = max(max_memory // (2 * row_bytes), 1)
+    if block_size >= length:
+        dataset[...] = dataset[...][permutation]
+        return
+    destination = np.empty(length, dtype=np.int64)
+    destination[permutation] = np.arange(length)
+    block_starts = np.arange(0, length, block_size)
+    with tempfile.TemporaryFile() as f:
+        buffer = np.memmap(f, dtype=dataset.dtype, mode="w+", shape=dataset.shape)
+        # the destination of each row in the buffer
+        buffer_destination = np.empty(length, dtype=np.int64)
+        offsets = block_starts.copy()
+        for start in block_starts:
+            rows = dataset[start : start + block_size]
+            order = np.argsort(destination[start : start + block_size], kind="stable")
+            rows_destination = destination[start : start + block_size][order]
+            rows = rows[order]
+            bounds = np.searchsorted(rows_destination, block_starts)
+            bounds = np.append(bounds, len(rows))
+            for i in np.nonzero(np.diff(bounds))[0]:
+                begin, end = bounds[i], bounds[i + 1]
+                offset = offsets[i]
+                buffer[offset : offset + end - begin] = rows[begin:end]
+                buffer_destination[offset : offset + end - begin] = rows_destination[
+                    begin:end
+                ]
+                offsets[i] += end - begin
+        for start in block_starts:
+            stop = min(start + block_size, length)
+            block = np.empty((stop - start,) + dataset.shape[1:], dtype=dataset.dtype)
+            block[buffer_destination[start:stop] - start] = buffer[start:stop]
+            dataset[start:stop] = block
+        del buffer
+
+
+# id of each native leaf handed out by a packed object -> the packed object, the
+# natives are kept alive by their packed object so the ids are never reused while
+# the entry exists
+_packed_natives = weakref.WeakValueDictionary()
+
+_packed_fn_names = None
+
+
+def _get_packed_fn_names():
+    # names of the ivy functions which act on each element independently, these are
+    # applied to the flat buffers of packed containers directly
+    global _packed_fn_names
+    if _packed_fn_names is None:
+        elementwise = importlib.import_module("ivy.functional.ivy.elementwise")
+        _packed_fn_names = frozenset(
+            [
+                name
+                for name, obj in vars(elementwise).items()
+                if inspect.isfunction(obj)
+                and not name.startswith("_")
+                and obj.__module__ == elementwise.__name__
+                and name != "trapz"
+            ]
+            + [
+                "gelu",
+                "hardswish",
+                "leaky_relu",
+                "mish",
+                "relu",
+                "sigmoid",
+                "softplus",
+                "softsign",
+                "stop_gradient",
+            ]
+        )
+    return _packed_fn_names
+
+
+# the keys of the config of every container, as set by ContainerBase.__init__
+_container_config_keys = frozenset(
+    [
+        "print_limit",
+        "print_indent",
+        "key_length_limit",
+        "print_line_spacing",
+        "ivyh",
+        "default_key_color",
+        "keyword_color_dict",
+        "rebuild_child_containers",
+        "build_callable",
+        "types_to_iteratively_nest",
+        "alphabetical_keys",
+    ]
+)
+# the attribute holding each config entry, as set by cont_update_config
+_container_config_attrs = {
+    k: "_local_ivy" if k == "ivyh" else "_" + k for k in _container_config_keys
+}
+
+
 # noinspection PyMissingConstructor
 
 
@@ -70,6 +514,8 @@ class ContainerBase(dict, abc.ABC):
         alphabetical_keys=True,
         dynamic_backend=None,
         build_callable=False,
+        queue_prefetch_depth=0,
+        queue_prefetch_device=None,
         **kwargs,
     ):
         """
@@ -123,24 +569,43 @@ class ContainerBase(dict, abc.ABC):
         alphabetical_keys
             Whether to sort the container keys alphabetically, or preserve the dict
             order. Default is ``True``.
+        queue_prefetch_depth
+            The number of containers to load ahead from the queues on a background
+            thread, so that loading overlaps with the computations on the loaded ones.
+            Default is ``0``, in which case the containers are loaded when first
+            accessed.
+        queue_prefetch_device
+            The device to move the containers loaded from the queues to.
+            Default is ``None``, in which case the containers are kept as loaded.
         kwargs
             keyword arguments for dict creation. Default is ``None``.
         """
-        self._queues = queues
-        self._container_combine_method = container_combine_method
+        self._cont_init_attributes(
+            dict(
+                print_limit=print_limit,
+                print_indent=print_indent,
+                key_length_limit=key_length_limit,
+                print_line_spacing=print_line_spacing,
+                ivyh=ivyh,
+                default_key_color=default_key_color,
+                keyword_color_dict=keyword_color_dict,
+                rebuild_child_containers=rebuild_child_containers,
+                build_callable=build_callable,
+                types_to_iteratively_nest=types_to_iteratively_nest,
+                alphabetical_keys=alphabetical_keys,
+            ),
+            queues=queues,
+            container_combine_method=container_combine_method,
+            dynamic_backend=dynamic_backend,
+        )
         if ivy.exists(self._queues):
             if isinstance(self._container_combine_method, str):
                 self._container_combine_method = {
                     "list_join": self.cont_list_join,
                     "concat": lambda conts: self.concat(conts, 0),
                 }[self._container_combine_method]
-            self._loaded_containers_from_queues = dict()
             self._queue_load_sizes_cum = np.cumsum(queue_load_sizes)
             self._queue_timeout = ivy.default(queue_timeout, ivy.queue_timeout)
-        if dynamic_backend is not None:
-            self._dynamic_backend = dynamic_backend
-        else:
-            self._dynamic_backend = ivy.dynamic_backend
         if dict_in is None:
             if kwargs:
                 dict_in = dict(**kwargs)
@@ -151,21 +616,15 @@ class ContainerBase(dict, abc.ABC):
                 "dict_in and **kwargs cannot both be specified for ivy.Container "
                 "constructor, please specify one or the other, not both."
             )
-        self._config_in = dict(
-            print_limit=print_limit,
-            print_indent=print_indent,
-            key_length_limit=key_length_limit,
-            print_line_spacing=print_line_spacing,
-            ivyh=ivyh,
-            default_key_color=default_key_color,
-            keyword_color_dict=keyword_color_dict,
-            rebuild_child_containers=rebuild_child_containers,
-            build_callable=build_callable,
-            types_to_iteratively_nest=types_to_iteratively_nest,
-            alphabetical_keys=alphabetical_keys,
-        )
-        self._config = dict()
         self.cont_inplace_update(dict_in, **self._config_in)
+        if ivy.exists(self._queues):
+            self._queue_loader = _QueueLoader(
+                self._queues,
+                self._queue_timeout,
+                self._config,
+                queue_prefetch_depth,
+                queue_prefetch_device,
+            )
 
     # Class Methods #
     # --------------#
@@ -222,6 +681,18 @@ class ContainerBase(dict, abc.ABC):
         cont0 = conts[0]
         if isinstance(fn, str):
             fn = cont0.cont_ivy.__dict__[fn]
+        if (
+            fn.__name__ in _get_packed_fn_names()
+            and key_chains is None
+            and to_apply
+            and not prune_unapplied
+            and out is None
+        ):
+            ret = ContainerBase._cont_map_packed(fn, args, kwargs)
+            if ret is None and ivy.container_fusion_mode:
+                ret = ContainerBase._cont_map_fused(fn, args, kwargs)
+            if ret is not None:
+                return ret
         # Get the function with the name fn_name, enabling containers to specify
         # their backends irrespective of global ivy's backend
 
@@ -270,6 +741,138 @@ class ContainerBase(dict, abc.ABC):
 
         return ret
 
+    @staticmethod
+    def _cont_map_fused(fn, args, kwargs=None):
+        """
+        Apply the elementwise function fn to containers, calling it once for each group
+        of leaves sharing their shapes and dtypes.
+
+        The leaves of each group are stacked, fn is called on the stacks
+        and the result is unstacked. Returns None unless all the
+        containers in args and kwargs have the same structure with array
+        leaves, some leaves can be grouped, and all the other arguments
+        broadcast against the stacks as against the leaves.
+        """
+        kwargs = ivy.default(kwargs, {})
+        values = list(chain(args, kwargs.values()))
+        cont_idxs = [i for i, x in enumerate(values) if isinstance(x, ivy.Container)]
+        if not cont_idxs or any(
+            isinstance(x, (list, tuple, dict)) and not isinstance(x, ivy.Container)
+            for x in values
+        ):
+            return None
+        cont0 = values[cont_idxs[0]]
+        tree_def = cont0.cont_tree_def()
+        flat = list()
+        for i in cont_idxs:
+            leaves = values[i]._cont_tree_def_leaves(tree_def)
+            if leaves is None or not all(isinstance(x, ivy.Array) for x in leaves):
+                return None
+            flat.append(leaves)
+        groups = dict()
+        for j, leaves in enumerate(zip(*flat)):
+            # the dtypes and devices are cached on the arrays
+            key = tuple((x.data.shape, x.dtype, x.device) for x in leaves)
+            groups.setdefault(key, []).append(j)
+        flat = [[x.data for x in leaves] for leaves in flat]
+        if all(len(idxs) == 1 for idxs in groups.values()):
+            return None
+        # arrays broadcast against the stacks as against the leaves if they have no
+        # more dimensions than the leaves
+        min_ndim = min(len(shape) for key in groups for shape, _, _ in key)
+        if any(
+            len(x.shape) > min_ndim
+            for i, x in enumerate(values)
+            if i not in cont_idxs and ivy.is_array(x)
+        ):
+            return None
+
+        def _call(cont_values):
+            for i, x in zip(cont_idxs, cont_values):
+                values[i] = x
+            return fn(*values[: len(args)], **dict(zip(kwargs, values[len(args) :])))
+
+        # the leaves are stacked and unstacked by the backend directly, as the ivy
+        # functions would add the per-leaf overhead the fusion avoids
+        backend = ivy.current_backend(flat[0][0])
+        ret_leaves = [None] * len(flat[0])
+        for idxs in groups.values():
+            if len(idxs) == 1:
+                ret = _call([ivy.Array(leaves[idxs[0]]) for leaves in flat])
+            else:
+                ret = _call(
+                    [
+                        ivy.Array(backend.stack([leaves[j] for j in idxs]))
+                        for leaves in flat
+                    ]
+                )
+            if not isinstance(ret, ivy.Array):
+                return None
+            if len(idxs) == 1:
+                ret_leaves[idxs[0]] = ret
+            else:
+                for j, x in zip(idxs, backend.unstack(ret.data, axis=0)):
+                    ret_leaves[j] = ivy.Array(x)
+        return tree_def.unflatten(ret_leaves, config=cont0._config)
+
+    @staticmethod
+    def _cont_map_packed(fn, args, kwargs=None):
+        """
+        Apply the elementwise function fn to the flat buffers of packed containers.
+
+        Returns None unless all the containers in args and kwargs are
+        packed with the same layout, and all the other arguments
+        broadcast against any leaf as scalars do, in which case fn is
+        called once per buffer.
+        """
+        kwargs = ivy.default(kwargs, {})
+        packs = dict()
+        array_shapes = []
+        for i, x in enumerate(chain(args, kwargs.values())):
+            if isinstance(x, ivy.Container):
+                packs[i] = x._cont_packed()
+                if packs[i] is None or packs[i].layout != packs[min(packs)].layout:
+                    return None
+            elif isinstance(x, (list, tuple, dict)):
+                return None
+            elif ivy.is_array(x):
+                array_shapes.append(tuple(x.shape))
+        if not packs:
+            return None
+        template = list(chain(args, kwargs.values()))[min(packs)]
+        layout = packs[min(packs)].layout
+        # arrays only act as scalars if they don't change the shape of any leaf
+        if not layout.groups or any(
+            _reduce(mul, shape, 1) != 1 or len(shape) > layout.min_ndim
+            for shape in array_shapes
+        ):
+            return None
+
+        def _buffer(i, x, group):
+            return ivy.Array(packs[i].buffers[group]) if i in packs else x
+
+        rets = dict()
+        for group, size in layout.groups.items():
+            ret = fn(
+                *[_buffer(i, x, group) for i, x in enumerate(args)],
+                **{
+                    k: _buffer(i, v, group)
+                    for i, (k, v) in enumerate(kwargs.items(), len(args))
+                },
+            )
+            ret = ret if isinstance(ret, (tuple, list)) else (ret,)
+            ret = [ivy.to_native(r) for r in ret]
+            if any(
+                not ivy.is_native_array(r) or tuple(r.shape) != (size,) for r in ret
+            ):
+                return None
+            rets[group] = ret
+        ret = [
+            _Packed(layout, {group: r[i] for group, r in rets.items()}).unpack(template)
+            for i in range(len(next(iter(rets.values()))))
+        ]
+        return ret if len(ret) > 1 else ret[0]
+
     @staticmethod
     def cont_handle_inplace(ret, out):
         """
@@ -673,6 +1276,7 @@ class ContainerBase(dict, abc.ABC):
         config=None,
         map_nests=False,
         assert_identical=False,
+        tree_def=None,
     ):
         """
         Apply function to all array values from a collection of containers.
@@ -700,19 +1304,26 @@ class ContainerBase(dict, abc.ABC):
             Default is ``False``.
         assert_identical
             Whether to assert that the input containers are identical or not.
+        tree_def
+            The tree definition shared by the containers, as returned by
+            :meth:`cont_tree_def`. Default is ``None``, in which case the tree
+            definition cached on the first container is used if any. The structure is
+            traversed as usual if any container doesn't match it, or when key_chains
+            are specified, nests found in the leaves are mapped or the structure has
+            empty sub-containers.
 
         Returns
         -------
             Container
         """
         # retrieve all keys and the first container if it exists
-        keys = set([])
+        keys = dict()
         container0 = None
         for container in containers:
             if isinstance(container, ivy.Container):
                 if container0 is None:
                     container0 = container
-                keys = keys.union(container.keys())
+                keys.update(dict.fromkeys(container.keys()))
 
         ivy.utils.assertions.check_exists(
             container0,
@@ -722,6 +1333,30 @@ class ContainerBase(dict, abc.ABC):
             config = (
                 container0.cont_config if isinstance(container0, ivy.Container) else {}
             )
+        if key_chain == "" and key_chains is None:
+            tree_def = ivy.default(tree_def, container0.__dict__.get("_tree_def"))
+            if tree_def is not None and not tree_def.has_empty_nodes:
+                flat = [
+                    (
+                        cont._cont_tree_def_leaves(tree_def)
+                        if isinstance(cont, ivy.Container)
+                        else [cont] * tree_def.num_leaves
+                    )
+                    for cont in containers
+                ]
+                if all(leaves is not None for leaves in flat) and not (
+                    map_nests
+                    and any(
+                        isinstance(x, (list, tuple)) for leaves in flat for x in leaves
+                    )
+                ):
+                    return tree_def.unflatten(
+                        [
+                            func([_materialize(v) for v in values], kc)
+                            for values, kc in zip(zip(*flat), tree_def.key_chains)
+                        ],
+                        config=config,
+                    )
         return_dict = dict()
 
         for key in keys:
@@ -790,6 +1425,9 @@ class ContainerBase(dict, abc.ABC):
                 return_dict[key] = value0
 
             # noinspection PyProtectedMember
+        if len(keys) == len(container0):
+            # the keys are those of container0, in its order
+            return ivy.Container._cont_trusted(return_dict, config)
         return ivy.Container(return_dict, **config)
 
     @staticmethod
@@ -860,6 +1498,18 @@ class ContainerBase(dict, abc.ABC):
         -------
         Boolean
         """
+        if (
+            not partial
+            and not assert_and_assign
+            and all(isinstance(cont, ivy.Container) for cont in containers)
+            and not any(cont.cont_config["build_callable"] for cont in containers)
+        ):
+            # differing cached fingerprints rule out identical structures early, while
+            # equal ones may collide and are confirmed by the comparison below
+            fingerprint_0 = containers[0]._cont_fingerprint(check_types, check_shapes)
+            for cont in containers[1:]:
+                if cont._cont_fingerprint(check_types, check_shapes) != fingerprint_0:
+                    return False
         if partial:
             common_key_chains = ivy.Container.cont_common_key_chains(containers)
             if not common_key_chains:
@@ -965,21 +1615,22 @@ class ContainerBase(dict, abc.ABC):
             Whether to also check for partially complete sub-containers.
             Default is ``False``.
         """
-        ivy.utils.assertions.check_true(
-            ivy.Container.cont_identical(
-                containers,
-                check_types,
-                check_shapes,
-                same_arrays,
-                arrays_equal,
-                key_chains,
-                to_apply,
-                partial,
-            ),
-            "Containers were not identical:\n\n{}".format(
-                ivy.Container.cont_diff(*containers)
-            ),
-        )
+        # the diff is only computed on failure
+        if not ivy.Container.cont_identical(
+            containers,
+            check_types,
+            check_shapes,
+            same_arrays,
+            arrays_equal,
+            key_chains,
+            to_apply,
+            partial,
+        ):
+            raise ivy.utils.exceptions.IvyException(
+                "Containers were not identical:\n\n{}".format(
+                    ivy.Container.cont_diff(*containers)
+                )
+            )
 
     @staticmethod
     def cont_identical_structure(
@@ -1072,20 +1723,21 @@ class ContainerBase(dict, abc.ABC):
             if true, then the container being compared with is updated with the value in
             the container being compared to given that the strucutres are congruent
         """
-        ivy.utils.assertions.check_true(
-            ivy.Container.cont_identical_structure(
-                containers,
-                check_types,
-                check_shapes,
-                key_chains,
-                to_apply,
-                partial,
-                assert_and_assign=assert_and_assign,
-            ),
-            "Containers did not have identical structure:\n\n{}".format(
-                ivy.Container.cont_structural_diff(*containers)
-            ),
-        )
+        # the diff is only computed on failure
+        if not ivy.Container.cont_identical_structure(
+            containers,
+            check_types,
+            check_shapes,
+            key_chains,
+            to_apply,
+            partial,
+            assert_and_assign=assert_and_assign,
+        ):
+            raise ivy.utils.exceptions.IvyException(
+                "Containers did not have identical structure:\n\n{}".format(
+                    ivy.Container.cont_structural_diff(*containers)
+                )
+            )
 
     @staticmethod
     def cont_identical_configs(containers):
@@ -1152,7 +1804,14 @@ class ContainerBase(dict, abc.ABC):
 
     @staticmethod
     def cont_from_disk_as_hdf5(
-        h5_obj_or_filepath, slice_obj=slice(None), alphabetical_keys=True, ivyh=None
+        h5_obj_or_filepath,
+        slice_obj=slice(None),
+        alphabetical_keys=True,
+        ivyh=None,
+        lazy=False,
+        max_materialized=None,
+        _store=None,
+        _filepath=None,
     ):
         """
         Load container object from disk, as an h5py file, at the specified hdf5
@@ -1170,6 +1829,16 @@ class ContainerBase(dict, abc.ABC):
         ivyh
             Handle to ivy module to use for the calculations. Default is ``None``, which
             results in the global ivy.
+        lazy
+            Whether to keep the arrays on disk until they are accessed. The leaves of
+            the container are then read from the file when accessed through the
+            container, and slicing the container reads only the slices. Loading from a
+            filepath, the file is opened again for each read rather than kept open.
+            Default is ``False``.
+        max_materialized
+            The maximum number of leaves held in memory when loading lazily, the least
+            recently accessed leaves are dropped first. Default is ``None``, in which
+            case all the accessed leaves are kept.
 
         Returns
         -------
@@ -1182,18 +1851,41 @@ class ContainerBase(dict, abc.ABC):
                 "files from disk into a container."
             ),
         )
-        container_dict = dict()
         if type(h5_obj_or_filepath) is str:
-            h5_obj = h5py.File(h5_obj_or_filepath, "r")
-        else:
-            h5_obj = h5_obj_or_filepath
+            with h5py.File(h5_obj_or_filepath, "r") as h5_obj:
+                return ivy.Container.cont_from_disk_as_hdf5(
+                    h5_obj,
+                    slice_obj,
+                    alphabetical_keys,
+                    ivyh,
+                    lazy,
+                    max_materialized,
+                    _filepath=h5_obj_or_filepath,
+                )
+        container_dict = dict()
+        h5_obj = h5_obj_or_filepath
+        if lazy and _store is None:
+            _store = _LazyStore(max_materialized)
         items = sorted(h5_obj.items()) if alphabetical_keys else h5_obj.items()
         for key, value in items:
             if isinstance(value, h5py.Group):
                 container_dict[key] = ivy.Container.cont_from_disk_as_hdf5(
-                    value, slice_obj, ivyh
+                    value,
+                    slice_obj,
+                    alphabetical_keys,
+                    ivyh,
+                    lazy,
+                    max_materialized,
+                    _store,
+                    _filepath,
                 )
             elif isinstance(value, h5py.Dataset):
+                if lazy:
+                    source = (
+                        value if _filepath is None else _H5Dataset(_filepath, value)
+                    )
+                    container_dict[key] = _LazyLeaf(source, _store, slice_obj, ivyh)
+                    continue
                 container_dict[key] = ivy.default(ivyh, ivy).array(
                     list(value[slice_obj]), dtype=str(value[slice_obj].dtype)
                 )
@@ -1247,6 +1939,114 @@ class ContainerBase(dict, abc.ABC):
         with open(json_filepath) as json_data_file:
             return ivy.Container(json.load(json_data_file), ivyh=ivyh)
 
+    @staticmethod
+    def cont_from_disk_as_safetensors(
+        filepath,
+        prefix=None,
+        lazy=False,
+        max_materialized=None,
+        num_workers=None,
+        ivyh=None,
+    ):
+        """
+        Load container object from disk at the specified safetensors filepath.
+
+        The files are memory-mapped, and the arrays are created from views of the
+        mapped data, so backends which can wrap numpy arrays without copying them
+        read the arrays from disk only when they are used. Checkpoints saved in
+        shards are loaded from the shards listed in ``filepath + ".index.json"``.
+
+        Parameters
+        ----------
+        filepath
+            Filepath where the container object is saved to disk.
+        prefix
+            Key chain, or sequence of key chains, of the sub-containers to load.
+            Default is ``None``, in which case the whole container is loaded.
+        lazy
+            Whether to keep the arrays on disk until they are accessed, see
+            ``cont_from_disk_as_hdf5``. Default is ``False``.
+        max_materialized
+            The maximum number of leaves held in memory when loading lazily.
+            Default is ``None``, in which case all the accessed leaves are kept.
+        num_workers
+            Number of threads reading the shards of sharded checkpoints. Default is
+            ``None``, which uses as many threads as ``concurrent.futures`` defaults to.
+        ivyh
+            Handle to ivy module to use for the calculations. Default is ``None``, which
+            results in the global ivy.
+
+        Returns
+        -------
+            Container loaded from disk
+
+        Examples
+        --------
+        >>> x = ivy.Container(a=ivy.array([1., 2.]), b={"c": ivy.array([3, 4])})
+        >>> x.cont_to_disk_as_safetensors("weights.safetensors")
+        >>> y = ivy.Container.cont_from_disk_as_safetensors("weights.safetensors",
+        ...                                                 prefix="b")
+        >>> print(y)
+        {
+            b: {
+                c: ivy.array([3, 4])
+            }
+        }
+        """
+        if isinstance(prefix, str):
+            prefix = [prefix]
+        if os.path.exists(filepath) or not os.path.exists(filepath + ".index.json"):
+            shard_filepaths = [filepath]
+        else:
+            with open(filepath + ".index.json") as index_file:
+                weight_map = json.load(index_file)["weight_map"]
+            shard_filepaths = sorted(
+                set(
+                    os.path.join(os.path.dirname(filepath), shard)
+                    for key_chain, shard in weight_map.items()
+                    if prefix is None or _key_chain_has_prefix(key_chain, prefix)
+                )
+            )
+        store = _LazyStore(max_materialized) if lazy else None
+        ivyh = ivy.default(ivyh, ivy)
+
+        def _load_shard(shard_filepath):
+            header, data = _read_safetensors(shard_filepath)
+            leaves = dict()
+            for key_chain, info in header.items():
+                if prefix is not None and not _key_chain_has_prefix(key_chain, prefix):
+                    continue
+                dtype = info["dtype"]
+                ivy.utils.assertions.check_elem_in_list(
+                    dtype, list(_safetensors_np_dtypes)
+                )
+                begin, end = info["data_offsets"]
+                value = (
+                    data[begin:end]
+                    .view(np.dtype(_safetensors_np_dtypes[dtype]))
+                    .reshape(info["shape"])
+                )
+                if lazy:
+                    leaves[key_chain] = _LazyLeaf(value, store, ivyh=ivyh)
+                else:
+                    leaves[key_chain] = ivyh.array(np.asarray(value), dtype=value.dtype)
+            return leaves
+
+        if len(shard_filepaths) > 1 and num_workers != 1:
+            with ThreadPoolExecutor(num_workers) as pool:
+                shards = list(pool.map(_load_shard, shard_filepaths))
+        else:
+            shards = [_load_shard(shard_filepath) for shard_filepath in shard_filepaths]
+        container_dict = dict()
+        for leaves in shards:
+            for key_chain, value in leaves.items():
+                *keys, last_key = key_chain.split("/")
+                sub_dict = container_dict
+                for key in keys:
+                    sub_dict = sub_dict.setdefault(key, dict())
+                sub_dict[last_key] = value
+        return ivy.Container(container_dict, ivyh=ivyh)
+
     @staticmethod
     def h5_file_size(h5_obj_or_filepath):
         """
@@ -1290,17 +2090,25 @@ class ContainerBase(dict, abc.ABC):
         return size, batch_size
 
     @staticmethod
-    def shuffle_h5_file(h5_obj_or_filepath, seed_value=0):
+    def shuffle_h5_file(h5_obj_or_filepath, seed_value=0, max_memory=2**28):
         """
         Shuffle entries in all datasets of h5 file, such that they are still aligned
         along axis 0.
 
+        The datasets are shuffled out of core, in blocks of rows fitting in the
+        memory budget, so that each row is read and written a constant number of
+        times however large the datasets are.
+
         Parameters
         ----------
         h5_obj_or_filepath
             Filepath where the container object is saved to disk, or h5 object.
         seed_value
             random seed to use for array shuffling (Default value = 0)
+        max_memory
+            The number of bytes of each dataset to hold in memory at a time, besides
+            the permutation itself. Datasets which fit in the budget are shuffled in
+            memory. (Default value = 2**28)
         """
         ivy.utils.assertions.check_exists(
             h5py,
@@ -1316,17 +2124,30 @@ class ContainerBase(dict, abc.ABC):
         else:
             h5_obj = h5_obj_or_filepath
 
-        for key, value in h5_obj.items():
-            if isinstance(value, h5py.Group):
-                ivy.Container.shuffle_h5_file(value, seed_value)
-            elif isinstance(value, h5py.Dataset):
-                random.seed(seed_value)
-                # noinspection PyTypeChecker
-                random.shuffle(value)
-            else:
+        datasets = list()
+
+        def _visit(name, value):
+            if isinstance(value, h5py.Dataset):
+                datasets.append(value)
+            elif not isinstance(value, h5py.Group):
                 raise ivy.utils.exceptions.IvyException(
                     "Item found inside h5_obj which was neither a Group nor a Dataset."
                 )
+
+        h5_obj.visititems(_visit)
+        # datasets of the same length are shuffled with the same permutation, the
+        # one python's random.shuffle gives for the seed
+        permutations = dict()
+        for dataset in datasets:
+            if dataset.ndim == 0 or dataset.shape[0] < 2:
+                continue
+            length = dataset.shape[0]
+            if length not in permutations:
+                random.seed(seed_value)
+                permutation = list(range(length))
+                random.shuffle(permutation)
+                permutations[length] = np.array(permutation, dtype=np.int64)
+            _shuffle_h5_dataset(dataset, permutations[length], max_memory)
         if isinstance(h5_obj, h5py.File):
             h5_obj.close()
 
@@ -1695,6 +2516,82 @@ class ContainerBase(dict, abc.ABC):
                 else:
                     self[key] = value
 
+    def _cont_init_attributes(
+        self,
+        config_in,
+        queues=None,
+        container_combine_method="list_join",
+        dynamic_backend=None,
+    ):
+        """
+        Set the attributes of a new container, before its config is applied.
+
+        Shared by the constructor and by :meth:`_cont_trusted`, which builds
+        containers without calling the constructor.
+        """
+        self.__dict__.update(
+            _queues=queues,
+            _container_combine_method=container_combine_method,
+            _dynamic_backend=(
+                dynamic_backend if dynamic_backend is not None else ivy.dynamic_backend
+            ),
+            _config_in=config_in,
+            _config=dict(),
+            _has_lazy_leaves=False,
+        )
+        _tracked_containers[id(self)] = self
+
+    @staticmethod
+    def _cont_trusted(dict_in, config):
+        """
+        Build a container around dict_in without revalidating it.
+
+        Fast path for the containers rebuilt from the entries of existing ones, which
+        would otherwise re-sort the keys and re-check the config of every sub-container
+        on each op. The keys of dict_in are kept in their order, which is expected to
+        be the order of the container the entries come from, and config is expected to
+        be the config of a container. Any other config falls back to the constructor.
+
+        Parameters
+        ----------
+        dict_in
+            The dict to wrap, with sub-dicts which are mostly containers already.
+        config
+            The config of the container dict_in was built from.
+
+        Returns
+        -------
+        ret
+            The container wrapping the entries of dict_in.
+        """
+        if (
+            config.keys() != _container_config_keys
+            or config["rebuild_child_containers"]
+            or not isinstance(config["types_to_iteratively_nest"], tuple)
+            or not isinstance(config["keyword_color_dict"], dict)
+        ):
+            return ivy.Container(dict_in, **config)
+        nest_types = config["types_to_iteratively_nest"]
+        ret = dict.__new__(ivy.Container)
+        ret._cont_init_attributes(dict(config))
+        # the config applied as done by cont_update_config
+        ret.__dict__["_config"] = dict(config)
+        ret.__dict__.update({_container_config_attrs[k]: v for k, v in config.items()})
+        for key, value in dict_in.items():
+            if isinstance(value, dict):
+                if not isinstance(value, ivy.Container):
+                    value = ivy.Container(value, **config)
+            elif (nest_types and isinstance(value, nest_types)) or (
+                type(value) is not ivy.Array
+                and isinstance(value, Mapping)
+                and isinstance(value, tuple(ivy.container_types()))
+            ):
+                value = ivy.Container(value, **config)
+            elif isinstance(value, _LazyLeaf):
+                ret._has_lazy_leaves = True
+            dict.__setitem__(ret, key, value)
+        return ret
+
     def cont_all_true(
         self,
         assert_is_bool=False,
@@ -2016,11 +2913,23 @@ class ContainerBase(dict, abc.ABC):
             raise ValueError("Unsupported format")
 
     def cont_to_disk_as_hdf5(
-        self, h5_obj_or_filepath, starting_index=0, mode="a", max_batch_size=None
+        self,
+        h5_obj_or_filepath,
+        starting_index=0,
+        mode="a",
+        max_batch_size=None,
+        chunks=None,
+        compression=None,
+        compression_opts=None,
+        num_workers=None,
     ):
         """
         Save container object to disk, as an h5py file, at the specified filepath.
 
+        Each leaf is written to its dataset in a single slab. The leaves are converted
+        to numpy arrays on a pool of threads while the calling thread writes the
+        converted ones, in order, with at most one conversion in flight per thread.
+
         Parameters
         ----------
         h5_obj_or_filepath
@@ -2034,6 +2943,19 @@ class ContainerBase(dict, abc.ABC):
         max_batch_size
             Maximum batch size for the container on disk, this is useful if later
             appending to file. (Default value = None)
+        chunks
+            Chunk shape of the datasets created, or ``True`` to let h5py choose it.
+            Default is ``None``, which lets h5py choose it.
+        compression
+            Compression filter of the datasets created, such as ``"gzip"`` or
+            ``"lzf"``. Default is ``None``, for no compression.
+        compression_opts
+            Options of the compression filter, such as the gzip level.
+            Default is ``None``.
+        num_workers
+            Number of threads converting the leaves to numpy arrays. Default is
+            ``None``, which uses as many threads as ``concurrent.futures`` defaults to.
+            The leaves are converted on the calling thread if ``1``.
         """
         ivy.utils.assertions.check_exists(
             h5py,
@@ -2046,36 +2968,72 @@ class ContainerBase(dict, abc.ABC):
             h5_obj = h5py.File(h5_obj_or_filepath, mode)
         else:
             h5_obj = h5_obj_or_filepath
-        for key, value in self.items():
-            if isinstance(value, ivy.Container):
-                if key not in h5_obj.keys():
-                    h5_group = h5_obj.create_group(key)
-                else:
-                    h5_group = h5_obj[key]
-                value.cont_to_disk_as_hdf5(
-                    h5_group, starting_index, mode, max_batch_size
+        leaves = list(self.cont_to_iterator(include_empty=True))
+        to_numpy = self._cont_ivy.to_numpy
+
+        def _write(key_chain, value_as_np):
+            value_shape = value_as_np.shape
+            this_batch_size = value_shape[0]
+            max_bs = (
+                starting_index + this_batch_size
+                if not max_batch_size
+                else max_batch_size
+            )
+            if key_chain not in h5_obj:
+                dataset_shape = [max_bs] + list(value_shape[1:])
+                maxshape = [None for _ in dataset_shape]
+                h5_obj.create_dataset(
+                    key_chain,
+                    dataset_shape,
+                    dtype=value_as_np.dtype,
+                    maxshape=maxshape,
+                    chunks=chunks,
+                    compression=compression,
+                    compression_opts=compression_opts,
+                )
+            space_left = max_bs - starting_index
+            amount_to_write = min(this_batch_size, space_left)
+            if amount_to_write > 0:
+                dataset = h5_obj[key_chain]
+                dataset[starting_index : starting_index + amount_to_write] = (
+                    value_as_np[:amount_to_write]
                 )
+
+        def _convert_in_window(pool, window):
+            # at most window conversions are in flight, so that only as many
+            # converted leaves as workers are held in memory alongside the file
+            in_flight = deque()
+            for key_chain, value in leaves:
+                in_flight.append((key_chain, pool.submit(to_numpy, value)))
+                if len(in_flight) == window:
+                    key_chain, future = in_flight.popleft()
+                    yield key_chain, future.result()
+            while in_flight:
+                key_chain, future = in_flight.popleft()
+                yield key_chain, future.result()
+
+        # empty sub-containers are stored as empty groups
+        for key_chain in [kc for kc, v in leaves if isinstance(v, ivy.Container)]:
+            h5_obj.require_group(key_chain)
+        leaves = [(kc, v) for kc, v in leaves if not isinstance(v, ivy.Container)]
+        pool = None
+        try:
+            if num_workers == 1 or len(leaves) < 2:
+                converted = ((kc, to_numpy(v)) for kc, v in leaves)
             else:
-                value_as_np = self._cont_ivy.to_numpy(value)
-                value_shape = value_as_np.shape
-                this_batch_size = value_shape[0]
-                max_bs = (
-                    starting_index + this_batch_size
-                    if not max_batch_size
-                    else max_batch_size
+                # h5py is not thread safe, so only the conversions are parallel
+                num_workers = ivy.default(
+                    num_workers, min(32, (os.cpu_count() or 1) + 4)
                 )
-                if key not in h5_obj.keys():
-                    dataset_shape = [max_bs] + list(value_shape[1:])
-                    maxshape = [None for _ in dataset_shape]
-                    h5_obj.create_dataset(
-                        key, dataset_shape, dtype=value_as_np.dtype, maxshape=maxshape
-                    )
-                space_left = max_bs - starting_index
-                amount_to_write = min(this_batch_size, space_left)
-                for i in range(amount_to_write):
-                    h5_obj[key][starting_index + i : starting_index + i + 1] = (
-                        value_as_np[i : i + 1]
-                    )
+                pool = ThreadPoolExecutor(num_workers)
+                converted = _convert_in_window(pool, num_workers)
+            for key_chain, value_as_np in converted:
+                _write(key_chain, value_as_np)
+        finally:
+            if pool is not None:
+                pool.shutdown(cancel_futures=True)
+            if h5_obj is not h5_obj_or_filepath:
+                h5_obj.close()
 
     def cont_to_disk_as_pickled(self, pickle_filepath):
         """
@@ -2119,6 +3077,100 @@ class ContainerBase(dict, abc.ABC):
         with open(json_filepath, "w+") as json_data_file:
             json.dump(self.cont_to_jsonable().cont_to_dict(), json_data_file, indent=4)
 
+    def cont_to_disk_as_safetensors(self, filepath, max_shard_size=None):
+        """
+        Save container object to disk, in the safetensors format, at the specified
+        filepath.
+
+        The file holds a json header with the key chain, dtype, shape and byte
+        offsets of each leaf, followed by the raw bytes of the leaves, so that it can
+        be loaded by memory-mapping the arrays.
+
+        Parameters
+        ----------
+        filepath
+            Filepath for where to save the container to disk.
+        max_shard_size
+            The maximum number of bytes of array data per file. If the leaves don't
+            fit in one file, they are saved in numbered shards next to ``filepath``,
+            which are listed in ``filepath + ".index.json"``. Default is ``None``,
+            in which case all the leaves are saved in one file.
+        """
+        leaves = list()
+        for key_chain, value in self.cont_to_iterator():
+            ivy.utils.assertions.check_true(
+                ivy.is_array(value),
+                "only arrays can be saved as safetensors, but {} is a {}".format(
+                    key_chain, type(value)
+                ),
+            )
+            value = np.asarray(self._cont_ivy.to_numpy(value), order="C")
+            value = value.astype(value.dtype.newbyteorder("<"), copy=False)
+            ivy.utils.assertions.check_elem_in_list(
+                value.dtype.name, list(_safetensors_dtypes)
+            )
+            leaves.append((key_chain, value))
+        shards = [[]]
+        shard_size = 0
+        for key_chain, value in leaves:
+            if (
+                max_shard_size is not None
+                and shards[-1]
+                and shard_size + value.nbytes > max_shard_size
+            ):
+                shards.append([])
+                shard_size = 0
+            shards[-1].append((key_chain, value))
+            shard_size += value.nbytes
+        # remove the files of a previous checkpoint saved at filepath with a
+        # different sharding, which would otherwise take precedence when loading
+        stale_filepath = filepath if len(shards) > 1 else filepath + ".index.json"
+        if os.path.exists(stale_filepath):
+            os.remove(stale_filepath)
+        if len(shards) == 1:
+            shard_filepaths = [filepath]
+        else:
+            stem, ext = os.path.splitext(filepath)
+            shard_filepaths = [
+                "{}-{:05d}-of-{:05d}{}".format(stem, i + 1, len(shards), ext)
+                for i in range(len(shards))
+            ]
+        for shard, shard_filepath in zip(shards, shard_filepaths):
+            header = dict()
+            offset = 0
+            for key_chain, value in shard:
+                header[key_chain] = dict(
+                    dtype=_safetensors_dtypes[value.dtype.name],
+                    shape=list(value.shape),
+                    data_offsets=[offset, offset + value.nbytes],
+                )
+                offset += value.nbytes
+            header = json.dumps(header, separators=(",", ":")).encode()
+            # the data is aligned to 8 bytes by padding the header with spaces
+            header += b" " * (-len(header) % 8)
+            with open(shard_filepath, "wb") as f:
+                f.write(len(header).to_bytes(8, "little"))
+                f.write(header)
+                for _, value in shard:
+                    f.write(value.reshape(-1).view(np.uint8).data)
+        if len(shards) > 1:
+            weight_map = {
+                key_chain: os.path.basename(shard_filepath)
+                for shard, shard_filepath in zip(shards, shard_filepaths)
+                for key_chain, _ in shard
+            }
+            with open(filepath + ".index.json", "w") as index_file:
+                json.dump(
+                    dict(
+                        metadata=dict(
+                            total_size=sum(value.nbytes for _, value in leaves)
+                        ),
+                        weight_map=weight_map,
+                    ),
+                    index_file,
+                    indent=4,
+                )
+
     def cont_to_nested_list(self):
         return_list = list()
         for key, value in self.items():
@@ -2194,7 +3246,7 @@ class ContainerBase(dict, abc.ABC):
             if isinstance(value, ivy.Container) and (not include_empty or value):
                 yield from value.cont_to_iterator(kc, leaf_keys_only, include_empty)
             else:
-                yield kc, value
+                yield kc, _materialize(value)
 
     def cont_to_iterator_values(self, include_empty=False):
         """
@@ -2214,7 +3266,7 @@ class ContainerBase(dict, abc.ABC):
                 # noinspection PyCompatibility
                 yield from value.cont_to_iterator_values(include_empty)
             else:
-                yield value
+                yield _materialize(value)
 
     def cont_to_iterator_keys(
         self, key_chain="", leaf_keys_only=False, include_empty=False
@@ -2248,6 +3300,105 @@ class ContainerBase(dict, abc.ABC):
             else:
                 yield kc
 
+    def cont_tree_def(self):
+        """
+        Return the tree definition of the container.
+
+        The tree definition is computed once and cached on the container, and the
+        containers built from it, such as the results of :meth:`cont_map` and of the
+        container operations on this container, share it. Passing it to
+        :meth:`cont_map` or :meth:`cont_multi_map` for other containers of the same
+        structure skips discovering their structure.
+
+        Returns
+        -------
+        ret
+            The tree definition of the container.
+
+        Examples
+        --------
+        >>> x = ivy.Container(a=ivy.array([1.]), b={"c": ivy.array([2.])})
+        >>> tree_def = x.cont_tree_def()
+        >>> tree_def.key_chains
+        ('a', 'b/c')
+        >>> y = tree_def.unflatten([ivy.array([3.]), ivy.array([4.])])
+        >>> print(y.b.c)
+        ivy.array([4.])
+        >>> x.cont_map(lambda v, kc: v * 2).cont_tree_def() is tree_def
+        True
+        """
+        tree_def = self.__dict__.get("_tree_def")
+        if self._cont_tree_def_leaves(tree_def) is None:
+            tree_def = ivy.TreeDef(self, containers=True)
+            self._tree_def = tree_def
+        return tree_def
+
+    def _cont_tree_def_leaves(self, tree_def):
+        # the leaves of the container if it matches tree_def, dropping the tree
+        # definition cached on the container once the container no longer matches it
+        if tree_def is None:
+            return None
+        try:
+            return tree_def.flatten(self)
+        except ivy.utils.exceptions.IvyException:
+            if self.__dict__.get("_tree_def") is tree_def:
+                self._tree_def = None
+            return None
+
+    def cont_fingerprint(self):
+        """
+        Return the structural fingerprint of the container.
+
+        The fingerprint hashes the keys of the container and of its sub-containers,
+        and the types, shapes and dtypes of its leaves, independently of the order of
+        the keys and of the values of the arrays. It is cached on the container until
+        a container or an array it holds is next changed in place, and can key caches
+        of anything depending only on the structure, such as compiled graphs. Distinct
+        structures may, rarely, share a fingerprint.
+
+        Returns
+        -------
+        ret
+            The fingerprint of the container, as an integer.
+
+        Examples
+        --------
+        >>> x = ivy.Container(a=ivy.array([1., 2.]), b={"c": ivy.array([3])})
+        >>> y = ivy.Container(b={"c": ivy.array([4])}, a=ivy.array([5., 6.]))
+        >>> x.cont_fingerprint() == y.cont_fingerprint()
+        True
+        >>> z = ivy.Container(a=ivy.array([1., 2., 3.]), b={"c": ivy.array([3])})
+        >>> x.cont_fingerprint() == z.cont_fingerprint()
+        False
+        """
+        return self._cont_fingerprint(check_dtypes=True)
+
+    def _cont_fingerprint(
+        self, check_types=True, check_shapes=True, check_dtypes=False
+    ):
+        # the hash of the sorted keys and of the structures of the leaves, cached for
+        # each set of checks until _structure_changed is called on the container or on
+        # any sub-container or array it was computed from
+        fingerprints = self.__dict__.get("_fingerprints")
+        if fingerprints is None:
+            fingerprints = self.__dict__["_fingerprints"] = dict()
+        checks = (check_types, check_shapes, check_dtypes)
+        ret = fingerprints.get(checks)
+        if ret is None:
+            structure = []
+            for key, value in sorted(dict.items(self), key=lambda kv: str(kv[0])):
+                if isinstance(value, ivy.Container):
+                    _add_structure_parent(value, self)
+                    structure.append(
+                        (key, ivy.Container, value._cont_fingerprint(*checks))
+                    )
+                    continue
+                if isinstance(value, ivy.Array):
+                    _add_structure_parent(value, self)
+                structure.append((key, _leaf_structure(value, *checks)))
+            ret = fingerprints[checks] = hash(tuple(structure))
+        return ret
+
     def cont_to_flat_list(self):
         """
         Summary.
@@ -2280,7 +3431,90 @@ class ContainerBase(dict, abc.ABC):
             else:
                 new_value = flat_list.pop(0)
             new_dict[key] = new_value
-        return ivy.Container(new_dict, **self._config)
+        return ivy.Container._cont_trusted(new_dict, self._config)
+
+    def cont_pack(self):
+        """
+        Return a copy of the container with its arrays packed into flat buffers.
+
+        The arrays are copied into one contiguous buffer per dtype and device, and the
+        leaves of the returned container are views into these buffers for backends
+        which support views. Elementwise operations between containers packed with
+        the same structure, such as the container arithmetic operators and the
+        optimizer updates built on them, then run once per buffer instead of once per
+        leaf, and return packed containers themselves. Replacing any leaf of a packed
+        container makes it fall back to the per-leaf behaviour.
+
+        Returns
+        -------
+        ret
+            The packed container.
+
+        Examples
+        --------
+        >>> x = ivy.Container(a=ivy.array([1., 2.]), b={"c": ivy.array([[3.]])})
+        >>> y = x.cont_pack()
+        >>> buffers = y.cont_packed_buffers()
+        >>> print(len(buffers))
+        1
+        >>> print((y * 2).b.c)
+        ivy.array([[6.]])
+        """
+        entries = []
+        groups = dict()
+        flat_arrays = dict()
+        for key_chain, value in self.cont_to_iterator():
+            if not ivy.is_array(value):
+                raise ivy.utils.exceptions.IvyException(
+                    "only containers with array leaves can be packed, but found {} at"
+                    " {}".format(type(value), key_chain)
+                )
+            group = (str(ivy.dtype(value)), str(ivy.dev(value)))
+            start = groups.get(group, 0)
+            shape = tuple(value.shape)
+            groups[group] = start + _reduce(mul, shape, 1)
+            entries.append((group, start, groups[group], shape))
+            flat_arrays.setdefault(group, []).append(ivy.reshape(value, (-1,)))
+        buffers = {
+            group: ivy.to_native(ivy.concat(arrays, axis=0))
+            for group, arrays in flat_arrays.items()
+        }
+        return _Packed(_PackedLayout(entries, groups), buffers).unpack(self)
+
+    def cont_packed_buffers(self):
+        """
+        Return the flat buffers of a container returned by :meth:`cont_pack`.
+
+        Returns
+        -------
+        ret
+            A dict mapping each (dtype, device) pair to the native buffer holding the
+            leaves of that dtype and device, or None if the container isn't packed or
+            any of its leaves has since been replaced.
+        """
+        packed = self._cont_packed()
+        return None if packed is None else packed.buffers
+
+    def _cont_packed(self):
+        packed = None
+        i = -1
+        for i, x in enumerate(self.cont_to_iterator_values()):
+            if isinstance(x, ivy.Array):
+                x = x.data
+            x_packed = _packed_natives.get(id(x))
+            if (
+                x_packed is None
+                or i >= len(x_packed.natives)
+                or x is not x_packed.natives[i]
+            ):
+                return None
+            if packed is None:
+                packed = x_packed
+            elif x_packed is not packed:
+                return None
+        if packed is None or i + 1 != len(packed.natives):
+            return None
+        return packed
 
     def cont_has_key(self, query_key):
         """
@@ -3215,6 +4449,7 @@ class ContainerBase(dict, abc.ABC):
         map_sequences=False,
         inplace=False,
         key_chain="",
+        tree_def=None,
     ):
         """
         Apply function to all array values of container.
@@ -3239,11 +4474,41 @@ class ContainerBase(dict, abc.ABC):
             Default is ``False``.
         key_chain
             Chain of keys for this dict entry (Default value = '')
+        tree_def
+            The tree definition of the container, as returned by
+            :meth:`cont_tree_def`. Default is ``None``, in which case the tree
+            definition cached on the container is used if any. The structure is
+            traversed as usual if neither matches the container, or for inplace
+            mapping, mapping sequences found in the leaves or pruning empty
+            sub-containers.
 
         Returns
         -------
             New container following the function mapped to each sub-array.
         """
+        if key_chain == "" and not inplace:
+            tree_def = ivy.default(tree_def, self.__dict__.get("_tree_def"))
+            leaves = self._cont_tree_def_leaves(tree_def)
+            if (
+                leaves is not None
+                and not (
+                    prune_unapplied
+                    and (key_chains is not None or tree_def.has_empty_nodes)
+                )
+                and not (
+                    map_sequences and any(isinstance(x, (list, tuple)) for x in leaves)
+                )
+            ):
+                return tree_def.unflatten(
+                    [
+                        (
+                            func(_materialize(x), kc)
+                            if key_chains is None or (kc in key_chains) == to_apply
+                            else x
+                        )
+                        for x, kc in zip(leaves, tree_def.key_chains)
+                    ]
+                )
         return_dict = self if inplace else dict()
         for key, value in self.items():
             this_key_chain = (
@@ -3279,10 +4544,10 @@ class ContainerBase(dict, abc.ABC):
                             continue
                         return_dict[key] = value
                         continue
-                return_dict[key] = func(value, this_key_chain)
+                return_dict[key] = func(_materialize(value), this_key_chain)
         if inplace:
             return self
-        return ivy.Container(return_dict, **self._config)
+        return ivy.Container._cont_trusted(return_dict, self._config)
 
     def cont_map_sub_conts(
         self,
@@ -3344,7 +4609,11 @@ class ContainerBase(dict, abc.ABC):
                 ):
                     continue
                 return_dict[key] = value
-        ret = return_dict if inplace else ivy.Container(return_dict, **self._config)
+        ret = (
+            return_dict
+            if inplace
+            else ivy.Container._cont_trusted(return_dict, self._config)
+        )
         if key_chain != "" or include_self:
             ret = func(ret, key_chain)
         if inplace:
@@ -4022,7 +5291,7 @@ class ContainerBase(dict, abc.ABC):
     # noinspection PyProtectedMember
     def __getattr__(self, item, *args, **kwargs):
         try:
-            ret = dict.__getitem__(self, item)
+            ret = _materialize(dict.__getitem__(self, item))
         except KeyError:
             # noinspection PyUnresolvedReferences
             ret = ivy.Container()
@@ -4067,16 +5336,7 @@ class ContainerBase(dict, abc.ABC):
         queue_idxs = set(
             [np.sum(q >= self._queue_load_sizes_cum).item() for q in queue_queries]
         )
-        conts = list()
-        for i in queue_idxs:
-            if i not in self._loaded_containers_from_queues:
-                cont = ivy.Container(
-                    self._queues[i].get(timeout=self._queue_timeout), **self._config
-                ).to_ivy()
-                self._loaded_containers_from_queues[i] = cont
-            else:
-                cont = self._loaded_containers_from_queues[i]
-            conts.append(cont)
+        conts = [self._queue_loader.get(i) for i in queue_idxs]
         combined_cont = self._container_combine_method(conts)
         idx = list(queue_idxs)[0]
         offset = 0 if idx == 0 else self._queue_load_sizes_cum[idx - 1]
@@ -4094,6 +5354,28 @@ class ContainerBase(dict, abc.ABC):
         # noinspection PyUnboundLocalVariable
         return combined_cont[shifted_query]
 
+    def cont_queue_metrics(self):
+        """
+        Return the time spent waiting for containers from the queues, versus the time
+        spent computing between the accesses to the queues.
+
+        Returns
+        -------
+        ret
+            A dict with the seconds spent waiting as ``wait_time``, the seconds spent
+            between accesses as ``compute_time``, and the number of containers loaded
+            as ``num_loaded``.
+        """
+        ivy.utils.assertions.check_true(
+            ivy.exists(self._queues), "the container is not loaded from queues"
+        )
+        loader = self._queue_loader
+        return dict(
+            wait_time=loader.wait_time,
+            compute_time=loader.compute_time,
+            num_loaded=len(loader.loaded),
+        )
+
     def __getitem__(self, query):
         """
         Get slice, key or key chain of container object.
@@ -4113,13 +5395,14 @@ class ContainerBase(dict, abc.ABC):
             if "/" in query or "." in query:
                 ret = self.cont_at_key_chain(query)
                 return ret
-            ret = dict.__getitem__(self, query)
+            ret = _materialize(dict.__getitem__(self, query))
             return ret
         elif ivy.exists(self._queues):
             ret = self._get_queue_item(query)
             return ret
         return_dict = dict()
-        for key, value in self.items():
+        # lazily loaded leaves are sliced without reading the rest of them
+        for key, value in dict.items(self):
             if isinstance(value, ivy.Container):
                 return_dict[key] = value[query]
             else:
@@ -4133,7 +5416,7 @@ class ContainerBase(dict, abc.ABC):
                     return_dict[key] = value
                 else:
                     return_dict[key] = value[query]
-        ret = ivy.Container(return_dict, **self._config)
+        ret = ivy.Container._cont_trusted(return_dict, self._config)
         return ret
 
     def __setitem__(self, query, val):
@@ -4170,11 +5453,55 @@ class ContainerBase(dict, abc.ABC):
             self._dynamic_backend = val
             return
 
+        _structure_changed(self)
         if isinstance(query, str) and ("/" in query or "." in query):
             return self.cont_set_at_key_chain(query, val, inplace=True)
         else:
+            if isinstance(val, _LazyLeaf):
+                self._has_lazy_leaves = True
             return dict.__setitem__(self, query, val)
 
+    def __delitem__(self, key):
+        _structure_changed(self)
+        return dict.__delitem__(self, key)
+
+    def pop(self, *args):
+        _structure_changed(self)
+        return dict.pop(self, *args)
+
+    def popitem(self):
+        _structure_changed(self)
+        return dict.popitem(self)
+
+    def clear(self):
+        _structure_changed(self)
+        return dict.clear(self)
+
+    def update(self, *args, **kwargs):
+        _structure_changed(self)
+        return dict.update(self, *args, **kwargs)
+
+    def setdefault(self, *args):
+        _structure_changed(self)
+        return dict.setdefault(self, *args)
+
+    def _cont_materialized_dict(self):
+        # lazily loaded leaves are materialized, as when accessed by key
+        return {k: _materialize(v) for k, v in dict.items(self)}
+
+    def items(self):
+        if not self._has_lazy_leaves:
+            return dict.items(self)
+        return self._cont_materialized_dict().items()
+
+    def values(self):
+        if not self._has_lazy_leaves:
+            return dict.values(self)
+        return self._cont_materialized_dict().values()
+
+    def get(self, key, default=None):
+        return _materialize(dict.get(self, key, default))
+
     def __contains__(self, key):
         if isinstance(key, str) and ("/" in key or "." in key):
             return self.cont_has_key_chain(key)
@@ -4185,6 +5512,12 @@ class ContainerBase(dict, abc.ABC):
 
     def __getstate__(self):
         state_dict = copy.copy(self.__dict__)
+        # the cached tree definition and fingerprints are recomputed when needed
+        state_dict.pop("_tree_def", None)
+        state_dict.pop("_fingerprints", None)
+        state_dict.pop("_structure_parents", None)
+        # the entries are pickled through items, which materializes lazy leaves
+        state_dict["_has_lazy_leaves"] = False
         state_dict["_local_ivy"] = (
             state_dict["_local_ivy"].current_backend_str()
             if state_dict["_local_ivy"] is not None
@@ -4234,6 +5567,7 @@ class ContainerBase(dict, abc.ABC):
                         config["ivyh"] = ivy
             state_dict["_config"] = config
         self.__dict__.update(state_dict)
+        _tracked_containers[id(self)] = self
 
     # Getters and Setters #
     # --------------------#
@@ -108,6 +108,8 @@ class Container(
         types_to_iteratively_nest=None,
         alphabetical_keys=True,
         dynamic_backend=None,
+        queue_prefetch_depth=0,
+        queue_prefetch_device=None,
         **kwargs
     ):
         ContainerBase.__init__(
@@ -128,6 +130,8 @@ class Container(
             types_to_iteratively_nest,
             alphabetical_keys,
             dynamic_backend,
+            queue_prefetch_depth=queue_prefetch_depth,
+            queue_prefetch_device=queue_prefetch_device,
             **kwargs
         )
 
@@ -138,6 +142,9 @@ class Container(
         return self
 
     def __neg__(self):
+        ret = ivy.Container._cont_map_packed(operator.neg, (self,))
+        if ret is not None:
+            return ret
         return self.cont_map(lambda x, kc: -x, map_sequences=True)
 
     def __pow__(self, power):
@@ -179,6 +186,9 @@ class Container(
             b: ivy.array([11.52153397, 30.13532257])
         }
         """
+        ret = ivy.Container._cont_map_packed(operator.pow, (self, power))
+        if ret is not None:
+            return ret
         if isinstance(power, ivy.Container):
             return ivy.Container.cont_multi_map(
                 lambda xs, _: operator.pow(xs[0], xs[1]), [self, power], map_nests=True
@@ -186,6 +196,9 @@ class Container(
         return self.cont_map(lambda x, kc: x**power, map_sequences=True)
 
     def __rpow__(self, power):
+        ret = ivy.Container._cont_map_packed(operator.pow, (power, self))
+        if ret is not None:
+            return ret
         return self.cont_map(lambda x, kc: power**x, map_sequences=True)
 
     def __ipow__(self, power):
@@ -256,6 +269,9 @@ class Container(
                           [8.1, 9.3, 3.4]])
         }
         """
+        ret = ivy.Container._cont_map_packed(operator.add, (self, other))
+        if ret is not None:
+            return ret
         return ivy.Container.cont_multi_map(
             lambda xs, _: operator.add(xs[0], xs[1]), [self, other], map_nests=True
         )
@@ -290,6 +306,9 @@ class Container(
             b: 5
         }
         """
+        ret = ivy.Container._cont_map_packed(operator.add, (other, self))
+        if ret is not None:
+            return ret
         return ivy.Container.cont_multi_map(
             lambda xs, _: operator.add(xs[0], xs[1]), [other, self], map_nests=True
         )
@@ -360,6 +379,9 @@ class Container(
                           [5.9, 4.7, 10.6]])
         }
         """
+        ret = ivy.Container._cont_map_packed(operator.sub, (self, other))
+        if ret is not None:
+            return ret
         return ivy.Container.cont_multi_map(
             lambda xs, _: operator.sub(xs[0], xs[1]), [self, other], map_nests=True
         )
@@ -399,16 +421,25 @@ class Container(
             b: -3
         }
         """
+        ret = ivy.Container._cont_map_packed(operator.sub, (other, self))
+        if ret is not None:
+            return ret
         return ivy.Container.cont_multi_map(
             lambda xs, _: operator.sub(xs[0], xs[1]), [other, self], map_nests=True
         )
 
     def __mul__(self, other):
+        ret = ivy.Container._cont_map_packed(operator.mul, (self, other))
+        if ret is not None:
+            return ret
         return ivy.Container.cont_multi_map(
             lambda xs, _: operator.mul(xs[0], xs[1]), [self, other], map_nests=True
         )
 
     def __rmul__(self, other):
+        ret = ivy.Container._cont_map_packed(operator.mul, (other, self))
+        if ret is not None:
+            return ret
         return ivy.Container.cont_multi_map(
             lambda xs, _: operator.mul(xs[0], xs[1]), [other, self], map_nests=True
         )
@@ -497,11 +528,17 @@ class Container(
             b: ivy.array([0.66666669, 0.60000002, 0.5])
         }
         """
+        ret = ivy.Container._cont_map_packed(operator.truediv, (self, other))
+        if ret is not None:
+            return ret
         return ivy.Container.cont_multi_map(
             lambda xs, _: operator.truediv(xs[0], xs[1]), [self, other], map_nests=True
         )
 
     def __rtruediv__(self, other):
+        ret = ivy.Container._cont_map_packed(operator.truediv, (other, self))
+        if ret is not None:
+            return ret
         return ivy.Container.cont_multi_map(
             lambda xs, _: operator.truediv(xs[0], xs[1]), [other, self], map_nests=True
         )
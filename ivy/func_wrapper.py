@@ -292,6 +292,18 @@ def _check_in_nested_sequence(sequence, value=None, _type=None):
             )
 
 
+def _is_ivy_array_container(x):
+    """
+    Check whether `x` is a container holding only ivy arrays.
+
+    Converting such containers to arrays maps ``ivy.array`` over the leaves without
+    changing any of them, so the conversion can be skipped altogether.
+    """
+    return isinstance(x, ivy.Container) and all(
+        isinstance(leaf, ivy.Array) for leaf in x.cont_to_iterator_values()
+    )
+
+
 def _get_preferred_device(args, kwargs):
     # When new arrays are created, they should be created on the same device as
     # existing array inputs. If a device is specified as a kwarg, create them there.
@@ -407,11 +419,11 @@ def handle_array_like_without_promotion(fn: Callable) -> Callable:
                     # since asarray throws unpredictable bugs
                     if _check_in_nested_sequence(arg, value=Ellipsis, _type=slice):
                         continue
-                    if not ivy.is_array(arg):
+                    if not ivy.is_array(arg) and not _is_ivy_array_container(arg):
                         args[i] = ivy.array(arg, device=device)
                 elif parameters in kwargs:
                     kwarg = kwargs[parameter]
-                    if not ivy.is_array(kwarg):
+                    if not ivy.is_array(kwarg) and not _is_ivy_array_container(kwarg):
                         kwargs[parameter] = ivy.array(kwarg, device=device)
 
         return fn(*args, **kwargs)
@@ -1062,6 +1074,250 @@ def handle_partial_mixed_function(fn) -> Callable:
     return _handle_partial_mixed_function
 
 
+# Fast Path Dispatch #
+# -------------------#
+
+# wrappers which are guaranteed to be no-ops (or which the fast path replicates)
+# when all inputs are arrays, scalars or lists, tuples and dicts of these, and the
+# `out` argument is None
+FAST_PATH_DECORATORS = {
+    "handle_array_function",
+    "outputs_to_ivy_arrays",
+    "inputs_to_native_arrays",
+    "handle_out_argument",
+    "handle_array_like_without_promotion",
+    "handle_nestable",
+    "handle_ragged",
+    "handle_backend_invalid",
+    "handle_exceptions",
+    "handle_nans",
+}
+
+# maximum number of argument layouts cached for each function
+DISPATCH_CACHE_SIZE = 64
+
+_fast_path_scalar_types = (int, float, bool, complex)
+_array_leaf = "array"
+_scalar_leaf = "scalar"
+
+
+def _nest_layout(x, leaves, native_array_type):
+    """
+    Return a hashable description of the structure of `x`, appending its leaves to
+    `leaves` with all `ivy.Array` instances replaced by their native data.
+
+    `None` is returned whenever `x` requires the full wrapper chain, such as for
+    containers, ragged arrays, arrays belonging to another backend or any other
+    unrecognised type.
+    """
+    x_type = type(x)
+    if x_type is ivy.Array:
+        x = x.data
+        if not isinstance(x, native_array_type):
+            return None
+        leaves.append(x)
+        return _array_leaf
+    if isinstance(x, native_array_type):
+        leaves.append(x)
+        return _array_leaf
+    if x is None or x_type in _fast_path_scalar_types or isinstance(x, str):
+        leaves.append(x)
+        return _scalar_leaf
+    if x_type is list or x_type is tuple:
+        layout = [x_type]
+        for item in x:
+            item_layout = _nest_layout(item, leaves, native_array_type)
+            if item_layout is None:
+                return None
+            layout.append(item_layout)
+        return tuple(layout)
+    if x_type is dict:
+        layout = [dict]
+        for key, value in x.items():
+            value_layout = _nest_layout(value, leaves, native_array_type)
+            if value_layout is None:
+                return None
+            layout.append((key, value_layout))
+        return tuple(layout)
+    return None
+
+
+def _fast_path_layout(args, kwargs, native_array_type):
+    """
+    Scan `args` and `kwargs` once for the fast path of the wrappers.
+
+    Returns the layout of the arguments together with their flattened
+    leaves, or `None` if the full wrapper chain is required.
+    """
+    leaves = []
+    args_layout = []
+    for arg in args:
+        arg_layout = _nest_layout(arg, leaves, native_array_type)
+        if arg_layout is None:
+            return None
+        args_layout.append(arg_layout)
+    kwargs_layout = []
+    for key, value in kwargs.items():
+        if key == "out" and value is not None:
+            return None
+        value_layout = _nest_layout(value, leaves, native_array_type)
+        if value_layout is None:
+            return None
+        kwargs_layout.append((key, value_layout))
+    return (tuple(args_layout), tuple(kwargs_layout)), leaves
+
+
+def _nest_builder(layout):
+    """Return a function which rebuilds a nest with `layout` from a leaf iterator."""
+    if layout is _array_leaf or layout is _scalar_leaf:
+        return next
+    nest_type = layout[0]
+    if nest_type is dict:
+        keys = [key for key, _ in layout[1:]]
+        builders = [_nest_builder(value_layout) for _, value_layout in layout[1:]]
+        return lambda leaves: {k: b(leaves) for k, b in zip(keys, builders)}
+    builders = [_nest_builder(item_layout) for item_layout in layout[1:]]
+    if nest_type is tuple:
+        return lambda leaves: tuple([b(leaves) for b in builders])
+    return lambda leaves: [b(leaves) for b in builders]
+
+
+def _args_builder(layout):
+    """Return a function which rebuilds `(args, kwargs)` from the flattened leaves."""
+    args_layout, kwargs_layout = layout
+    num_args = len(args_layout)
+    keys = [key for key, _ in kwargs_layout]
+    if all(
+        arg_layout is _array_leaf or arg_layout is _scalar_leaf
+        for arg_layout in args_layout + tuple(v for _, v in kwargs_layout)
+    ):
+        # flat inputs, the leaves are the arguments themselves
+        return lambda leaves: (leaves[:num_args], dict(zip(keys, leaves[num_args:])))
+    args_builders = [_nest_builder(arg_layout) for arg_layout in args_layout]
+    kwargs_builders = [_nest_builder(value_layout) for _, value_layout in kwargs_layout]
+
+    def _build(leaves):
+        leaves = iter(leaves)
+        return (
+            [b(leaves) for b in args_builders],
+            {k: b(leaves) for k, b in zip(keys, kwargs_builders)},
+        )
+
+    return _build
+
+
+def _array_like_positions(fn):
+    """
+    Return the positions of the arguments of `fn` converted to arrays.
+
+    These are the arguments which `handle_array_like_without_promotion`
+    would convert.
+    """
+    try:
+        parameters = inspect.signature(fn).parameters
+    except (TypeError, ValueError):
+        return ()
+    positions = []
+    for i, (parameter, value) in enumerate(parameters.items()):
+        annotation_str = str(value.annotation)
+        if (
+            ("rray" in annotation_str or "Tensor" in annotation_str)
+            and parameter != "out"
+            and all(
+                sq not in annotation_str
+                for sq in ["Sequence", "List", "Tuple", "float", "int", "bool"]
+            )
+        ):
+            positions.append(i)
+    return tuple(positions)
+
+
+def _fast_path_dispatch(fn: Callable, core_fn: Callable, applied: list) -> Callable:
+    """
+    Fuse the wrapper chain of `fn` into a single dispatcher.
+
+    The dispatcher scans the inputs once, and when they only contain arrays and
+    scalars it calls `core_fn` (the backend implementation, with device and dtype
+    handling applied) directly, converting the output back to `ivy.Array` instances.
+    In all other cases, the fully wrapped function `fn` is called instead. The
+    decision for each layout of the arguments, together with how to rebuild the
+    arguments from their flattened leaves, is cached in `fn.dispatch_cache`.
+
+    Parameters
+    ----------
+    fn
+        the fully wrapped function.
+    core_fn
+        the backend implementation, with only the wrappers which are not
+        replicated by the fast path applied.
+    applied
+        the wrappers which were applied on top of `core_fn` to produce `fn`.
+
+    Returns
+    -------
+    ret
+        the fused dispatcher, carrying all the attributes of `fn`.
+    """
+    check_nans = "handle_nans" in applied
+    to_native = "inputs_to_native_arrays" in applied
+    to_ivy = "outputs_to_ivy_arrays" in applied
+    array_like = "handle_array_like_without_promotion" in applied
+    array_like_positions = None
+    dispatch_cache = {}
+
+    @functools.wraps(core_fn)
+    def _fast_path(*args, **kwargs):
+        ret = core_fn(*args, **kwargs)
+        if not to_ivy:
+            return ret
+        if isinstance(ret, ivy.NativeArray):
+            return ivy.Array(ret)
+        return ivy.to_ivy(ret, nested=True, include_derived={"tuple": True})
+
+    if "handle_exceptions" in applied:
+        _fast_path = ivy.handle_exceptions(_fast_path)
+
+    def _compile_layout(layout):
+        nonlocal array_like_positions
+        if array_like:
+            if array_like_positions is None:
+                array_like_positions = _array_like_positions(core_fn)
+            args_layout = layout[0]
+            if any(
+                i < len(args_layout) and args_layout[i] is not _array_leaf
+                for i in array_like_positions
+            ):
+                # non-array inputs need converting by the full wrapper chain
+                return None
+        return _args_builder(layout)
+
+    @functools.wraps(fn)
+    def _fast_path_dispatcher(*args, **kwargs):
+        if (check_nans and ivy.nan_policy != "nothing") or (
+            (to_native or to_ivy) and not ivy.array_mode
+        ):
+            return fn(*args, **kwargs)
+        scanned = _fast_path_layout(args, kwargs, ivy.NativeArray)
+        if scanned is None:
+            return fn(*args, **kwargs)
+        layout, leaves = scanned
+        try:
+            builder = dispatch_cache[layout]
+        except KeyError:
+            if len(dispatch_cache) >= DISPATCH_CACHE_SIZE:
+                dispatch_cache.clear()
+            builder = dispatch_cache[layout] = _compile_layout(layout)
+        if builder is None:
+            return fn(*args, **kwargs)
+        if to_native:
+            args, kwargs = builder(leaves)
+        return _fast_path(*args, **kwargs)
+
+    _fast_path_dispatcher.fast_path_dispatch = True
+    _fast_path_dispatcher.dispatch_cache = dispatch_cache
+    return _fast_path_dispatcher
+
+
 # Functions #
 
 
@@ -1134,6 +1390,9 @@ def _wrap_function(
             add_wrappers = backend_wrappers.get("to_add")
             skip_wrappers = backend_wrappers.get("to_skip")
 
+        # the wrappers up to `infer_dtype` already receive native arrays, so the fast
+        # path calls them directly and only the wrappers applied on top are tracked
+        core_fn, applied = to_wrap, []
         for attr in FN_DECORATORS:
             if hasattr(original, attr) and not hasattr(to_wrap, attr):
                 if partial_mixed and attr == "handle_partial_mixed_function":
@@ -1141,8 +1400,19 @@ def _wrap_function(
                     to_wrap = handle_partial_mixed_function(to_wrap)
                 if attr not in skip_wrappers:
                     to_wrap = getattr(ivy, attr)(to_wrap)
+                    applied.append(attr)
             if attr in add_wrappers:
                 to_wrap = getattr(ivy, attr)(to_wrap)
+                applied.append(attr)
+            if attr == "infer_dtype":
+                core_fn, applied = to_wrap, []
+
+        if (
+            not mixed_fn
+            and applied
+            and all(attr in FAST_PATH_DECORATORS for attr in applied)
+        ):
+            to_wrap = _fast_path_dispatch(to_wrap, core_fn, applied)
 
         # we should remove the all the decorators
         # after handle_mixed_fuction in FN_DECORATORS
@@ -17,3 +17,33 @@ def bind_custom_gradient_function(func, custom_grad_fn):
     func = jax.custom_vjp(func)
     func.defvjp(custom_forward, custom_backward)
     return inputs_to_native_arrays(func)
+
+
+def checkpoint(func):
+    # jax.checkpoint traces func abstractly, which the value-dependent branches of the
+    # ivy functions do not support, so func is rather rerun with jax.vjp in the
+    # backward pass of a custom vjp which saves only its inputs
+    def _checkpointed(*args, **kwargs):
+        leaves, tree = jax.tree_util.tree_flatten((args, kwargs))
+        idxs = [i for i, x in enumerate(leaves) if isinstance(x, jax.Array)]
+
+        def _func(*xs):
+            leaves_ = list(leaves)
+            for i, x in zip(idxs, xs):
+                leaves_[i] = x
+            args, kwargs = jax.tree_util.tree_unflatten(tree, leaves_)
+            return ivy.to_native(
+                func(*args, **kwargs), nested=True, include_derived=True
+            )
+
+        def _forward(*xs):
+            return _func(*xs), xs
+
+        def _backward(xs, upstream):
+            return jax.vjp(_func, *xs)[1](upstream)
+
+        checkpointed_func = jax.custom_vjp(_func)
+        checkpointed_func.defvjp(_forward, _backward)
+        return checkpointed_func(*[leaves[i] for i in idxs])
+
+    return inputs_to_native_arrays(_checkpointed)
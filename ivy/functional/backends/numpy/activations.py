@@ -27,7 +27,7 @@ def leaky_relu(
     complex_mode="jax",
     out: Optional[np.ndarray] = None,
 ) -> np.ndarray:
-    return np.asarray(np.where(x > 0, x, np.multiply(x, alpha)), x.dtype)
+    return np.asanyarray(np.where(x > 0, x, np.multiply(x, alpha)), x.dtype)
 
 
 @_scalar_output_to_0d_array
@@ -50,8 +50,8 @@ def sigmoid(
     x: np.ndarray, /, *, complex_mode="jax", out: Optional[np.ndarray] = None
 ) -> np.ndarray:
     if not ivy.is_array(x):
-        return np.asarray(1 / (1 + np.exp(-x)))
-    return np.asarray(1 / (1 + np.exp(-x))).astype(x.dtype)
+        return np.asanyarray(1 / (1 + np.exp(-x)))
+    return np.asanyarray(1 / (1 + np.exp(-x))).astype(x.dtype)
 
 
 def softmax(
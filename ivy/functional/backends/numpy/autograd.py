@@ -0,0 +1,1403 @@
+"""
+Tape-based reverse-mode automatic differentiation of NumPy code.
+
+While a :class:`_Tape` is active, the NumPy functions and ufuncs called in its thread on
+:class:`_TracedArray` instances, the array type of the NumPy backend variables, are
+recorded on the tape together with the vector-Jacobian products (VJPs) of their inputs,
+as registered with :func:`_defvjp`. Walking the tape backwards then propagates the
+cotangents of the outputs to the variables, releasing the intermediates saved by each
+operation as soon as its cotangent has been consumed.
+
+NumPy functions without a VJP are run on the traced arrays if they are written in
+Python, in which case the operations they are composed of are recorded. Otherwise, or if
+their outputs are not traced through those operations, their outputs are recorded with
+VJPs raising :class:`IvyNotImplementedException`, unless they are piecewise constant.
+"""
+
+# global
+import contextlib
+import functools
+import inspect
+import threading
+import numpy as np
+
+# local
+import ivy
+
+
+# Tape #
+# ---- #
+
+
+class _TapeStack(threading.local):
+    """The tapes currently recording in each thread, innermost last."""
+
+    def __init__(self):
+        self.tapes = []
+
+
+_stack = _TapeStack()
+
+
+class _Node:
+    """An operation recorded on the tape, or a variable if it has no parents."""
+
+    __slots__ = ("parents", "shape", "dtype")
+
+    def __init__(self, value, parents=()):
+        # pairs of the input nodes and the VJPs mapping the cotangent of the output
+        # to the cotangent of each of the inputs
+        self.parents = parents
+        self.shape = value.shape
+        self.dtype = value.dtype
+
+
+class _Tape:
+    """Record the operations on traced arrays while active, in the order they ran."""
+
+    def __init__(self):
+        self.nodes = []
+
+    def __enter__(self):
+        _stack.tapes.append(self)
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        _stack.tapes.remove(self)
+
+    def gradients(self, ys, xs, cotangents=None, retain_graph=False):
+        """
+        Compute the gradients of the outputs ys w.r.t. the traced arrays xs.
+
+        The cotangents of ys default to ones. Unless retain_graph is
+        set, or the operations are still needed by an enclosing tape,
+        the VJPs of each operation and the intermediates they hold are
+        released once they have been applied.
+        """
+        if cotangents is None:
+            cotangents = [np.ones_like(_raw(y)) for y in ys]
+        grads = dict()
+        for y, g in zip(ys, cotangents):
+            node = _grad_node(y)
+            if node is not None:
+                _accumulate(grads, node, g)
+        targets = set(_grad_node(x) for x in xs)
+        release = not retain_graph and not _stack.tapes
+        for node in reversed(self.nodes):
+            parents = node.parents
+            if release:
+                node.parents = ()
+            # cotangents are dropped once consumed, except for those requested
+            g = grads.get(node) if node in targets else grads.pop(node, None)
+            if g is None:
+                continue
+            for parent, vjp in parents:
+                _accumulate(grads, parent, vjp(g))
+        if release:
+            self.nodes = []
+        return [
+            grads[node] if node in grads else np.zeros_like(_raw(x))
+            for node, x in zip(map(_grad_node, xs), xs)
+        ]
+
+    def release(self):
+        """Release the operations recorded on the tape."""
+        if not _stack.tapes:
+            for node in self.nodes:
+                node.parents = ()
+        self.nodes = []
+
+
+@contextlib.contextmanager
+def _paused():
+    """Stop recording on the active tapes while in the context."""
+    tapes = _stack.tapes
+    _stack.tapes = []
+    try:
+        yield
+    finally:
+        _stack.tapes = tapes
+
+
+def _accumulate(grads, node, g):
+    g = _unbroadcast(np.asarray(g), node.shape).astype(node.dtype, copy=False)
+    grads[node] = grads[node] + g if node in grads else g
+
+
+def _unbroadcast(g, shape):
+    # sum the cotangent of a broadcast input over the broadcast dimensions
+    if g.shape == shape:
+        return g
+    if g.ndim > len(shape):
+        g = g.sum(axis=tuple(range(g.ndim - len(shape))))
+    axes = tuple(i for i, d in enumerate(shape) if d == 1 and g.shape[i] != 1)
+    if axes:
+        g = g.sum(axis=axes, keepdims=True)
+    return np.broadcast_to(g, shape)
+
+
+# Traced Arrays #
+# ------------- #
+
+
+class _TracedArray(np.ndarray):
+    """A NumPy array whose computations are recorded on the active tapes."""
+
+    def __array_finalize__(self, obj):
+        # views and copies not made through a recorded operation are constants
+        self._node = None
+
+    def __array_ufunc__(self, ufunc, method, *inputs, **kwargs):
+        out = kwargs.get("out")
+        raw_inputs = tuple(map(_raw, inputs))
+        if out is not None:
+            kwargs["out"] = tuple(map(_raw, out))
+            if _recording(inputs):
+                # inputs overwritten in place are saved for the VJPs before that
+                raw_inputs = tuple(
+                    np.copy(x) if any(np.may_share_memory(x, o) for o in out) else x
+                    for x in raw_inputs
+                )
+        ans = getattr(ufunc, method)(*raw_inputs, **kwargs)
+        if method == "__call__":
+            rules = _ufunc_vjps.get(ufunc)
+            params = inputs
+        elif method == "reduce":
+            rules = _reduce_vjps.get(ufunc)
+            params = _reduce_params(*inputs, **kwargs)
+        else:
+            rules = None
+        parents = []
+        if rules is not None and _recording(inputs):
+            raw_params = raw_inputs
+            saved = ans if out is None else np.copy(ans)
+            if method == "reduce":
+                params, raw_params = (params["array"],), (raw_params[0], params)
+            for i, rule in enumerate(rules):
+                node = _grad_node(params[i])
+                if node is not None:
+                    parents.append(
+                        (node, functools.partial(rule, ans=saved, args=raw_params))
+                    )
+        elif ufunc not in _constants and method != "at" and _recording(inputs):
+            name = "np.{}".format(ufunc.__name__)
+            if method != "__call__":
+                name = "{}.{}".format(name, method)
+            parents = _unsupported(name, inputs)
+        if out is not None and len(out) == 1:
+            # the result was written to out, which now holds the recorded output
+            return _rebind(out[0], ans, parents) if _stack.tapes else out[0]
+        if isinstance(ans, tuple):
+            return tuple(_record(y, parents) for y in ans)
+        return _record(ans, parents)
+
+    def __array_function__(self, func, types, args, kwargs):
+        if func in _vjps:
+            return _apply(func, func, args, kwargs)
+        if func in _constants or not _recording((args, kwargs)):
+            return func(*_raw_nest(args), **_raw_nest(kwargs))
+        if inspect.isfunction(getattr(func, "_implementation", None)):
+            # python implementations are differentiated through their calls, unless
+            # their outputs lost track of the traced arrays, e.g. through np.asarray
+            ans = super().__array_function__(func, types, args, kwargs)
+            if not _untraced(ans):
+                return ans
+        else:
+            ans = func(*_raw_nest(args), **_raw_nest(kwargs))
+        parents = _unsupported("np.{}".format(func.__name__), (args, kwargs))
+        if not isinstance(ans, (list, tuple)):
+            return _record(_raw(ans), parents) if _is_inexact_array(ans) else ans
+        return _rebuild(
+            ans,
+            [
+                (
+                    _record(_raw(y), parents)
+                    if _is_inexact_array(y) and not _is_watched(y)
+                    else y
+                )
+                for y in ans
+            ],
+        )
+
+    def __getitem__(self, key):
+        ans = self.view(np.ndarray)[_raw_nest(key)]
+        if _recording(self):
+            # scalars picked from a traced array are traced as 0-d arrays
+            ans = np.asarray(ans)
+            rule = functools.partial(_getitem_vjp, key=_raw_nest(key), shape=self.shape)
+            return _record(ans, [(self._node, rule)])
+        return ans
+
+    def __setitem__(self, key, value):
+        key = _raw_nest(key)
+        parents = []
+        if _recording((self, value)):
+            if self._node is not None:
+                parents.append((self._node, functools.partial(_setitem_vjp, key=key)))
+            if _grad_node(value) is not None:
+                parents.append((_grad_node(value), lambda g: np.asarray(g)[key]))
+        raw = self.view(np.ndarray)
+        raw[key] = _raw(value)
+        if _stack.tapes:
+            _rebind(self, raw, parents)
+
+    def astype(self, dtype, *args, **kwargs):
+        raw = self.view(np.ndarray)
+        ans = raw.astype(dtype, *args, **kwargs)
+        if ans is raw:
+            return self
+        if _recording(self):
+            return _record(ans, [(self._node, _identity)])
+        return ans
+
+    def copy(self, order="C"):
+        return np.copy(self, order=order)
+
+    def reshape(self, *shape, order="C"):
+        if len(shape) == 1 and not isinstance(shape[0], int):
+            shape = shape[0]
+        return np.reshape(self, shape, order=order)
+
+    def transpose(self, *axes):
+        if len(axes) == 1 and not isinstance(axes[0], int):
+            axes = axes[0]
+        return np.transpose(self, axes or None)
+
+    @property
+    def T(self):
+        return np.transpose(self)
+
+    @property
+    def real(self):
+        return self if not np.iscomplexobj(self) else np.real(self)
+
+    def sort(self, axis=-1, kind=None, order=None):
+        self[...] = np.sort(self, axis=axis, kind=kind, order=order)
+
+    def flatten(self, order="C"):
+        return np.ravel(np.copy(self), order=order)
+
+    def ravel(self, order="C"):
+        return np.ravel(self, order=order)
+
+    def squeeze(self, axis=None):
+        return np.squeeze(self, axis=axis)
+
+    def swapaxes(self, axis1, axis2):
+        return np.swapaxes(self, axis1, axis2)
+
+    def sum(self, *args, **kwargs):
+        return np.sum(self, *args, **kwargs)
+
+    def mean(self, *args, **kwargs):
+        return np.mean(self, *args, **kwargs)
+
+    def prod(self, *args, **kwargs):
+        return np.prod(self, *args, **kwargs)
+
+    def max(self, *args, **kwargs):
+        return np.max(self, *args, **kwargs)
+
+    def min(self, *args, **kwargs):
+        return np.min(self, *args, **kwargs)
+
+    def var(self, *args, **kwargs):
+        return np.var(self, *args, **kwargs)
+
+    def std(self, *args, **kwargs):
+        return np.std(self, *args, **kwargs)
+
+    def cumsum(self, *args, **kwargs):
+        return np.cumsum(self, *args, **kwargs)
+
+    def cumprod(self, *args, **kwargs):
+        return np.cumprod(self, *args, **kwargs)
+
+    def clip(self, *args, **kwargs):
+        return np.clip(self, *args, **kwargs)
+
+    def repeat(self, *args, **kwargs):
+        return np.repeat(self, *args, **kwargs)
+
+    def take(self, *args, **kwargs):
+        return np.take(self, *args, **kwargs)
+
+    def diagonal(self, *args, **kwargs):
+        return np.diagonal(self, *args, **kwargs)
+
+    def trace(self, *args, **kwargs):
+        return np.trace(self, *args, **kwargs)
+
+    def dot(self, b, out=None):
+        return np.dot(self, b, out=out)
+
+
+def _raw(x):
+    if isinstance(x, ivy.Array):
+        x = x.data
+    return x.view(np.ndarray) if isinstance(x, _TracedArray) else x
+
+
+def _raw_nest(x):
+    if isinstance(x, (list, tuple)):
+        return type(x)(_raw_nest(v) for v in x)
+    if isinstance(x, dict):
+        return {k: _raw_nest(v) for k, v in x.items()}
+    return _raw(x)
+
+
+def _grad_node(x):
+    # the node of a traced floating point array, through which gradients can flow
+    if isinstance(x, ivy.Array):
+        x = x.data
+    if isinstance(x, _TracedArray) and np.issubdtype(x.dtype, np.floating):
+        return x._node
+    return None
+
+
+def _recording(x):
+    # whether any of the traced arrays in the nest x is to be recorded
+    if not _stack.tapes:
+        return False
+    if isinstance(x, (list, tuple)):
+        return any(_recording(v) for v in x)
+    if isinstance(x, dict):
+        return any(_recording(v) for v in x.values())
+    return _grad_node(x) is not None
+
+
+def _record(ans, parents):
+    """Record the operation computing ans from the given parents on the tapes."""
+    if parents and np.iscomplexobj(ans):
+        # complex arrays are not traced, so their gradients would silently be lost
+        _not_implemented("complex outputs")(None)
+    if not parents or not np.issubdtype(np.result_type(ans), np.floating):
+        return ans
+    ans = np.asarray(ans)
+    node = _Node(ans, tuple(parents))
+    for tape in _stack.tapes:
+        tape.nodes.append(node)
+    ans = ans.view(_TracedArray)
+    ans._node = node
+    return ans
+
+
+def _rebind(x, ans, parents):
+    # an array updated in place now holds the output of the recorded operation
+    if isinstance(x, _TracedArray):
+        x._node = None
+        if parents and np.issubdtype(x.dtype, np.floating):
+            x._node = _record(np.asarray(ans), parents)._node
+    return x
+
+
+def _watch(x):
+    """Return a traced view of x, recorded as a variable without parents."""
+    ret = np.asarray(x).view(_TracedArray)
+    ret._node = _Node(ret)
+    return ret
+
+
+def _is_watched(x):
+    return isinstance(x, _TracedArray) and x._node is not None
+
+
+# VJP Registration #
+# ---------------- #
+
+# VJPs of the numpy functions and primitives, keyed by the name of the parameter
+_vjps = dict()
+
+# the signatures used to bind the arguments of the functions with VJPs
+_signatures = dict()
+
+# the functions and ufuncs whose outputs are piecewise constant, or not computed from
+# the values of their inputs, and so have no gradient
+_constants = {
+    np.zeros_like,
+    np.ones_like,
+    np.full_like,
+    np.empty_like,
+    np.round,
+    np.around,
+    np.fix,
+    np.floor,
+    np.ceil,
+    np.trunc,
+    np.rint,
+    np.sign,
+    np.floor_divide,
+    np.heaviside,
+    np.spacing,
+}
+
+# VJPs of the ufuncs when called and reduced, one for each of the inputs
+_ufunc_vjps = dict()
+_reduce_vjps = dict()
+
+
+def _defvjp(fn, signature=None, **vjps):
+    """
+    Register the VJPs of a numpy function, or of a function made primitive.
+
+    Each VJP is registered with the name of the parameter it
+    differentiates and is called as vjp(g, ans, p), with the cotangent g
+    of the output ans and the bound arguments p, or as vjp(g, ans, p, i)
+    for the i-th array of a sequence parameter. The VJPs of functions
+    returning a tuple of arrays are called with the cotangent of each of
+    them and its index k. The signature of the functions implemented in
+    C is given by a function with the same parameters.
+    """
+    _vjps[fn] = vjps
+    _signatures[fn] = inspect.signature(signature or fn)
+
+
+def _defvjp_ufunc(ufunc, *vjps):
+    """Register the VJPs of the inputs of a ufunc, called as vjp(g, ans, *inputs)."""
+    _ufunc_vjps[ufunc] = tuple(
+        lambda g, ans, args, vjp=vjp: vjp(g, ans, *args) for vjp in vjps
+    )
+
+
+def _primitive(fn):
+    """Record the calls of fn on traced arrays as single operations."""
+
+    @functools.wraps(fn)
+    def _primitive_fn(*args, **kwargs):
+        if not _recording((args, kwargs)):
+            return fn(*_raw_nest(args), **_raw_nest(kwargs))
+        return _apply(_primitive_fn, fn, args, kwargs)
+
+    return _primitive_fn
+
+
+def _apply(key, fn, args, kwargs):
+    ans = fn(*_raw_nest(args), **_raw_nest(kwargs))
+    if not _recording((args, kwargs)):
+        return ans
+    bound = _signatures[key].bind(*args, **kwargs)
+    bound.apply_defaults()
+    raw = {k: _raw_nest(v) for k, v in bound.arguments.items()}
+    if isinstance(ans, (list, tuple)):
+        # the outputs are recorded separately, their VJPs given the output index k
+        ys = [
+            _record(y, _parents(key, bound, raw, ans, k=k)) for k, y in enumerate(ans)
+        ]
+        return _rebuild(ans, ys)
+    if not isinstance(ans, (np.ndarray, np.generic)):
+        return ans
+    return _record(ans, _parents(key, bound, raw, ans))
+
+
+def _parents(key, bound, raw, ans, **kwargs):
+    parents = []
+    for name, vjp in _vjps[key].items():
+        value = bound.arguments.get(name)
+        if isinstance(value, (list, tuple)):
+            for i, v in enumerate(value):
+                if _grad_node(v) is not None:
+                    rule = functools.partial(vjp, ans=ans, p=raw, i=i, **kwargs)
+                    parents.append((_grad_node(v), rule))
+        elif _grad_node(value) is not None:
+            rule = functools.partial(vjp, ans=ans, p=raw, **kwargs)
+            parents.append((_grad_node(value), rule))
+    return parents
+
+
+def _rebuild(ans, ys):
+    # the list, tuple or named tuple ans with the values ys
+    return ans._make(ys) if hasattr(ans, "_make") else type(ans)(ys)
+
+
+def _grad_nodes(x):
+    # the distinct nodes of the traced arrays in the nest x
+    if isinstance(x, (list, tuple)):
+        nodes = [n for v in x for n in _grad_nodes(v)]
+    elif isinstance(x, dict):
+        nodes = [n for v in x.values() for n in _grad_nodes(v)]
+    else:
+        nodes = [_grad_node(x)] if _grad_node(x) is not None else []
+    return list(dict.fromkeys(nodes))
+
+
+def _untraced(ans):
+    # whether any of the float outputs of an operation on traced arrays is untraced
+    ys = ans if isinstance(ans, (list, tuple)) else [ans]
+    return any(_is_inexact_array(y) and not _is_watched(y) for y in ys)
+
+
+def _unsupported(name, inputs):
+    """Return the parents of an operation without VJPs, raising if differentiated."""
+    return [(node, _not_implemented(name)) for node in _grad_nodes(inputs)]
+
+
+def _reduce_params(array, axis=0, dtype=None, out=None, keepdims=False, *_, **__):
+    return dict(array=array, axis=axis, keepdims=keepdims)
+
+
+# Checkpointing #
+# ------------- #
+
+
+def _checkpoint(func):
+    """
+    Record the calls of func as single operations which recompute its intermediates.
+
+    The intermediates of func are not saved for the backward pass, but
+    recomputed from its inputs by running func again on a separate tape
+    when the cotangents of its outputs are propagated. Only the traced
+    arrays passed in the (nested) arguments of func are differentiated,
+    and the global random state is restored for the recomputation such
+    that random operations, such as dropout, draw the same values.
+    """
+
+    @functools.wraps(func)
+    def _checkpointed_fn(*args, **kwargs):
+        if not _recording((args, kwargs)):
+            return func(*args, **kwargs)
+        inputs = [args, kwargs]
+        x_idxs = ivy.nested_argwhere(inputs, lambda x: _grad_node(x) is not None)
+        xs = [_raw(x) for x in ivy.multi_index_nest(inputs, x_idxs)]
+        random_state = np.random.get_state()
+        with _paused():
+            inputs = _replace_nest(inputs, x_idxs, xs)
+            ret = func(*inputs[0], **inputs[1])
+        y_idxs = _float_array_idxs(ret)
+        if not y_idxs:
+            return ret
+        ys = [np.asarray(y) for y in _index_nest(ret, y_idxs)]
+        offsets = np.cumsum([0] + [y.size for y in ys])
+
+        def _recompute(g):
+            watched = [_watch(x) for x in xs]
+            state = np.random.get_state()
+            np.random.set_state(random_state)
+            with _paused():
+                with _Tape() as tape:
+                    inputs = _replace_nest([args, kwargs], x_idxs, watched)
+                    ret = func(*inputs[0], **inputs[1])
+                cotangents = [
+                    g[begin:end].reshape(y.shape)
+                    for begin, end, y in zip(offsets[:-1], offsets[1:], ys)
+                ]
+                grads = tape.gradients(_index_nest(ret, y_idxs), watched, cotangents)
+            np.random.set_state(state)
+            return grads
+
+        grads = []
+
+        def _recompute_vjp(g, i):
+            # the VJPs of all the inputs share a single recomputation
+            if i == 0:
+                grads[:] = _recompute(g)
+            ret = grads[i]
+            if i == len(xs) - 1:
+                grads.clear()
+            return ret
+
+        # the cotangents of all the outputs are gathered in a single flat node, as
+        # inputs of the recomputation
+        packed = _Node(
+            np.broadcast_to(np.zeros((), np.result_type(*ys)), offsets[-1:]),
+            tuple(
+                (_grad_node(x), functools.partial(_recompute_vjp, i=i))
+                for i, x in enumerate(ivy.multi_index_nest([args, kwargs], x_idxs))
+            ),
+        )
+        for tape in _stack.tapes:
+            tape.nodes.append(packed)
+        ys = [
+            _record(
+                y,
+                [(packed, functools.partial(_pack_vjp, begin=begin, size=offsets[-1]))],
+            )
+            for begin, y in zip(offsets[:-1], ys)
+        ]
+        return ys[0] if y_idxs == [[]] else _replace_nest(ret, y_idxs, ys)
+
+    return _checkpointed_fn
+
+
+def _pack_vjp(g, begin, size):
+    ret = np.zeros(size, g.dtype)
+    ret[begin : begin + g.size] = g.reshape(-1)
+    return ret
+
+
+def _is_float_array(x):
+    return isinstance(x, (np.ndarray, np.generic)) and np.issubdtype(
+        x.dtype, np.floating
+    )
+
+
+def _is_inexact_array(x):
+    return isinstance(x, (np.ndarray, np.generic)) and np.issubdtype(
+        x.dtype, np.inexact
+    )
+
+
+def _float_array_idxs(x):
+    if isinstance(x, (np.ndarray, np.generic)):
+        return [[]] if _is_float_array(x) else []
+    return ivy.nested_argwhere(x, _is_float_array)
+
+
+def _index_nest(x, idxs):
+    return [x] if idxs == [[]] else ivy.multi_index_nest(x, idxs)
+
+
+def _replace_nest(x, idxs, values):
+    return ivy.set_nest_at_indices(x, idxs, values, shallow=False)
+
+
+# Helpers #
+# ------- #
+
+
+def _identity(g):
+    return g
+
+
+def _getitem_vjp(g, key, shape):
+    ret = np.zeros(shape, g.dtype)
+    if _is_basic_index(key):
+        ret[key] = g
+    else:
+        np.add.at(ret, key, g)
+    return ret
+
+
+def _setitem_vjp(g, key):
+    g = np.array(g)
+    g[key] = 0
+    return g
+
+
+def _is_basic_index(key):
+    key = key if isinstance(key, tuple) else (key,)
+    return all(
+        k is None or k is Ellipsis or isinstance(k, (slice, int, np.integer))
+        for k in key
+        if not isinstance(k, bool)
+    ) and not any(isinstance(k, bool) for k in key)
+
+
+def _keepdims(p):
+    return p.get("keepdims") is True
+
+
+def _axes(axis, ndim):
+    if axis is None:
+        return tuple(range(ndim))
+    axis = axis if isinstance(axis, (tuple, list)) else (axis,)
+    return tuple(a % ndim for a in axis)
+
+
+def _unreduce(g, ans, p, name="a"):
+    # broadcast the cotangent and output of a reduction back to the input shape
+    x = p[name]
+    if not _keepdims(p):
+        axes = _axes(p.get("axis"), np.ndim(x))
+        g = np.expand_dims(g, axes)
+        ans = np.expand_dims(ans, axes)
+    return np.broadcast_to(g, np.shape(x)), np.broadcast_to(ans, np.shape(x))
+
+
+def _count(p, name="a"):
+    x = p[name]
+    return np.prod([np.shape(x)[a] for a in _axes(p.get("axis"), np.ndim(x))])
+
+
+def _swap(x):
+    return np.swapaxes(x, -1, -2)
+
+
+def _extremum_vjp(g, ans, p):
+    g, ans = _unreduce(g, ans, p)
+    mask = p["a"] == ans
+    counts = mask.sum(axis=_axes(p.get("axis"), np.ndim(p["a"])), keepdims=True)
+    return g * mask / counts
+
+
+def _not_implemented(name):
+    def _vjp(g, *_, **__):
+        raise ivy.utils.exceptions.IvyNotImplementedException(
+            "the gradient of {} is not supported by the numpy backend".format(name)
+        )
+
+    return _vjp
+
+
+# Elementwise #
+# ----------- #
+
+_defvjp_ufunc(np.add, lambda g, ans, x, y: g, lambda g, ans, x, y: g)
+_defvjp_ufunc(np.subtract, lambda g, ans, x, y: g, lambda g, ans, x, y: -g)
+_defvjp_ufunc(np.multiply, lambda g, ans, x, y: g * y, lambda g, ans, x, y: g * x)
+_defvjp_ufunc(
+    np.true_divide, lambda g, ans, x, y: g / y, lambda g, ans, x, y: -g * ans / y
+)
+_defvjp_ufunc(np.negative, lambda g, ans, x: -g)
+_defvjp_ufunc(np.positive, lambda g, ans, x: g)
+_defvjp_ufunc(np.conjugate, lambda g, ans, x: g)
+_defvjp_ufunc(
+    np.power,
+    lambda g, ans, x, y: g * y * np.power(x, np.subtract(y, 1)),
+    lambda g, ans, x, y: g * ans * np.log(np.where(x > 0, x, 1)),
+)
+_ufunc_vjps[np.float_power] = _ufunc_vjps[np.power]
+_defvjp_ufunc(np.square, lambda g, ans, x: 2 * g * x)
+_defvjp_ufunc(np.sqrt, lambda g, ans, x: g / (2 * ans))
+_defvjp_ufunc(np.cbrt, lambda g, ans, x: g / (3 * ans**2))
+_defvjp_ufunc(np.reciprocal, lambda g, ans, x: -g * ans**2)
+_defvjp_ufunc(np.exp, lambda g, ans, x: g * ans)
+_defvjp_ufunc(np.exp2, lambda g, ans, x: g * ans * np.log(2))
+_defvjp_ufunc(np.expm1, lambda g, ans, x: g * (ans + 1))
+_defvjp_ufunc(np.log, lambda g, ans, x: g / x)
+_defvjp_ufunc(np.log2, lambda g, ans, x: g / (x * np.log(2)))
+_defvjp_ufunc(np.log10, lambda g, ans, x: g / (x * np.log(10)))
+_defvjp_ufunc(np.log1p, lambda g, ans, x: g / (1 + x))
+_defvjp_ufunc(
+    np.logaddexp,
+    lambda g, ans, x, y: g * np.exp(x - ans),
+    lambda g, ans, x, y: g * np.exp(y - ans),
+)
+_defvjp_ufunc(
+    np.logaddexp2,
+    lambda g, ans, x, y: g * np.exp2(x - ans),
+    lambda g, ans, x, y: g * np.exp2(y - ans),
+)
+_defvjp_ufunc(np.absolute, lambda g, ans, x: g * np.sign(x))
+_defvjp_ufunc(np.fabs, lambda g, ans, x: g * np.sign(x))
+_defvjp_ufunc(np.sin, lambda g, ans, x: g * np.cos(x))
+_defvjp_ufunc(np.cos, lambda g, ans, x: -g * np.sin(x))
+_defvjp_ufunc(np.tan, lambda g, ans, x: g * (1 + ans**2))
+_defvjp_ufunc(np.arcsin, lambda g, ans, x: g / np.sqrt(1 - x**2))
+_defvjp_ufunc(np.arccos, lambda g, ans, x: -g / np.sqrt(1 - x**2))
+_defvjp_ufunc(np.arctan, lambda g, ans, x: g / (1 + x**2))
+_defvjp_ufunc(np.sinh, lambda g, ans, x: g * np.cosh(x))
+_defvjp_ufunc(np.cosh, lambda g, ans, x: g * np.sinh(x))
+_defvjp_ufunc(np.tanh, lambda g, ans, x: g * (1 - ans**2))
+_defvjp_ufunc(np.arcsinh, lambda g, ans, x: g / np.sqrt(x**2 + 1))
+_defvjp_ufunc(np.arccosh, lambda g, ans, x: g / np.sqrt(x**2 - 1))
+_defvjp_ufunc(np.arctanh, lambda g, ans, x: g / (1 - x**2))
+_defvjp_ufunc(
+    np.arctan2,
+    lambda g, ans, y, x: g * x / (x**2 + y**2),
+    lambda g, ans, y, x: -g * y / (x**2 + y**2),
+)
+_defvjp_ufunc(
+    np.hypot, lambda g, ans, x, y: g * x / ans, lambda g, ans, x, y: g * y / ans
+)
+_defvjp_ufunc(
+    np.remainder,
+    lambda g, ans, x, y: g,
+    lambda g, ans, x, y: -g * np.floor_divide(x, y),
+)
+_defvjp_ufunc(
+    np.fmod, lambda g, ans, x, y: g, lambda g, ans, x, y: -g * np.trunc(x / y)
+)
+
+
+def _maximum_vjp(first):
+    # ties split the cotangent evenly between the inputs
+    def _vjp(g, ans, x, y):
+        mask = (x == ans) if first else (y == ans)
+        return g * mask / ((x == ans).astype(np.int8) + (y == ans))
+
+    return _vjp
+
+
+for _ufunc in (np.maximum, np.minimum, np.fmax, np.fmin):
+    _defvjp_ufunc(_ufunc, _maximum_vjp(True), _maximum_vjp(False))
+
+
+_defvjp_ufunc(
+    np.core.umath.clip,
+    lambda g, ans, x, lo, hi: g * ((x >= lo) & (x <= hi)),
+    lambda g, ans, x, lo, hi: g * (x < lo),
+    lambda g, ans, x, lo, hi: g * (x > hi),
+)
+
+
+def _matmul_vjp(first):
+    def _vjp(g, ans, x, y):
+        # vectors are promoted to matrices, and the cotangent along with them
+        x2 = x[None] if np.ndim(x) == 1 else x
+        y2 = y[:, None] if np.ndim(y) == 1 else y
+        g = g[..., None, :] if np.ndim(x) == 1 else g
+        g = g[..., None] if np.ndim(y) == 1 else g
+        if first:
+            ret = np.matmul(g, _swap(y2))
+            return ret[..., 0, :] if np.ndim(x) == 1 else ret
+        ret = np.matmul(_swap(x2), g)
+        return ret[..., 0] if np.ndim(y) == 1 else ret
+
+    return _vjp
+
+
+_defvjp_ufunc(np.matmul, _matmul_vjp(True), _matmul_vjp(False))
+
+
+def _where_vjp(first):
+    def _vjp(g, ans, p):
+        return (
+            np.where(p["condition"], g, 0) if first else np.where(p["condition"], 0, g)
+        )
+
+    return _vjp
+
+
+_defvjp(
+    np.where,
+    signature=lambda condition, x=None, y=None: None,
+    x=_where_vjp(True),
+    y=_where_vjp(False),
+)
+
+
+def _clip_vjp(name):
+    def _vjp(g, ans, p):
+        x, lo, hi = p["a"], p["a_min"], p["a_max"]
+        if name == "a":
+            mask = np.ones(np.shape(x), bool)
+            mask = mask & (x >= lo) if lo is not None else mask
+            mask = mask & (x <= hi) if hi is not None else mask
+            return g * mask
+        return g * (x < lo) if name == "a_min" else g * (x > hi)
+
+    return _vjp
+
+
+_defvjp(
+    np.clip,
+    a=_clip_vjp("a"),
+    a_min=_clip_vjp("a_min"),
+    a_max=_clip_vjp("a_max"),
+)
+
+
+# Reductions #
+# ---------- #
+
+_reduce_vjps[np.add] = (
+    lambda g, ans, args: _unreduce(
+        g, ans, dict(a=args[0], axis=args[1]["axis"], keepdims=args[1]["keepdims"])
+    )[0],
+)
+_reduce_vjps[np.maximum] = _reduce_vjps[np.minimum] = (
+    lambda g, ans, args: _extremum_vjp(
+        g, ans, dict(a=args[0], axis=args[1]["axis"], keepdims=args[1]["keepdims"])
+    ),
+)
+_defvjp(np.sum, a=lambda g, ans, p: _unreduce(g, ans, p)[0])
+_defvjp(np.mean, a=lambda g, ans, p: _unreduce(g, ans, p)[0] / _count(p))
+
+
+def _prod_vjp(g, ans, p):
+    g, ans = _unreduce(g, ans, p)
+    return g * ans / p["a"]
+
+
+_defvjp(np.prod, a=_prod_vjp)
+for _fn in (np.max, np.amax, np.min, np.amin):
+    _defvjp(_fn, a=_extremum_vjp)
+
+
+def _var_vjp(g, ans, p):
+    x = p["a"]
+    g, _ = _unreduce(g, ans, p)
+    mean = np.mean(x, axis=p.get("axis"), keepdims=True)
+    return 2 * g * (x - mean) / (_count(p) - p["ddof"])
+
+
+_defvjp(np.var, a=_var_vjp)
+_defvjp(
+    np.std,
+    a=lambda g, ans, p: _var_vjp(g / (2 * np.where(ans == 0, 1, ans)), ans, p),
+)
+
+
+def _cumsum_vjp(g, ans, p):
+    if p["axis"] is None:
+        return np.flip(np.cumsum(np.flip(g))).reshape(np.shape(p["a"]))
+    axis = p["axis"]
+    return np.flip(np.cumsum(np.flip(g, axis), axis), axis)
+
+
+_defvjp(np.cumsum, a=_cumsum_vjp)
+
+
+def _cumprod_vjp(g, ans, p):
+    # each input scales the following outputs, the inputs being assumed nonzero
+    x, axis = p["a"], p["axis"]
+    if axis is None:
+        x, axis = np.ravel(x), 0
+    ret = np.flip(np.cumsum(np.flip(g * ans, axis), axis), axis) / x
+    return ret.reshape(np.shape(p["a"]))
+
+
+_defvjp(np.cumprod, a=_cumprod_vjp)
+_defvjp(
+    np.broadcast_arrays,
+    args=lambda g, ans, p, i, k: g if i == k else np.zeros(np.shape(p["args"][i])),
+)
+
+
+# Manipulation #
+# ------------ #
+
+_defvjp(np.reshape, a=lambda g, ans, p: np.reshape(g, np.shape(p["a"])))
+_defvjp(np.ravel, a=lambda g, ans, p: np.reshape(g, np.shape(p["a"])))
+_defvjp(np.squeeze, a=lambda g, ans, p: np.reshape(g, np.shape(p["a"])))
+_defvjp(np.expand_dims, a=lambda g, ans, p: np.reshape(g, np.shape(p["a"])))
+_defvjp(np.copy, a=lambda g, ans, p: g)
+_defvjp(np.broadcast_to, array=lambda g, ans, p: g)
+_defvjp(
+    np.transpose,
+    a=lambda g, ans, p: np.transpose(
+        g, None if p["axes"] is None else np.argsort(p["axes"])
+    ),
+)
+_defvjp(
+    np.swapaxes,
+    a=lambda g, ans, p: np.swapaxes(g, p["axis1"], p["axis2"]),
+)
+_defvjp(
+    np.moveaxis,
+    a=lambda g, ans, p: np.moveaxis(g, p["destination"], p["source"]),
+)
+_defvjp(np.flip, m=lambda g, ans, p: np.flip(g, p["axis"]))
+_defvjp(
+    np.roll,
+    a=lambda g, ans, p: np.roll(g, np.negative(p["shift"]), p["axis"]),
+)
+
+
+def _concatenate_vjp(g, ans, p, i):
+    arrays, axis = p["arrays"], p["axis"]
+    if axis is None:
+        start = sum(np.size(x) for x in arrays[:i])
+        return g[start : start + np.size(arrays[i])].reshape(np.shape(arrays[i]))
+    axis = axis % g.ndim
+    start = sum(np.shape(x)[axis] for x in arrays[:i])
+    index = (slice(None),) * axis + (slice(start, start + np.shape(arrays[i])[axis]),)
+    return g[index]
+
+
+_defvjp(
+    np.concatenate,
+    signature=lambda arrays, axis=0, out=None, *, dtype=None, casting=None: None,
+    arrays=_concatenate_vjp,
+)
+_defvjp(np.stack, arrays=lambda g, ans, p, i: np.take(g, i, axis=p["axis"]))
+
+
+def _tile_vjp(g, ans, p):
+    shape = np.shape(p["A"])
+    reps = (p["reps"],) if isinstance(p["reps"], int) else tuple(p["reps"])
+    ndim = max(len(shape), len(reps))
+    shape = (1,) * (ndim - len(shape)) + shape
+    reps = (1,) * (ndim - len(reps)) + reps
+    g = g.reshape([d for r, s in zip(reps, shape) for d in (r, s)])
+    return g.sum(axis=tuple(range(0, 2 * ndim, 2))).reshape(np.shape(p["A"]))
+
+
+_defvjp(np.tile, A=_tile_vjp)
+
+
+def _repeat_vjp(g, ans, p):
+    x, axis = p["a"], p["axis"]
+    if axis is None:
+        x = np.ravel(x)
+        axis = 0
+    index = np.repeat(np.arange(np.shape(x)[axis]), p["repeats"])
+    ret = np.zeros(np.moveaxis(x, axis, 0).shape, g.dtype)
+    np.add.at(ret, index, np.moveaxis(g, axis, 0))
+    return np.moveaxis(ret, 0, axis).reshape(np.shape(p["a"]))
+
+
+_defvjp(np.repeat, a=_repeat_vjp)
+
+
+def _pad_vjp(g, ans, p):
+    if p["mode"] != "constant":
+        return _not_implemented("np.pad with mode {}".format(p["mode"]))(g, ans, p)
+    pad_width = np.broadcast_to(np.asarray(p["pad_width"]), (g.ndim, 2))
+    return g[tuple(slice(b, d - a) for (b, a), d in zip(pad_width, g.shape))]
+
+
+_defvjp(np.pad, array=_pad_vjp)
+
+
+def _sliding_window_view_vjp(g, ans, p):
+    x = p["x"]
+    window = tuple(np.atleast_1d(p["window_shape"]))
+    axis = range(np.ndim(x)) if p["axis"] is None else np.atleast_1d(p["axis"])
+    ret = np.zeros(np.shape(x), g.dtype)
+    for offset in np.ndindex(*window):
+        # each window position covers a shifted slice of the input
+        starts = [0] * np.ndim(x)
+        for a, o in zip(axis, offset):
+            starts[a % np.ndim(x)] += o
+        index = tuple(slice(b, b + d) for b, d in zip(starts, ans.shape))
+        ret[index] += g[(Ellipsis,) + offset]
+    return ret
+
+
+_defvjp(np.lib.stride_tricks.sliding_window_view, x=_sliding_window_view_vjp)
+
+
+def _take_vjp(g, ans, p):
+    x, axis = p["a"], p["axis"]
+    ret = np.zeros(np.size(x) if axis is None else np.shape(x), g.dtype)
+    axis = 0 if axis is None else axis % np.ndim(x)
+    np.add.at(ret, (slice(None),) * axis + (p["indices"],), g)
+    return ret.reshape(np.shape(x))
+
+
+_defvjp(np.take, a=_take_vjp)
+
+
+def _along_axis_index(indices, axis):
+    # the full fancy index selecting along axis with the given indices
+    shape = np.shape(indices)
+    return tuple(
+        (
+            indices
+            if i == axis
+            else np.arange(d).reshape((1,) * i + (d,) + (1,) * (len(shape) - i - 1))
+        )
+        for i, d in enumerate(shape)
+    )
+
+
+def _take_along_axis_vjp(g, ans, p):
+    x, indices, axis = p["arr"], p["indices"], p["axis"]
+    if axis is None:
+        ret = np.zeros(np.size(x), g.dtype)
+        np.add.at(ret, indices, g)
+        return ret.reshape(np.shape(x))
+    ret = np.zeros(np.shape(x), g.dtype)
+    np.add.at(ret, _along_axis_index(indices, axis % np.ndim(x)), g)
+    return ret
+
+
+_defvjp(np.take_along_axis, arr=_take_along_axis_vjp)
+
+
+def _sort_vjp(g, ans, p):
+    x, axis = p["a"], p["axis"]
+    if axis is None:
+        x = np.ravel(x)
+        axis = -1
+    ret = np.zeros(np.shape(x), g.dtype)
+    np.put_along_axis(ret, np.argsort(x, axis=axis, kind="stable"), g, axis)
+    return ret.reshape(np.shape(p["a"]))
+
+
+_defvjp(np.sort, a=_sort_vjp)
+
+
+def _diagonal_index(shape, offset):
+    n = min(shape[-2] - max(-offset, 0), shape[-1] - max(offset, 0))
+    n = max(n, 0)
+    return (
+        Ellipsis,
+        np.arange(n) + max(-offset, 0),
+        np.arange(n) + max(offset, 0),
+    )
+
+
+def _diagonal_vjp(g, ans, p):
+    ret = np.zeros(np.shape(p["a"]), g.dtype)
+    view = np.moveaxis(ret, (p["axis1"], p["axis2"]), (-2, -1))
+    view[_diagonal_index(view.shape, p["offset"])] = g
+    return ret
+
+
+def _trace_vjp(g, ans, p):
+    ret = np.zeros(np.shape(p["a"]), np.result_type(g))
+    view = np.moveaxis(ret, (p["axis1"], p["axis2"]), (-2, -1))
+    view[_diagonal_index(view.shape, p["offset"])] = np.asarray(g)[..., None]
+    return ret
+
+
+_defvjp(np.diagonal, a=_diagonal_vjp)
+_defvjp(np.trace, a=_trace_vjp)
+
+
+# Linear Algebra #
+# -------------- #
+
+
+def _dot_vjp(first):
+    def _vjp(g, ans, p):
+        a, b = p["a"], p["b"]
+        if np.ndim(a) == 0 or np.ndim(b) == 0:
+            # a product with a scalar, summed back by _unbroadcast if needed
+            return g * b if first else g * a
+        if np.ndim(b) == 1:
+            if first:
+                return np.asarray(g)[..., None] * b
+            return np.tensordot(a, g, axes=(range(np.ndim(a) - 1), range(np.ndim(g))))
+        # a[..., k] @ b[..., k, j] contracts the last axis of a with the second to
+        # last axis of b, the output axes of a coming first
+        if first:
+            b_axes = list(range(np.ndim(b) - 2)) + [np.ndim(b) - 1]
+            return np.tensordot(g, b, axes=(range(np.ndim(a) - 1, g.ndim), b_axes))
+        ret = np.tensordot(a, g, axes=(range(np.ndim(a) - 1), range(np.ndim(a) - 1)))
+        return np.moveaxis(ret, 0, -2)
+
+    return _vjp
+
+
+_defvjp(
+    np.dot,
+    signature=lambda a, b, out=None: None,
+    a=_dot_vjp(True),
+    b=_dot_vjp(False),
+)
+_defvjp(
+    np.outer,
+    a=lambda g, ans, p: (g @ np.ravel(p["b"])).reshape(np.shape(p["a"])),
+    b=lambda g, ans, p: (np.ravel(p["a"]) @ g).reshape(np.shape(p["b"])),
+)
+
+
+def _tensordot_vjp(first):
+    def _vjp(g, ans, p):
+        a, b, axes = p["a"], p["b"], p["axes"]
+        if isinstance(axes, int):
+            axes = (range(np.ndim(a) - axes, np.ndim(a)), range(axes))
+        axes_a = [i % np.ndim(a) for i in np.atleast_1d(axes[0])]
+        axes_b = [i % np.ndim(b) for i in np.atleast_1d(axes[1])]
+        free_a = [i for i in range(np.ndim(a)) if i not in axes_a]
+        free_b = [i for i in range(np.ndim(b)) if i not in axes_b]
+        if first:
+            # the free axes of a followed by the contracted axes in the order of b
+            ret = np.tensordot(g, b, axes=(range(len(free_a), g.ndim), free_b))
+            order = free_a + [axes_a[k] for k in np.argsort(axes_b)]
+        else:
+            ret = np.tensordot(a, g, axes=(free_a, range(len(free_a))))
+            order = [axes_b[k] for k in np.argsort(axes_a)] + free_b
+        return np.transpose(ret, np.argsort(order))
+
+    return _vjp
+
+
+_defvjp(np.tensordot, a=_tensordot_vjp(True), b=_tensordot_vjp(False))
+
+
+def _einsum_vjp(g, ans, p, i):
+    operands = list(p["operands"])
+    if not isinstance(operands[0], str) or "..." in operands[0]:
+        return _not_implemented("np.einsum without explicit subscripts")(g, ans, p)
+    subscripts = operands.pop(0).replace(" ", "")
+    inputs, output = (
+        subscripts.split("->")
+        if "->" in subscripts
+        else (
+            subscripts,
+            "".join(
+                sorted(
+                    c
+                    for c in set(subscripts.replace(",", ""))
+                    if subscripts.count(c) == 1
+                )
+            ),
+        )
+    )
+    inputs = inputs.split(",")
+    i = i - 1
+    target = inputs[i]
+    if len(set(target)) != len(target):
+        return _not_implemented("np.einsum with repeated subscripts")(g, ans, p)
+    others = [s for j, s in enumerate(inputs) if j != i]
+    present = set(output + "".join(others))
+    # indices only found in the target operand are summed over, so broadcast along
+    kept = "".join(c for c in target if c in present)
+    ret = np.einsum(
+        ",".join([output] + others) + "->" + kept,
+        g,
+        *[x for j, x in enumerate(operands) if j != i],
+    )
+    shape = np.shape(operands[i])
+    ret = ret.reshape([shape[k] if c in present else 1 for k, c in enumerate(target)])
+    return np.broadcast_to(ret, shape)
+
+
+_defvjp(np.einsum, operands=_einsum_vjp)
+
+_defvjp(
+    np.linalg.inv,
+    a=lambda g, ans, p: -_swap(ans) @ g @ _swap(ans),
+)
+_defvjp(
+    np.linalg.det,
+    a=lambda g, ans, p: (np.asarray(g) * ans)[..., None, None]
+    * _swap(np.linalg.inv(p["a"])),
+)
+
+
+def _solve_vjp(first):
+    def _vjp(g, ans, p):
+        a, b = p["a"], p["b"]
+        vector = np.ndim(b) == np.ndim(a) - 1
+        gb = np.linalg.solve(_swap(a), g[..., None] if vector else g)
+        if not first:
+            return gb[..., 0] if vector else gb
+        x = ans[..., None] if vector else ans
+        return -gb @ _swap(x)
+
+    return _vjp
+
+
+_defvjp(np.linalg.solve, a=_solve_vjp(True), b=_solve_vjp(False))
+
+
+def _norm_vjp(g, ans, p):
+    x, order, axis = p["x"], p["ord"], p["axis"]
+    matrix = (axis is None and np.ndim(x) == 2 and order is not None) or (
+        isinstance(axis, (tuple, list)) and len(axis) == 2
+    )
+    if matrix and order not in (None, "fro"):
+        return _not_implemented("matrix norms of order {}".format(order))(g, ans, p)
+    if axis is None and not matrix:
+        axis = tuple(range(np.ndim(x)))
+    g, ans = _unreduce(
+        g, ans, dict(a=x, axis=axis, keepdims=p["keepdims"] is True), "a"
+    )
+    if order in (None, "fro", 2):
+        return g * x / np.where(ans == 0, 1, ans)
+    if order == 1:
+        return g * np.sign(x)
+    if order == np.inf:
+        mask = np.abs(x) == ans
+        return g * np.sign(x) * mask / mask.sum(axis=axis, keepdims=True)
+    return (
+        g
+        * np.sign(x)
+        * np.abs(x) ** (order - 1)
+        / np.where(ans == 0, 1, ans ** (order - 1))
+    )
+
+
+_defvjp(np.linalg.norm, x=_norm_vjp)
+
+
+def _cross_vjp(first):
+    def _vjp(g, ans, p):
+        a, b = p["a"], p["b"]
+        axes = (p["axisa"], p["axisb"], p["axisc"])
+        axisa, axisb, axisc = axes if p["axis"] is None else (p["axis"],) * 3
+        if np.shape(a)[axisa] != 3 or np.shape(b)[axisb] != 3:
+            return _not_implemented("np.cross of 2-vectors")(g, ans, p)
+        g = np.moveaxis(g, axisc, -1)
+        if first:
+            return np.moveaxis(np.cross(np.moveaxis(b, axisb, -1), g), -1, axisa)
+        return np.moveaxis(np.cross(g, np.moveaxis(a, axisa, -1)), -1, axisb)
+
+    return _vjp
+
+
+_defvjp(np.cross, a=_cross_vjp(True), b=_cross_vjp(False))
+
+
+def _slogdet_vjp(g, ans, p, k):
+    # the sign is piecewise constant
+    if k == 0:
+        return np.zeros(np.shape(p["a"]))
+    return np.asarray(g)[..., None, None] * _swap(np.linalg.inv(p["a"]))
+
+
+_defvjp(np.linalg.slogdet, a=_slogdet_vjp)
+
+
+def _cholesky_vjp(g, ans, p):
+    # the symmetric cotangent of the input, as the perturbations of a symmetric matrix
+    inv = np.linalg.inv(ans)
+    phi = np.tril(_swap(ans) @ g) / (1 + np.eye(ans.shape[-1]))
+    ret = _swap(inv) @ phi @ inv
+    return (ret + _swap(ret)) / 2
+
+
+_defvjp(np.linalg.cholesky, a=_cholesky_vjp)
+
+
+def _eigh_cotangent(gw, gv, w, v):
+    # the symmetric cotangent of the input from those of the eigenvalues w and
+    # eigenvectors v, assuming distinct eigenvalues
+    ret = (v * gw[..., None, :]) @ _swap(v)
+    if gv is not None:
+        eye = np.eye(w.shape[-1])
+        f = (1 - eye) / (w[..., None, :] - w[..., :, None] + eye)
+        ret = ret + v @ (f * (_swap(v) @ gv)) @ _swap(v)
+    return (ret + _swap(ret)) / 2
+
+
+def _eigh_vjp(g, ans, p, k):
+    w, v = ans
+    if k == 0:
+        return _eigh_cotangent(g, None, w, v)
+    return _eigh_cotangent(np.zeros_like(w), g, w, v)
+
+
+def _eigvalsh_vjp(g, ans, p):
+    v = np.linalg.eigh(p["a"], p["UPLO"])[1]
+    return _eigh_cotangent(g, None, ans, v)
+
+
+_defvjp(np.linalg.eigh, a=_eigh_vjp)
+_defvjp(np.linalg.eigvalsh, a=_eigvalsh_vjp)
+
+
+def _svd_cotangent(gu, gs, gvh, u, s, vh):
+    # the cotangent of the input from those of the reduced svd u, s, vh, assuming
+    # distinct nonzero singular values
+    m, n = u.shape[-2], vh.shape[-1]
+    eye = np.eye(s.shape[-1])
+    f = (1 - eye) / (s[..., None, :] ** 2 - s[..., :, None] ** 2 + eye)
+    utgu = _swap(u) @ gu
+    vhgvh = vh @ _swap(gvh)
+    ret = f * (utgu - _swap(utgu)) * s[..., None, :]
+    ret = ret + eye * gs[..., :, None]
+    ret = ret + s[..., :, None] * (f * (vhgvh - _swap(vhgvh)))
+    ret = u @ ret @ vh
+    if m < n:
+        ret = ret + (u / s[..., None, :]) @ gvh @ (np.eye(n) - _swap(vh) @ vh)
+    elif m > n:
+        ret = ret + (np.eye(m) - u @ _swap(u)) @ gu @ (vh / s[..., :, None])
+    return ret
+
+
+def _svd_vjp(g, ans, p, k=1):
+    a = p["a"]
+    if not p["compute_uv"]:
+        u, _, vh = np.linalg.svd(a, full_matrices=False)
+        return _svd_cotangent(np.zeros_like(u), g, np.zeros_like(vh), u, ans, vh)
+    u, s, vh = ans
+    r = s.shape[-1]
+    # the singular vectors beyond the reduced svd only span the complement
+    if (k == 0 and np.any(g[..., r:])) or (k == 2 and np.any(g[..., r:, :])):
+        return _not_implemented("np.linalg.svd of full matrices")(g, ans, p)
+    u, vh = u[..., :r], vh[..., :r, :]
+    gs = [np.zeros_like(u), np.zeros_like(s), np.zeros_like(vh)]
+    gs[k] = g[..., :r] if k == 0 else g[..., :r, :] if k == 2 else g
+    return _svd_cotangent(*gs, u, s, vh)
+
+
+_defvjp(np.linalg.svd, a=_svd_vjp)
+
+
+def _pinv_vjp(g, ans, p):
+    a = p["a"]
+    m, n = np.shape(a)[-2:]
+    return (
+        -_swap(ans) @ g @ _swap(ans)
+        + (np.eye(m) - a @ ans) @ _swap(g) @ ans @ _swap(ans)
+        + _swap(ans) @ ans @ _swap(g) @ (np.eye(n) - ans @ a)
+    )
+
+
+_defvjp(np.linalg.pinv, a=_pinv_vjp)
@@ -1,10 +1,26 @@
-# global
-import logging
+# local
+import ivy
+from ivy.func_wrapper import inputs_to_native_arrays
+from ..autograd import _primitive, _defvjp, _checkpoint
 
 
 def bind_custom_gradient_function(func, custom_grad_fn):
-    logging.warning(
-        "NumPy does not support autograd, 'bind_custom_gradient_function' "
-        "has no effect on the array, as gradients are not supported in the first place."
-    )
-    return func
+    @_primitive
+    def custom_forward(x):
+        return ivy.to_native(func(x), nested=True, include_derived=True)
+
+    def custom_backward(upstream, ans, p):
+        grads = custom_grad_fn(
+            *ivy.to_ivy(((p["x"], ans), upstream), nested=True, include_derived=True)
+        )
+        return ivy.to_native(grads, nested=True, include_derived=True)
+
+    _defvjp(custom_forward, x=custom_backward)
+    return inputs_to_native_arrays(custom_forward)
+
+
+def checkpoint(func):
+    def _func(*args, **kwargs):
+        return ivy.to_native(func(*args, **kwargs), nested=True, include_derived=True)
+
+    return inputs_to_native_arrays(_checkpoint(_func))
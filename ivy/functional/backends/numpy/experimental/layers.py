@@ -8,11 +8,9 @@ from typing import Optional, Union, Tuple, List, Literal, Sequence, Callable
 import ivy
 from ivy.functional.ivy.layers import (
     _handle_padding,
-    _get_num_padded_values,
     _validate_max_pool_params,
     _depth_max_pooling_helper,
 )
-from ivy.functional.backends.numpy.layers import _add_dilations
 from ivy.functional.ivy.experimental.layers import _padding_ceil_mode
 from ivy.func_wrapper import with_supported_dtypes
 from ivy.func_wrapper import with_unsupported_dtypes
@@ -28,71 +26,84 @@ def _determine_depth_max_pooling(x, kernel, strides, dims, data_format="channel_
     return x, kernel, strides, depth_pooling
 
 
-def max_pool1d(
-    x: np.ndarray,
-    kernel: Union[int, Tuple[int, ...]],
-    strides: Union[int, Tuple[int, ...]],
-    padding: Union[str, int, Tuple[int], List[Tuple[int, int]]],
-    /,
-    *,
-    data_format: str = "NWC",
-    dilation: Union[int, Tuple[int]] = 1,
-    ceil_mode: bool = False,
-    out: Optional[np.ndarray] = None,
-) -> np.ndarray:
-    dims = 1
+def _pool_windows(x, kernel, strides, padding, dims, dilation=None, pad_value=0):
+    """
+    Return a strided view of the pooling windows of the channel-last `x`.
+
+    `padding` holds a (before, after) pair per spatial dimension. The view is of
+    shape B x *O x C x *K with the dilation already applied to the windows, so
+    nothing is copied apart from the padded input.
+    """
+    dilation = [1] * dims if dilation is None else dilation
+    if any(p for pair in padding for p in pair):
+        x = np.pad(x, [(0, 0), *padding, (0, 0)], constant_values=pad_value)
+    dilated_kernel = [dilation[i] * (kernel[i] - 1) + 1 for i in range(dims)]
+    if any(dilated_kernel[i] > x.shape[i + 1] for i in range(dims)):
+        # no window fits, which sliding_window_view would reject
+        out_shape = [
+            max(0, (x.shape[i + 1] - dilated_kernel[i]) // strides[i] + 1)
+            for i in range(dims)
+        ]
+        return np.empty((x.shape[0], *out_shape, x.shape[-1], *kernel), dtype=x.dtype)
+    windows = np.lib.stride_tricks.sliding_window_view(
+        x, dilated_kernel, axis=tuple(range(1, dims + 1))
+    )
+    return windows[
+        (
+            slice(None),
+            *[slice(None, None, s) for s in strides],
+            slice(None),
+            *[slice(None, None, d) for d in dilation],
+        )
+    ]
+
+
+def _reduce_windows(windows, dims, reduce_fn, dtype=None):
+    # reduce one kernel offset at a time, each step being a single vectorised
+    # operation over the whole B x *O x C output
+    res = None
+    for offset in np.ndindex(*windows.shape[-dims:]):
+        window = windows[(Ellipsis, *offset)]
+        if res is None:
+            res = window.astype(dtype or window.dtype, copy=True)
+        else:
+            reduce_fn(res, window, out=res)
+    return res
+
+
+def _channel_first_kernel_params(params, dims):
+    # reorder kernel/strides/padding given for all dims of a channel first input
+    if isinstance(params, (list, tuple)) and len(params) == dims + 2:
+        return [params[i] for i in (0, *range(2, dims + 2), 1)]
+    return params
+
+
+def _max_pool(x, kernel, strides, padding, dims, data_format, dilation, ceil_mode):
     kernel, strides, padding, dilation = _validate_max_pool_params(
         kernel, strides, padding, dilation, ceil_mode, dims=dims
     )
-
-    if data_format == "NCW":
-        x = np.swapaxes(x, 1, 2)
-        kernel = [kernel[i] for i in [0, 2, 1]] if len(kernel) == (dims + 2) else kernel
-        strides = (
-            [strides[i] for i in [0, 2, 1]] if len(strides) == (dims + 2) else strides
-        )
-        padding = (
-            [padding[i] for i in [0, 2, 1]]
-            if isinstance(padding, list) and len(padding) == (dims + 2)
-            else padding
-        )
-        padding = (
-            [padding[i] for i in [0, 2, 1]]
-            if isinstance(padding, list) and len(padding) == (dims + 2)
-            else padding
-        )
+    channel_first = data_format in ("NCW", "NCHW", "NCDHW")
+    if channel_first:
+        x = np.transpose(x, (0, *range(2, dims + 2), 1))
+        kernel = _channel_first_kernel_params(kernel, dims)
+        strides = _channel_first_kernel_params(strides, dims)
+        if isinstance(padding, list):
+            padding = _channel_first_kernel_params(padding, dims)
 
     x, kernel, strides, depth_pooling = _determine_depth_max_pooling(
         x, kernel, strides, dims, data_format="channel_last"
     )
 
-    x_shape = x.shape[1:2]
-    filters = np.ones((list(kernel)), dtype=x.dtype)
     if not depth_pooling:
-        if dilation[0] > 1:
-            filters = _add_dilations(filters, dilation[0], axis=0, values=0)
-        kernel = list(filters.shape)
-        pad_list = padding
-        if isinstance(padding, str):
-            pad_w = _handle_padding(x_shape[0], strides[0], kernel[0], padding)
-            pad_list = [
-                (pad_w // 2, pad_w - pad_w // 2),
-            ]
-        if ceil_mode:
-            pad_list[0] = _padding_ceil_mode(
-                x_shape[0], kernel[0], pad_list[0], strides[0]
-            )
-
-        x = np.pad(
-            x,
-            [
-                (0, 0),
-                *pad_list,
-                (0, 0),
-            ],
-            "constant",
-            constant_values=-math.inf,
+        dilated_kernel = [dilation[i] * (kernel[i] - 1) + 1 for i in range(dims)]
+        padding, _, _ = _get_padded_values(
+            x.shape[1:-1], dilated_kernel, strides, padding, False, dims
         )
+        if ceil_mode:
+            for i in range(dims):
+                padding[i] = _padding_ceil_mode(
+                    x.shape[i + 1], dilated_kernel[i], padding[i], strides[i]
+                )
     else:
         if isinstance(padding, list) and any(
             [item != 0 for sublist in padding for item in sublist]
@@ -100,36 +111,42 @@ def max_pool1d(
             raise NotImplementedError(
                 "Nonzero explicit padding is not supported for depthwise max pooling"
             )
+        padding = [(0, 0)] * dims
+        dilation = [1] * dims
 
-    x_shape = x.shape
-    new_w = (x_shape[1] - kernel[0]) // strides[0] + 1
-    new_shape = [x_shape[0], new_w] + list(kernel) + [x_shape[-1]]
-    new_strides = (
-        x.strides[0],
-        x.strides[1] * strides[0],
-        x.strides[1],
-        x.strides[2],
-    )
-
-    # B x OW x KW x I
-    sub_matrices = np.lib.stride_tricks.as_strided(
-        x, new_shape, new_strides, writeable=False
-    )
-
-    # B x OW x KW x I
-    sub_matrices = np.where(
-        filters.reshape([1] * 2 + list(kernel) + [1]), sub_matrices, -math.inf
-    )
-
-    res = sub_matrices.max(axis=(2))
+    if np.issubdtype(x.dtype, np.floating):
+        pad_value = -math.inf
+    elif np.issubdtype(x.dtype, np.integer):
+        pad_value = np.iinfo(x.dtype).min
+    else:
+        pad_value = False
+    # B x *O x I x *K
+    windows = _pool_windows(x, kernel, strides, padding, dims, dilation, pad_value)
+    # B x *O x I
+    res = _reduce_windows(windows, dims, np.maximum)
 
     if depth_pooling:
-        res = np.swapaxes(res, 1, 2)
-    if data_format == "NCW":
-        res = np.swapaxes(res, 1, 2)
+        res = np.transpose(res, (0, *range(2, dims + 2), 1))
+    if channel_first:
+        return np.transpose(res, (0, dims + 1, *range(1, dims + 1)))
     return res
 
 
+def max_pool1d(
+    x: np.ndarray,
+    kernel: Union[int, Tuple[int, ...]],
+    strides: Union[int, Tuple[int, ...]],
+    padding: Union[str, int, Tuple[int], List[Tuple[int, int]]],
+    /,
+    *,
+    data_format: str = "NWC",
+    dilation: Union[int, Tuple[int]] = 1,
+    ceil_mode: bool = False,
+    out: Optional[np.ndarray] = None,
+) -> np.ndarray:
+    return _max_pool(x, kernel, strides, padding, 1, data_format, dilation, ceil_mode)
+
+
 def max_pool2d(
     x: np.ndarray,
     kernel: Union[int, Tuple[int, ...]],
@@ -142,102 +159,7 @@ def max_pool2d(
     ceil_mode: bool = False,
     out: Optional[np.ndarray] = None,
 ) -> np.ndarray:
-    dims = 2
-    kernel, strides, padding, dilation = _validate_max_pool_params(
-        kernel, strides, padding, dilation, ceil_mode, dims=dims
-    )
-
-    if data_format == "NCHW":
-        x = np.transpose(x, (0, 2, 3, 1))
-        kernel = (
-            [kernel[i] for i in [0, 2, 3, 1]] if len(kernel) == (dims + 2) else kernel
-        )
-        strides = (
-            [strides[i] for i in [0, 2, 3, 1]]
-            if len(strides) == (dims + 2)
-            else strides
-        )
-        padding = (
-            [padding[i] for i in [0, 2, 3, 1]]
-            if isinstance(padding, list) and len(padding) == (dims + 2)
-            else padding
-        )
-
-    x, kernel, strides, depth_pooling = _determine_depth_max_pooling(
-        x, kernel, strides, dims, data_format="channel_last"
-    )
-
-    x_shape = list(x.shape[1:3])
-    filters = np.ones((list(kernel)), dtype=x.dtype)
-    if not depth_pooling:
-        for j in range(dims):
-            if dilation[j] > 1:
-                filters = _add_dilations(filters, dilation[j], axis=j, values=0)
-        kernel = list(filters.shape)
-        pad_list = padding
-        if isinstance(padding, str):
-            pad_h = _handle_padding(x_shape[0], strides[0], kernel[0], padding)
-            pad_w = _handle_padding(x_shape[1], strides[1], kernel[1], padding)
-            pad_list = [
-                (pad_h // 2, pad_h - pad_h // 2),
-                (pad_w // 2, pad_w - pad_w // 2),
-            ]
-        pad_list = list(pad_list)
-        if ceil_mode:
-            for i in range(dims):
-                pad_list[i] = _padding_ceil_mode(
-                    x_shape[i], kernel[i], pad_list[i], strides[i]
-                )
-
-        x = np.pad(
-            x,
-            [
-                (0, 0),
-                *pad_list,
-                (0, 0),
-            ],
-            "constant",
-            constant_values=-math.inf,
-        )
-    else:
-        if isinstance(padding, list) and any(
-            [item != 0 for sublist in padding for item in sublist]
-        ):
-            raise NotImplementedError(
-                "Nonzero explicit padding is not supported for depthwise max pooling"
-            )
-
-    x_shape = x.shape
-    new_h = (x_shape[1] - kernel[0]) // strides[0] + 1
-    new_w = (x_shape[2] - kernel[1]) // strides[1] + 1
-    new_shape = [x_shape[0], new_h, new_w] + list(kernel) + [x_shape[-1]]
-    new_strides = (
-        x.strides[0],
-        x.strides[1] * strides[0],
-        x.strides[2] * strides[1],
-        x.strides[1],
-        x.strides[2],
-        x.strides[3],
-    )
-
-    # B x OH x OW x KH x KW x I
-    sub_matrices = np.lib.stride_tricks.as_strided(
-        x, new_shape, new_strides, writeable=False
-    )
-
-    # B x OH x OW x KH x KW x I
-    sub_matrices = np.where(
-        filters.reshape([1] * 3 + list(kernel) + [1]), sub_matrices, -math.inf
-    )
-
-    # B x OH x OW x O
-    res = sub_matrices.max(axis=(3, 4))
-
-    if depth_pooling:
-        res = np.transpose(res, (0, 2, 3, 1))
-    if data_format == "NCHW":
-        return np.transpose(res, (0, 3, 1, 2))
-    return res
+    return _max_pool(x, kernel, strides, padding, 2, data_format, dilation, ceil_mode)
 
 
 def max_pool3d(
@@ -252,108 +174,7 @@ def max_pool3d(
     ceil_mode: bool = False,
     out: Optional[np.ndarray] = None,
 ) -> np.ndarray:
-    dims = 3
-    kernel, strides, padding, dilation = _validate_max_pool_params(
-        kernel, strides, padding, dilation, ceil_mode, dims=dims
-    )
-
-    if data_format == "NCDHW":
-        x = np.transpose(x, (0, 2, 3, 4, 1))
-        kernel = (
-            [kernel[i] for i in [0, 2, 3, 4, 1]]
-            if len(kernel) == (dims + 2)
-            else kernel
-        )
-        strides = (
-            [strides[i] for i in [0, 2, 3, 4, 1]]
-            if len(strides) == (dims + 2)
-            else strides
-        )
-        padding = (
-            [padding[i] for i in [0, 2, 3, 4, 1]]
-            if isinstance(padding, list) and len(padding) == (dims + 2)
-            else padding
-        )
-
-    x, kernel, strides, depth_pooling = _determine_depth_max_pooling(
-        x, kernel, strides, dims, data_format="channel_last"
-    )
-
-    x_shape = x.shape[1:4]
-    filters = np.ones((list(kernel)), dtype=x.dtype)
-    if not depth_pooling:
-        for j in range(dims):
-            if dilation[j] > 1:
-                filters = _add_dilations(filters, dilation[j], axis=j, values=0)
-        kernel = list(filters.shape)
-        pad_list = padding
-        if isinstance(padding, str):
-            pad_d = _handle_padding(x_shape[0], strides[0], kernel[0], padding)
-            pad_h = _handle_padding(x_shape[1], strides[1], kernel[1], padding)
-            pad_w = _handle_padding(x_shape[2], strides[2], kernel[2], padding)
-            pad_list = [
-                (pad_d // 2, pad_d - pad_d // 2),
-                (pad_h // 2, pad_h - pad_h // 2),
-                (pad_w // 2, pad_w - pad_w // 2),
-            ]
-        pad_list = list(pad_list)
-        if ceil_mode:
-            for i in range(dims):
-                pad_list[i] = _padding_ceil_mode(
-                    x_shape[i], kernel[i], pad_list[i], strides[i]
-                )
-
-        x = np.pad(
-            x,
-            [
-                (0, 0),
-                *pad_list,
-                (0, 0),
-            ],
-            "constant",
-            constant_values=-math.inf,
-        )
-    else:
-        if isinstance(padding, list) and any(
-            [item != 0 for sublist in padding for item in sublist]
-        ):
-            raise NotImplementedError(
-                "Nonzero explicit padding is not supported for depthwise max pooling"
-            )
-
-    x_shape = x.shape
-    new_d = (x_shape[1] - kernel[0]) // strides[0] + 1
-    new_h = (x_shape[2] - kernel[1]) // strides[1] + 1
-    new_w = (x_shape[3] - kernel[2]) // strides[2] + 1
-    new_shape = [x_shape[0], new_d, new_h, new_w] + list(kernel) + [x_shape[-1]]
-    new_strides = (
-        x.strides[0],
-        x.strides[1] * strides[0],
-        x.strides[2] * strides[1],
-        x.strides[3] * strides[2],
-        x.strides[1],
-        x.strides[2],
-        x.strides[3],
-        x.strides[4],
-    )
-    # B x OD x OH x OW x KD x KH x KW x I
-    sub_matrices = np.lib.stride_tricks.as_strided(
-        x, new_shape, new_strides, writeable=False
-    )
-
-    # B x OD x OH x OW x KD x KH x KW x I
-    sub_matrices = np.where(
-        filters.reshape([1] * 4 + list(kernel) + [1]), sub_matrices, -math.inf
-    )
-
-    # B x OD x OH x OW x O
-    res = sub_matrices.max(axis=(4, 5, 6))
-
-    if depth_pooling:
-        res = np.transpose(res, (0, 2, 3, 4, 1))
-    if data_format == "NCDHW":
-        return np.transpose(res, (0, 4, 1, 2, 3))
-    return res
+    return _max_pool(x, kernel, strides, padding, 3, data_format, dilation, ceil_mode)
 
 
 def _get_padded_values(x_shape, kernel, strides, padding, ceil_mode, dim):
@@ -367,6 +188,7 @@ def _get_padded_values(x_shape, kernel, strides, padding, ceil_mode, dim):
             for i in range(dim)
         ]
     else:
+        padding = list(padding)
         pad_specific = [sum(padding[i]) for i in range(dim)]
 
     c = []
@@ -380,90 +202,97 @@ def _get_padded_values(x_shape, kernel, strides, padding, ceil_mode, dim):
     return padding, pad_specific, c
 
 
-def avg_pool1d(
-    x: np.ndarray,
-    kernel: Union[int, Tuple[int]],
-    strides: Union[int, Tuple[int]],
-    padding: str,
-    /,
-    *,
-    data_format: str = "NWC",
-    count_include_pad: bool = False,
-    ceil_mode: bool = False,
-    out: Optional[np.ndarray] = None,
-) -> np.ndarray:
+def _avg_pool(
+    x,
+    kernel,
+    strides,
+    padding,
+    dims,
+    data_format,
+    count_include_pad,
+    ceil_mode,
+    divisor_override=None,
+):
     if isinstance(kernel, int):
-        kernel = [kernel]
+        kernel = [kernel] * dims
     elif len(kernel) == 1:
-        kernel = [kernel[0]]
+        kernel = [kernel[0]] * dims
 
     if isinstance(strides, int):
-        strides = [strides]
+        strides = [strides] * dims
     elif len(strides) == 1:
-        strides = [strides[0]]
+        strides = [strides[0]] * dims
+
+    if isinstance(padding, int):
+        padding = [(padding, padding)] * dims
 
-    if data_format in ("NCW", "NCL"):
-        x = np.swapaxes(x, 1, 2)
+    channel_first = data_format in ("NCW", "NCL", "NCHW", "NCDHW")
+    if channel_first:
+        x = np.transpose(x, (0, *range(2, dims + 2), 1))
 
     x_shape = x.shape[1:-1]
     padding, pad_specific, c = _get_padded_values(
-        x_shape, kernel, strides, padding, ceil_mode, 1
-    )
-
-    x = np.pad(
-        x,
-        [
-            (0, 0),
-            *padding,
-            (0, 0),
-        ],
-        constant_values=0.0,
+        x_shape, kernel, strides, padding, ceil_mode, dims
     )
 
-    x_shape = x.shape
-    new_w = (x_shape[1] - kernel[0]) // strides[0] + 1
-    new_shape = [x_shape[0], new_w, kernel[0]] + [x_shape[-1]]
-    new_strides = (
-        x.strides[0],
-        x.strides[1] * strides[0],
-        x.strides[1],
-        x.strides[2],
+    dtype = x.dtype if np.issubdtype(x.dtype, np.floating) else np.float64
+    # B x *O x I x *K
+    windows = _pool_windows(x, kernel, strides, padding, dims)
+    # B x *O x I
+    res = _reduce_windows(
+        windows,
+        dims,
+        np.add,
+        dtype=np.float32 if dtype == np.float16 else dtype,
     )
 
-    sub_matrices = np.lib.stride_tricks.as_strided(
-        x, new_shape, new_strides, writeable=False
-    )
-
-    res = np.mean(sub_matrices, axis=2)
+    if divisor_override is not None:
+        res /= divisor_override
+        return _finalize_avg_pool(res, dtype, dims, channel_first)
 
     if (not count_include_pad or ceil_mode) and any(pad_specific):
-        if not count_include_pad:
-            num_padded_values = np.array(
-                ivy.map(
-                    _get_num_padded_values,
-                    constant={
-                        "p": pad_specific[0],
-                        "n": x.shape[1] - pad_specific[0],
-                        "k": kernel[0],
-                        "s": strides[0],
-                    },
-                    unique={
-                        "i": np.arange(res.shape[1]),
-                    },
-                ),
-                dtype=res.dtype,
-            )
-        else:
-            num_padded_values = np.zeros(res.shape[1], dtype=res.dtype)
-            num_padded_values[-1] = c[0]
-        res = (kernel[0] * res) / (kernel[0] - num_padded_values[:, None])
+        # the number of elements counted in each window, given as the product of
+        # the number of counted elements along each dimension
+        divisor = np.ones([1] * (dims + 2), dtype=res.dtype)
+        for i in range(dims):
+            mask = np.zeros(x_shape[i] + pad_specific[i], dtype=res.dtype)
+            if count_include_pad:
+                mask[: mask.shape[0] - c[i]] = 1
+            else:
+                mask[padding[i][0] : padding[i][0] + x_shape[i]] = 1
+            counts = np.lib.stride_tricks.sliding_window_view(mask, kernel[i])
+            counts = counts[:: strides[i]].sum(-1)
+            divisor = divisor * counts.reshape([1] * (i + 1) + [-1] + [1] * (dims - i))
+        res /= divisor
+    else:
+        res /= np.prod(kernel)
+    return _finalize_avg_pool(res, dtype, dims, channel_first)
 
-    if data_format in ("NCW", "NCL"):
-        return res.swapaxes(1, 2)
 
+def _finalize_avg_pool(res, dtype, dims, channel_first):
+    res = res.astype(dtype, copy=False)
+    if channel_first:
+        return np.transpose(res, (0, dims + 1, *range(1, dims + 1)))
     return res
 
 
+def avg_pool1d(
+    x: np.ndarray,
+    kernel: Union[int, Tuple[int]],
+    strides: Union[int, Tuple[int]],
+    padding: str,
+    /,
+    *,
+    data_format: str = "NWC",
+    count_include_pad: bool = False,
+    ceil_mode: bool = False,
+    out: Optional[np.ndarray] = None,
+) -> np.ndarray:
+    return _avg_pool(
+        x, kernel, strides, padding, 1, data_format, count_include_pad, ceil_mode
+    )
+
+
 def avg_pool2d(
     x: np.ndarray,
     kernel: Union[int, Tuple[int], Tuple[int, int]],
@@ -477,98 +306,17 @@ def avg_pool2d(
     divisor_override: Optional[int] = None,
     out: Optional[np.ndarray] = None,
 ) -> np.ndarray:
-    if isinstance(kernel, int):
-        kernel = [kernel] * 2
-    elif len(kernel) == 1:
-        kernel = [kernel[0]] * 2
-
-    if isinstance(strides, int):
-        strides = [strides] * 2
-    elif len(strides) == 1:
-        strides = [strides[0]] * 2
-
-    if data_format == "NCHW":
-        x = np.transpose(x, (0, 2, 3, 1))
-
-    x_shape = list(x.shape[1:3])
-    padding, pad_specific, c = _get_padded_values(
-        x_shape, kernel, strides, padding, ceil_mode, 2
-    )
-    x = np.pad(
+    return _avg_pool(
         x,
-        [
-            (0, 0),
-            *padding,
-            (0, 0),
-        ],
-        constant_values=0.0,
-    )
-
-    x_shape = x.shape
-    new_h = (x_shape[1] - kernel[0]) // strides[0] + 1
-    new_w = (x_shape[2] - kernel[1]) // strides[1] + 1
-    new_shape = [x_shape[0], new_h, new_w] + list(kernel) + [x_shape[-1]]
-    new_strides = (
-        x.strides[0],
-        x.strides[1] * strides[0],
-        x.strides[2] * strides[1],
-        x.strides[1],
-        x.strides[2],
-        x.strides[3],
+        kernel,
+        strides,
+        padding,
+        2,
+        data_format,
+        count_include_pad,
+        ceil_mode,
+        divisor_override,
     )
-    # B x OH x OW x KH x KW x I
-    sub_matrices = np.lib.stride_tricks.as_strided(
-        x, new_shape, new_strides, writeable=False
-    )
-
-    # B x OH x OW x O
-    if divisor_override is not None:
-        res = np.sum(sub_matrices, axis=(3, 4)) / divisor_override
-    else:
-        res = np.mean(sub_matrices, axis=(3, 4))
-    if (
-        (not count_include_pad or ceil_mode)
-        and any(pad_specific)
-        and not divisor_override
-    ):
-        if not count_include_pad:
-            num_padded_values = [
-                np.array(
-                    ivy.map(
-                        _get_num_padded_values,
-                        constant={
-                            "p": pad_specific[i],
-                            "n": x.shape[i + 1] - pad_specific[i],
-                            "k": kernel[i],
-                            "s": strides[i],
-                        },
-                        unique={
-                            "i": np.arange(res.shape[i + 1]),
-                        },
-                    ),
-                    dtype=res.dtype,
-                )
-                for i in range(2)
-            ]
-        else:
-            num_padded_values = []
-            for i in range(2):
-                num_pad = np.zeros(res.shape[i + 1], dtype=res.dtype)
-                num_pad[-1] = c[i]
-                num_padded_values.append(num_pad)
-        num_padded_values1 = num_padded_values[0][:, None]
-        num_padded_values2 = num_padded_values[1][None, :]
-        num_padded_values = (
-            num_padded_values1 * kernel[1]
-            + num_padded_values2 * kernel[0]
-            - num_padded_values1 * num_padded_values2
-        )
-        kernel_mul = np.prod(kernel)
-        res = (kernel_mul * res) / (kernel_mul - np.expand_dims(num_padded_values, -1))
-
-    if data_format == "NCHW":
-        return np.transpose(res, (0, 3, 1, 2))
-    return res
 
 
 def avg_pool3d(
@@ -584,107 +332,17 @@ def avg_pool3d(
     divisor_override: Optional[int] = None,
     out: Optional[np.ndarray] = None,
 ) -> np.ndarray:
-    if isinstance(kernel, int):
-        kernel = [kernel] * 3
-    elif len(kernel) == 1:
-        kernel = [kernel[0]] * 3
-
-    if isinstance(strides, int):
-        strides = [strides] * 3
-    elif len(strides) == 1:
-        strides = [strides[0]] * 3
-
-    if data_format == "NCDHW":
-        x = np.transpose(x, (0, 2, 3, 4, 1))
-
-    x_shape = list(x.shape[1:4])
-    padding, pad_specific, c = _get_padded_values(
-        x_shape, kernel, strides, padding, ceil_mode, 3
-    )
-
-    x = np.pad(
+    return _avg_pool(
         x,
-        [
-            (0, 0),
-            *padding,
-            (0, 0),
-        ],
-        constant_values=0.0,
-    )
-
-    x_shape = x.shape
-    new_d = (x_shape[1] - kernel[0]) // strides[0] + 1
-    new_h = (x_shape[2] - kernel[1]) // strides[1] + 1
-    new_w = (x_shape[3] - kernel[2]) // strides[2] + 1
-    new_shape = [x_shape[0], new_d, new_h, new_w] + list(kernel) + [x_shape[-1]]
-    new_strides = (
-        x.strides[0],
-        x.strides[1] * strides[0],
-        x.strides[2] * strides[1],
-        x.strides[3] * strides[2],
-        x.strides[1],
-        x.strides[2],
-        x.strides[3],
-        x.strides[4],
+        kernel,
+        strides,
+        padding,
+        3,
+        data_format,
+        count_include_pad,
+        ceil_mode,
+        divisor_override,
     )
-    # B x OH x OW x KH x KW x I
-    sub_matrices = np.lib.stride_tricks.as_strided(
-        x, new_shape, new_strides, writeable=False
-    )
-
-    # B x OH x OW x O
-    if divisor_override is not None:
-        res = np.sum(sub_matrices, axis=(4, 5, 6)) / divisor_override
-    else:
-        res = np.mean(sub_matrices, axis=(4, 5, 6))
-
-    if (
-        (not count_include_pad or ceil_mode)
-        and any(pad_specific)
-        and not divisor_override
-    ):
-        if not count_include_pad:
-            num_padded_values = [
-                np.array(
-                    ivy.map(
-                        _get_num_padded_values,
-                        constant={
-                            "p": pad_specific[i],
-                            "n": x.shape[i + 1] - pad_specific[i],
-                            "k": kernel[i],
-                            "s": strides[i],
-                        },
-                        unique={
-                            "i": np.arange(res.shape[i + 1]),
-                        },
-                    ),
-                    dtype=res.dtype,
-                )
-                for i in range(3)
-            ]
-        else:
-            num_padded_values = []
-            for i in range(3):
-                num_pad = np.zeros(res.shape[i + 1], dtype=res.dtype)
-                num_pad[-1] = c[i]
-                num_padded_values.append(num_pad)
-        num_padded_values1 = num_padded_values[0].reshape((-1, 1, 1))
-        num_padded_values2 = num_padded_values[1].reshape((1, -1, 1))
-        num_padded_values3 = num_padded_values[2].reshape((1, 1, -1))
-        num_padded_values = (
-            num_padded_values1 * kernel[1] * kernel[2]
-            + num_padded_values2 * kernel[0] * kernel[2]
-            + num_padded_values3 * kernel[0] * kernel[1]
-            + num_padded_values1 * num_padded_values2 * num_padded_values3
-            - num_padded_values1 * num_padded_values2 * kernel[2]
-            - num_padded_values1 * num_padded_values3 * kernel[1]
-            - num_padded_values2 * num_padded_values3 * kernel[0]
-        )
-        kernel_mul = np.prod(kernel)
-        res = (kernel_mul * res) / (kernel_mul - np.expand_dims(num_padded_values, -1))
-    if data_format == "NCDHW":
-        return np.transpose(res, (0, 4, 1, 2, 3))
-    return res
 
 
 def fft(
@@ -428,84 +428,38 @@ def cummax(
     dtype: Optional[np.dtype] = None,
     out: Optional[np.ndarray] = None,
 ) -> Tuple[np.ndarray, np.ndarray]:
-    if exclusive or reverse:
-        if exclusive and reverse:
-            indices = __find_cummax_indices(np.flip(x, axis=axis), axis=axis)
-            x = np.maximum.accumulate(np.flip(x, axis=axis), axis=axis, dtype=x.dtype)
-            x = np.swapaxes(x, axis, -1)
-            indices = np.swapaxes(indices, axis, -1)
-            x, indices = np.concatenate(
-                (np.zeros_like(x[..., -1:]), x[..., :-1]), -1
-            ), np.concatenate((np.zeros_like(indices[..., -1:]), indices[..., :-1]), -1)
-            x, indices = np.swapaxes(x, axis, -1), np.swapaxes(indices, axis, -1)
-            res, indices = np.flip(x, axis=axis), np.flip(indices, axis=axis)
-
-        elif exclusive:
-            x = np.swapaxes(x, axis, -1)
-            x = np.concatenate((np.zeros_like(x[..., -1:]), x[..., :-1]), -1)
-            x = np.swapaxes(x, axis, -1)
-            indices = __find_cummax_indices(x, axis=axis)
-            res = np.maximum.accumulate(x, axis=axis, dtype=x.dtype)
-        elif reverse:
-            x = np.flip(x, axis=axis)
-            indices = __find_cummax_indices(x, axis=axis)
-            x = np.maximum.accumulate(x, axis=axis)
-            res, indices = np.flip(x, axis=axis), np.flip(indices, axis=axis)
-        return res, indices
-    indices = __find_cummax_indices(x, axis=axis)
-    return np.maximum.accumulate(x, axis=axis, dtype=x.dtype), indices
-
-
-def __find_cummax_indices(
-    x: np.ndarray,
-    axis: int = 0,
-) -> np.ndarray:
-    indices = []
-    if x[0] is np.ndarray:
-        if axis >= 1:
-            for ret1 in x:
-                indice = __find_cummax_indices(ret1, axis=axis - 1)
-                indices.append(indice)
+    if exclusive and reverse:
+        res, indices = _cumulative_extremum(np.flip(x, axis=axis), np.maximum, axis)
+        res, indices = _shift_exclusive(res, axis), _shift_exclusive(indices, axis)
+        return np.flip(res, axis=axis), np.flip(indices, axis=axis)
+    elif exclusive:
+        return _cumulative_extremum(_shift_exclusive(x, axis), np.maximum, axis)
+    elif reverse:
+        res, indices = _cumulative_extremum(np.flip(x, axis=axis), np.maximum, axis)
+        return np.flip(res, axis=axis), np.flip(indices, axis=axis)
+    return _cumulative_extremum(x, np.maximum, axis)
+
+
+def _cumulative_extremum(x, ufunc, axis):
+    # the running extremum along with the index at which it was last attained, an
+    # element attains it iff it equals the accumulated value at its position (nans
+    # propagate through the accumulation and always do)
+    values = ufunc.accumulate(x, axis=axis, dtype=x.dtype)
+    is_extremum = x == values
+    if np.issubdtype(x.dtype, np.inexact):
+        is_extremum |= np.isnan(x)
+    positions = np.arange(x.shape[axis], dtype=np.int64).reshape(
+        (-1,) + (1,) * (x.ndim - axis % x.ndim - 1)
+    )
+    indices = np.maximum.accumulate(np.where(is_extremum, positions, 0), axis=axis)
+    return values, indices
 
-        else:
-            indice_list = __get_index(x.tolist())
-            indices, n1 = x.copy(), {}
-            indices.fill(0)
-            indice_list = sorted(indice_list, key=lambda i: i[1])
-            for y, y_index in indice_list:
-                multi_index = y_index
-                if tuple(multi_index[1:]) not in n1:
-                    n1[tuple(multi_index[1:])] = multi_index[0]
-                    indices[y_index] = multi_index[0]
-                elif (
-                    y >= x[tuple([n1[tuple(multi_index[1:])]] + list(multi_index[1:]))]
-                ):
-                    n1[tuple(multi_index[1:])] = multi_index[0]
-                    indices[y_index] = multi_index[0]
-                else:
-                    indices[y_index] = n1[tuple(multi_index[1:])]
-    else:
-        n = 0
-        for index1, ret1 in enumerate(x):
-            if x[n] <= ret1 or index1 == 0:
-                n = index1
-            indices.append(n)
-    return np.array(indices, dtype=np.int64)
-
-
-def __get_index(lst, indices=None, prefix=None):
-    if indices is None:
-        indices = []
-    if prefix is None:
-        prefix = []
-
-    if isinstance(lst, list):
-        for i, sub_lst in enumerate(lst):
-            sub_indices = prefix + [i]
-            __get_index(sub_lst, indices, sub_indices)
-    else:
-        indices.append((lst, tuple(prefix)))
-    return indices
+
+def _shift_exclusive(x, axis):
+    # shift x one step along axis, filling the first position with zeros
+    x = np.swapaxes(x, axis, -1)
+    x = np.concatenate((np.zeros_like(x[..., -1:]), x[..., :-1]), -1)
+    return np.swapaxes(x, axis, -1)
 
 
 @with_unsupported_dtypes({"1.25.2 and below": "bfloat16"}, backend_version)
@@ -14,7 +14,9 @@ from ivy.functional.backends.numpy.device import _to_device
 from ivy.functional.backends.numpy.helpers import _scalar_output_to_0d_array
 from ivy.func_wrapper import with_unsupported_dtypes
 from . import backend_version
+from ...ivy import elementwise as _ivy_elementwise
 from ...ivy.general import _broadcast_to
+from .autograd import _primitive, _defvjp
 
 
 def array_equal(x0: np.ndarray, x1: np.ndarray, /) -> bool:
@@ -57,9 +59,9 @@ def set_item(
 
 def to_numpy(x: np.ndarray, /, *, copy: bool = True) -> np.ndarray:
     if copy:
-        return x.copy()
+        return np.array(x)
     else:
-        return x
+        return np.asarray(x)
 
 
 def to_scalar(x: np.ndarray, /) -> Number:
@@ -72,6 +74,22 @@ def to_list(x: np.ndarray, /) -> list:
     return x.tolist()
 
 
+def _ravel_index_vectors(indices, dims):
+    # flat offsets of the index vectors along the last axis of ``indices`` into an
+    # array of shape ``dims``, negative indices count from the end of their dim
+    if not len(dims):
+        return np.zeros(indices.shape[:-1], dtype=np.int64)
+    indices = np.where(indices < 0, indices + np.asarray(dims), indices)
+    return np.ravel_multi_index(tuple(np.moveaxis(indices, -1, 0)), tuple(dims))
+
+
+def _batch_offsets(batch_shape, num_dims, stride):
+    # offsets of the flattened batch entries, broadcastable against indices which
+    # have ``num_dims`` further dims after the batch dims
+    offsets = np.arange(_reduce(mul, batch_shape, 1), dtype=np.int64) * stride
+    return offsets.reshape(tuple(batch_shape) + (1,) * num_dims)
+
+
 def gather(
     params: np.ndarray,
     indices: np.ndarray,
@@ -84,55 +102,43 @@ def gather(
     axis = axis % len(params.shape)
     batch_dims = batch_dims % len(params.shape)
     ivy.utils.assertions.check_gather_input_valid(params, indices, axis, batch_dims)
-    result = []
     if batch_dims == 0:
-        result = np.take(params, indices, axis)
-    else:
-        for b in range(batch_dims):
-            if b == 0:
-                zip_list = [(p, i) for p, i in zip(params, indices)]
-            else:
-                zip_list = [
-                    (p, i) for z in [zip(p1, i1) for p1, i1 in zip_list] for p, i in z
-                ]
-        for z in zip_list:
-            p, i = z
-            r = np.take(p, i, axis - batch_dims)
-            result.append(r)
-        result = np.array(result)
-        result = result.reshape([*params.shape[0:batch_dims], *result.shape[1:]])
+        return _to_device(np.take(params, indices, axis))
+    # gather from params flattened to (batch * axis, ...) at the offsets of all the
+    # batch entries at once
+    batch_shape = params.shape[:batch_dims]
+    num_outer_dims = axis - batch_dims
+    axis_size = params.shape[axis]
+    flat_params = np.moveaxis(params, axis, batch_dims).reshape(
+        (-1, *params.shape[batch_dims:axis], *params.shape[axis + 1 :])
+    )
+    num_index_dims = indices.ndim - batch_dims
+    indices = np.where(indices < 0, indices + axis_size, indices)
+    offsets = indices + _batch_offsets(batch_shape, num_index_dims, axis_size)
+    result = np.take(flat_params, offsets, 0)
+    # move the dims of params between the batch dims and axis in front of the index
+    # dims
+    result = np.moveaxis(
+        result,
+        tuple(range(axis - num_outer_dims + num_index_dims, axis + num_index_dims)),
+        tuple(range(batch_dims, axis)),
+    )
     return _to_device(result)
 
 
-def gather_nd_helper(params, indices):
-    indices_shape = indices.shape
-    params_shape = params.shape
+def gather_nd_helper(params, indices, batch_dims=0):
     if len(indices.shape) == 0:
-        num_index_dims = 1
-    else:
-        num_index_dims = indices_shape[-1]
-    result_dim_sizes_list = [
-        _reduce(mul, params_shape[i + 1 :], 1) for i in range(len(params_shape) - 1)
-    ] + [1]
-    result_dim_sizes = np.array(result_dim_sizes_list)
-    implicit_indices_factor = int(result_dim_sizes[num_index_dims - 1].item())
-    flat_params = np.reshape(params, (-1,))
-    new_shape = [1] * (len(indices_shape) - 1) + [num_index_dims]
-    indices_scales = np.reshape(result_dim_sizes[0:num_index_dims], new_shape)
-    indices_for_flat_tiled = np.tile(
-        np.reshape(np.sum(indices * indices_scales, -1, keepdims=True), (-1, 1)),
-        (1, implicit_indices_factor),
-    )
-    implicit_indices = np.tile(
-        np.expand_dims(np.arange(implicit_indices_factor), 0),
-        (indices_for_flat_tiled.shape[0], 1),
-    )
-    indices_for_flat = indices_for_flat_tiled + implicit_indices
-    flat_indices_for_flat = np.reshape(indices_for_flat, (-1,)).astype(np.int32)
-    flat_gather = np.take(flat_params, flat_indices_for_flat, 0)
-    new_shape = list(indices_shape[:-1]) + list(params_shape[num_index_dims:])
-    res = np.reshape(flat_gather, new_shape)
-    return res
+        indices = indices[None]
+    num_index_dims = indices.shape[-1]
+    batch_shape = params.shape[:batch_dims]
+    index_shape = params.shape[batch_dims : batch_dims + num_index_dims]
+    flat_params = np.reshape(params, (-1, *params.shape[batch_dims + num_index_dims :]))
+    offsets = _ravel_index_vectors(indices, index_shape)
+    if batch_dims:
+        offsets = offsets + _batch_offsets(
+            batch_shape, indices.ndim - batch_dims - 1, _reduce(mul, index_shape, 1)
+        )
+    return np.take(flat_params, offsets, 0)
 
 
 def gather_nd(
@@ -145,24 +151,7 @@ def gather_nd(
 ) -> np.ndarray:
     ivy.utils.assertions.check_gather_nd_input_valid(params, indices, batch_dims)
     batch_dims = batch_dims % len(params.shape)
-    result = []
-    if batch_dims == 0:
-        result = gather_nd_helper(params, indices)
-    else:
-        for b in range(batch_dims):
-            if b == 0:
-                zip_list = [(p, i) for p, i in zip(params, indices)]
-            else:
-                zip_list = [
-                    (p, i) for z in [zip(p1, i1) for p1, i1 in zip_list] for p, i in z
-                ]
-        for z in zip_list:
-            p, i = z
-            r = gather_nd_helper(p, np.asarray(i, indices.dtype))
-            result.append(r)
-        result = np.array(result)
-        result = result.reshape([*params.shape[0:batch_dims], *result.shape[1:]])
-    return _to_device(result)
+    return _to_device(gather_nd_helper(params, indices, batch_dims))
 
 
 def get_num_dims(x, /, *, as_array=False):
@@ -250,6 +239,55 @@ def multiprocessing(context: Optional[str] = None):
     )
 
 
+@_primitive
+def _scatter_reduce(target, indices, updates, reduction):
+    if reduction == "sum":
+        np.add.at(target, indices, updates)
+    elif reduction == "replace":
+        target[indices] = updates
+    elif reduction == "min":
+        np.minimum.at(target, indices, updates)
+    elif reduction == "max":
+        np.maximum.at(target, indices, updates)
+    else:
+        raise ivy.utils.exceptions.IvyException(
+            "reduction is {}, but it must be one of "
+            '"sum", "min", "max" or "replace"'.format(reduction)
+        )
+    return target
+
+
+def _scatter_reduce_won(ans, p):
+    # whether each of the updates was kept by the min or max reduction
+    selected = ans[p["indices"]]
+    return selected == np.broadcast_to(p["updates"], selected.shape)
+
+
+def _scatter_reduce_target_vjp(g, ans, p):
+    if p["reduction"] == "sum":
+        return g
+    g = np.array(g)
+    if p["reduction"] == "replace":
+        g[p["indices"]] = 0
+    else:
+        g[np.asarray(p["indices"])[_scatter_reduce_won(ans, p)]] = 0
+    return g
+
+
+def _scatter_reduce_updates_vjp(g, ans, p):
+    g = np.asarray(g)[p["indices"]]
+    if p["reduction"] in ("min", "max"):
+        g = g * _scatter_reduce_won(ans, p)
+    return g
+
+
+_defvjp(
+    _scatter_reduce,
+    target=_scatter_reduce_target_vjp,
+    updates=_scatter_reduce_updates_vjp,
+)
+
+
 def scatter_flat(
     indices: np.ndarray,
     updates: np.ndarray,
@@ -266,23 +304,10 @@ def scatter_flat(
         ivy.utils.assertions.check_equal(target.shape[0], size, as_array=False)
     if not target_given:
         reduction = "replace"
-    if reduction == "sum":
-        np.add.at(target, indices, updates)
+        target = np.zeros([size], dtype=updates.dtype)
     elif reduction == "replace":
-        if not target_given:
-            target = np.zeros([size], dtype=updates.dtype)
-        target = np.asarray(target).copy()
-        target.setflags(write=1)
-        target[indices] = updates
-    elif reduction == "min":
-        np.minimum.at(target, indices, updates)
-    elif reduction == "max":
-        np.maximum.at(target, indices, updates)
-    else:
-        raise ivy.utils.exceptions.IvyException(
-            "reduction is {}, but it must be one of "
-            '"sum", "min", "max" or "replace"'.format(reduction)
-        )
+        target = np.array(target)
+    target = _scatter_reduce(target, indices, updates, reduction)
     if target_given:
         return ivy.inplace_update(out, target)
     return target
@@ -306,27 +331,25 @@ def scatter_nd(
         ivy.utils.assertions.check_equal(
             ivy.Shape(target.shape), ivy.Shape(shape), as_array=False
         )
-    indices_flat = indices.reshape(-1, indices.shape[-1]).T
-    indices_tuple = tuple(indices_flat) + (Ellipsis,)
     if not target_given:
         shape = list(shape) if ivy.exists(shape) else list(out.shape)
         target = np.zeros(shape, dtype=updates.dtype)
-    updates = _broadcast_to(updates, target[indices_tuple].shape)
-    if reduction == "sum":
-        np.add.at(target, indices_tuple, updates)
-    elif reduction == "replace":
-        target = np.asarray(target).copy()
-        target.setflags(write=1)
-        target[indices_tuple] = updates
-    elif reduction == "min":
-        np.minimum.at(target, indices_tuple, updates)
-    elif reduction == "max":
-        np.maximum.at(target, indices_tuple, updates)
+    elif reduction == "replace" or not target.flags.c_contiguous:
+        target = np.array(target)
+    # scatter into the flattened target at the offsets of every updated element,
+    # so that the reduction runs as a single 1-D ufunc.at call
+    num_index_dims = indices.shape[-1]
+    slice_size = _reduce(mul, target.shape[num_index_dims:], 1)
+    offsets = _ravel_index_vectors(indices, target.shape[:num_index_dims])
+    updates_shape = offsets.shape + target.shape[num_index_dims:]
+    if updates.size == _reduce(mul, updates_shape, 1):
+        updates = updates.reshape(updates_shape)
     else:
-        raise ivy.utils.exceptions.IvyException(
-            "reduction is {}, but it must be one of "
-            '"sum", "min", "max" or "replace"'.format(reduction)
-        )
+        updates = ivy.to_native(_broadcast_to(updates, updates_shape))
+    offsets = offsets[..., None] * slice_size + np.arange(slice_size)
+    target = _scatter_reduce(
+        target.reshape(-1), offsets.reshape(-1), updates.reshape(-1), reduction
+    ).reshape(target.shape)
     if ivy.exists(out):
         return ivy.inplace_update(out, _to_device(target))
     return _to_device(target)
@@ -347,6 +370,364 @@ def shape(
         return ivy.Shape(x.shape)
 
 
+class _BatchTracer:
+    """
+    Stand-in for a single item of a vmapped batch while tracing.
+
+    ``val`` holds the whole batch as a native array with the mapped axis at
+    position 0. The ivy functions with a batching rule, which dispatch to
+    ``__ivy_array_function__`` when given the tracer, unwrap it and run once on
+    the full batch, as do the numpy ufuncs. Anything else that touches the
+    tracer aborts the trace so that vmap falls back to mapping the function
+    over the items one by one.
+    """
+
+    __slots__ = ("val",)
+
+    def __init__(self, val):
+        self.val = val
+
+    def __ivy_array_function__(self, func, types, args, kwargs):
+        if func.__name__ == "asarray" and not (
+            kwargs.get("dtype") or kwargs.get("copy")
+        ):
+            # the ivy functions taking arrays convert the arguments which aren't
+            return self
+        rule = _batching_rules.get(func.__name__)
+        if (
+            rule is None
+            or kwargs.get("out") is not None
+            or any(isinstance(x, _BatchTracer) for x in kwargs.values())
+        ):
+            raise _NoBatchingRule(func.__name__)
+        # the out argument is passed on by the ivy functions, even if None
+        kwargs = {k: v for k, v in kwargs.items() if k != "out"}
+        return _BatchTracer(ivy.to_native(rule(func, *args, **kwargs)))
+
+    def __array_ufunc__(self, ufunc, method, *inputs, **kwargs):
+        # numpy ufuncs called on the tracer, including through the operators of
+        # numpy arrays, are elementwise apart from matmul
+        if (
+            method != "__call__"
+            or kwargs
+            or (ufunc.signature and ufunc is not np.matmul)
+        ):
+            raise _NoBatchingRule(ufunc.__name__)
+        rule = _matmul_rule if ufunc is np.matmul else _elementwise_rule
+        return _BatchTracer(rule(ufunc, *inputs))
+
+    def __array_function__(self, func, types, args, kwargs):
+        raise _NoBatchingRule(func.__name__)
+
+    def __getattr__(self, name):
+        if name == "is_tracked_proxy":
+            # probed by ivy.nested_map on the leaves of the arguments
+            raise AttributeError(name)
+        raise _NoBatchingRule(name)
+
+    def __array__(self, *args, **kwargs):
+        raise _NoBatchingRule("__array__")
+
+    def __bool__(self):
+        raise _NoBatchingRule("__bool__")
+
+    def __len__(self):
+        raise _NoBatchingRule("__len__")
+
+    def __iter__(self):
+        raise _NoBatchingRule("__iter__")
+
+    def __getitem__(self, query):
+        raise _NoBatchingRule("__getitem__")
+
+    def __setitem__(self, query, val):
+        raise _NoBatchingRule("__setitem__")
+
+    def __int__(self):
+        raise _NoBatchingRule("__int__")
+
+    def __float__(self):
+        raise _NoBatchingRule("__float__")
+
+    def __index__(self):
+        raise _NoBatchingRule("__index__")
+
+    def __pos__(self):
+        return ivy.positive(self)
+
+    def __invert__(self):
+        return ivy.bitwise_invert(self)
+
+    def __neg__(self):
+        return ivy.negative(self)
+
+    def __abs__(self):
+        return ivy.abs(self)
+
+    def __add__(self, other):
+        return ivy.add(self, other)
+
+    def __radd__(self, other):
+        return ivy.add(other, self)
+
+    def __sub__(self, other):
+        return ivy.subtract(self, other)
+
+    def __rsub__(self, other):
+        return ivy.subtract(other, self)
+
+    def __mul__(self, other):
+        return ivy.multiply(self, other)
+
+    def __rmul__(self, other):
+        return ivy.multiply(other, self)
+
+    def __truediv__(self, other):
+        return ivy.divide(self, other)
+
+    def __rtruediv__(self, other):
+        return ivy.divide(other, self)
+
+    def __pow__(self, other):
+        return ivy.pow(self, other)
+
+    def __rpow__(self, other):
+        return ivy.pow(other, self)
+
+    def __matmul__(self, other):
+        return ivy.matmul(self, other)
+
+    def __rmatmul__(self, other):
+        return ivy.matmul(other, self)
+
+    def __floordiv__(self, other):
+        return ivy.floor_divide(self, other)
+
+    def __rfloordiv__(self, other):
+        return ivy.floor_divide(other, self)
+
+    def __mod__(self, other):
+        return ivy.remainder(self, other)
+
+    def __rmod__(self, other):
+        return ivy.remainder(other, self)
+
+    def __and__(self, other):
+        return ivy.bitwise_and(self, other)
+
+    def __rand__(self, other):
+        return ivy.bitwise_and(other, self)
+
+    def __or__(self, other):
+        return ivy.bitwise_or(self, other)
+
+    def __ror__(self, other):
+        return ivy.bitwise_or(other, self)
+
+    def __xor__(self, other):
+        return ivy.bitwise_xor(self, other)
+
+    def __rxor__(self, other):
+        return ivy.bitwise_xor(other, self)
+
+    def __lshift__(self, other):
+        return ivy.bitwise_left_shift(self, other)
+
+    def __rlshift__(self, other):
+        return ivy.bitwise_left_shift(other, self)
+
+    def __rshift__(self, other):
+        return ivy.bitwise_right_shift(self, other)
+
+    def __rrshift__(self, other):
+        return ivy.bitwise_right_shift(other, self)
+
+    def __lt__(self, other):
+        return ivy.less(self, other)
+
+    def __le__(self, other):
+        return ivy.less_equal(self, other)
+
+    def __gt__(self, other):
+        return ivy.greater(self, other)
+
+    def __ge__(self, other):
+        return ivy.greater_equal(self, other)
+
+    def __eq__(self, other):
+        return ivy.equal(self, other)
+
+    def __ne__(self, other):
+        return ivy.not_equal(self, other)
+
+    __hash__ = object.__hash__
+
+
+class _NoBatchingRule(BaseException):
+    """
+    Raised when a vmapped function touches a tracer without a batching rule.
+
+    It derives from BaseException so that it passes through the
+    exception handling of the ivy functions, which wraps any Exception,
+    up to vmap.
+    """
+
+
+def _item_ndim(x):
+    if isinstance(x, _BatchTracer):
+        return x.val.ndim - 1
+    return np.ndim(x)
+
+
+def _align_batched(args, ndim):
+    # insert unit axes after the batch axis so that every batched argument has
+    # ``ndim`` item dimensions, unbatched arguments broadcast against the items
+    return [
+        (
+            np.expand_dims(x.val, tuple(range(1, ndim - x.val.ndim + 2)))
+            if isinstance(x, _BatchTracer)
+            else x
+        )
+        for x in args
+    ]
+
+
+def _elementwise_rule(fn, *args, **kwargs):
+    ndim = max(_item_ndim(x) for x in args)
+    return fn(*_align_batched(args, ndim), **kwargs)
+
+
+def _axis_rule(fn, *args, axis=-1, **kwargs):
+    # ops along one item axis, which moves by one past the batch axis
+    ndim = max(_item_ndim(x) for x in args)
+    if axis is None:
+        raise _NoBatchingRule(fn.__name__)
+    axis = axis + 1 if axis >= 0 else axis
+    return fn(*_align_batched(args, ndim), axis=axis, **kwargs)
+
+
+def _vecdot_rule(fn, x1, x2, /, *, axis=-1, **kwargs):
+    # vecdot contracts the axis like tensordot, i.e. without broadcasting the rest
+    if kwargs:
+        raise _NoBatchingRule(fn.__name__)
+    size = next(x.val.shape[0] for x in (x1, x2) if isinstance(x, _BatchTracer))
+    x1, x2 = (
+        (
+            np.moveaxis(x.val, axis + 1 if axis >= 0 else axis, -1)
+            if isinstance(x, _BatchTracer)
+            else np.broadcast_to(np.moveaxis(x, axis, -1), (size,) + x.shape)
+        )
+        for x in (x1, x2)
+    )
+    x1, x2 = ivy.promote_types_of_inputs(x1, x2)
+    ret = np.matmul(
+        x1.reshape(size, -1, x1.shape[-1]),
+        x2.reshape(size, -1, x2.shape[-1]).swapaxes(-1, -2),
+    )
+    return ret.reshape((size,) + x1.shape[1:-1] + x2.shape[1:-1])
+
+
+def _softmax_rule(fn, x, /, *, axis=None, **kwargs):
+    return _axis_rule(fn, x, axis=axis, **kwargs)
+
+
+def _reduction_rule(fn, x, /, *, axis=None, **kwargs):
+    if not isinstance(x, _BatchTracer):
+        raise _NoBatchingRule(fn.__name__)
+    ndim = x.val.ndim - 1
+    if axis is None:
+        axis = tuple(range(ndim))
+    axis = tuple(a % ndim + 1 for a in ((axis,) if isinstance(axis, int) else axis))
+    return fn(x.val, axis=axis, **kwargs)
+
+
+def _arg_reduction_rule(fn, x, /, *, axis=None, keepdims=False, **kwargs):
+    if not isinstance(x, _BatchTracer):
+        raise _NoBatchingRule(fn.__name__)
+    val = x.val
+    if axis is None:
+        if keepdims:
+            raise _NoBatchingRule(fn.__name__)
+        val = val.reshape(val.shape[0], -1)
+        axis = 0
+    axis = axis + 1 if axis >= 0 else axis
+    return fn(val, axis=axis, keepdims=keepdims, **kwargs)
+
+
+def _matmul_rule(fn, x1, x2, /, **kwargs):
+    if kwargs:
+        raise _NoBatchingRule(fn.__name__)
+    # vectors are promoted to matrices as np.matmul does, and squeezed back out
+    x1_vector, x2_vector = _item_ndim(x1) == 1, _item_ndim(x2) == 1
+    if x1_vector:
+        x1 = _BatchTracer(x1.val[:, None]) if isinstance(x1, _BatchTracer) else x1[None]
+    if x2_vector:
+        x2 = (
+            _BatchTracer(x2.val[..., None])
+            if isinstance(x2, _BatchTracer)
+            else x2[..., None]
+        )
+    ret = ivy.to_native(_elementwise_rule(fn, x1, x2))
+    if x2_vector:
+        ret = ret[..., 0]
+    if x1_vector:
+        ret = ret[..., 0] if x2_vector else ret[..., 0, :]
+    return ret
+
+
+_batching_rules = {
+    **dict.fromkeys(
+        [
+            name
+            for name, obj in vars(_ivy_elementwise).items()
+            if callable(obj)
+            and not name.startswith("_")
+            and getattr(obj, "__module__", None) == _ivy_elementwise.__name__
+            and name != "trapz"
+        ]
+        + [
+            "gelu",
+            "hardswish",
+            "leaky_relu",
+            "mish",
+            "relu",
+            "sigmoid",
+            "softplus",
+            "softsign",
+            "where",
+        ],
+        _elementwise_rule,
+    ),
+    **dict.fromkeys(["argsort", "sort"], _axis_rule),
+    **dict.fromkeys(["log_softmax", "softmax"], _softmax_rule),
+    **dict.fromkeys(
+        ["all", "any", "max", "mean", "min", "prod", "std", "sum", "var"],
+        _reduction_rule,
+    ),
+    **dict.fromkeys(["argmax", "argmin"], _arg_reduction_rule),
+    "matmul": _matmul_rule,
+    "vecdot": _vecdot_rule,
+}
+
+
+def _vmap_batched(func, args, batched):
+    """
+    Run ``func`` once on the whole batch by tracing it with batching rules.
+
+    Returns None if ``func`` touches its inputs without a batching rule, or
+    if its output isn't a single batched array, while any other error raised
+    by ``func`` propagates.
+    """
+    args = [_BatchTracer(x) if b else x for x, b in zip(args, batched)]
+    try:
+        ret = func(*args)
+    except _NoBatchingRule:
+        return None
+    if isinstance(ret, _BatchTracer):
+        return ret.val
+    return None
+
+
 def vmap(
     func: Callable,
     in_axes: Union[int, Sequence[int], Sequence[None]] = 0,
@@ -397,33 +778,26 @@ def vmap(
                 in_axes, message="single value in_axes should not be None"
             )
 
-        # Handling None in in_axes by broadcasting the axis_size
-        if isinstance(in_axes, (tuple, list)) and None in in_axes:
-            none_axis_index = list()
-            for index, axis in enumerate(in_axes):
-                if axis is None:
-                    none_axis_index.append(index)
-
-            for none_mapped_axis in none_axis_index:
-                args[none_mapped_axis] = np.broadcast_to(
-                    args[none_mapped_axis],
-                    (tuple(axis_size) + args[none_mapped_axis].shape),
-                )
-
         # set up the axis to be mapped to index zero.
         if isinstance(in_axes, (tuple, list)):
+            batched = [axis is not None for axis in in_axes]
             for i in range(len(in_axes)):
                 if in_axes[i] is not None:
                     args[i] = np.moveaxis(args[i], in_axes[i], 0)
         elif isinstance(in_axes, int):
-            args[0] = np.moveaxis(args[0], in_axes, 0)
-
-        # vectorisation. To be optimized.
-        arr_results = []
-        for arrays in zip(*args):
-            single_op = func(*arrays)
-            arr_results.append(single_op)
-        res = np.stack(arr_results)
+            batched = [True] * len(args)
+            args = [np.moveaxis(arg, in_axes, 0) for arg in args]
+
+        # run the whole batch at once if all the primitives have batching rules
+        res = _vmap_batched(func, args, batched)
+
+        if res is None:
+            # Handling None in in_axes by broadcasting the axis_size
+            args = [
+                arg if b else np.broadcast_to(arg, tuple(axis_size) + arg.shape)
+                for arg, b in zip(args, batched)
+            ]
+            res = np.stack([func(*arrays) for arrays in zip(*args)])
 
         if out_axes:
             res = np.moveaxis(res, 0, out_axes)
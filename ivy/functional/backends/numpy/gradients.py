@@ -1,27 +1,61 @@
 """Collection of NumPy gradient functions, wrapped to fit Ivy syntax and signature."""
 
 # global
-import logging
-from typing import Optional, Sequence, Union
+import numpy as np
+from typing import Optional, Callable, Sequence, Union
+
+# local
 import ivy
+from ivy.functional.ivy.gradients import (
+    _get_required_float_variables,
+    _get_y_and_ret_idxs,
+    _get_native_y,
+    _set_duplicates,
+    _process_func_ret_and_grads,
+)
+from .autograd import _Tape, _TracedArray, _watch, _is_watched, _raw
 
 
 def variable(x, /):
-    logging.warning(
-        "NumPy does not support autograd, declaring a 'variable' "
-        "is identical to declaring an 'array' when using numpy backend."
-    )
-    return x
+    if ivy.is_int_dtype(x.dtype):
+        x = ivy.astype(x, ivy.default_float_dtype()).to_native()
+    return _watch(x)
 
 
 def is_variable(x, /, *, exclusive=False):
-    # NumPy does not support autograd, checking if x is a variable does have any meaning
-    # for NumPy. Return False.
-    return False
+    return _is_watched(x)
 
 
 def variable_data(x, /):
-    return x
+    return _raw(x)
+
+
+def _watch_nest(xs):
+    # traced copies of all the arrays in the nest, keeping ivy arrays as such
+    def _watch_fn(x):
+        if ivy.is_ivy_array(x):
+            return ivy.Array(_watch(_raw(x.data)))
+        return _watch(_raw(x)) if ivy.is_native_array(x) else x
+
+    return ivy.nested_map(_watch_fn, xs, include_derived=True, shallow=False)
+
+
+def _grad_func(tape, y, xs, retain_graph):
+    """Gradient calculation function."""
+    if isinstance(xs, np.ndarray):
+        return tape.gradients([y], [xs], retain_graph=retain_graph)[0]
+    leaf_idxs = ivy.nested_argwhere(xs, lambda x: isinstance(x, _TracedArray))
+    grads = tape.gradients(
+        [y], ivy.multi_index_nest(xs, leaf_idxs), retain_graph=retain_graph
+    )
+    grads_ = ivy.nested_map(
+        lambda x: np.zeros_like(x) if ivy.is_native_array(x) else x,
+        xs,
+        include_derived=True,
+        shallow=False,
+    )
+    ivy.set_nest_at_indices(grads_, leaf_idxs, grads)
+    return grads_
 
 
 def execute_with_gradients(
@@ -33,67 +67,138 @@ def execute_with_gradients(
     xs_grad_idxs: Optional[Sequence[Sequence[Union[str, int]]]] = [[0]],
     ret_grad_idxs: Optional[Sequence[Sequence[Union[str, int]]]] = [[0]],
 ):
-    logging.warning(
-        "NumPy does not support autograd, "
-        "'execute_with_gradients' returns None in place of function gradients."
-    )
-    xs = ivy.to_ivy(xs)
-    func_ret = func(xs)
-    return func_ret, None
-
-
-def value_and_grad(func):
-    logging.warning(
-        "NumPy does not support autograd, 'value_and_grad' "
-        "has no effect on the array, as gradients are not supported in the first place."
-    )
-
-    def grad_fn(xs):
-        grads = ivy.nested_map(
-            lambda x: ivy.zeros_like(x), xs, include_derived=True, shallow=False
+    # Conversion of required arrays to float variables and duplicate index chains
+    (
+        xs,
+        xs_grad_idxs,
+        xs1,
+        required_duplicate_index_chains,
+        _,
+    ) = _get_required_float_variables(xs, xs_grad_idxs)
+    with _Tape() as tape:
+        func_ret = func(xs)
+        # Getting the relevant outputs from the function return for gradient
+        # calculation
+        ret_grad_idxs, y, ret_idxs = _get_y_and_ret_idxs(func_ret, ret_grad_idxs)
+    xs = xs1
+
+    if isinstance(y, ivy.NativeArray):
+        # Gradient calculation for a single output
+        grads = _set_duplicates(
+            _grad_func(tape, y, xs, False), required_duplicate_index_chains
         )
-        y = func(xs)
-        y = ivy.to_ivy(y)
-        return y, grads
+    else:
+        # Gradient calculation for multiple outputs, keeping the recorded operations
+        # until the last output has been differentiated
+        y = _get_native_y(y)
+        grad_arr_idxs = ivy.nested_argwhere(y, lambda x: ivy.is_native_array(x))
+        grad_arr_values = ivy.multi_index_nest(y, grad_arr_idxs)
+        grads_ = [
+            _grad_func(tape, arr_value, xs, i < len(grad_arr_values) - 1)
+            for i, arr_value in enumerate(grad_arr_values)
+        ]
+        tape.release()
+        grads = grads_
+        if isinstance(ret_idxs, list) and len(ret_idxs):
+            grads = {
+                ret_idxs[i]: _set_duplicates(grad, required_duplicate_index_chains)
+                for i, grad in enumerate(grads_)
+            }
+
+    # Stop further gradient propagation if not retaining gradients
+    return _process_func_ret_and_grads(func_ret, grads, retain_grads)
 
-    return grad_fn
 
+def value_and_grad(func):
+    def callback_fn(xs):
+        xs = _watch_nest(xs)
+        with _Tape() as tape:
+            y = ivy.to_native(func(xs))
+        grads = _grad_func(tape, y, ivy.to_native(xs, nested=True), False)
+        return ivy.to_ivy(_raw(y)), ivy.to_ivy(grads, nested=True)
 
-def jac(func):
-    logging.warning(
-        "NumPy does not support autograd, 'jac' "
-        "has no effect on the array, as gradients are not supported in the first place."
-    )
-
-    def grad_fn(xs):
-        jacobian = ivy.nested_map(
-            lambda x: ivy.zeros_like(x), xs, include_derived=True, shallow=False
-        )
-        return jacobian
-
-    return grad_fn
-
-
-def grad(func, argnums=0):
-    logging.warning(
-        "NumPy does not support autograd, 'grad' "
-        "has no effect on the array, as gradients are not supported in the first place."
-    )
-
-    def grad_fn(xs):
-        grad = ivy.nested_map(
-            lambda x: ivy.zeros_like(x), xs, include_derived=True, shallow=False
-        )
-        y = func(xs)
-        y = ivy.to_ivy(y)
-        return grad
-
-    return grad_fn
+    return callback_fn
 
 
-def stop_gradient(x, /, *, preserve_type=True, out=None):
-    logging.warning(
-        "NumPy does not support autograd, 'stop_gradient' "
-        "has no effect on the array, as gradients are not supported in the first place."
-    )
-    return x
+def stop_gradient(
+    x: np.ndarray,
+    /,
+    *,
+    preserve_type: bool = True,
+    out: Optional[np.ndarray] = None,
+) -> np.ndarray:
+    if is_variable(x) and preserve_type:
+        return _watch(_raw(x))
+    return _raw(x)
+
+
+def jac(func: Callable):
+    def callback_fn(x_in):
+        x_in = ivy.to_native(_watch_nest(x_in), nested=True)
+        with _Tape() as tape:
+            ys = ivy.to_native(func(ivy.to_ivy(x_in, nested=True)), nested=True)
+        y_idxs = ivy.nested_argwhere(ys, ivy.is_native_array)
+        y_values = ivy.multi_index_nest(ys, y_idxs)
+        x_idxs = ivy.nested_argwhere(x_in, lambda x: isinstance(x, _TracedArray))
+        x_values = ivy.multi_index_nest(x_in, x_idxs)
+
+        def _jacobian(y, last):
+            # one backward pass for each element of the output
+            y_size = int(np.prod(y.shape))
+            rows = []
+            for i in range(y_size):
+                cotangent = np.zeros(y_size, y.dtype)
+                cotangent[i] = 1
+                rows.append(
+                    tape.gradients(
+                        [y],
+                        x_values,
+                        [cotangent.reshape(y.shape)],
+                        retain_graph=not (last and i == y_size - 1),
+                    )
+                )
+            jacobians = [
+                (
+                    np.stack([row[j] for row in rows]).reshape(y.shape + x.shape)
+                    if rows
+                    else np.zeros(y.shape + x.shape, x.dtype)
+                )
+                for j, x in enumerate(x_values)
+            ]
+            if isinstance(x_in, np.ndarray):
+                return jacobians[0]
+            ret = ivy.nested_map(lambda x: x, x_in, include_derived=True, shallow=False)
+            ivy.set_nest_at_indices(ret, x_idxs, jacobians)
+            return ret
+
+        jacobians = [
+            _jacobian(y, i == len(y_values) - 1) for i, y in enumerate(y_values)
+        ]
+        tape.release()
+        if isinstance(ys, np.ndarray):
+            return ivy.to_ivy(jacobians[0], nested=True, include_derived=True)
+        ivy.set_nest_at_indices(ys, y_idxs, jacobians)
+        return ivy.to_ivy(ys, nested=True, include_derived=True)
+
+    return callback_fn
+
+
+def grad(func: Callable, argnums: Union[int, Sequence[int]] = 0):
+    def callback_fn(*args, **kwargs):
+        argnums_ = [argnums] if isinstance(argnums, int) else list(argnums)
+        args = list(args)
+        for i in argnums_:
+            args[i] = _watch_nest(args[i])
+        with _Tape() as tape:
+            y = ivy.to_native(func(*args, **kwargs))
+        grads = [
+            ivy.to_ivy(
+                _grad_func(tape, y, ivy.to_native(args[i], nested=True), True),
+                nested=True,
+            )
+            for i in argnums_
+        ]
+        tape.release()
+        return grads[0] if isinstance(argnums, int) else tuple(grads)
+
+    return callback_fn
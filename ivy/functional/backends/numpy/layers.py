@@ -12,8 +12,117 @@ from ivy.functional.ivy.layers import (
     _deconv_length,
     _get_x_data_format,
 )
+from .autograd import _primitive, _defvjp
 
 
+# upper bound on the size of the im2col buffer materialised per tile
+_IM2COL_TILE_BYTES = 1 << 26
+
+
+@_primitive
+def _im2col_conv(x, filters, strides, dims, feature_group_count=1):
+    """
+    Convolve `x` with `filters` using im2col and a batched matmul.
+
+    `x` is a padded and dilated channel-last input and `filters` is of shape
+    *K x I x O. The input windows are copied into the column matrix in tiles over
+    the batch and the first output dimension, such that the materialised buffer
+    stays below _IM2COL_TILE_BYTES.
+    """
+    kernel = list(filters.shape[:dims])
+    input_dim, output_dim = filters.shape[-2:]
+    groups = feature_group_count
+    out_spatial = [(x.shape[i + 1] - kernel[i]) // strides[i] + 1 for i in range(dims)]
+    # B x *OS x *K x G x I
+    windows = np.lib.stride_tricks.as_strided(
+        x,
+        [x.shape[0], *out_spatial, *kernel, groups, input_dim],
+        (
+            x.strides[0],
+            *[x.strides[i + 1] * strides[i] for i in range(dims)],
+            *x.strides[1:-1],
+            x.strides[-1] * input_dim,
+            x.strides[-1],
+        ),
+        writeable=False,
+    )
+    # G x KI x O/G
+    filters = np.moveaxis(
+        filters.reshape(-1, groups, output_dim // groups), 1, 0
+    ).reshape(groups, -1, output_dim // groups)
+    dtype = np.result_type(x, filters)
+    res = np.empty([x.shape[0], *out_spatial, output_dim], dtype=dtype)
+
+    row_bytes = max(1, int(np.prod(kernel)) * x.shape[-1] * dtype.itemsize)
+    batch_rows = int(np.prod(out_spatial))
+    batch_tile = max(1, _IM2COL_TILE_BYTES // max(1, batch_rows * row_bytes))
+    if batch_tile > 1 or not out_spatial[0]:
+        out_tile = max(1, out_spatial[0])
+    else:
+        out_tile = max(
+            1, _IM2COL_TILE_BYTES // max(1, batch_rows // out_spatial[0] * row_bytes)
+        )
+    for b in range(0, x.shape[0], batch_tile):
+        for o in range(0, out_spatial[0], out_tile):
+            tile = windows[b : b + batch_tile, o : o + out_tile]
+            tile_shape = tile.shape[: dims + 1]
+            # G x rows x KI
+            cols = np.moveaxis(tile, -2, 0).reshape(
+                groups, -1, int(np.prod(kernel)) * input_dim
+            )
+            # rows x O
+            tile_res = np.moveaxis(np.matmul(cols, filters), 0, 1).reshape(
+                *tile_shape, output_dim
+            )
+            res[b : b + batch_tile, o : o + out_tile] = tile_res
+    return res
+
+
+def _im2col_conv_windows(x, filters, strides, dims, feature_group_count):
+    # the input slice seen by each kernel offset, with the output spatial shape
+    kernel = filters.shape[:dims]
+    out_spatial = [(x.shape[i + 1] - kernel[i]) // strides[i] + 1 for i in range(dims)]
+    for k in np.ndindex(*kernel):
+        yield k, (slice(None),) + tuple(
+            slice(k[i], k[i] + strides[i] * (out_spatial[i] - 1) + 1, strides[i])
+            for i in range(dims)
+        )
+
+
+def _im2col_conv_x_vjp(g, ans, p):
+    x, filters, groups = p["x"], p["filters"], p["feature_group_count"]
+    input_dim, output_dim = filters.shape[-2:]
+    ret = np.zeros(x.shape, g.dtype)
+    if not g.size:
+        return ret
+    # G x N x O/G
+    g = np.moveaxis(g.reshape(-1, groups, output_dim // groups), 1, 0)
+    for k, index in _im2col_conv_windows(x, filters, p["strides"], p["dims"], groups):
+        # G x O/G x I
+        f = filters[k].reshape(input_dim, groups, -1).transpose(1, 2, 0)
+        ret[index] += np.moveaxis(np.matmul(g, f), 0, 1).reshape(ret[index].shape)
+    return ret
+
+
+def _im2col_conv_filters_vjp(g, ans, p):
+    x, filters, groups = p["x"], p["filters"], p["feature_group_count"]
+    input_dim, output_dim = filters.shape[-2:]
+    ret = np.zeros(filters.shape, g.dtype)
+    if not g.size:
+        return ret
+    # G x N x O/G
+    g = np.moveaxis(g.reshape(-1, groups, output_dim // groups), 1, 0)
+    for k, index in _im2col_conv_windows(x, filters, p["strides"], p["dims"], groups):
+        # G x I x N
+        cols = np.moveaxis(x[index].reshape(-1, groups, input_dim), 0, -1)
+        ret[k] = np.moveaxis(np.matmul(cols, g), 0, 1).reshape(input_dim, output_dim)
+    return ret
+
+
+_defvjp(_im2col_conv, x=_im2col_conv_x_vjp, filters=_im2col_conv_filters_vjp)
+
+
+@_primitive
 def _add_dilations(x, dilations, axis, values=0):
     return np.insert(
         x,
@@ -23,6 +132,14 @@ def _add_dilations(x, dilations, axis, values=0):
     )
 
 
+_defvjp(
+    _add_dilations,
+    x=lambda g, ans, p: np.take(
+        g, np.arange(0, g.shape[p["axis"]], p["dilations"]), axis=p["axis"]
+    ),
+)
+
+
 def _dilate_pad_conv(x, filters, strides, padding, dims, dilations):
     for j in range(dims):
         if dilations[j] > 1:
@@ -134,32 +251,7 @@ def conv1d(
     x, filters = _ff_xd_before_conv(x, filters, 1, filter_format, x_dilations)
     x, filters = _dilate_pad_conv(x, filters, strides, padding, 1, dilations)
 
-    x_shape = x.shape
-    filter_shape = list(filters.shape[0:1])
-    input_dim = filters.shape[-2]
-    output_dim = filters.shape[-1]
-    new_w = (x_shape[1] - filter_shape[0]) // strides[0] + 1
-    new_shape = [x_shape[0], new_w] + filter_shape + [x_shape[-1]]
-    new_strides = (
-        x.strides[0],
-        x.strides[1] * strides[0],
-        x.strides[1],
-        x.strides[2],
-    )
-    # B x OW x KW x I
-    sub_matrices = np.lib.stride_tricks.as_strided(
-        x, new_shape, new_strides, writeable=False
-    )
-    # B x OW x KW x I x O
-    sub_matrices_w_output_dim = np.tile(
-        np.expand_dims(sub_matrices, -1), [1] * 4 + [output_dim]
-    )
-    # B x OW x KW x I x O
-    mult = sub_matrices_w_output_dim * filters.reshape(
-        [1] * 2 + filter_shape + [input_dim, output_dim]
-    )
-    # B x OW x O
-    res = np.sum(mult, (2, 3))
+    res = _im2col_conv(x, filters, strides, 1)
     res = np.add(res, bias) if bias is not None else res
     if data_format == "NCW":
         res = np.transpose(res, (0, 2, 1))
@@ -216,35 +308,7 @@ def conv2d(
     x, filters = _ff_xd_before_conv(x, filters, 2, filter_format, x_dilations)
     x, filters = _dilate_pad_conv(x, filters, strides, padding, 2, dilations)
 
-    x_shape = x.shape
-    filter_shape = list(filters.shape[0:2])
-    input_dim = filters.shape[-2]
-    output_dim = filters.shape[-1]
-    new_h = (x_shape[1] - filter_shape[0]) // strides[0] + 1
-    new_w = (x_shape[2] - filter_shape[1]) // strides[1] + 1
-    new_shape = [x_shape[0], new_h, new_w] + filter_shape + [x_shape[-1]]
-    new_strides = (
-        x.strides[0],
-        x.strides[1] * strides[0],
-        x.strides[2] * strides[1],
-        x.strides[1],
-        x.strides[2],
-        x.strides[3],
-    )
-    # B x OH x OW x KH x KW x I
-    sub_matrices = np.lib.stride_tricks.as_strided(
-        x, new_shape, new_strides, writeable=False
-    )
-    # B x OH x OW x KH x KW x I x O
-    sub_matrices_w_output_dim = np.tile(
-        np.expand_dims(sub_matrices, -1), [1] * 6 + [output_dim]
-    )
-    # B x OH x OW x KH x KW x I x O
-    mult = sub_matrices_w_output_dim * filters.reshape(
-        [1] * 3 + filter_shape + [input_dim, output_dim]
-    )
-    # B x OH x OW x O
-    res = np.sum(mult, (3, 4, 5))
+    res = _im2col_conv(x, filters, strides, 2)
     res = np.add(res, bias) if bias is not None else res
     if data_format == "NCHW":
         return np.transpose(res, (0, 3, 1, 2))
@@ -293,47 +357,16 @@ def depthwise_conv2d(
 ):
     strides = [strides] * 2 if isinstance(strides, int) else strides
     dilations = [dilations] * 2 if isinstance(dilations, int) else dilations
-    if isinstance(padding, int):
-        padding = [(padding, padding)] * 2
-    if data_format == "NHWC":
-        x = np.transpose(x, (3, 0, 1, 2))
-    else:
-        x = np.transpose(x, (1, 0, 2, 3))
+    if data_format == "NCHW":
+        x = np.transpose(x, (0, 2, 3, 1))
     filters = np.squeeze(filters, 3) if filters.ndim == 4 else filters
-    filters = np.transpose(filters, (2, 0, 1))
-    filters = np.expand_dims(filters, (-1, -2))
-    filter_h = filters.shape[1] + (filters.shape[1] - 1) * (dilations[0] - 1)
-    filter_w = filters.shape[2] + (filters.shape[2] - 1) * (dilations[1] - 1)
-    if isinstance(padding, str):
-        if padding == "VALID":
-            out_height = np.ceil(float(x.shape[2] - filter_h + 1) / float(strides[0]))
-            out_width = np.ceil(float(x.shape[3] - filter_w + 1) / float(strides[1]))
-        else:
-            out_height = np.ceil(float(x.shape[2]) / float(strides[0]))
-            out_width = np.ceil(float(x.shape[3]) / float(strides[1]))
-    else:
-        out_height = np.ceil(
-            float(x.shape[2] - filter_h + padding[0][0] + padding[0][1] + 1)
-            / float(strides[0])
-        )
-        out_width = np.ceil(
-            float(x.shape[3] - filter_w + padding[1][0] + padding[1][1] + 1)
-            / float(strides[1])
-        )
-    if data_format == "NHWC":
-        outputs = np.empty([x.shape[1], int(out_height), int(out_width), 0], x.dtype)
-    else:
-        outputs = np.empty([x.shape[1], 0, int(out_height), int(out_width)], x.dtype)
-    x = np.expand_dims(x, -1)
-    for i in range(x.shape[0]):
-        output = conv2d(
-            x[i], filters[i], strides, padding, data_format="NHWC", dilations=dilations
-        )
-        if data_format == "NHWC":
-            outputs = np.append(outputs, output, axis=-1)
-        else:
-            outputs = np.append(outputs, np.transpose(output, (0, 3, 1, 2)), axis=1)
-    return outputs
+    # every channel is its own group with a single input and output channel
+    filters = np.expand_dims(filters, -2)
+    x, filters = _dilate_pad_conv(x, filters, strides, padding, 2, dilations)
+    res = _im2col_conv(x, filters, strides, 2, feature_group_count=x.shape[-1])
+    if data_format == "NCHW":
+        return np.transpose(res, (0, 3, 1, 2))
+    return res
 
 
 def conv3d(
@@ -357,38 +390,7 @@ def conv3d(
     x, filters = _ff_xd_before_conv(x, filters, 3, filter_format, x_dilations)
     x, filters = _dilate_pad_conv(x, filters, strides, padding, 3, dilations)
 
-    x_shape = x.shape
-    filter_shape = list(filters.shape[0:3])
-    input_dim = filters.shape[-2]
-    output_dim = filters.shape[-1]
-    new_d = (x_shape[1] - filter_shape[0]) // strides[0] + 1
-    new_h = (x_shape[2] - filter_shape[1]) // strides[1] + 1
-    new_w = (x_shape[3] - filter_shape[2]) // strides[2] + 1
-    new_shape = [x_shape[0], new_d, new_h, new_w] + filter_shape + [x_shape[-1]]
-    new_strides = (
-        x.strides[0],
-        x.strides[1] * strides[0],
-        x.strides[2] * strides[1],
-        x.strides[3] * strides[2],
-        x.strides[1],
-        x.strides[2],
-        x.strides[3],
-        x.strides[4],
-    )
-    # B x OD X OH x OW x KD X KH x KW x I
-    sub_matrices = np.lib.stride_tricks.as_strided(
-        x, new_shape, new_strides, writeable=False
-    )
-    # B x OD X OH x OW x KD X KH x KW x I x O
-    sub_matrices_w_output_dim = np.tile(
-        np.expand_dims(sub_matrices, -1), [1] * 8 + [output_dim]
-    )
-    # B x OD X OH x OW x KD X KH x KW x I x O
-    mult = sub_matrices_w_output_dim * filters.reshape(
-        [1] * 4 + filter_shape + [input_dim, output_dim]
-    )
-    # B x OD X OH x OW x O
-    res = np.sum(mult, (4, 5, 6, 7))
+    res = _im2col_conv(x, filters, strides, 3)
     res = np.add(res, bias) if bias is not None else res
     if data_format == "NCDHW":
         return np.transpose(res, (0, 4, 1, 2, 3))
@@ -455,46 +457,7 @@ def conv_general_dilated(
             x = _add_dilations(x, x_dilations[j], axis=j + 1)
     x, filters = _dilate_pad_conv(x, filters, strides, padding, dims, dilations)
 
-    x_shape = x.shape
-    filter_shape = list(filters.shape[0:dims])
-    input_dim = filters.shape[-2]
-    output_dim = filters.shape[-1]
-    new_shape = [
-        (x_shape[i + 1] - filter_shape[i]) // strides[i] + 1 for i in range(dims)
-    ]
-    res = []
-    new_shape = [x_shape[0], *new_shape] + filter_shape + [input_dim]
-    for i, j in zip(
-        range(0, x.shape[-1], input_dim),
-        range(0, output_dim, output_dim // feature_group_count),
-    ):
-        sliced_x = x[..., i : i + input_dim]
-        sliced_filters = filters[..., j : j + output_dim // feature_group_count]
-        normal_strides = [sliced_x.strides[i] for i in range(1, dims + 2)]
-        changed_strides = [
-            sliced_x.strides[i] * strides[i - 1] for i in range(1, dims + 1)
-        ]
-        new_strides = (x.strides[0], *changed_strides, *normal_strides)
-        # B x OH x OW x KH x KW x I
-        sub_matrices = np.lib.stride_tricks.as_strided(
-            sliced_x, new_shape, new_strides, writeable=False
-        )
-
-        # B x OH x OW x KH x KW x I x O
-        sub_matrices_w_output_dim = np.tile(
-            np.expand_dims(sub_matrices, -1),
-            [1] * (dims * 2 + 2) + [output_dim // feature_group_count],
-        )
-        # B x OH x OW x KH x KW x I x O
-        mult = sub_matrices_w_output_dim * sliced_filters.reshape(
-            [1] * (dims + 1)
-            + filter_shape
-            + [input_dim, output_dim // feature_group_count]
-        )
-
-        # B x OH x OW x O
-        res.append(np.sum(mult, tuple([i for i in range(dims + 1, dims * 2 + 2)])))
-    res = np.concatenate(res, axis=-1)
+    res = _im2col_conv(x, filters, strides, dims, feature_group_count)
     res = np.add(res, bias) if bias is not None else res
 
     if data_format == "channel_first":
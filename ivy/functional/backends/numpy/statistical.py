@@ -23,7 +23,7 @@ def min(
     out: Optional[np.ndarray] = None,
 ) -> np.ndarray:
     axis = tuple(axis) if isinstance(axis, list) else axis
-    return np.asarray(np.amin(a=x, axis=axis, keepdims=keepdims, out=out))
+    return np.asanyarray(np.amin(a=x, axis=axis, keepdims=keepdims, out=out))
 
 
 min.support_native_out = True
@@ -38,7 +38,7 @@ def max(
     out: Optional[np.ndarray] = None,
 ) -> np.ndarray:
     axis = tuple(axis) if isinstance(axis, list) else axis
-    return np.asarray(np.amax(a=x, axis=axis, keepdims=keepdims, out=out))
+    return np.asanyarray(np.amax(a=x, axis=axis, keepdims=keepdims, out=out))
 
 
 max.support_native_out = True
@@ -82,7 +82,9 @@ def prod(
     if dtype is None:
         dtype = _infer_dtype(x.dtype)
     axis = tuple(axis) if isinstance(axis, list) else axis
-    return np.asarray(np.prod(a=x, axis=axis, dtype=dtype, keepdims=keepdims, out=out))
+    return np.asanyarray(
+        np.prod(a=x, axis=axis, dtype=dtype, keepdims=keepdims, out=out)
+    )
 
 
 prod.support_native_out = True
@@ -98,7 +100,9 @@ def std(
     out: Optional[np.ndarray] = None,
 ) -> np.ndarray:
     axis = tuple(axis) if isinstance(axis, list) else axis
-    return np.asarray(np.std(x, axis=axis, ddof=correction, keepdims=keepdims, out=out))
+    return np.asanyarray(
+        np.std(x, axis=axis, ddof=correction, keepdims=keepdims, out=out)
+    )
 
 
 std.support_native_out = True
@@ -116,7 +120,7 @@ def sum(
     if dtype is None and not ivy.is_bool_dtype(x):
         dtype = x.dtype
     axis = tuple(axis) if isinstance(axis, list) else axis
-    return np.asarray(
+    return np.asanyarray(
         np.sum(
             a=x,
             axis=axis,
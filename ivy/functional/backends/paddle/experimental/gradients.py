@@ -1,7 +1,21 @@
 # global
+from paddle.distributed.fleet.utils import recompute
 
+# local
+import ivy
+from ivy.func_wrapper import inputs_to_native_arrays
 from ivy.utils.exceptions import IvyNotImplementedException
 
 
 def bind_custom_gradient_function(func, custom_grad_fn):
     raise IvyNotImplementedException()
+
+
+def checkpoint(func):
+    def _func(*args, **kwargs):
+        return ivy.to_native(func(*args, **kwargs), nested=True, include_derived=True)
+
+    def _checkpointed(*args, **kwargs):
+        return recompute(_func, *args, use_reentrant=False, **kwargs)
+
+    return inputs_to_native_arrays(_checkpointed)
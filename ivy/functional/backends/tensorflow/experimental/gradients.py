@@ -19,3 +19,22 @@ def bind_custom_gradient_function(func, custom_grad_fn):
         return ivy.to_native((ret, grad), nested=True, include_derived=True)
 
     return inputs_to_native_arrays(custom_module)
+
+
+def checkpoint(func):
+    def _checkpointed(*args, **kwargs):
+        # tf.recompute_grad differentiates flat tensor arguments only
+        inputs = [args, kwargs]
+        idxs = ivy.nested_argwhere(
+            inputs, lambda x: isinstance(x, (tf.Tensor, tf.Variable))
+        )
+
+        def _func(*xs):
+            args, kwargs = ivy.set_nest_at_indices(inputs, idxs, xs, shallow=False)
+            return ivy.to_native(
+                func(*args, **kwargs), nested=True, include_derived=True
+            )
+
+        return tf.recompute_grad(_func)(*ivy.multi_index_nest(inputs, idxs))
+
+    return inputs_to_native_arrays(_checkpointed)
@@ -1,5 +1,6 @@
 # global
 import torch
+import torch.utils.checkpoint
 
 # local
 import ivy
@@ -25,3 +26,15 @@ def bind_custom_gradient_function(func, custom_grad_fn):
 
     custom_module = _CustomModule.apply
     return inputs_to_native_arrays(custom_module)
+
+
+def checkpoint(func):
+    def _func(*args, **kwargs):
+        return ivy.to_native(func(*args, **kwargs), nested=True, include_derived=True)
+
+    def _checkpointed(*args, **kwargs):
+        return torch.utils.checkpoint.checkpoint(
+            _func, *args, use_reentrant=False, **kwargs
+        )
+
+    return inputs_to_native_arrays(_checkpointed)
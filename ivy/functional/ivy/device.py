@@ -2,7 +2,6 @@
 
 # global
 import os
-import gc
 import abc
 import math
 import psutil
@@ -167,6 +166,67 @@ def _shift_native_arrays_on_default_device(*args, **kwargs):
     return args, kwargs, default_device
 
 
+def _get_split_chunk_sizes(inputs, input_axes, max_chunk_size, chunk_size, device):
+    """
+    Get the sizes of the chunks for splitting the inputs of a function call.
+
+    The inputs are split along the first input axis, using the global
+    split factor of the device unless a chunk size is given. Returns
+    None if the inputs fit into a single chunk.
+    """
+    if not ivy.exists(max_chunk_size) and not ivy.exists(chunk_size):
+        shape_key = "_".join([str(inp.shape) for inp in inputs])
+        if shape_key in max_chunk_sizes:
+            max_chunk_size = max_chunk_sizes[shape_key]
+        else:
+            max_chunk_size = 0
+        max_dim = max(
+            [
+                (inp.shape if ivy.is_array(inp) else inp.cont_shape)[inp_ax]
+                for inp, inp_ax in zip(inputs, input_axes)
+            ]
+        )
+        if max_dim > max_chunk_size:
+            max_chunk_sizes[shape_key] = max_dim
+            max_chunk_size = max_dim
+    chunk_size = ivy.default(
+        chunk_size,
+        default_val=lambda: 1
+        + int(
+            round((max_chunk_size - 1) * ivy.split_factor(ivy.default_device(device)))
+        ),
+        with_callable=True,
+    )
+    dim_size = inputs[0].shape[input_axes[0]]
+    if chunk_size >= dim_size:
+        return None
+    num_chunks = dim_size / chunk_size
+    num_chunks_floored = math.floor(num_chunks)
+    chunk_sizes = [chunk_size] * num_chunks_floored
+    if num_chunks != num_chunks_floored:
+        chunk_sizes.append(dim_size - chunk_size * num_chunks_floored)
+    return chunk_sizes
+
+
+def _split_inputs(inputs, input_axes, chunk_sizes):
+    """Split each of the inputs along its axis into chunks of the given sizes."""
+    return [
+        (
+            ivy.split(
+                inp,
+                num_or_size_splits=chunk_sizes,
+                axis=input_axes[i],
+                with_remainder=True,
+            )
+            if ivy.is_array(inp)
+            else inp.split(
+                num_or_size_splits=chunk_sizes, axis=input_axes[i], with_remainder=True
+            )
+        )
+        for i, inp in enumerate(inputs)
+    ]
+
+
 # Device Queries #
 
 # Array Printing
@@ -200,12 +260,8 @@ def get_all_ivy_arrays_on_dev(
     """
     device = ivy.as_ivy_dev(device)
     all_arrays = list()
-    for obj in gc.get_objects():
-        if (
-            obj is ivy.data_classes.array.array.Array
-            and ivy.is_ivy_array(obj)
-            and ivy.dev(obj) == device
-        ):
+    for obj in list(ivy.utils.backend.handler._tracked_arrays.values()):
+        if ivy.is_native_array(obj.data) and ivy.dev(obj) == device:
             all_arrays.append(obj)
 
     return ivy.Container(dict(zip([str(id(a)) for a in all_arrays], all_arrays)))
@@ -1081,50 +1137,13 @@ def split_func_call(
     """
     if isinstance(input_axes, int):
         input_axes = [input_axes] * len(inputs)
-    if not ivy.exists(max_chunk_size) and not ivy.exists(chunk_size):
-        shape_key = "_".join([str(inp.shape) for inp in inputs])
-        if shape_key in max_chunk_sizes:
-            max_chunk_size = max_chunk_sizes[shape_key]
-        else:
-            max_chunk_size = 0
-        max_dim = max(
-            [inp.cont_shape[inp_ax] for inp, inp_ax in zip(inputs, input_axes)]
-        )
-        if max_dim > max_chunk_size:
-            max_chunk_sizes[shape_key] = max_dim
-            max_chunk_size = max_dim
-    chunk_size = ivy.default(
-        chunk_size,
-        default_val=lambda: 1
-        + int(
-            round((max_chunk_size - 1) * ivy.split_factor(ivy.default_device(device)))
-        ),
-        with_callable=True,
+    chunk_sizes = _get_split_chunk_sizes(
+        inputs, input_axes, max_chunk_size, chunk_size, device
     )
-    dim_size = inputs[0].shape[input_axes[0]]
-    if chunk_size >= dim_size:
+    if chunk_sizes is None:
         return func(*inputs)
-    num_chunks = dim_size / chunk_size
-    num_chunks_floored = math.floor(num_chunks)
-    num_chunks_ceiled = math.ceil(num_chunks)
-    chunk_sizes = [chunk_size] * num_chunks_floored
-    if num_chunks != num_chunks_floored:
-        chunk_sizes.append(dim_size - chunk_size * num_chunks_floored)
-    inputs_split = [
-        (
-            ivy.split(
-                inp,
-                num_or_size_splits=chunk_sizes,
-                axis=input_axes[i],
-                with_remainder=True,
-            )
-            if ivy.is_array(inp)
-            else inp.split(
-                num_or_size_splits=chunk_sizes, axis=input_axes[i], with_remainder=True
-            )
-        )
-        for i, inp in enumerate(inputs)
-    ]
+    num_chunks_ceiled = len(chunk_sizes)
+    inputs_split = _split_inputs(inputs, input_axes, chunk_sizes)
     is_mean = mode == "mean"
     is_sum = mode == "sum"
     post_fn = ivy.stop_gradient if stop_gradients else lambda x: x
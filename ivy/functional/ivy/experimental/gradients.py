@@ -20,3 +20,32 @@ def bind_custom_gradient_function(func, custom_grad_func):
         the function
     """
     return current_backend(None).bind_custom_gradient_function(func, custom_grad_func)
+
+
+def checkpoint(func):
+    """
+    Wrap a function such that the intermediate arrays of its forward pass are not kept
+    for the computation of the gradients, but recomputed during the backward pass.
+
+    This trades compute for memory, as the intermediates of the wrapped function are
+    only alive while it runs, both in the forward and in the backward pass. The
+    gradients are propagated to the arrays passed in the (nested) arguments of the
+    function.
+
+    Parameters
+    ----------
+    func
+        Function whose intermediates are recomputed during the backward pass.
+
+    Returns
+    -------
+    ret
+        the function, computing the same outputs and gradients as func
+
+    Examples
+    --------
+    >>> x = ivy.array([1., 2., 3.])
+    >>> f = ivy.checkpoint(lambda x: ivy.sum(ivy.sin(ivy.exp(x))))
+    >>> _, grad = ivy.execute_with_gradients(f, x)
+    """
+    return current_backend(None).checkpoint(func)
@@ -5,6 +5,16 @@ from ivy.utils.exceptions import handle_exceptions
 
 
 # helpers
+def _indices_dtype():
+    # jax only holds int64 arrays with jax_enable_x64 set
+    if (
+        ivy.backend == "jax"
+        and not ivy.functional.backends.jax.jax.config.jax_enable_x64
+    ):
+        return "int32"
+    return "int64"
+
+
 def _verify_coo_components(indices=None, values=None, dense_shape=None):
     ivy.utils.assertions.check_all_or_any_fn(
         indices,
@@ -452,22 +462,32 @@ class SparseArray(ivy.Array):
         )
 
         if "coo_indices" in indices:
-            self._coo_indices = ivy.array(indices["coo_indices"], dtype="int64")
+            self._coo_indices = ivy.array(
+                indices["coo_indices"], dtype=_indices_dtype()
+            )
             self._crow_indices = None
             self._col_indices = None
             self._ccol_indices = None
             self._row_indices = None
 
         elif "crow_indices" in indices and "col_indices" in indices:
-            self._crow_indices = ivy.array(indices["crow_indices"], dtype="int64")
-            self._col_indices = ivy.array(indices["col_indices"], dtype="int64")
+            self._crow_indices = ivy.array(
+                indices["crow_indices"], dtype=_indices_dtype()
+            )
+            self._col_indices = ivy.array(
+                indices["col_indices"], dtype=_indices_dtype()
+            )
             self._coo_indices = None
             self._ccol_indices = None
             self._row_indices = None
 
         else:
-            self._ccol_indices = ivy.array(indices["ccol_indices"], dtype="int64")
-            self._row_indices = ivy.array(indices["row_indices"], dtype="int64")
+            self._ccol_indices = ivy.array(
+                indices["ccol_indices"], dtype=_indices_dtype()
+            )
+            self._row_indices = ivy.array(
+                indices["row_indices"], dtype=_indices_dtype()
+            )
             self._coo_indices = None
             self._crow_indices = None
             self._col_indices = None
@@ -477,7 +497,7 @@ class SparseArray(ivy.Array):
         self._format = self._data.format.lower()
 
     def _init_coo_components(self, coo_indices, values, shape, format):
-        coo_indices = ivy.array(coo_indices, dtype="int64")
+        coo_indices = ivy.array(coo_indices, dtype=_indices_dtype())
         values = ivy.array(values)
         shape = ivy.Shape(shape)
         self._data = ivy.native_sparse_array(
@@ -495,8 +515,8 @@ class SparseArray(ivy.Array):
     def _init_compressed_row_components(
         self, crow_indices, col_indices, values, shape, format
     ):
-        crow_indices = ivy.array(crow_indices, dtype="int64")
-        col_indices = ivy.array(col_indices, dtype="int64")
+        crow_indices = ivy.array(crow_indices, dtype=_indices_dtype())
+        col_indices = ivy.array(col_indices, dtype=_indices_dtype())
         values = ivy.array(values)
         shape = ivy.Shape(shape)
         self._data = ivy.native_sparse_array(
@@ -518,8 +538,8 @@ class SparseArray(ivy.Array):
     def _init_compressed_column_components(
         self, ccol_indices, row_indices, values, shape, format
     ):
-        ccol_indices = ivy.array(ccol_indices, dtype="int64")
-        row_indices = ivy.array(row_indices, dtype="int64")
+        ccol_indices = ivy.array(ccol_indices, dtype=_indices_dtype())
+        row_indices = ivy.array(row_indices, dtype=_indices_dtype())
         values = ivy.array(values)
         shape = ivy.Shape(shape)
         self._data = ivy.native_sparse_array(
@@ -617,7 +637,7 @@ class SparseArray(ivy.Array):
 
     @coo_indices.setter
     def coo_indices(self, indices):
-        indices = ivy.array(indices, dtype="int64")
+        indices = ivy.array(indices, dtype=_indices_dtype())
         _verify_coo_components(
             indices=indices, values=self._values, dense_shape=self._dense_shape
         )
@@ -625,7 +645,7 @@ class SparseArray(ivy.Array):
 
     @crow_indices.setter
     def crow_indices(self, indices):
-        indices = ivy.array(indices, dtype="int64")
+        indices = ivy.array(indices, dtype=_indices_dtype())
         if self._format == "csr":
             _verify_csr_components(
                 crow_indices=indices,
@@ -644,7 +664,7 @@ class SparseArray(ivy.Array):
 
     @col_indices.setter
     def col_indices(self, indices):
-        indices = ivy.array(indices, dtype="int64")
+        indices = ivy.array(indices, dtype=_indices_dtype())
         if self._format == "csr":
             _verify_csr_components(
                 crow_indices=indices,
@@ -663,7 +683,7 @@ class SparseArray(ivy.Array):
 
     @ccol_indices.setter
     def ccol_indices(self, indices):
-        indices = ivy.array(indices, dtype="int64")
+        indices = ivy.array(indices, dtype=_indices_dtype())
         if self._format == "csc":
             _verify_csc_components(
                 ccol_indices=indices,
@@ -682,7 +702,7 @@ class SparseArray(ivy.Array):
 
     @row_indices.setter
     def row_indices(self, indices):
-        indices = ivy.array(indices, dtype="int64")
+        indices = ivy.array(indices, dtype=_indices_dtype())
         if self._format == "csc":
             _verify_csc_components(
                 ccol_indices=self._ccol_indices,
@@ -860,3 +880,57 @@ def native_sparse_array(
 @handle_exceptions
 def native_sparse_array_to_indices_values_and_shape(x):
     return ivy.current_backend().native_sparse_array_to_indices_values_and_shape(x)
+
+
+@handle_exceptions
+def to_row_sparse(x, /, *, rows=None):
+    """
+    Convert a 2-d array to a sparse array in COO format holding only some of its rows,
+    such as the gradient of an embedding table of which a batch only looks up a few
+    rows.
+
+    Parameters
+    ----------
+    x
+        The 2-d array to convert.
+    rows
+        Indices of the rows to keep, which may contain duplicates. Default is ``None``,
+        in which case the rows with any non-zero value are kept.
+
+    Returns
+    -------
+    ret
+        A sparse array in COO format with the same dense shape as x, holding every entry
+        of the kept rows.
+
+    Examples
+    --------
+    >>> x = ivy.array([[0., 0.], [1., 2.], [0., 0.], [0., 3.]])
+    >>> y = ivy.to_row_sparse(x)
+    >>> print(y.coo_indices)
+    ivy.array([[1, 1, 3, 3],
+               [0, 1, 0, 1]])
+    >>> print(y.values)
+    ivy.array([1., 2., 0., 3.])
+    """
+    x = ivy.to_ivy(x)
+    ivy.utils.assertions.check_equal(
+        len(x.shape), 2, message="x must be 2-d", as_array=False
+    )
+    if rows is None:
+        rows = ivy.nonzero(ivy.any(x != 0, axis=-1))[0]
+    else:
+        rows = ivy.unique_values(ivy.reshape(rows, (-1,)))
+    num_rows, num_cols = rows.shape[0], x.shape[1]
+    coo_indices = ivy.stack(
+        [
+            ivy.repeat(rows, num_cols),
+            ivy.tile(ivy.arange(num_cols, dtype=rows.dtype), (num_rows,)),
+        ]
+    )
+    return ivy.SparseArray(
+        coo_indices=coo_indices,
+        values=ivy.reshape(ivy.gather(x, rows, axis=0), (-1,)),
+        dense_shape=x.shape,
+        format="coo",
+    )
@@ -52,6 +52,7 @@ queue_timeout_stack = list()
 array_mode_stack = list()
 shape_array_mode_stack = list()
 nestable_mode_stack = list()
+container_fusion_mode_stack = list()
 exception_trace_mode_stack = list()
 inplace_mode_stack = list()
 trace_mode_dict = dict()
@@ -518,6 +519,64 @@ def unset_nestable_mode() -> None:
         ivy.__setattr__("nestable_mode", mode, True)
 
 
+ivy.container_fusion_mode = (
+    container_fusion_mode_stack[-1] if container_fusion_mode_stack else False
+)
+
+
+@handle_exceptions
+def set_container_fusion_mode(mode: bool) -> None:
+    """
+    Set the mode of whether to fuse the leaves of ivy.Container inputs.
+
+    In this mode, elementwise functions called with containers are called once for
+    each group of leaves sharing their shapes and dtypes, on the stacked leaves of the
+    group, rather than once for each leaf.
+
+    Parameter
+    ---------
+    mode
+        boolean whether to fuse the leaves of ivy.Container inputs
+
+    Examples
+    --------
+    >>> ivy.set_container_fusion_mode(True)
+    >>> ivy.container_fusion_mode
+    True
+
+    >>> ivy.set_container_fusion_mode(False)
+    >>> ivy.container_fusion_mode
+    False
+    """
+    global container_fusion_mode_stack
+    ivy.utils.assertions.check_isinstance(mode, bool)
+    container_fusion_mode_stack.append(mode)
+    ivy.__setattr__("container_fusion_mode", mode, True)
+
+
+@handle_exceptions
+def unset_container_fusion_mode() -> None:
+    """
+    Reset the mode of whether to fuse the leaves of ivy.Container inputs to the previous
+    state.
+
+    Examples
+    --------
+    >>> ivy.set_container_fusion_mode(True)
+    >>> ivy.container_fusion_mode
+    True
+
+    >>> ivy.unset_container_fusion_mode()
+    >>> ivy.container_fusion_mode
+    False
+    """
+    global container_fusion_mode_stack
+    if container_fusion_mode_stack:
+        container_fusion_mode_stack.pop(-1)
+        mode = container_fusion_mode_stack[-1] if container_fusion_mode_stack else False
+        ivy.__setattr__("container_fusion_mode", mode, True)
+
+
 ivy.exception_trace_mode = (
     exception_trace_mode_stack[-1] if exception_trace_mode_stack else "full"
 )
@@ -4144,7 +4203,7 @@ def vmap(
     >>> print(z.shape)
     (3, 5, 2)
     """
-    # TODO: optimize in the numpy and tensorflow backends and extend functionality
+    # TODO: optimize in the tensorflow backend and extend functionality
     return current_backend().vmap(func, in_axes, out_axes)
 
 
@@ -270,6 +270,27 @@ _non_finite_to_zero = lambda xs: ivy.nested_map(
 )
 
 
+def _grad_arrays(grads):
+    """Get the arrays of a gradient nest, which can be a single array."""
+    if ivy.is_array(grads):
+        return [grads]
+    return ivy.multi_index_nest(grads, ivy.nested_argwhere(grads, ivy.is_array))
+
+
+def _scale_in_place(grads, weight):
+    """Scale the arrays of a gradient nest in-place by the given weight."""
+    if weight != 1:
+        for grad in _grad_arrays(grads):
+            ivy.multiply(grad, weight, out=grad)
+    return grads
+
+
+def _accumulate_in_place(grads, chunk_grads, weight):
+    """Add the weighted arrays of a gradient nest in-place to those of another."""
+    for grad, chunk_grad in zip(_grad_arrays(grads), _grad_arrays(chunk_grads)):
+        ivy.add(grad, chunk_grad, alpha=weight, out=grad)
+
+
 # Private Variable Helpers #
 # -------------------------#
 
@@ -586,6 +607,113 @@ def grad(func: Callable, argnums: Union[int, Sequence[int]] = 0) -> Callable:
 grad.computes_gradients = True
 
 
+@handle_exceptions
+def execute_with_accumulated_gradients(
+    func: Callable,
+    xs: Union[ivy.Array, ivy.NativeArray, ivy.Container],
+    inputs: Sequence[Union[ivy.Array, ivy.NativeArray, ivy.Container]],
+    /,
+    *,
+    mode: str = "mean",
+    max_chunk_size: Optional[int] = None,
+    chunk_size: Optional[int] = None,
+    input_axes: Union[int, Sequence[int]] = 0,
+    xs_grad_idxs: Optional[Sequence[Sequence[Union[str, int]]]] = [[0]],
+    device: Optional[Union[ivy.Device, ivy.NativeDevice]] = None,
+) -> Tuple[ivy.Array, Union[ivy.Array, ivy.Container]]:
+    """
+    Call function func with input of xs variables on micro-batches of the inputs, and
+    return the function result and the gradients w.r.t. xs accumulated over them.
+
+    The inputs are split in the same way as in :func:`ivy.split_func_call`, and
+    :func:`ivy.execute_with_gradients` is called on each of the chunks, with the
+    gradients of each chunk accumulated in-place into a single gradient nest. The
+    memory used by the backward pass therefore scales with the chunk size rather than
+    the batch size, while the returned gradients can be passed to a single optimizer
+    step.
+
+    Parameters
+    ----------
+    func
+        Function returning a scalar loss, called as ``func(xs, *inputs)`` for each
+        chunk of the inputs.
+    xs
+        Variables for which to compute the function gradients with respective to. This
+        can be a single array or an arbitrary nest of arrays.
+    inputs
+        The inputs to split into micro-batches and pass to the function.
+    mode
+        How the losses of the chunks make up the loss of the whole batch, must be one
+        of [ mean | sum ]. With ``mean``, the result and gradients of each chunk are
+        weighted by its share of the batch. Default is ``mean``.
+    max_chunk_size
+        The maximum size of each of the chunks to be fed into the function.
+    chunk_size
+        The size of each of the chunks to be fed into the function. Specifying this arg
+        overwrites the global split factor. Default is ``None``.
+    input_axes
+        The axes along which to split each of the inputs, before passing to the
+        function. Default is ``0``.
+    xs_grad_idxs
+        Indices of the input arrays to compute gradients with respect to. If None,
+        gradients are returned with respect to all input arrays. Default is ``[[0]]``.
+    device
+        The device to set the split factor for. Sets the default device by default.
+
+    Returns
+    -------
+    ret
+        the function result over the whole batch, and its gradients w.r.t. xs
+        accumulated over the chunks.
+
+    Examples
+    --------
+    >>> v = ivy.Container(w=ivy.array([1., 2.]))
+    >>> x = ivy.array([[1., 0.], [0., 1.], [1., 1.], [2., 1.]])
+    >>> func = lambda v, x: ivy.mean(ivy.square(ivy.matmul(x, v.w)))
+    >>> loss, grads = ivy.execute_with_accumulated_gradients(
+    ...     func, v, [x], chunk_size=2)
+    >>> print(loss)
+    ivy.array(7.5)
+    >>> print(grads)
+    {
+        w: ivy.array([6., 4.5])
+    }
+    """
+    ivy.utils.assertions.check_elem_in_list(mode, ["mean", "sum"])
+    if isinstance(input_axes, int):
+        input_axes = [input_axes] * len(inputs)
+    chunk_sizes = ivy.functional.ivy.device._get_split_chunk_sizes(
+        inputs, input_axes, max_chunk_size, chunk_size, device
+    )
+    if chunk_sizes is None:
+        return ivy.execute_with_gradients(
+            lambda xs_: func(xs_, *inputs), xs, xs_grad_idxs=xs_grad_idxs
+        )
+    inputs_split = ivy.functional.ivy.device._split_inputs(
+        inputs, input_axes, chunk_sizes
+    )
+    dim_size = sum(chunk_sizes)
+    func_ret, grads = None, None
+    for size, inps in zip(chunk_sizes, zip(*inputs_split)):
+        ret, chunk_grads = ivy.execute_with_gradients(
+            lambda xs_: func(xs_, *inps), xs, xs_grad_idxs=xs_grad_idxs
+        )
+        weight = size / dim_size if mode == "mean" else 1
+        if grads is None:
+            # the gradients of the first chunk are the accumulation buffers
+            func_ret = ivy.multiply(ret, weight)
+            grads = _scale_in_place(chunk_grads, weight)
+        else:
+            func_ret = ivy.add(func_ret, ret, alpha=weight)
+            _accumulate_in_place(grads, chunk_grads, weight)
+        del chunk_grads
+    return func_ret, grads
+
+
+execute_with_accumulated_gradients.computes_gradients = True
+
+
 # Optimizer Steps #
 
 
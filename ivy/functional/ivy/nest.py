@@ -10,6 +10,223 @@ import ivy
 from ivy.utils.exceptions import handle_exceptions
 
 
+class TreeDef:
+    """
+    The structure of a nest, computed once and shared by all nests of that structure.
+
+    A tree definition flattens matching nests to their leaves and builds new nests
+    from lists of leaves, both in a single pass over the nodes, without discovering
+    the structure or building key chains again. It is hashable, such that it can be
+    used to cache anything computed per structure.
+
+    Tree definitions are created with :func:`ivy.nested_tree_def` for nests of lists,
+    tuples and dicts, whose other entries are all leaves, as traversed by
+    :func:`ivy.nested_map`, or with :meth:`ivy.Container.cont_tree_def` for
+    containers, whose non-container entries are all leaves, as traversed by
+    :meth:`ivy.Container.cont_map`.
+    """
+
+    __slots__ = (
+        "_node",
+        "_containers",
+        "_hash",
+        "num_leaves",
+        "has_empty_nodes",
+        "_paths",
+        "_key_chains",
+    )
+
+    def __init__(self, nest, /, *, containers=False):
+        self._containers = containers
+        self.num_leaves = 0
+        self.has_empty_nodes = False
+        self._node = self._build(nest)
+        self._hash = hash((containers, self._structure(self._node)))
+        self._paths = None
+        self._key_chains = None
+
+    def _is_node(self, x):
+        if self._containers:
+            return isinstance(x, ivy.Container)
+        return type(x) in (list, tuple, dict)
+
+    def _build(self, x):
+        # nodes are (type, keys, children, config) tuples and leaves are None
+        if not self._is_node(x):
+            self.num_leaves += 1
+            return None
+        keys = tuple(x.keys()) if isinstance(x, dict) else len(x)
+        values = x.values() if isinstance(x, dict) else x
+        if not x:
+            self.has_empty_nodes = True
+        return (
+            type(x),
+            keys,
+            tuple(self._build(v) for v in values),
+            x.cont_config if self._containers else None,
+        )
+
+    @staticmethod
+    def _structure(node):
+        if node is None:
+            return None
+        return node[0], node[1], tuple(TreeDef._structure(n) for n in node[2])
+
+    def __eq__(self, other):
+        return self is other or (
+            isinstance(other, TreeDef)
+            and self._hash == other._hash
+            and self._containers == other._containers
+            and self._node == other._node
+        )
+
+    def __hash__(self):
+        return self._hash
+
+    def __repr__(self):
+        def _repr(node):
+            if node is None:
+                return "*"
+            if isinstance(node[1], tuple):
+                return "{{{}}}".format(
+                    ", ".join(
+                        "{}: {}".format(k, _repr(n)) for k, n in zip(node[1], node[2])
+                    )
+                )
+            return ("[{}]" if node[0] is list else "({})").format(
+                ", ".join(_repr(n) for n in node[2])
+            )
+
+        return "TreeDef({})".format(_repr(self._node))
+
+    @property
+    def paths(self) -> Tuple[Tuple, ...]:
+        """The keys and indices leading to each leaf, in the order of the leaves."""
+        if self._paths is None:
+            paths = []
+
+            def _collect(node, path):
+                if node is None:
+                    paths.append(path)
+                    return
+                keys = node[1] if isinstance(node[1], tuple) else range(node[1])
+                for k, child in zip(keys, node[2]):
+                    _collect(child, path + (k,))
+
+            _collect(self._node, ())
+            self._paths = tuple(paths)
+        return self._paths
+
+    @property
+    def key_chains(self) -> Tuple[str, ...]:
+        """
+        The key chains of the leaves.
+
+        These are the key chains passed to the functions mapped by
+        :meth:`ivy.Container.cont_map`.
+        """
+        if self._key_chains is None:
+            self._key_chains = tuple(
+                "/".join(str(k) for k in path) for path in self.paths
+            )
+        return self._key_chains
+
+    def flatten(self, nest, /) -> List:
+        """
+        Return the leaves of a nest with this structure.
+
+        Parameters
+        ----------
+        nest
+            The nest to flatten.
+
+        Returns
+        -------
+        ret
+            The leaves of the nest, in the order of :attr:`paths`.
+
+        Raises
+        ------
+        IvyException
+            If the structure of nest differs from this one.
+        """
+        leaves = []
+
+        def _flatten(node, x):
+            if node is None:
+                if self._is_node(x):
+                    raise ivy.utils.exceptions.IvyException(
+                        "found a nest where the tree definition has a leaf"
+                    )
+                leaves.append(x)
+                return
+            node_type, keys, children, _ = node
+            if type(x) is not node_type or (
+                tuple(x.keys()) != keys if isinstance(keys, tuple) else len(x) != keys
+            ):
+                raise ivy.utils.exceptions.IvyException(
+                    "the structure of the nest doesn't match the tree definition"
+                )
+            for child, v in zip(children, x.values() if isinstance(x, dict) else x):
+                _flatten(child, v)
+
+        _flatten(self._node, nest)
+        return leaves
+
+    def unflatten(self, leaves, /, *, config=None):
+        """
+        Build a nest with this structure from its leaves.
+
+        Parameters
+        ----------
+        leaves
+            The leaves of the nest, in the order of :attr:`paths`.
+        config
+            The config to use for all the containers of the nest. Default is ``None``,
+            in which case each container gets the config it had when the tree
+            definition was created.
+
+        Returns
+        -------
+        ret
+            The nest holding the leaves, whose containers keep this tree definition.
+        """
+        return self._unflatten(iter(leaves), config=config)
+
+    def _unflatten(self, leaves, *, into=None, to_mutable=False, config=None):
+        # with into, the lists and dicts of the nest into are updated inplace, as
+        # nested_map does with shallow=True
+        def _unflatten(node, x):
+            if node is None:
+                return next(leaves)
+            node_type, keys, children, node_config = node
+            if isinstance(keys, tuple):
+                values = x.values() if x is not None else (None,) * len(keys)
+                ret = dict(zip(keys, _map(_unflatten, children, values)))
+                if self._containers:
+                    ret = ivy.Container._cont_trusted(
+                        ret, node_config if config is None else config
+                    )
+                elif x is not None:
+                    x.update(ret)
+                    ret = x
+                elif node_type is not dict:
+                    ret = node_type(ret)
+                return ret
+            values = x if x is not None else (None,) * keys
+            ret = list(_map(_unflatten, children, values))
+            if node_type is list and x is not None:
+                x[:] = ret
+                return x
+            return ret if to_mutable or node_type is list else node_type(ret)
+
+        ret = _unflatten(self._node, into)
+        if self._containers:
+            # containers built from the tree definition keep it for later traversals
+            ret._tree_def = self
+        return ret
+
+
 # Extra #
 # ------#
 
@@ -654,6 +871,8 @@ def nested_argwhere(
     _index: Optional[List] = None,
     _base: bool = True,
     stop_after_n_found: Optional[int] = None,
+    *,
+    tree_def: Optional[TreeDef] = None,
 ) -> Union[Iterable, bool]:
     """
     Check the leaf nodes of nested x via function fn, and returns all nest indices where
@@ -678,6 +897,10 @@ def nested_argwhere(
         stack. Used internally, do not set manually.
     stop_after_n_found
         to stop after some needed indices are found.
+    tree_def
+        The tree definition of nest, as returned by :func:`ivy.nested_tree_def`. If
+        given, only the leaves it describes are checked, and ``check_nests`` and
+        ``to_ignore`` don't apply. Default is ``None``.
 
     Returns
     -------
@@ -721,6 +944,13 @@ def nested_argwhere(
         ['c', 0]
     ]
     """
+    if tree_def is not None:
+        _indices = [
+            list(path)
+            for path, leaf in zip(tree_def.paths, tree_def.flatten(nest))
+            if fn(leaf)
+        ]
+        return _indices[:stop_after_n_found]
     to_ignore = ivy.default(to_ignore, ())
     _index = list() if _index is None else _index
     if isinstance(nest, (tuple, list)) and not isinstance(nest, to_ignore):
@@ -1004,6 +1234,8 @@ def nested_map(
     _list_check_fn: Optional[Callable] = None,
     _dict_check_fn: Optional[Callable] = None,
     shallow: bool = True,
+    *,
+    tree_def: Optional[TreeDef] = None,
 ) -> Union[ivy.Array, ivy.NativeArray, Iterable, Dict]:
     """
     Apply a function on x in a nested manner, whereby all dicts, lists and tuples are
@@ -1033,6 +1265,10 @@ def nested_map(
     shallow
         Whether to inplace update the input nest or not
         Only works if nest is a mutable type. Default is ``True``.
+    tree_def
+        The tree definition of x, as returned by :func:`ivy.nested_tree_def`. If
+        given, the structure of x isn't discovered again, and only ``to_mutable`` and
+        ``shallow`` of the other traversal options apply. Default is ``None``.
 
     Returns
     -------
@@ -1102,6 +1338,11 @@ def nested_map(
     >>> ivy.nested_map(function, nest, to_mutable=True)
     [[24, 25, 1338], [64, 99, 7]]
     """
+    if tree_def is not None:
+        leaves = [fn(leaf) for leaf in tree_def.flatten(x)]
+        return tree_def._unflatten(
+            iter(leaves), into=x if shallow else None, to_mutable=to_mutable
+        )
     to_ignore = ivy.default(to_ignore, ())
     if include_derived is True:
         include_derived = {"tuple": True, "list": True, "dict": True}
@@ -1213,6 +1454,42 @@ def nested_map(
     return fn(x)
 
 
+@handle_exceptions
+def nested_tree_def(nest: Iterable, /) -> TreeDef:
+    """
+    Compute the tree definition of a nest of lists, tuples and dicts.
+
+    The tree definition can be computed once per structure and passed to
+    :func:`ivy.nested_map` and :func:`ivy.nested_argwhere` for any nest of that
+    structure, which then skip discovering the structure. Only lists, tuples and dicts
+    are traversed, subclasses of these such as named tuples or containers are leaves.
+
+    Parameters
+    ----------
+    nest
+        The nest to compute the structure of.
+
+    Returns
+    -------
+    ret
+        The tree definition of the nest.
+
+    Examples
+    --------
+    >>> nest = {"a": [ivy.array([1.]), ivy.array([2.])], "b": (3, 4)}
+    >>> tree_def = ivy.nested_tree_def(nest)
+    >>> tree_def.num_leaves
+    4
+    >>> tree_def.paths
+    (('a', 0), ('a', 1), ('b', 0), ('b', 1))
+    >>> tree_def.unflatten([1, 2, 3, 4])
+    {'a': [1, 2], 'b': (3, 4)}
+    >>> ivy.nested_map(lambda x: x * 2, nest, tree_def=tree_def, shallow=False)
+    {'a': [ivy.array([2.]), ivy.array([4.])], 'b': (6, 8)}
+    """
+    return TreeDef(nest)
+
+
 @handle_exceptions
 def nested_any(
     nest: Iterable,
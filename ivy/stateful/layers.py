@@ -2114,6 +2114,7 @@ class Embedding(Module):
         device=None,
         v=None,
         dtype=None,
+        sparse_grad=False,
     ):
         """
         Class for embedding indices into a dense representation. The Embedding layer is
@@ -2140,12 +2141,18 @@ class Embedding(Module):
         dtype
             the desired data type of the internal variables to be created if not
              provided. Default is ``None``.
+        sparse_grad
+            Whether to record the indices looked up in the forward passes in training
+            mode, so that :meth:`sparse_gradients` can convert the gradients of the
+            weights to row-sparse arrays holding only those rows. Default is ``False``.
         """
         self._num_embeddings = num_embeddings
         self._embedding_dim = embedding_dim
         self._padding_idx = padding_idx
         self._max_norm = max_norm
         self._weight_initializer = weight_initializer
+        self._sparse_grad = sparse_grad
+        self._looked_up_rows = None
         Module.__init__(self, device=device, v=v, dtype=dtype)
 
     def _create_variables(self, device, dtype=None):
@@ -2190,11 +2197,46 @@ class Embedding(Module):
         -------
             The output array of the layer.
         """
+        if self._sparse_grad and self.training:
+            # the unique rows only, so that repeated calls before the optimizer step
+            # hold at most num_embeddings indices
+            rows = ivy.reshape(indices, (-1,))
+            if self._looked_up_rows is not None:
+                rows = ivy.concat([self._looked_up_rows, rows])
+            self._looked_up_rows = ivy.unique_values(rows)
         emb = ivy.embedding(self.v.w, indices, max_norm=self._max_norm)
         if self._padding_idx is not None:
             emb = self._pad_embd(indices, emb)
         return emb
 
+    def sparse_gradients(self, grads):
+        """
+        Convert the gradients of the weights to row-sparse arrays holding only the rows
+        looked up in training mode since the last call, which optimizers supporting
+        sparse gradients update without touching the other rows. Requires
+        ``sparse_grad=True``.
+
+        Parameters
+        ----------
+        grads
+            The gradients of the variables of the layer.
+
+        Returns
+        -------
+        ret
+            The gradients, with those of the weights as sparse arrays in COO format.
+        """
+        ivy.utils.assertions.check_true(
+            self._sparse_grad, "the layer must be constructed with sparse_grad=True"
+        )
+        rows = ivy.default(
+            self._looked_up_rows,
+            lambda: ivy.zeros((0,), dtype="int64", device=self._device),
+            with_callable=True,
+        )
+        self._looked_up_rows = None
+        return grads.cont_set_at_key_chain("w", ivy.to_row_sparse(grads.w, rows=rows))
+
 
 class Identity(Module):
     def __init__(self):
@@ -64,6 +64,7 @@ class Module(ModuleHelpers, ModuleConverters, ModuleMeta):
         dtype=None,
         dynamic_backend=None,
         training=True,
+        checkpoint_activations=False,
         **kwargs,
     ):
         """
@@ -104,6 +105,10 @@ class Module(ModuleHelpers, ModuleConverters, ModuleMeta):
         training
             specifies whether the module is in training or evaluation mode. Default is
             ``True``.
+        checkpoint_activations
+            Whether to discard the intermediate activations of the forward pass of the
+            module in training mode, and recompute them during the backward pass with
+            :func:`ivy.checkpoint`, trading compute for memory. Default is ``False``.
         devices
             devices on which to distribute the module's variables
             'cuda:0', 'cuda:1', 'cpu' etc. (Default value = None)
@@ -152,6 +157,7 @@ class Module(ModuleHelpers, ModuleConverters, ModuleMeta):
         self._lazy_compiled = False
         self._dynamic_backend = dynamic_backend
         self.training = training
+        self.checkpoint_activations = checkpoint_activations
         if build_mode != "on_init":
             return
         if hasattr(Module, "_init_var"):
@@ -544,6 +550,31 @@ class Module(ModuleHelpers, ModuleConverters, ModuleMeta):
             self._check_submod_ret()
         return ret
 
+    def _checkpointed_forward(self, *args, **kwargs):
+        """
+        Forward pass whose intermediate activations are recomputed during the backward
+        pass, from the inputs and the variables of the module.
+
+        Returns
+        -------
+        ret
+            Result of the forward pass of the layer.
+        """
+
+        def _forward(v, *args, **kwargs):
+            v_orig = self.v
+            self.v = v
+            ret = self._forward_with_tracking(*args, **kwargs)
+            self.v = v_orig
+            return ret
+
+        return ivy.checkpoint(_forward)(self.v, *args, **kwargs)
+
+    def _forward_maybe_checkpointed(self, *args, **kwargs):
+        if self.checkpoint_activations and self.training:
+            return self._checkpointed_forward(*args, **kwargs)
+        return self._forward_with_tracking(*args, **kwargs)
+
     def _call(self, *args, v=None, buffers=None, **kwargs):
         """
         Compute forward pass of the layer, treating layer instance as callable function.
@@ -577,7 +608,7 @@ class Module(ModuleHelpers, ModuleConverters, ModuleMeta):
                 if isinstance(v, Container)
                 else Container(v)
             )
-            ret = self._forward_with_tracking(*args, **kwargs)
+            ret = self._forward_maybe_checkpointed(*args, **kwargs)
             self.v = v_orig
             if buffers:
                 self.buffers = {}
@@ -586,7 +617,7 @@ class Module(ModuleHelpers, ModuleConverters, ModuleMeta):
 
         elif hasattr(self.__call__, "wrapped"):
             return self.__call__(*args, **kwargs)
-        return self._forward_with_tracking(*args, **kwargs)
+        return self._forward_maybe_checkpointed(*args, **kwargs)
 
     # Public #
     # -------#
@@ -660,7 +691,15 @@ class Module(ModuleHelpers, ModuleConverters, ModuleMeta):
         self._unset_submod_flags()
         return ret
 
-    def save_weights(self, weights_path, /):
+    def save_weights(
+        self,
+        weights_path,
+        /,
+        *,
+        compression=None,
+        compression_opts=None,
+        num_workers=None,
+    ):
         """
         Save the weights on the Module.
 
@@ -668,13 +707,135 @@ class Module(ModuleHelpers, ModuleConverters, ModuleMeta):
         ----------
         weights_path
             The hdf5 file for saving the weights.
+        compression
+            Compression filter of the weights on disk, such as ``"gzip"`` or
+            ``"lzf"``. Default is ``None``, for no compression.
+        compression_opts
+            Options of the compression filter, such as the gzip level.
+            Default is ``None``.
+        num_workers
+            Number of threads converting the weights to numpy arrays, see
+            ``ivy.Container.cont_to_disk_as_hdf5``. Default is ``None``.
 
         Returns
         -------
         None
         """
         os.makedirs("/".join(weights_path.split("/")[:-1]), exist_ok=True)
-        self.v.cont_to_disk_as_hdf5(weights_path)
+        self.v.cont_to_disk_as_hdf5(
+            weights_path,
+            compression=compression,
+            compression_opts=compression_opts,
+            num_workers=num_workers,
+        )
+
+    def load_weights(self, weights_path, /, *, lazy=False, max_materialized=None):
+        """
+        Load the weights of the Module saved with ``save_weights``.
+
+        Parameters
+        ----------
+        weights_path
+            The hdf5 file to load the weights from.
+        lazy
+            Whether to keep the weights on disk until they are accessed, see
+            ``ivy.Container.cont_from_disk_as_hdf5``. Default is ``False``.
+        max_materialized
+            The maximum number of weights held in memory when loading lazily. Default
+            is ``None``, in which case all the accessed weights are kept.
+
+        Returns
+        -------
+        None
+        """
+        weights = ivy.Container.cont_from_disk_as_hdf5(
+            weights_path, lazy=lazy, max_materialized=max_materialized
+        )
+        if isinstance(self.v, Container) and self.v:
+            weights = self.v.cont_set_at_key_chains(weights)
+        self.v = weights
+
+    def save_checkpoint(self, checkpoint_path, /, *, max_shard_size=None):
+        """
+        Save the weights and buffers of the Module in the safetensors format.
+
+        The weights are saved under ``v`` and the buffers under ``buffers``, see
+        ``ivy.Container.cont_to_disk_as_safetensors``.
+
+        Parameters
+        ----------
+        checkpoint_path
+            The file for saving the checkpoint.
+        max_shard_size
+            The maximum number of bytes per file, above which the checkpoint is saved
+            in shards. Default is ``None``, for a single file.
+
+        Returns
+        -------
+        None
+        """
+        os.makedirs(os.path.dirname(checkpoint_path) or ".", exist_ok=True)
+        checkpoint = Container(v=self.v)
+        if getattr(self, "buffers", None):
+            checkpoint.buffers = Container(self.buffers)
+        checkpoint.cont_to_disk_as_safetensors(
+            checkpoint_path, max_shard_size=max_shard_size
+        )
+
+    def load_checkpoint(
+        self,
+        checkpoint_path,
+        /,
+        *,
+        prefix=None,
+        lazy=False,
+        max_materialized=None,
+        num_workers=None,
+    ):
+        """
+        Load the weights and buffers of the Module saved with ``save_checkpoint``.
+
+        The checkpoint is memory-mapped, see
+        ``ivy.Container.cont_from_disk_as_safetensors``.
+
+        Parameters
+        ----------
+        checkpoint_path
+            The file to load the checkpoint from.
+        prefix
+            Key chain, or sequence of key chains, of the parts of the checkpoint to
+            load, such as ``"v/linear0"``. Default is ``None``, to load all of it.
+        lazy
+            Whether to keep the weights on disk until they are accessed.
+            Default is ``False``.
+        max_materialized
+            The maximum number of weights held in memory when loading lazily.
+            Default is ``None``, in which case all the accessed weights are kept.
+        num_workers
+            Number of threads reading the shards of the checkpoint.
+            Default is ``None``.
+
+        Returns
+        -------
+        None
+        """
+        checkpoint = ivy.Container.cont_from_disk_as_safetensors(
+            checkpoint_path,
+            prefix=prefix,
+            lazy=lazy,
+            max_materialized=max_materialized,
+            num_workers=num_workers,
+        )
+        if "v" in checkpoint:
+            weights = checkpoint.v
+            if isinstance(self.v, Container) and self.v:
+                weights = self.v.cont_set_at_key_chains(weights)
+            self.v = weights
+        if "buffers" in checkpoint:
+            # buffers are set as attributes, so they are read from disk now
+            self._set_buffers(
+                checkpoint.buffers.cont_map(lambda x, _: x).cont_to_dict()
+            )
 
     def build(
         self,
@@ -805,6 +966,10 @@ class Module(ModuleHelpers, ModuleConverters, ModuleMeta):
 
         # flag built and remove local variables if specified
         self._built = bool(built)
+        if self._built and isinstance(self.v, Container):
+            # cache the structure of the variables, which the gradients and the
+            # optimizer states derived from them share
+            self.v.cont_tree_def()
         v_ret = self.v
         if not self._store_vars:
             # ToDo: verify variables in self.v are released once this method exits
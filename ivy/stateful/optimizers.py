@@ -3,12 +3,133 @@
 
 # global
 import abc
+import math
 from typing import Union, Optional, Callable
 
 # local
 import ivy
 
 
+# Helpers #
+# --------#
+
+
+def _quantize_blockwise(x, block_size, signed):
+    """
+    Quantize an array to 8 bits in blocks of its flattened values, with each block
+    scaled by its absolute maximum.
+
+    The magnitudes are companded with a square root, or a fourth root
+    for the non-negative second moments, so that the small moments of a
+    block keep a low relative error.
+    """
+    flat = ivy.reshape(x, (-1,))
+    pad = -flat.shape[0] % block_size
+    if pad:
+        flat = ivy.concat([flat, ivy.zeros((pad,), dtype=flat.dtype, device=x.device)])
+    blocks = ivy.reshape(flat, (-1, block_size))
+    scales = ivy.max(ivy.abs(blocks), axis=-1, keepdims=True)
+    normed = ivy.abs(blocks) / ivy.where(scales > 0, scales, ivy.ones_like(scales))
+    if signed:
+        codes = ivy.astype(ivy.round(ivy.sign(blocks) * normed**0.5 * 127), "int8")
+    else:
+        codes = ivy.astype(ivy.round(normed**0.25 * 255), "uint8")
+    return ivy.Container(codes=codes, scales=ivy.reshape(scales, (-1,)))
+
+
+def _dequantize_blockwise(state, shape, dtype):
+    """Reconstruct an array of the given shape from its block-wise quantized state."""
+    codes = ivy.astype(state.codes, dtype)
+    if state.codes.dtype == "int8":
+        blocks = ivy.sign(codes) * (codes / 127) ** 2
+    else:
+        blocks = (codes / 255) ** 4
+    flat = ivy.reshape(blocks * ivy.expand_dims(state.scales, axis=-1), (-1,))
+    return ivy.reshape(flat[: math.prod(shape)], shape)
+
+
+def _factor_second_moment(vw):
+    """Keep only the row and column means of the second moments of a matrix."""
+    return ivy.Container(row=ivy.mean(vw, axis=-1), col=ivy.mean(vw, axis=-2))
+
+
+def _unfactor_second_moment(state):
+    """Reconstruct the second moments of a matrix from its row and column means."""
+    row_mean = ivy.mean(state.row, axis=-1, keepdims=True)
+    return ivy.stable_divide(
+        ivy.expand_dims(state.row, axis=-1) * ivy.expand_dims(state.col, axis=-2),
+        ivy.expand_dims(row_mean, axis=-1),
+    )
+
+
+def _compress_moment(x, quantize, factor, block_size, signed):
+    if factor and len(x.shape) >= 2:
+        return _factor_second_moment(x)
+    if quantize:
+        return _quantize_blockwise(x, block_size, signed)
+    return x
+
+
+def _decompress_moment(state, w):
+    if not isinstance(state, ivy.Container):
+        return state
+    if "row" in state:
+        return _unfactor_second_moment(state)
+    return _dequantize_blockwise(state, w.shape, w.dtype)
+
+
+def _update_with_compressed_moments(
+    update_fn, v, grads, mw, vw, quantize, factor, block_size
+):
+    """
+    Apply an update function to each of the variables in turn.
+
+    The moments of each variable are decompressed before the update and
+    the new moments compressed after it, so that the full precision
+    moments of only one variable exist at any time.
+    """
+    compress_mw = lambda x: _compress_moment(x, quantize, False, block_size, True)
+    compress_vw = lambda x: _compress_moment(x, quantize, factor, block_size, False)
+    if not isinstance(v, ivy.Container):
+        new_v, mw_, vw_ = update_fn(
+            v, grads, _decompress_moment(mw, v), _decompress_moment(vw, v)
+        )
+        return new_v, compress_mw(mw_), compress_vw(vw_)
+    new_v, new_mw, new_vw = (ivy.Container(**v.cont_config) for _ in range(3))
+    for key_chain, w in v.cont_to_iterator():
+        new_w, mw_, vw_ = update_fn(
+            w,
+            grads[key_chain],
+            _decompress_moment(mw[key_chain], w),
+            _decompress_moment(vw[key_chain], w),
+        )
+        new_v.cont_set_at_key_chain(key_chain, new_w, inplace=True)
+        new_mw.cont_set_at_key_chain(key_chain, compress_mw(mw_), inplace=True)
+        new_vw.cont_set_at_key_chain(key_chain, compress_vw(vw_), inplace=True)
+    return new_v, new_mw, new_vw
+
+
+def _row_sparse_components(grad):
+    """Get the unique rows of a sparse gradient in COO format and their dense values."""
+    rows, inverse = ivy.unique_inverse(grad.coo_indices[0])
+    values = ivy.scatter_nd(
+        ivy.stack([ivy.astype(inverse, rows.dtype), grad.coo_indices[1]], axis=-1),
+        grad.values,
+        shape=(rows.shape[0], grad.dense_shape[1]),
+    )
+    return rows, values
+
+
+def _scatter_rows(x, rows, values, inplace):
+    """Write the values of some rows of an array, in-place if requested."""
+    return ivy.scatter_nd(
+        ivy.expand_dims(rows, axis=-1),
+        values,
+        reduction="replace",
+        out=x if inplace else ivy.copy_array(x),
+    )
+
+
 # Base #
 # -----#
 
@@ -88,6 +209,29 @@ class Optimizer(abc.ABC):
         """
         raise ivy.utils.exceptions.IvyNotImplementedException
 
+    def _sparse_step(self, key_chain: str, w: ivy.Array, grad: ivy.SparseArray):
+        """
+        Update variable w at the rows of its row-sparse gradient. Override this method
+        in child classes which support sparse gradients.
+
+        Parameters
+        ----------
+        key_chain
+            Key chain of the variable in the variables container.
+        w
+            Variable to update.
+        grad
+            Sparse gradient of the variable, in COO format.
+
+        Returns
+        -------
+        ret
+            The updated variable, following update step.
+        """
+        raise ivy.utils.exceptions.IvyNotImplementedException(
+            f"{type(self).__name__} does not support sparse gradients"
+        )
+
     # Given #
 
     def _step_fn(
@@ -107,6 +251,27 @@ class Optimizer(abc.ABC):
             the variables.
             Default is ``False``
         """
+        if ivy.is_ivy_sparse_array(grads):
+            return self._sparse_step("", v, grads)
+        sparse_key_chains = (
+            [kc for kc, g in grads.cont_to_iterator() if ivy.is_ivy_sparse_array(g)]
+            if isinstance(grads, ivy.Container)
+            else []
+        )
+        if sparse_key_chains:
+            # the dense gradients go through the usual step, while the variables with
+            # row-sparse gradients are only updated at the rows that were touched
+            dense_grads = grads.cont_prune_key_chains(sparse_key_chains)
+            if dense_grads.cont_all_key_chains():
+                v = v.cont_set_at_key_chains(
+                    self._step(v.cont_at_key_chains(dense_grads), dense_grads)
+                )
+            for key_chain in sparse_key_chains:
+                v = v.cont_set_at_key_chain(
+                    key_chain,
+                    self._sparse_step(key_chain, v[key_chain], grads[key_chain]),
+                )
+            return v
         if ignore_missing:
             return v.cont_set_at_keys(self._step(v.cont_at_key_chains(grads), grads))
         return self._step(v, grads)
@@ -154,6 +319,9 @@ class Optimizer(abc.ABC):
         """
         self._count += 1
         self._initialized = True
+        if isinstance(v, ivy.Container):
+            # the updates and optimizer states computed from v share its structure
+            v.cont_tree_def()
         return self._step_fn(v, grads, ignore_missing)
 
 
@@ -217,6 +385,34 @@ class SGD(Optimizer):
             stop_gradients=self._stop_gradients,
         )
 
+    def _sparse_step(self, key_chain: str, w: ivy.Array, grad: ivy.SparseArray):
+        """
+        Update variable w by gradient descent step at the rows of its row-sparse
+        gradient.
+
+        Parameters
+        ----------
+        key_chain
+            Key chain of the variable in the variables container.
+        w
+            Variable to update.
+        grad
+            Sparse gradient of the variable, in COO format.
+
+        Returns
+        -------
+        ret
+            The updated variable, following gradient descent step.
+        """
+        rows, values = _row_sparse_components(grad)
+        new_rows = ivy.gradient_descent_update(
+            ivy.gather(w, rows, axis=0),
+            values,
+            self._lr if isinstance(self._lr, float) else self._lr(),
+            stop_gradients=self._stop_gradients,
+        )
+        return _scatter_rows(w, rows, new_rows, self._inplace)
+
     def set_state(self, state: ivy.Container):
         """
         Set state of the optimizer.
@@ -321,6 +517,9 @@ class Adam(Optimizer):
         stop_gradients: bool = True,
         compile_on_next_step: bool = False,
         device: Optional[Union[ivy.Device, ivy.NativeDevice]] = None,
+        quantize_moments: bool = False,
+        factor_second_moments: bool = False,
+        quantization_block_size: int = 256,
     ):
         """
         Construct an ADAM optimizer.
@@ -349,12 +548,27 @@ class Adam(Optimizer):
         device
             Device on which to create the layer's variables 'cuda:0', 'cuda:1', 'cpu'
             etc. (Default value = None)
+        quantize_moments
+            Whether to keep the running averages of the gradients and of their second
+            moments as 8-bit codes with one scale per block of values, instead of at
+            full precision. Default is ``False``.
+        factor_second_moments
+            Whether to keep only the row and column means of the second moments of
+            variables with two or more dimensions, instead of the full second moments.
+            Default is ``False``.
+        quantization_block_size
+            Number of values sharing a scale in the quantized moments. Default is
+            ``256``.
         """
         self._beta1 = beta1
         self._beta2 = beta2
         self._epsilon = epsilon
+        self._quantize_moments = quantize_moments
+        self._factor_second_moments = factor_second_moments
+        self._quantization_block_size = quantization_block_size
         self._mw = None
         self._vw = None
+        self._sparse_state = ivy.Container()
         self._first_pass = True
         self._should_compile = False
 
@@ -386,19 +600,104 @@ class Adam(Optimizer):
             self._vw = grads**2
             self._first_pass = False
 
-        new_v, self._mw, self._vw = ivy.adam_update(
-            v,
-            grads,
+        lr = self._lr if isinstance(self._lr, float) else self._lr()
+
+        def _update(w, dcdw, mw, vw):
+            return ivy.adam_update(
+                w,
+                dcdw,
+                lr,
+                mw,
+                vw,
+                self._count,
+                beta1=self._beta1,
+                beta2=self._beta2,
+                epsilon=self._epsilon,
+                stop_gradients=self._stop_gradients,
+            )
+
+        if self._quantize_moments or self._factor_second_moments:
+            new_v, self._mw, self._vw = _update_with_compressed_moments(
+                _update,
+                v,
+                grads,
+                self._mw,
+                self._vw,
+                self._quantize_moments,
+                self._factor_second_moments,
+                self._quantization_block_size,
+            )
+        else:
+            new_v, self._mw, self._vw = _update(v, grads, self._mw, self._vw)
+        return new_v
+
+    def _sparse_step(self, key_chain: str, w: ivy.Array, grad: ivy.SparseArray):
+        """
+        Update variable w by Adam update step at the rows of its row-sparse gradient.
+        The moments of the other rows are decayed lazily, the next time their rows are
+        updated.
+
+        Parameters
+        ----------
+        key_chain
+            Key chain of the variable in the variables container.
+        w
+            Variable to update.
+        grad
+            Sparse gradient of the variable, in COO format.
+
+        Returns
+        -------
+        ret
+            The updated variable, following Adam update step.
+        """
+        key_chain = key_chain or "w"
+        if not self._sparse_state.cont_has_key_chain(key_chain):
+            self._sparse_state.cont_set_at_key_chain(
+                key_chain,
+                ivy.Container(
+                    mw=ivy.zeros_like(w),
+                    vw=ivy.zeros_like(w),
+                    steps=ivy.zeros((w.shape[0],), dtype="int32", device=w.device),
+                ),
+                inplace=True,
+            )
+        state = self._sparse_state.cont_at_key_chain(key_chain)
+        rows, values = _row_sparse_components(grad)
+        steps = ivy.gather(state.steps, rows, axis=0)
+        # decays of the steps since each row was last updated, with the moments
+        # starting from the gradients on the first step as in the dense update
+        skipped = ivy.expand_dims(ivy.astype(self._count - 1 - steps, w.dtype), axis=-1)
+        first = self._count == 1
+        mw = ivy.where(
+            first, values, ivy.gather(state.mw, rows, axis=0) * self._beta1**skipped
+        )
+        vw = ivy.where(
+            first,
+            values**2,
+            ivy.gather(state.vw, rows, axis=0) * self._beta2**skipped,
+        )
+        new_rows, mw, vw = ivy.adam_update(
+            ivy.gather(w, rows, axis=0),
+            values,
             self._lr if isinstance(self._lr, float) else self._lr(),
-            self._mw,
-            self._vw,
+            mw,
+            vw,
             self._count,
             beta1=self._beta1,
             beta2=self._beta2,
             epsilon=self._epsilon,
             stop_gradients=self._stop_gradients,
         )
-        return new_v
+        state.mw = _scatter_rows(state.mw, rows, mw, True)
+        state.vw = _scatter_rows(state.vw, rows, vw, True)
+        state.steps = _scatter_rows(
+            state.steps,
+            rows,
+            ivy.astype(ivy.broadcast_to(self._count, rows.shape), "int32"),
+            True,
+        )
+        return _scatter_rows(w, rows, new_rows, self._inplace)
 
     def set_state(self, state: ivy.Container):
         """
@@ -411,10 +710,17 @@ class Adam(Optimizer):
         """
         self._mw = state.mw
         self._vw = state.vw
+        self._sparse_state = state.sparse if "sparse" in state else ivy.Container()
+        if "count" in state:
+            self._count = state.count
+        self._first_pass = False
 
     @property
     def state(self):
-        return ivy.Container({"mw": self._mw, "vw": self._vw})
+        state = {"mw": self._mw, "vw": self._vw, "count": self._count}
+        if self._sparse_state:
+            state["sparse"] = self._sparse_state
+        return ivy.Container(state)
 
 
 class LAMB(Optimizer):
@@ -430,6 +736,9 @@ class LAMB(Optimizer):
         stop_gradients: bool = True,
         compile_on_next_step: bool = False,
         device: Optional[Union[ivy.Device, ivy.NativeDevice]] = None,
+        quantize_moments: bool = False,
+        factor_second_moments: bool = False,
+        quantization_block_size: int = 256,
     ):
         """
         Construct an LAMB optimizer.
@@ -463,6 +772,17 @@ class LAMB(Optimizer):
         device
             Device on which to create the layer's variables 'cuda:0', 'cuda:1', 'cpu'
             etc. (Default value = None)
+        quantize_moments
+            Whether to keep the running averages of the gradients and of their second
+            moments as 8-bit codes with one scale per block of values, instead of at
+            full precision. Default is ``False``.
+        factor_second_moments
+            Whether to keep only the row and column means of the second moments of
+            variables with two or more dimensions, instead of the full second moments.
+            Default is ``False``.
+        quantization_block_size
+            Number of values sharing a scale in the quantized moments. Default is
+            ``256``.
         """
         Optimizer.__init__(
             self, lr, inplace, stop_gradients, True, compile_on_next_step, device=device
@@ -470,6 +790,9 @@ class LAMB(Optimizer):
         self._beta1 = beta1
         self._beta2 = beta2
         self._epsilon = epsilon
+        self._quantize_moments = quantize_moments
+        self._factor_second_moments = factor_second_moments
+        self._quantization_block_size = quantization_block_size
         self._mw = None
         self._vw = None
         self._max_trust_ratio = max_trust_ratio
@@ -500,20 +823,37 @@ class LAMB(Optimizer):
             self._vw = grads**2
             self._first_pass = False
 
-        new_v, self._mw, self._vw = ivy.lamb_update(
-            v,
-            grads,
-            self._lr if isinstance(self._lr, float) else self._lr(),
-            self._mw,
-            self._vw,
-            self._count,
-            beta1=self._beta1,
-            beta2=self._beta2,
-            epsilon=self._epsilon,
-            max_trust_ratio=self._max_trust_ratio,
-            decay_lambda=self._decay_lambda,
-            stop_gradients=self._stop_gradients,
-        )
+        lr = self._lr if isinstance(self._lr, float) else self._lr()
+
+        def _update(w, dcdw, mw, vw):
+            return ivy.lamb_update(
+                w,
+                dcdw,
+                lr,
+                mw,
+                vw,
+                self._count,
+                beta1=self._beta1,
+                beta2=self._beta2,
+                epsilon=self._epsilon,
+                max_trust_ratio=self._max_trust_ratio,
+                decay_lambda=self._decay_lambda,
+                stop_gradients=self._stop_gradients,
+            )
+
+        if self._quantize_moments or self._factor_second_moments:
+            new_v, self._mw, self._vw = _update_with_compressed_moments(
+                _update,
+                v,
+                grads,
+                self._mw,
+                self._vw,
+                self._quantize_moments,
+                self._factor_second_moments,
+                self._quantization_block_size,
+            )
+        else:
+            new_v, self._mw, self._vw = _update(v, grads, self._mw, self._vw)
         return new_v
 
     def set_state(self, state: ivy.Container):
@@ -527,7 +867,10 @@ class LAMB(Optimizer):
         """
         self._mw = state.mw
         self._vw = state.vw
+        if "count" in state:
+            self._count = state.count
+        self._first_pass = False
 
     @property
     def state(self):
-        return ivy.Container({"mw": self._mw, "vw": self._vw})
+        return ivy.Container({"mw": self._mw, "vw": self._vw, "count": self._count})
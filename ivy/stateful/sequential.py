@@ -15,6 +15,7 @@ class Sequential(Module):
         device: Optional[Union[ivy.Device, ivy.NativeDevice]] = None,
         v: Optional[Union[ivy.Array, ivy.NativeArray]] = None,
         dtype: Optional[Union[ivy.Dtype, ivy.NativeDtype]] = None,
+        checkpoint_activations: bool = False,
     ):
         """
         Initialize a sequential container. Modules will be added to it in the order they
@@ -30,6 +31,11 @@ class Sequential(Module):
         v
             the variables for each submodule in the sequence, constructed internally by
             default.
+        checkpoint_activations
+            whether to recompute the intermediate activations of the sequence during
+            the backward pass rather than keeping them in memory, such that only the
+            inputs of the sequence are kept for the backward pass. Default is
+            ``False``.
         """
         if v is not None:
             for i, submod in enumerate(sub_modules):
@@ -43,7 +49,13 @@ class Sequential(Module):
                             '"submodules/v{}", where {} is an idx'
                         )
         self._submodules = list(sub_modules)
-        Module.__init__(self, device=device, v=v, dtype=dtype)
+        Module.__init__(
+            self,
+            device=device,
+            v=v,
+            dtype=dtype,
+            checkpoint_activations=checkpoint_activations,
+        )
 
     def __iter__(self):
         return iter(self._submodules)
@@ -6,7 +6,7 @@ import ivy
 import importlib
 import functools
 import numpy as np
-import gc
+import weakref
 from ivy.utils import _importlib, verbosity
 
 # local
@@ -20,6 +20,15 @@ _compiled_backends_ids = {}
 implicit_backend = "numpy"
 ivy_original_dict = ivy.__dict__.copy()
 ivy_original_fn_dict = {}
+_backend_snapshots = {}
+_active_snapshot = None
+# weak registries of the live ivy.Array and ivy.Container instances, keyed by id and
+# populated on construction, so that dynamic backend conversion and device queries
+# don't need to scan the whole gc heap
+_tracked_arrays = weakref.WeakValueDictionary()
+_tracked_containers = weakref.WeakValueDictionary()
+# bytes shared with and copied from the source backend by the last dynamic switch
+_dynamic_transfer_stats = {"shared_bytes": 0, "copied_bytes": 0}
 
 
 class ContextManager:
@@ -274,6 +283,122 @@ def _set_backend_as_ivy(
             )
 
 
+def _backend_version_of(backend):
+    return dict(getattr(backend, "backend_version", {})).get("version")
+
+
+class _BackendSnapshot:
+    """
+    Immutable record of the ivy namespace entries which a backend overrides.
+
+    The snapshot is computed once, the first time a backend is set, so
+    that switching back to the backend later only needs to swap these
+    entries in rather than wrapping every function of the backend again.
+    It is invalidated by any change to either the original ivy namespace
+    or the backend module.
+    """
+
+    def __init__(self, original_dict, namespace, backend):
+        self.overrides = types.MappingProxyType(
+            {
+                k: v
+                for k, v in namespace.items()
+                if k in original_dict
+                and v is not original_dict[k]
+                and k not in ivy.GLOBAL_PROPS
+            }
+        )
+        self.deleted = frozenset(k for k in original_dict if k not in namespace)
+        self.functional_keys = frozenset(
+            k
+            for k in self.overrides
+            if k in ivy.functional.__dict__ and not k.startswith("__")
+        )
+        # the original and backend entries the overrides were computed against
+        self._originals = tuple(original_dict[k] for k in self.overrides)
+        self._backend_dict = backend.__dict__
+        self._backend_version = _backend_version_of(backend)
+        self._backend_entries = tuple(backend.__dict__.get(k) for k in self.overrides)
+
+    def is_valid(self, original_dict, backend):
+        """Check whether the ivy namespace or the backend changed since creation."""
+        backend_dict = backend.__dict__
+        return (
+            backend_dict is self._backend_dict
+            and _backend_version_of(backend) == self._backend_version
+            and all(
+                original_dict.get(k) is v
+                for k, v in zip(self.overrides, self._originals)
+            )
+            and all(
+                backend_dict.get(k) is v
+                for k, v in zip(self.overrides, self._backend_entries)
+            )
+        )
+
+
+def _restore_original_entries(keys):
+    ivy.__dict__.update(
+        {k: ivy_original_dict[k] for k in keys if k in ivy_original_dict}
+    )
+    ivy.functional.__dict__.update(
+        {
+            k: ivy_original_dict[k]
+            for k in keys
+            if k in ivy_original_dict
+            and k in ivy.functional.__dict__
+            and not k.startswith("__")
+        }
+    )
+
+
+def _set_backend_namespace(backend):
+    """
+    Point the ivy namespace to `backend`.
+
+    The wrapped namespace of each backend is computed once and stored as
+    a snapshot, any later switch to the same backend simply swaps the
+    snapshot in.
+    """
+    global _active_snapshot
+    snapshot = _backend_snapshots.get(backend)
+    if snapshot is None or not snapshot.is_valid(ivy_original_dict, backend):
+        _set_backend_as_ivy(ivy_original_dict, ivy, backend)
+        # following snippet is required to update the ivy.functional namespace with
+        # backend-specific functions
+        for key, _ in ivy.__dict__.items():
+            if key in ivy.functional.__dict__ and not key.startswith("__"):
+                ivy.functional.__dict__[key] = ivy.__dict__[key]
+        _backend_snapshots[backend] = _BackendSnapshot(
+            ivy_original_dict, ivy.__dict__, backend
+        )
+        _active_snapshot = _backend_snapshots[backend]
+        return
+    if _active_snapshot is not None and _active_snapshot is not snapshot:
+        # entries overridden or deleted by the previous backend only
+        _restore_original_entries(
+            (_active_snapshot.overrides.keys() | _active_snapshot.deleted)
+            - snapshot.overrides.keys()
+        )
+    ivy.__dict__.update(snapshot.overrides)
+    for k in snapshot.deleted:
+        ivy.__dict__.pop(k, None)
+    ivy.functional.__dict__.update(
+        {k: snapshot.overrides[k] for k in snapshot.functional_keys}
+    )
+    _active_snapshot = snapshot
+
+
+def _unset_backend_namespace():
+    """Point the ivy namespace back to ivy's original implementations."""
+    global _active_snapshot
+    for k, v in ivy_original_dict.items():
+        ivy.__dict__[k] = v
+        if k in ivy.functional.__dict__ and not k.startswith("__"):
+            ivy.functional.__dict__[k] = v
+    _active_snapshot = None
+
+
 def _handle_backend_specific_vars(target, backend):
     if backend.current_backend_str() == "numpy":
         target.set_default_device("cpu")
@@ -281,7 +406,75 @@ def _handle_backend_specific_vars(target, backend):
         target.set_global_attr("RNG", target.functional.backends.jax.random.RNG)
 
 
-def convert_from_source_backend_to_numpy(variable_ids, numpy_objs, devices):
+def _buffer_address(x):
+    """Return the address of the cpu buffer backing `x`, or None if unknown."""
+    if isinstance(x, np.ndarray):
+        return x.__array_interface__["data"][0]
+    try:
+        return np.from_dlpack(x).__array_interface__["data"][0]
+    except Exception:
+        return None
+
+
+def _share_numpy_buffer(np_arr):
+    """
+    Wrap a numpy array as a native array of the current backend without copying.
+
+    DLPack (or the buffer protocol, for torch) is used where the backend
+    supports it. Returns None if the buffer can't be shared, read-only
+    arrays are never shared since DLPack can't signal that they mustn't
+    be written to.
+    """
+    if not np_arr.flags.writeable:
+        return None
+    backend = ivy.current_backend_str()
+    try:
+        if backend == "numpy":
+            return np_arr
+        if backend == "torch":
+            return importlib.import_module("torch").from_numpy(np_arr)
+        if backend == "jax":
+            return importlib.import_module("jax.dlpack").from_dlpack(
+                np_arr.__dlpack__()
+            )
+        if backend == "tensorflow":
+            return importlib.import_module(
+                "tensorflow.experimental.dlpack"
+            ).from_dlpack(np_arr.__dlpack__())
+        if backend == "paddle":
+            return importlib.import_module("paddle.utils.dlpack").from_dlpack(
+                np_arr.__dlpack__()
+            )
+    except (BufferError, TypeError, ValueError, RuntimeError):
+        pass
+    return None
+
+
+def dynamic_backend_transfer_stats():
+    """
+    Return how many bytes the last dynamic backend switch shared or copied.
+
+    Returns
+    -------
+    ret
+        dict with the number of ``"shared_bytes"``, whose buffers were handed to
+        the new backend without a copy, and ``"copied_bytes"``.
+
+    Examples
+    --------
+    >>> ivy.set_backend("numpy")
+    >>> x = ivy.array([1.0, 2.0])
+    >>> ivy.set_backend("jax", dynamic=True)
+    >>> stats = ivy.dynamic_backend_transfer_stats()
+    >>> print(sorted(stats.keys()))
+    ['copied_bytes', 'shared_bytes']
+    """
+    return dict(_dynamic_transfer_stats)
+
+
+def convert_from_source_backend_to_numpy(
+    variable_ids, numpy_objs, devices, source_addresses
+):
     # Dynamic Backend
     from ivy.functional.ivy.gradients import _is_variable, _variable_data
 
@@ -312,21 +505,11 @@ def convert_from_source_backend_to_numpy(variable_ids, numpy_objs, devices):
             return _is_variable(obj)
 
     # get all ivy array instances in the project scope
-    container_list = [
-        obj
-        for obj in gc.get_objects()
-        if "ivy" in type(obj).__module__ and isinstance(obj, ivy.Container)
-    ]
-    cont_array_idxs = ivy.nested_argwhere(
-        container_list, lambda x: isinstance(x, ivy.Array)
-    )
-    cont_array_vals = ivy.multi_index_nest(container_list, cont_array_idxs)
-    array_list = [
-        obj
-        for obj in gc.get_objects()
-        if "ivy" in type(obj).__module__ and isinstance(obj, ivy.Array)
-    ]
-    array_list.extend(cont_array_vals)
+    array_list = list(_tracked_arrays.values())
+    for cont in list(_tracked_containers.values()):
+        array_list.extend(
+            x for x in cont.cont_to_iterator_values() if isinstance(x, ivy.Array)
+        )
 
     # filter uninitialized arrays and arrays with other bakcends, and ensure the order
     array_list = [
@@ -344,48 +527,77 @@ def convert_from_source_backend_to_numpy(variable_ids, numpy_objs, devices):
         if obj.dynamic_backend:
             numpy_objs.append(obj)
             devices.append(obj.device)
+            # cpu buffers are viewed rather than copied, so that the target backend
+            # may be able to share them
+            on_cpu = "cpu" in ivy.as_ivy_dev(obj.device)
             if _is_var(obj):
                 # add variable object id to set
                 variable_ids.add(id(obj))
-                native_var = _variable_data(obj)
-                np_data = ivy.to_numpy(native_var)
+                native_data = _variable_data(obj)
+                np_data = ivy.to_numpy(native_data, copy=not on_cpu)
 
             else:
-                np_data = obj.to_numpy()
+                native_data = obj.data
+                np_data = obj.to_numpy(copy=not on_cpu)
+
+            if on_cpu:
+                source_addresses[id(obj)] = _buffer_address(native_data)
 
             if isinstance(obj, ivy.Container):
                 obj.cont_inplace_update(np_data)
             else:
                 obj._data = np_data
 
-    return variable_ids, numpy_objs, devices
+    return variable_ids, numpy_objs, devices, source_addresses
+
+
+def _numpy_to_target(np_arr, device, source_address):
+    shared_arr = None
+    if source_address is not None:
+        shared_arr = _share_numpy_buffer(np_arr)
+    if shared_arr is not None:
+        new_arr = ivy.Array(shared_arr)
+    else:
+        if not np_arr.flags.writeable:
+            np_arr = np_arr.copy()
+        new_arr = current_backend().asarray(np_arr, device=device)
+    shared = source_address is not None and _buffer_address(new_arr.data) == (
+        source_address
+    )
+    _dynamic_transfer_stats[
+        "shared_bytes" if shared else "copied_bytes"
+    ] += np_arr.nbytes
+    return new_arr
 
 
-def convert_from_numpy_to_target_backend(variable_ids, numpy_objs, devices):
+def convert_from_numpy_to_target_backend(
+    variable_ids, numpy_objs, devices, source_addresses
+):
     # Dynamic Backend
     from ivy.functional.ivy.gradients import _variable
 
     # convert all ivy.Array and ivy.Container instances from numpy
-    # to native arrays using the newly set backend
+    # to native arrays using the newly set backend, sharing the buffers with the
+    # source backend where possible
     for obj, device in zip(numpy_objs, devices):
         np_arr = obj.data if isinstance(obj, ivy.Array) else obj
+        source_address = source_addresses.get(id(obj))
+        native_arr = ivy.nested_map(
+            lambda x: (
+                _numpy_to_target(x, device, source_address)
+                if isinstance(x, np.ndarray)
+                else current_backend().asarray(x, device=device)
+            ),
+            np_arr,
+            include_derived=True,
+            shallow=False,
+        )
         # check if object was originally a variable
         if id(obj) in variable_ids:
-            native_arr = ivy.nested_map(
-                lambda x: current_backend().asarray(x, device=device),
-                np_arr,
-                include_derived=True,
-                shallow=False,
-            )
             new_data = _variable(native_arr)
 
         else:
-            new_data = ivy.nested_map(
-                lambda x: current_backend().asarray(x, device=device),
-                np_arr,
-                include_derived=True,
-                shallow=False,
-            )
+            new_data = native_arr
 
         if isinstance(obj, ivy.Container):
             obj.cont_inplace_update(new_data)
@@ -427,10 +639,17 @@ def set_backend(backend: str, dynamic: bool = False):
     numpy_objs = []  # create an empty list to store numpy objects
     devices = []  # create an empty list to store device strings
     # created during 1st conversion step
+    source_addresses = {}  # create an empty dict to store source buffer addresses
 
     if dynamic:
-        variable_ids, numpy_objs, devices = convert_from_source_backend_to_numpy(
-            variable_ids, numpy_objs, devices
+        _dynamic_transfer_stats.update(shared_bytes=0, copied_bytes=0)
+        (
+            variable_ids,
+            numpy_objs,
+            devices,
+            source_addresses,
+        ) = convert_from_source_backend_to_numpy(
+            variable_ids, numpy_objs, devices, source_addresses
         )
 
     # update the global dict with the new backend
@@ -453,15 +672,14 @@ def set_backend(backend: str, dynamic: bool = False):
             ivy.set_global_attr("RNG", ivy.functional.backends.jax.random.RNG)
         backend_stack.append(backend)
         set_backend_to_specific_version(backend)
-        _set_backend_as_ivy(ivy_original_dict, ivy, backend)
-        # following snippet is required to update the ivy.functional namespace with
-        # backend-specific functions
-        for key, _ in ivy.__dict__.items():
-            if key in ivy.functional.__dict__ and not key.startswith("__"):
-                ivy.functional.__dict__[key] = ivy.__dict__[key]
+        _set_backend_namespace(backend)
 
         if dynamic:
-            convert_from_numpy_to_target_backend(variable_ids, numpy_objs, devices)
+            convert_from_numpy_to_target_backend(
+                variable_ids, numpy_objs, devices, source_addresses
+            )
+            if verbosity.level > 0:
+                verbosity.cprint(f"dynamic backend transfer: {_dynamic_transfer_stats}")
 
         if verbosity.level > 0:
             verbosity.cprint(f"backend stack: {backend_stack}")
@@ -573,18 +791,11 @@ def previous_backend():
                 ivy.set_default_device("cpu")
             elif new_backend.current_backend_str() == "jax":
                 ivy.set_global_attr("RNG", ivy.functional.backends.jax.random.RNG)
-        new_backend_dict = (
-            backend_stack[-1].__dict__ if backend_stack else ivy_original_dict
-        )
-        # wrap backend functions if there still is a backend, and add functions
-        # to ivy namespace
-        for k, v in new_backend_dict.items():
-            if backend_stack and k in ivy_original_dict:
-                v = _wrap_function(k, v, ivy_original_dict[k])
-            if k in ivy_original_dict:
-                ivy.__dict__[k] = v
-            if k in ivy.functional.__dict__ and not k.startswith("__"):
-                ivy.functional.__dict__[k] = v
+        if backend_stack:
+            # swap in the snapshot of the backend which is now on top of the stack
+            _set_backend_namespace(backend_stack[-1])
+        else:
+            _unset_backend_namespace()
     if verbosity.level > 0:
         verbosity.cprint(f"backend stack: {backend_stack}")
     _handle_inplace_mode()
@@ -1757,6 +1757,7 @@ def arrays_for_pooling(
     mixed_fn_compos=True,
     data_format="channel_last",
     return_data_format=False,
+    strided_dilation=False,
 ):
     in_shape = draw(
         nph.array_shapes(
@@ -1824,7 +1825,7 @@ def arrays_for_pooling(
     # We do this to avoid this error in the tf backend
     # ValueError: `strides > 1` not supported in conjunction with `dilation_rate > 1`
     # TODO: Explore fully compositional implementation for pooling to bypass this in tf.
-    if return_dilation:
+    if return_dilation and not strided_dilation:
         strides = (
             draw(st.tuples(st.integers(1, min(kernel))))
             if max(dilations) <= 1
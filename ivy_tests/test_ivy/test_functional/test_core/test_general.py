@@ -1,6 +1,7 @@
 """Collection of tests for unified general functions."""
 
 # global
+import importlib
 import time
 import math
 from types import SimpleNamespace
@@ -1528,6 +1529,32 @@ def test_num_arrays_in_memory():
     return
 
 
+def test_numpy_negative_indices(backend_fw):
+    if backend_fw != "numpy":
+        pytest.skip()
+    np_general = importlib.import_module("ivy.functional.backends.numpy.general")
+    # negative indices count from the end of their dim as in numpy, which not all
+    # the backends support and the gather and scatter tests therefore never draw
+    rng = np.random.default_rng(0)
+    params = rng.standard_normal((2, 3, 5, 4))
+    indices = rng.integers(-5, 5, (2, 6))
+    assert np.array_equal(
+        np_general.gather(params, indices, axis=2, batch_dims=1),
+        np_general.gather(params, indices % 5, axis=2, batch_dims=1),
+    )
+    indices = np.stack([rng.integers(-d, d, (2, 6)) for d in (3, 5)], axis=-1)
+    assert np.array_equal(
+        np_general.gather_nd(params, indices, batch_dims=1),
+        np_general.gather_nd(params, indices % [3, 5], batch_dims=1),
+    )
+    indices = np.stack([rng.integers(-d, d, (6,)) for d in (2, 3)], axis=-1)
+    updates = rng.standard_normal((6, 5, 4))
+    assert np.allclose(
+        np_general.scatter_nd(indices, updates, params.shape, reduction="sum"),
+        np_general.scatter_nd(indices % [2, 3], updates, params.shape, reduction="sum"),
+    )
+
+
 def test_print_all_arrays_in_memory():
     return
 
@@ -1552,7 +1579,7 @@ def test_print_all_arrays_in_memory():
                 max_num_dims=1,
                 min_dim_size=n,
                 max_dim_size=n,
-            ).filter(lambda d_n_v: len(set(d_n_v[1][0])) == len(d_n_v[1][0])),
+            ),
             st.integers(min_value=n, max_value=n),
         )
     ),
@@ -1572,6 +1599,8 @@ def test_scatter_flat(x, reduction, test_flags, backend_fw, fn_name, on_device):
                 test_flags.test_gradients = False
             k += 1
     (val_dtype, vals), (ind_dtype, ind), size = x
+    # the updates at duplicated indices are reduced, unless they replace each other
+    assume(reduction != "replace" or len(set(ind[0])) == len(ind[0]))
     helpers.test_function(
         input_dtypes=ind_dtype + val_dtype,
         test_flags=test_flags,
@@ -2023,6 +2052,52 @@ def test_vmap(func, dtype_and_arrays_and_axes, in_axes_as_cont, backend_fw):
         assert False, "One of the results is None while other isn't"
 
 
+@pytest.mark.parametrize(
+    ("func", "batched"),
+    [
+        (lambda x, y: ivy.sum(ivy.relu(ivy.matmul(x, y)), axis=-1), True),
+        (lambda x, y: ivy.vecdot(x[0], y[:, 0]) * 2.0 + ivy.mean(x), False),
+        (lambda x, y: ivy.argmax(ivy.add(x, y[:, 1])), True),
+        (lambda x, y: ivy.exp(x) @ y * (ivy.sum(x) > 1.0), True),
+    ],
+)
+def test_vmap_batching_rules(func, batched, backend_fw):
+    ivy.set_backend(backend_fw)
+    x = np.random.uniform(size=(3, 4, 5))
+    y = np.random.uniform(size=(5, 2))
+    calls = []
+
+    def _func(*args):
+        calls.append(None)
+        return func(*args)
+
+    ret = ivy.vmap(_func, in_axes=(1, None))(x, y)
+    expected = np.stack([ivy.to_numpy(func(x[:, i], y)) for i in range(4)])
+    assert np.allclose(ivy.to_numpy(ret), expected)
+    if backend_fw == "numpy":
+        # functions made of primitives with batching rules run once on the batch,
+        # anything else falls back to mapping over the items
+        assert len(calls) == (1 if batched else 5)
+    ivy.previous_backend()
+
+
+def test_vmap_errors(backend_fw):
+    ivy.set_backend(backend_fw)
+    calls = []
+
+    def _func(x):
+        calls.append(None)
+        raise ValueError("error in the mapped function")
+
+    # errors raised by the function itself are not mistaken for missing batching
+    # rules, and the function doesn't run again over the items
+    with pytest.raises(Exception, match="error in the mapped function"):
+        ivy.vmap(_func)(np.ones((4, 3)))
+    if backend_fw == "numpy":
+        assert len(calls) == 1
+    ivy.previous_backend()
+
+
 _composition_1.test_unsupported_devices_and_dtypes = {
     "cpu": {
         "numpy": ("bfloat16",),
@@ -15,6 +15,295 @@ from ivy_tests.test_ivy.helpers import handle_test, BackendHandler
 # --------------- #
 
 
+def _finite_difference_vjp(fn, xs, g, i, eps=1e-6):
+    # central differences of <g, fn(xs)> w.r.t. each element of the i-th input
+    ret = np.zeros_like(xs[i])
+    for index in np.ndindex(*xs[i].shape):
+        plus = [x.copy() for x in xs]
+        minus = [x.copy() for x in xs]
+        plus[i][index] += eps
+        minus[i][index] -= eps
+        ret[index] = np.sum(g * (fn(*plus) - fn(*minus))) / (2 * eps)
+    return ret
+
+
+def _numpy_vjp_cases():
+    # the functions with VJPs registered on the tape of the numpy backend, with the
+    # shapes of the inputs they are differentiated w.r.t.
+    from ivy.functional.backends.numpy.autograd import _checkpoint
+    from ivy.functional.backends.numpy.general import _scatter_reduce
+    from ivy.functional.backends.numpy.layers import _add_dilations, _im2col_conv
+
+    def _swap(x):
+        return np.swapaxes(x, -1, -2)
+
+    def _setitem(x, y):
+        x = x * 1.0
+        x[1:, [0, 2]] = y
+        return x
+
+    unary = [
+        np.negative,
+        np.positive,
+        np.conjugate,
+        np.square,
+        np.sqrt,
+        np.cbrt,
+        np.reciprocal,
+        np.exp,
+        np.exp2,
+        np.expm1,
+        np.log,
+        np.log2,
+        np.log10,
+        np.log1p,
+        np.absolute,
+        np.fabs,
+        np.sin,
+        np.cos,
+        np.tan,
+        np.arcsin,
+        np.arccos,
+        np.arctan,
+        np.sinh,
+        np.cosh,
+        np.tanh,
+        np.arcsinh,
+        np.arctanh,
+    ]
+    binary = [
+        np.add,
+        np.subtract,
+        np.multiply,
+        np.true_divide,
+        np.power,
+        np.float_power,
+        np.logaddexp,
+        np.logaddexp2,
+        np.arctan2,
+        np.hypot,
+        np.remainder,
+        np.fmod,
+        np.maximum,
+        np.minimum,
+        np.fmax,
+        np.fmin,
+    ]
+    cases = [pytest.param(fn, [(2, 3)], id=fn.__name__) for fn in unary]
+    cases += [pytest.param(fn, [(2, 3), (3,)], id=fn.__name__) for fn in binary]
+    cases += [
+        pytest.param(lambda x: np.arccosh(x + 1), [(2, 3)], id="arccosh"),
+        pytest.param(lambda x: np.clip(x, 0.3, 0.7), [(2, 3)], id="clip"),
+        pytest.param(
+            lambda x, lo, hi: np.clip(2 * x - 0.5, lo - 0.6, hi + 0.3),
+            [(6,), (6,), (6,)],
+            id="clip_bounds",
+        ),
+        pytest.param(
+            lambda x: np.core.umath.clip(x, 0.3, 0.7), [(2, 3)], id="clip_ufunc"
+        ),
+        pytest.param(lambda x, y: np.where(x > 0.5, x, y), [(2, 3), (3,)], id="where"),
+        pytest.param(np.matmul, [(2, 3), (3, 4)], id="matmul"),
+        pytest.param(np.matmul, [(3,), (2, 3, 4)], id="matmul_vector_x"),
+        pytest.param(np.matmul, [(2, 3), (3,)], id="matmul_vector_y"),
+        # reductions
+        pytest.param(lambda x: np.sum(x, axis=1), [(2, 3, 4)], id="sum"),
+        pytest.param(
+            lambda x: np.mean(x, axis=(0, 2), keepdims=True), [(2, 3, 4)], id="mean"
+        ),
+        pytest.param(lambda x: np.prod(x, axis=-1), [(2, 3)], id="prod"),
+        pytest.param(lambda x: np.max(x, axis=0), [(2, 3)], id="max"),
+        pytest.param(lambda x: np.amin(x), [(2, 3)], id="amin"),
+        pytest.param(lambda x: np.var(x, axis=1, ddof=1), [(2, 3)], id="var"),
+        pytest.param(lambda x: np.std(x), [(2, 3)], id="std"),
+        pytest.param(lambda x: np.cumsum(x, axis=1), [(2, 3)], id="cumsum"),
+        pytest.param(lambda x: np.cumsum(x), [(2, 3)], id="cumsum_flat"),
+        pytest.param(lambda x: np.cumprod(x, axis=1), [(2, 3)], id="cumprod"),
+        pytest.param(lambda x: x.cumprod(), [(2, 3)], id="cumprod_flat"),
+        pytest.param(lambda x: np.add.reduce(x, axis=0), [(2, 3)], id="add_reduce"),
+        pytest.param(
+            lambda x: np.maximum.reduce(x, axis=1), [(2, 3)], id="maximum_reduce"
+        ),
+        pytest.param(lambda x: x.sum(axis=0) + x.mean(), [(2, 3)], id="methods"),
+        # manipulation
+        pytest.param(lambda x: np.reshape(x, (3, 2)), [(2, 3)], id="reshape"),
+        pytest.param(np.ravel, [(2, 3)], id="ravel"),
+        pytest.param(np.squeeze, [(2, 1, 3)], id="squeeze"),
+        pytest.param(lambda x: np.expand_dims(x, 1), [(2, 3)], id="expand_dims"),
+        pytest.param(np.copy, [(2, 3)], id="copy"),
+        pytest.param(lambda x: np.broadcast_to(x, (2, 3)), [(3,)], id="broadcast_to"),
+        pytest.param(
+            lambda x, y: np.stack(np.broadcast_arrays(x, y)),
+            [(2, 1), (3,)],
+            id="broadcast_arrays",
+        ),
+        pytest.param(lambda x: np.transpose(x, (2, 0, 1)), [(2, 3, 4)], id="transpose"),
+        pytest.param(lambda x: np.swapaxes(x, 0, 2), [(2, 3, 4)], id="swapaxes"),
+        pytest.param(lambda x: np.moveaxis(x, 0, -1), [(2, 3, 4)], id="moveaxis"),
+        pytest.param(lambda x: np.flip(x, 1), [(2, 3)], id="flip"),
+        pytest.param(lambda x: np.roll(x, 2, axis=1), [(2, 3)], id="roll"),
+        pytest.param(
+            lambda x, y: np.concatenate([x, y], axis=1),
+            [(2, 3), (2, 2)],
+            id="concatenate",
+        ),
+        pytest.param(
+            lambda x, y: np.concatenate([x, y], axis=None),
+            [(2, 3), (4,)],
+            id="concatenate_flat",
+        ),
+        pytest.param(
+            lambda x, y: np.stack([x, y], axis=1), [(2, 3), (2, 3)], id="stack"
+        ),
+        pytest.param(lambda x: np.tile(x, (2, 1, 2)), [(2, 3)], id="tile"),
+        pytest.param(lambda x: np.repeat(x, [1, 3, 2], axis=1), [(2, 3)], id="repeat"),
+        pytest.param(lambda x: np.repeat(x, 2), [(2, 3)], id="repeat_flat"),
+        pytest.param(lambda x: np.pad(x, ((1, 0), (2, 1))), [(2, 3)], id="pad"),
+        pytest.param(
+            lambda x: np.lib.stride_tricks.sliding_window_view(x, (2, 2)),
+            [(3, 4)],
+            id="sliding_window_view",
+        ),
+        pytest.param(lambda x: np.take(x, [2, 0, 2], axis=1), [(2, 3)], id="take"),
+        pytest.param(lambda x: np.take(x, [5, -1, 0]), [(2, 3)], id="take_flat"),
+        pytest.param(
+            lambda x: np.take_along_axis(x, np.array([[0, 0], [2, 1]]), axis=1),
+            [(2, 3)],
+            id="take_along_axis",
+        ),
+        pytest.param(
+            lambda x: np.take_along_axis(x, np.array([4, 4, 1]), axis=None),
+            [(2, 3)],
+            id="take_along_axis_flat",
+        ),
+        pytest.param(lambda x: np.sort(x, axis=0), [(3, 4)], id="sort"),
+        pytest.param(lambda x: np.sort(x, axis=None), [(3, 4)], id="sort_flat"),
+        pytest.param(lambda x: np.diagonal(x, 1, 0, 2), [(3, 2, 4)], id="diagonal"),
+        pytest.param(lambda x: np.trace(x, -1), [(3, 4)], id="trace"),
+        pytest.param(lambda x: x[1:, ::2], [(3, 4)], id="getitem"),
+        pytest.param(lambda x: x[[0, 2, 0], 1:], [(3, 4)], id="getitem_advanced"),
+        pytest.param(_setitem, [(3, 4), (2, 2)], id="setitem"),
+        # linear algebra
+        pytest.param(np.dot, [(2, 3), (3, 4)], id="dot"),
+        pytest.param(np.dot, [(2, 2, 3), (4, 3, 2)], id="dot_nd"),
+        pytest.param(np.dot, [(2, 3), (3,)], id="dot_vector"),
+        pytest.param(np.dot, [(2, 3), ()], id="dot_scalar"),
+        pytest.param(np.outer, [(2, 3), (4,)], id="outer"),
+        pytest.param(np.tensordot, [(2, 3, 4), (3, 4, 2)], id="tensordot"),
+        pytest.param(
+            lambda a, b: np.tensordot(a, b, axes=([2, 0], [0, 1])),
+            [(2, 3, 4), (4, 2, 3)],
+            id="tensordot_axes",
+        ),
+        pytest.param(
+            lambda a, b: np.einsum("ij,jk->ki", a, b), [(2, 3), (3, 4)], id="einsum"
+        ),
+        pytest.param(
+            lambda a, b: np.einsum("ijk,k", a, b),
+            [(2, 3, 4), (4,)],
+            id="einsum_implicit",
+        ),
+        pytest.param(lambda a: np.linalg.inv(a + 3 * np.eye(3)), [(2, 3, 3)], id="inv"),
+        pytest.param(lambda a: np.linalg.det(a + 3 * np.eye(3)), [(2, 3, 3)], id="det"),
+        pytest.param(
+            lambda a, b: np.linalg.solve(a + 3 * np.eye(3), b),
+            [(3, 3), (3, 2)],
+            id="solve",
+        ),
+        pytest.param(
+            lambda a, b: np.linalg.solve(a + 3 * np.eye(3), b),
+            [(3, 3), (3,)],
+            id="solve_vector",
+        ),
+        pytest.param(np.linalg.norm, [(2, 3)], id="norm"),
+        pytest.param(lambda x: np.linalg.norm(x, 1, 1), [(2, 3)], id="norm_1"),
+        pytest.param(lambda x: np.linalg.norm(x, np.inf, 0), [(2, 3)], id="norm_inf"),
+        pytest.param(lambda x: np.linalg.norm(x, 3, 1), [(2, 3)], id="norm_3"),
+        pytest.param(
+            lambda x: np.linalg.norm(x, "fro", (0, 1), keepdims=True),
+            [(2, 3)],
+            id="norm_fro",
+        ),
+        pytest.param(lambda a, b: np.cross(a, b), [(2, 3), (3,)], id="cross"),
+        pytest.param(
+            lambda a, b: np.cross(a, b, axisa=0, axisb=1, axisc=0),
+            [(3, 2), (2, 3)],
+            id="cross_axes",
+        ),
+        pytest.param(
+            lambda a: np.linalg.slogdet(a + 3 * np.eye(3))[1],
+            [(2, 3, 3)],
+            id="slogdet",
+        ),
+        # symmetric matrices for the decompositions reading a single triangle
+        pytest.param(
+            lambda a: np.linalg.cholesky(a @ _swap(a) + 3 * np.eye(3)),
+            [(2, 3, 3)],
+            id="cholesky",
+        ),
+        pytest.param(
+            lambda a: np.linalg.eigvalsh(a + _swap(a), "U"),
+            [(2, 3, 3)],
+            id="eigvalsh",
+        ),
+        pytest.param(
+            lambda a: np.linalg.eigh(a + _swap(a))[0], [(3, 3)], id="eigh_values"
+        ),
+        # the squares of the eigen and singular vectors do not depend on their signs
+        pytest.param(
+            lambda a: np.linalg.eigh(a + _swap(a))[1] ** 2,
+            [(2, 3, 3)],
+            id="eigh_vectors",
+        ),
+        pytest.param(
+            lambda a: np.linalg.svd(a, compute_uv=False), [(2, 3, 4)], id="svdvals"
+        ),
+        pytest.param(
+            lambda a: np.linalg.svd(a, full_matrices=False)[0] ** 2,
+            [(4, 3)],
+            id="svd_u",
+        ),
+        pytest.param(
+            lambda a: np.linalg.svd(a, full_matrices=False)[2] ** 2,
+            [(3, 4)],
+            id="svd_vh",
+        ),
+        pytest.param(
+            lambda a: np.linalg.svd(a)[0][..., :2] ** 2, [(2, 3, 3)], id="svd_full"
+        ),
+        pytest.param(np.linalg.pinv, [(3, 4)], id="pinv"),
+        pytest.param(np.linalg.pinv, [(2, 4, 3)], id="pinv_tall"),
+        # backend primitives
+        pytest.param(
+            lambda x, f: _im2col_conv(x, f, [2, 1], 2, 2),
+            [(2, 5, 4, 4), (2, 3, 2, 6)],
+            id="im2col_conv",
+        ),
+        pytest.param(
+            lambda x: _add_dilations(x, 3, axis=1), [(2, 3)], id="add_dilations"
+        ),
+        pytest.param(
+            lambda x, y: _scatter_reduce(x * 1.0, np.array([0, 2, 0]), y, "sum"),
+            [(4,), (3,)],
+            id="scatter_sum",
+        ),
+        pytest.param(
+            lambda x, y: _scatter_reduce(x * 1.0, np.array([0, 2]), y, "replace"),
+            [(4,), (2,)],
+            id="scatter_replace",
+        ),
+        pytest.param(
+            lambda x, y: _scatter_reduce(x * 1.0, np.array([0, 2, 0]), y, "max"),
+            [(4,), (3,)],
+            id="scatter_max",
+        ),
+        pytest.param(
+            _checkpoint(lambda x, y: np.sin(x) * y), [(2, 3), (3,)], id="checkpoint"
+        ),
+    ]
+    return cases
+
+
 @st.composite
 def get_gradient_arguments_with_lr(
     draw,
@@ -176,6 +465,35 @@ def test_adam_update(
     )
 
 
+# execute_with_accumulated_gradients
+@pytest.mark.parametrize(
+    "x", [[[4.6, 2.1], [5, 2.8], [1.3, 6.2]], [[1.0, 0.5], [-2.0, 3.0], [0.3, 0.2]]]
+)
+@pytest.mark.parametrize("dtype", ["float32", "float64"])
+@pytest.mark.parametrize("mode", ["mean", "sum"])
+@pytest.mark.parametrize("chunk_size", [1, 2, 3])
+def test_execute_with_accumulated_gradients(x, dtype, mode, chunk_size, backend_fw):
+    ivy.set_backend(backend_fw)
+    reduce_fn = ivy.mean if mode == "mean" else ivy.sum
+    x = ivy.array(x, dtype=dtype)
+    v = ivy.Container(
+        w=ivy.array([[0.5, -1.0], [2.0, 0.3]], dtype=dtype),
+        b=ivy.array([0.1, -0.2], dtype=dtype),
+    )
+
+    def func(v_, x_):
+        return reduce_fn(ivy.square(ivy.tanh(ivy.matmul(x_, v_.w) + v_.b)))
+
+    ret, grads = ivy.execute_with_accumulated_gradients(
+        func, v, [x], mode=mode, chunk_size=chunk_size
+    )
+    ret_gt, grads_gt = ivy.execute_with_gradients(lambda v_: func(v_, x), v)
+    assert np.allclose(ivy.to_numpy(ret), ivy.to_numpy(ret_gt))
+    for key in ("w", "b"):
+        assert np.allclose(ivy.to_numpy(grads[key]), ivy.to_numpy(grads_gt[key]))
+    ivy.previous_backend()
+
+
 # execute_with_gradients
 @handle_test(
     fn_tree="functional.ivy.execute_with_gradients",
@@ -194,9 +512,6 @@ def test_adam_update(
 def test_execute_with_gradients(
     *, dtype_and_xs, retain_grads, test_flags, backend_fw, fn_name, on_device
 ):
-    if backend_fw == "numpy":
-        return
-
     def func(xs):
         with BackendHandler.update_backend(
             ivy.current_backend(xs.to_native()).backend
@@ -239,9 +554,7 @@ def test_execute_with_gradients(
 @pytest.mark.parametrize("nth", [1, 2, 3])
 def test_grad(x, dtype, func, backend_fw, nth):
     # ToDo: Remove skipping for paddle and jax for nth > 1
-    if backend_fw == "numpy" or (
-        (backend_fw == "paddle" or backend_fw == "jax") and nth > 1
-    ):
+    if backend_fw in ["numpy", "paddle", "jax"] and nth > 1:
         return
 
     with BackendHandler.update_backend(backend_fw) as ivy_backend:
@@ -308,9 +621,6 @@ def test_gradient_descent_update(
 @pytest.mark.parametrize("dtype", ["float32", "float64"])
 @pytest.mark.parametrize("func_str", ["square", "cos"])
 def test_jac(x, dtype, func_str, backend_fw):
-    if backend_fw == "numpy":
-        pytest.skip()
-
     with BackendHandler.update_backend(backend_fw) as ivy_backend:
         f = ivy_backend.__dict__[func_str]
         func = lambda x: ivy_backend.mean(f(x))
@@ -492,6 +802,25 @@ def test_lars_update(
     )
 
 
+# numpy tape
+@pytest.mark.parametrize(("fn", "shapes"), _numpy_vjp_cases())
+def test_numpy_vjps(fn, shapes, backend_fw):
+    if backend_fw != "numpy":
+        pytest.skip()
+    from ivy.functional.backends.numpy.autograd import _Tape, _watch
+
+    rng = np.random.default_rng(0)
+    xs = [np.asarray(rng.uniform(0.1, 0.9, shape)) for shape in shapes]
+    with _Tape() as tape:
+        watched = [_watch(x) for x in xs]
+        ret = fn(*watched)
+    g = rng.standard_normal(np.shape(ret))
+    grads = tape.gradients([ret], watched, [g])
+    for i, grad in enumerate(grads):
+        assert grad.shape == xs[i].shape
+        assert np.allclose(grad, _finite_difference_vjp(fn, xs, g, i), atol=1e-6)
+
+
 # optimizer_update
 @handle_test(
     fn_tree="functional.ivy.optimizer_update",
@@ -557,8 +886,6 @@ def test_stop_gradient(
     "func", [lambda x: ivy.mean(ivy.square(x)), lambda x: ivy.mean(ivy.cos(x))]
 )
 def test_value_and_grad(x, dtype, func, backend_fw):
-    if backend_fw == "numpy":
-        return
     with BackendHandler.update_backend(backend_fw) as ivy_backend:
         var = ivy_backend.ivy.functional.ivy.gradients._variable(
             ivy_backend.array(x, dtype=dtype)
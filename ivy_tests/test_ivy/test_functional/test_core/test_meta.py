@@ -33,11 +33,6 @@ def test_fomaml_step_overlapping_vars(
     return_inner_v,
     backend_fw,
 ):
-    # Numpy does not support gradients, jax does not support gradients on custom
-    # nested classes
-    if backend_fw == "numpy":
-        pytest.skip()
-
     with BackendHandler.update_backend(backend_fw) as ivy_backend:
         # config
         inner_learning_rate = 1e-2
@@ -397,11 +392,6 @@ def test_fomaml_step_unique_vars(
     return_inner_v,
     backend_fw,
 ):
-    # Numpy does not support gradients, and jax does not support gradients on
-    # custom nested classes
-    if backend_fw == "numpy":
-        return
-
     with BackendHandler.update_backend(backend_fw) as ivy_backend:
         # config
         inner_learning_rate = 1e-2
@@ -562,8 +552,8 @@ def test_maml_step_overlapping_vars(
 ):
     if backend_fw in ["numpy", "tensorflow"]:
         # ToDo: work out why MAML does not work for tensorflow
-        # Numpy does not support gradients, jax does not support gradients on custom
-        # nested classes
+        # Numpy only supports first order gradients, jax does not support gradients
+        # on custom nested classes
         pytest.skip()
 
     with BackendHandler.update_backend(backend_fw) as ivy_backend:
@@ -737,8 +727,8 @@ def test_maml_step_shared_vars(
 ):
     if backend_fw in ["numpy", "tensorflow"]:
         # ToDo: work out why MAML does not work for tensorflow
-        # Numpy does not support gradients, jax does not support gradients on custom
-        # nested classes
+        # Numpy only supports first order gradients, jax does not support gradients
+        # on custom nested classes
         pytest.skip()
 
     with BackendHandler.update_backend(backend_fw) as ivy_backend:
@@ -970,8 +960,8 @@ def test_maml_step_unique_vars(
 ):
     if backend_fw in ["numpy", "tensorflow"]:
         # ToDo: work out why MAML does not work for tensorflow
-        # Numpy does not support gradients, jax does not support gradients on custom
-        # nested classes
+        # Numpy only supports first order gradients, jax does not support gradients
+        # on custom nested classes
         pytest.skip()
 
     with BackendHandler.update_backend(backend_fw) as ivy_backend:
@@ -1132,11 +1122,6 @@ def test_reptile_step(
     return_inner_v,
     backend_fw,
 ):
-    if backend_fw == "numpy":
-        # Numpy does not support gradients, jax does not support gradients on custom
-        # nested classes,
-        pytest.skip()
-
     with BackendHandler.update_backend(backend_fw) as ivy_backend:
         # config
         inner_learning_rate = 1e-2
@@ -323,6 +323,38 @@ def test_nested_map(x, fn, shallow):
         assert x != x_copy
 
 
+@pytest.mark.parametrize(
+    "nest", [{"a": [[0, 1], (2, 3)], "b": {"c": [[0], [1]], "d": ()}}]
+)
+@pytest.mark.parametrize("shallow", [True, False])
+def test_nested_tree_def(nest, shallow):
+    tree_def = ivy.nested_tree_def(nest)
+    assert tree_def.num_leaves == 6
+    assert tree_def.paths[1] == ("a", 0, 1)
+    assert tree_def.flatten(nest) == [0, 1, 2, 3, 0, 1]
+    assert tree_def.unflatten(range(6)) == {
+        "a": [[0, 1], (2, 3)],
+        "b": {"c": [[4], [5]], "d": ()},
+    }
+    # equal structures share the hash of their tree definitions
+    other = copy.deepcopy(nest)
+    assert ivy.nested_tree_def(other) == tree_def
+    assert hash(ivy.nested_tree_def(other)) == hash(tree_def)
+    assert ivy.nested_tree_def([1, 2]) != tree_def
+
+    expected = ivy.nested_map(lambda x: x + 1, copy.deepcopy(nest), shallow=False)
+    result = ivy.nested_map(lambda x: x + 1, other, shallow=shallow, tree_def=tree_def)
+    assert result == expected
+    assert (result is other) == shallow
+    assert ivy.nested_argwhere(
+        nest, lambda x: x == 1, tree_def=tree_def
+    ) == ivy.nested_argwhere(nest, lambda x: x == 1)
+
+    # nests of another structure are rejected
+    with pytest.raises(ivy.utils.exceptions.IvyException):
+        tree_def.flatten({"a": [[0, 1], (2, 3)], "b": {"c": [[0], [1, 2]], "d": ()}})
+
+
 # nested_multi_map
 @pytest.mark.parametrize("func", [lambda x, _: x[0] - x[1]])
 @pytest.mark.parametrize(
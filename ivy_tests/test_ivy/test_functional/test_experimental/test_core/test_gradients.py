@@ -20,8 +20,6 @@ from ivy_tests.test_ivy.helpers.pipeline_helper import BackendHandler
 def test_bind_custom_gradient_function(
     x_, dtype, inter_func_str, custom_grad_fn, backend_fw
 ):
-    if backend_fw == "numpy":
-        return
     with BackendHandler.update_backend(backend_fw) as ivy_backend:
         inter_func_ = lambda x: ivy_backend.__dict__[inter_func_str](x)
         x = ivy_backend.array(x_, dtype=dtype)
@@ -1,4 +1,6 @@
 # global
+import importlib
+import pytest
 from hypothesis import strategies as st
 
 # local
@@ -128,6 +130,17 @@ def _get_dtype_value1_value2_cov(
     return [dtype], value1, value2, rowVar, bias, ddof, fweights, aweights
 
 
+@st.composite
+def _get_tied_castable_dtype(draw):
+    # few distinct values, such that most of the running maxima are tied
+    input_dtype, x, axis, castable_dtype = draw(
+        _get_castable_dtype(min_value=-3, max_value=3)
+    )
+    if np.issubdtype(x[0].dtype, np.floating):
+        x = [np.round(x[0])]
+    return input_dtype, x, axis, castable_dtype
+
+
 @st.composite
 def _histogram_helper(draw):
     dtype_input = draw(st.sampled_from(draw(helpers.get_dtypes("float"))))
@@ -423,7 +436,7 @@ def test_cov(
 
 @handle_test(
     fn_tree="functional.ivy.experimental.cummax",
-    dtype_x_axis_castable=_get_castable_dtype(),
+    dtype_x_axis_castable=st.one_of(_get_castable_dtype(), _get_tied_castable_dtype()),
     exclusive=st.booleans(),
     reverse=st.booleans(),
 )
@@ -681,6 +694,24 @@ def test_nanprod(
     )
 
 
+# numpy cummax
+def test_numpy_cummax_nan(backend_fw):
+    if backend_fw != "numpy":
+        pytest.skip()
+    np_statistical = importlib.import_module(
+        "ivy.functional.backends.numpy.experimental.statistical"
+    )
+    # a nan propagates to the rest of the running maximum, its index being that of
+    # the last nan reached, which the backends don't all agree on
+    x = np.array([1.0, np.nan, 2.0, np.nan, 0.0])
+    values, indices = np_statistical.cummax(x, axis=0)
+    assert np.array_equal(values, [1.0, np.nan, np.nan, np.nan, np.nan], equal_nan=True)
+    assert np.array_equal(indices, [0, 1, 1, 3, 3])
+    values, indices = np_statistical.cummax(np.stack([x, -x]), axis=1, reverse=True)
+    assert np.array_equal(values, [[np.nan] * 4 + [0.0]] * 2, equal_nan=True)
+    assert np.array_equal(indices, [[3, 3, 1, 1, 0]] * 2)
+
+
 # quantile
 @handle_test(
     fn_tree="functional.ivy.experimental.quantile",
@@ -1,5 +1,7 @@
 # global
+import importlib
 import numpy as np
+import pytest
 from hypothesis import strategies as st, assume
 
 # local
@@ -525,7 +527,13 @@ def test_adaptive_max_pool2d(
 
 @handle_test(
     fn_tree="functional.ivy.experimental.avg_pool1d",
-    x_k_s_p=helpers.arrays_for_pooling(min_dims=3, max_dims=3, min_side=1, max_side=4),
+    x_k_s_p=helpers.arrays_for_pooling(
+        min_dims=3,
+        max_dims=3,
+        min_side=1,
+        max_side=4,
+        explicit_or_str_padding=True,
+    ),
     count_include_pad=st.booleans(),
     ceil_mode=st.booleans(),
     ground_truth_backend="jax",
@@ -561,7 +569,13 @@ def test_avg_pool1d(
 # avg_pool2d
 @handle_test(
     fn_tree="functional.ivy.experimental.avg_pool2d",
-    x_k_s_p=helpers.arrays_for_pooling(min_dims=4, max_dims=4, min_side=1, max_side=4),
+    x_k_s_p=helpers.arrays_for_pooling(
+        min_dims=4,
+        max_dims=4,
+        min_side=1,
+        max_side=4,
+        explicit_or_str_padding=True,
+    ),
     count_include_pad=st.booleans(),
     ceil_mode=st.booleans(),
     divisor_override=st.one_of(st.none(), st.integers(min_value=1, max_value=4)),
@@ -609,7 +623,13 @@ def test_avg_pool2d(
 
 @handle_test(
     fn_tree="functional.ivy.experimental.avg_pool3d",
-    x_k_s_p=helpers.arrays_for_pooling(min_dims=5, max_dims=5, min_side=1, max_side=4),
+    x_k_s_p=helpers.arrays_for_pooling(
+        min_dims=5,
+        max_dims=5,
+        min_side=1,
+        max_side=4,
+        explicit_or_str_padding=True,
+    ),
     count_include_pad=st.booleans(),
     ceil_mode=st.booleans(),
     divisor_override=st.one_of(st.none(), st.integers(min_value=1, max_value=4)),
@@ -1059,6 +1079,7 @@ def test_interpolate(
         return_dilation=True,
         data_format=st.sampled_from(["channel_first", "channel_last"]),
         return_data_format=True,
+        strided_dilation=True,
     ),
     ceil_mode=st.sampled_from([True, False]),
     test_gradients=st.just(False),
@@ -1074,6 +1095,8 @@ def test_max_pool1d(
     on_device,
 ):
     dtype, x, kernel, stride, pad, dilation, data_format = x_k_s_p
+    # tensorflow doesn't support strides above 1 along with dilations above 1
+    assume(not (backend_fw == "tensorflow" and stride[0] > 1 and max(dilation) > 1))
     data_format = "NCW" if data_format == "channel_first" else "NWC"
     assume(not (isinstance(pad, str) and (pad.upper() == "VALID") and ceil_mode))
     # TODO: Remove this once the paddle backend supports dilation
@@ -1108,6 +1131,7 @@ def test_max_pool1d(
         return_dilation=True,
         data_format=st.sampled_from(["channel_first", "channel_last"]),
         return_data_format=True,
+        strided_dilation=True,
     ),
     ceil_mode=st.sampled_from([True, False]),
     test_gradients=st.just(False),
@@ -1169,6 +1193,7 @@ def test_max_pool2d(
         return_dilation=True,
         data_format=st.sampled_from(["channel_first", "channel_last"]),
         return_data_format=True,
+        strided_dilation=True,
     ),
     ceil_mode=st.sampled_from([True, False]),
     test_gradients=st.just(False),
@@ -1185,6 +1210,8 @@ def test_max_pool3d(
 ):
     dtype, x, kernel, stride, pad, dilation, data_format = x_k_s_p
 
+    # tensorflow doesn't support strides above 1 along with dilations above 1
+    assume(not (backend_fw == "tensorflow" and stride[0] > 1 and max(dilation) > 1))
     data_format = "NCDHW" if data_format == "channel_first" else "NDHWC"
     assume(not (isinstance(pad, str) and (pad.upper() == "VALID") and ceil_mode))
     # TODO: Remove this once the paddle backend supports dilation
@@ -1208,6 +1235,36 @@ def test_max_pool3d(
     )
 
 
+# numpy pooling
+def test_numpy_pool_windows(backend_fw):
+    if backend_fw != "numpy":
+        pytest.skip()
+    np_layers = importlib.import_module(
+        "ivy.functional.backends.numpy.experimental.layers"
+    )
+    x = np.random.default_rng(0).standard_normal((2, 6, 7, 3))
+    windows = np_layers._pool_windows(
+        x, [2, 3], [2, 1], [(1, 0), (0, 2)], 2, [2, 1], pad_value=-1.0
+    )
+    # B x *O x C x *K, with the dilated kernel offsets of every window
+    assert windows.shape == (2, 3, 7, 3, 2, 3)
+    padded = np.pad(x, [(0, 0), (1, 0), (0, 2), (0, 0)], constant_values=-1.0)
+    for i, j, k, m in np.ndindex(3, 7, 2, 3):
+        assert np.array_equal(
+            windows[:, i, j, :, k, m], padded[:, 2 * i + 2 * k, j + m]
+        )
+    summed = np_layers._reduce_windows(windows, 2, np.add)
+    assert np.allclose(summed, windows.sum(axis=(-2, -1)))
+    # without padding, the windows are a view of x
+    windows = np_layers._pool_windows(x, [2, 2], [1, 2], [(0, 0), (0, 0)], 2)
+    assert np.shares_memory(windows, x)
+    # a dilated kernel larger than the input leaves no windows
+    windows = np_layers._pool_windows(x, [3, 2], [1, 1], [(0, 0), (0, 0)], 2, [3, 2])
+    assert windows.shape == (2, 0, 5, 3, 3, 2)
+    ret = np_layers.max_pool2d(np.ones((1, 4, 4, 1)), 3, 1, "VALID", dilation=2)
+    assert ret.shape == (1, 0, 0, 1)
+
+
 @handle_test(
     fn_tree="functional.ivy.experimental.reduce_window",
     all_args=_reduce_window_helper(_get_reduce_func),
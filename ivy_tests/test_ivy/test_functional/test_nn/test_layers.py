@@ -1,9 +1,11 @@
 """Collection of tests for unified neural network layers."""
 
 # global
+import importlib
 from hypothesis import strategies as st, assume
 import ivy
 import numpy as np
+import pytest
 
 
 # local
@@ -330,7 +332,8 @@ def _x_and_filters(
         x_dim = []
         for i in range(dim):
             min_x = filter_shape[i] + (filter_shape[i] - 1) * (full_dilations[i] - 1)
-            x_dim.append(draw(st.integers(min_x, min_x + 1)))
+            # several output positions for the strides and dilations to apply to
+            x_dim.append(draw(st.integers(min_x, min_x + 4)))
         x_dim = tuple(x_dim)
     if not depthwise:
         if not transpose:
@@ -1269,6 +1272,27 @@ def test_multi_head_attention(
     )
 
 
+# numpy im2col convolution
+@pytest.mark.parametrize("tile_bytes", [1, 256, 2048, 8192])
+@pytest.mark.parametrize("groups", [1, 2])
+def test_numpy_im2col_conv_tiles(tile_bytes, groups, backend_fw, monkeypatch):
+    if backend_fw != "numpy":
+        pytest.skip()
+    np_layers = importlib.import_module("ivy.functional.backends.numpy.layers")
+
+    # small tiles split the column matrix over the batch and the first output
+    # dimension, down to a single output row per tile, which inputs as small as
+    # those of test_conv never reach
+    rng = np.random.default_rng(0)
+    x = rng.standard_normal((3, 9, 6, 4))
+    filters = rng.standard_normal((3, 2, 4 // groups, 6))
+    expected = np_layers._im2col_conv(x, filters, [2, 1], 2, groups)
+    monkeypatch.setattr(np_layers, "_IM2COL_TILE_BYTES", tile_bytes)
+    ret = np_layers._im2col_conv(x, filters, [2, 1], 2, groups)
+    assert ret.shape == expected.shape
+    assert np.allclose(ret, expected)
+
+
 # scaled_dot_product_attention
 @handle_test(
     fn_tree="functional.ivy.scaled_dot_product_attention",
@@ -2,6 +2,7 @@
 from packaging import version
 import pytest
 import importlib
+import gc
 import types
 import numpy as np
 
@@ -48,6 +49,60 @@ available_frameworks_with_none = _available_frameworks()[:]
 backends = list(_backend_dict.keys())
 
 
+@pytest.mark.parametrize("backend", _available_frameworks())
+def test_backend_snapshots(backend):
+    ivy.unset_backend()
+    ivy.set_backend(backend)
+    wrapped_sum = ivy.sum
+    ivy.previous_backend()
+    assert ivy.sum is ivy.utils.backend.handler.ivy_original_dict["sum"]
+    # switching back reuses the snapshot instead of wrapping the functions again
+    ivy.set_backend(backend)
+    assert ivy.sum is wrapped_sum
+    assert ivy.functional.sum is wrapped_sum
+    assert ivy.current_backend_str() == backend
+    x = ivy.array([1.0, 2.0])
+    assert ivy.to_numpy(ivy.sum(x)) == 3.0
+    # entries overridden only by the backend on top are restored when popping it
+    for other in _available_frameworks():
+        ivy.set_backend(other)
+        ivy.previous_backend()
+        assert ivy.sum is wrapped_sum
+        assert ivy.current_backend_str() == backend
+    ivy.previous_backend()
+
+
+@pytest.mark.parametrize("backend", _available_frameworks())
+def test_backend_snapshots_invalidated(backend, monkeypatch):
+    ivy.unset_backend()
+    ivy.set_backend(backend)
+    wrapped_sum = ivy.sum
+    ivy.previous_backend()
+    backend_module = importlib.import_module(_backend_dict[backend])
+
+    # patching a backend function after the snapshot was taken
+    def _patched_sum(x, /, **kwargs):
+        return x * 0.0 + 42.0
+
+    monkeypatch.setattr(backend_module, "sum", _patched_sum)
+    ivy.set_backend(backend)
+    assert ivy.sum is not wrapped_sum
+    assert ivy.to_numpy(ivy.sum(ivy.array([1.0, 2.0]))).tolist() == [42.0, 42.0]
+    ivy.previous_backend()
+
+    # as well as a change of the backend version
+    monkeypatch.undo()
+    ivy.set_backend(backend)
+    patched_wrapped_sum = ivy.sum
+    ivy.previous_backend()
+    monkeypatch.setitem(backend_module.backend_version, "version", "0.0.0")
+    ivy.set_backend(backend)
+    assert ivy.sum is not patched_wrapped_sum
+    assert ivy.to_numpy(ivy.sum(ivy.array([1.0, 2.0]))) == 3.0
+    ivy.previous_backend()
+    monkeypatch.undo()
+
+
 @pytest.mark.parametrize("excluded", available_frameworks_with_none)
 def test_choose_random_backend(excluded):
     backend = ivy.choose_random_backend(excluded=excluded)
@@ -154,6 +209,31 @@ def test_dynamic_backend_context_manager():
     assert d.dynamic_backend is False
 
 
+@pytest.mark.parametrize("backend", _available_frameworks())
+def test_dynamic_backend_registry(backend):
+    ivy.unset_backend()
+    ivy.set_backend("numpy")
+    a = ivy.array([1.0, 2.0])
+    cont = ivy.Container({"w": ivy.array([3.0])})
+    tracked_arrays = ivy.utils.backend.handler._tracked_arrays
+    tracked_containers = ivy.utils.backend.handler._tracked_containers
+    assert tracked_arrays[id(a)] is a
+    assert tracked_containers[id(cont)] is cont
+
+    # dead objects drop out of the registry
+    b = ivy.array([4.0])
+    b_id = id(b)
+    del b
+    gc.collect()
+    assert b_id not in tracked_arrays
+
+    ivy.set_backend(backend, dynamic=True)
+    assert isinstance(a.data, ivy.current_backend().NativeArray)
+    assert isinstance(cont["w"].data, ivy.current_backend().NativeArray)
+    assert ivy.get_all_ivy_arrays_on_dev(ivy.dev(a))[str(id(a))] is a
+    ivy.unset_backend()
+
+
 def test_dynamic_backend_setter():
     a = ivy.array([1, 2, 3])
     type_a = type(a.data)
@@ -172,6 +252,25 @@ def test_dynamic_backend_setter():
     assert isinstance(a.data, torch.Tensor)
 
 
+@pytest.mark.parametrize("backend", _available_frameworks())
+def test_dynamic_backend_transfer(backend):
+    ivy.unset_backend()
+    ivy.set_backend("numpy")
+    a = ivy.array(np.arange(1024, dtype=np.float32))
+    native_a = a.data
+    # cpu buffers are handed over without a copy when the backend stays the same
+    ivy.set_backend("numpy", dynamic=True)
+    assert a.data is native_a
+    stats = ivy.dynamic_backend_transfer_stats()
+    assert stats["shared_bytes"] >= native_a.nbytes
+
+    ivy.set_backend(backend, dynamic=True)
+    stats = ivy.dynamic_backend_transfer_stats()
+    assert stats["shared_bytes"] + stats["copied_bytes"] >= native_a.nbytes
+    assert np.array_equal(ivy.to_numpy(a), np.arange(1024, dtype=np.float32))
+    ivy.unset_backend()
+
+
 @pytest.mark.parametrize("backend", _available_frameworks())
 def test_previous_backend(backend):
     if not ivy.backend_stack:
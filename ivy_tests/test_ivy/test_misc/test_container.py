@@ -1,11 +1,13 @@
 # global
 import os
 import queue
+import time
 import pytest
 import random
 import numpy as np
 import multiprocessing
 import pickle
+import weakref
 
 # local
 import ivy
@@ -929,6 +931,81 @@ def test_container_find_sub_structure(on_device):
     assert found_kc == ""
 
 
+def test_container_fingerprint(on_device):
+    container = Container(
+        {
+            "a": ivy.array([1.0, 2.0], device=on_device),
+            "b": {"c": ivy.array([3], device=on_device)},
+        }
+    )
+    fingerprint = container.cont_fingerprint()
+    assert container.cont_fingerprint() == fingerprint
+
+    # key order and array values are ignored
+    reordered = Container(
+        {
+            "b": {"c": ivy.array([4], device=on_device)},
+            "a": ivy.array([5.0, 6.0], device=on_device),
+        }
+    )
+    assert reordered.cont_fingerprint() == fingerprint
+    assert ivy.Container.cont_identical_structure([container, reordered])
+    assert not ivy.Container.cont_identical([container, reordered])
+
+    # shapes and dtypes are not
+    reshaped = Container(
+        {
+            "a": ivy.array([1.0, 2.0, 3.0], device=on_device),
+            "b": {"c": ivy.array([3], device=on_device)},
+        }
+    )
+    assert reshaped.cont_fingerprint() != fingerprint
+    assert not ivy.Container.cont_identical_structure([container, reshaped])
+    assert ivy.Container.cont_identical_structure(
+        [container, reshaped], check_shapes=False
+    )
+    recast = Container(
+        {
+            "a": ivy.array([1.0, 2.0], device=on_device),
+            "b": {"c": ivy.array([3.0], device=on_device)},
+        }
+    )
+    assert recast.cont_fingerprint() != fingerprint
+
+    # in-place updates of the container and of its arrays are tracked
+    reordered.b.d = ivy.array([7], device=on_device)
+    assert reordered.cont_fingerprint() != fingerprint
+    assert not ivy.Container.cont_identical_structure([container, reordered])
+    del reordered.b["d"]
+    assert reordered.cont_fingerprint() == fingerprint
+    reordered.a.data = ivy.native_array([5.0, 6.0, 7.0], device=on_device)
+    assert reordered.cont_fingerprint() != fingerprint
+    assert reordered.cont_fingerprint() == reshaped.cont_fingerprint()
+    assert ivy.Container.cont_identical_structure([reordered, reshaped])
+    # as are the writes to the native arrays which backends make directly
+    reordered.a._data = ivy.native_array([[5.0, 6.0]], device=on_device)
+    assert reordered.cont_fingerprint() != reshaped.cont_fingerprint()
+    assert not ivy.Container.cont_identical_structure([reordered, reshaped])
+
+    # the fingerprints are cached on each container, and only changes to a container
+    # or to what it holds mark them as stale, up to the containers holding it
+    shared = Container({"c": ivy.array([3], device=on_device)})
+    parents = [
+        Container({"a": ivy.array([1.0, 2.0], device=on_device), "b": shared}),
+        Container({"a": ivy.array([1.0, 2.0], device=on_device), "b": shared}),
+    ]
+    assert all(parent.cont_fingerprint() == fingerprint for parent in parents)
+    Container({"e": ivy.array([0], device=on_device)})
+    assert all(parent._fingerprints for parent in parents)
+    shared.c = ivy.array([3, 4], device=on_device)
+    assert not any(parent._fingerprints for parent in parents)
+    assert all(parent.cont_fingerprint() != fingerprint for parent in parents)
+    assert ivy.Container.cont_identical_structure(parents)
+    assert pickle.loads(pickle.dumps(parents[0])).cont_fingerprint() == (
+        parents[0].cont_fingerprint()
+    )
+
+
 def test_container_flatten_key_chains(on_device):
     container = Container(
         {
@@ -1191,6 +1268,43 @@ def test_container_from_queues(on_device):
     del container
 
 
+def test_container_from_queues_prefetched(on_device):
+    queues = [queue.Queue() for _ in range(3)]
+    queues[0].put({"a": ivy.to_native(ivy.array([1.0, 2.0], device=on_device))})
+    queues[1].put({"a": ivy.to_native(ivy.array([3.0, 4.0], device=on_device))})
+    container = Container(
+        queues=queues,
+        queue_load_sizes=[2, 2, 2],
+        queue_timeout=0.1,
+        queue_prefetch_depth=2,
+        queue_prefetch_device=on_device,
+    )
+
+    # the first two containers are loaded in the background
+    for _ in range(100):
+        if queues[0].empty() and queues[1].empty():
+            break
+        time.sleep(0.01)
+    assert queues[0].empty() and queues[1].empty()
+    assert np.allclose(ivy.to_numpy(container[0].a), np.array([1.0]))
+    assert np.allclose(ivy.to_numpy(container[3].a), np.array([4.0]))
+
+    # the prefetch of the third timed out, so it is waited for again on access
+    queue_was_empty = False
+    try:
+        container[4]
+    except queue.Empty:
+        queue_was_empty = True
+    assert queue_was_empty
+    queues[2].put({"a": ivy.to_native(ivy.array([5.0, 6.0], device=on_device))})
+    assert np.allclose(ivy.to_numpy(container[5].a), np.array([6.0]))
+
+    metrics = container.cont_queue_metrics()
+    assert metrics["num_loaded"] == 3
+    assert metrics["wait_time"] > 0
+    assert metrics["compute_time"] > 0
+
+
 def test_container_from_tuple(on_device):
     tuple_in = (
         ivy.array([1], device=on_device),
@@ -1205,6 +1319,53 @@ def test_container_from_tuple(on_device):
     assert np.allclose(ivy.to_numpy(container.it_1.it_1), np.array([3]))
 
 
+def test_container_fused(on_device):
+    x = Container(
+        {
+            "a": ivy.array([[1.0, 2.0], [3.0, 4.0]], device=on_device),
+            "b": {
+                "c": ivy.array([[5.0, 6.0], [7.0, 8.0]], device=on_device),
+                "d": ivy.array([9.0, 10.0, 11.0], device=on_device),
+            },
+            "e": ivy.array([[12.0, 13.0], [14.0, 15.0]], device=on_device),
+        }
+    )
+    y = x.cont_map(lambda v, _: v + 1)
+
+    # the leaves of each shape and dtype are computed in one call
+    shapes = list()
+
+    def fn(a, b, *, scale):
+        shapes.append(tuple(a.shape))
+        return ivy.multiply(a, b) * scale
+
+    ret = Container._cont_map_fused(fn, (x, y), {"scale": ivy.array(2.0)})
+    assert sorted(shapes) == [(3,), (3, 2, 2)]
+    assert list(ret.cont_to_iterator_keys()) == list(x.cont_to_iterator_keys())
+    for key_chain, value in ret.cont_to_iterator():
+        assert value.shape == x[key_chain].shape
+        assert np.allclose(
+            ivy.to_numpy(value),
+            ivy.to_numpy(x[key_chain]) * ivy.to_numpy(y[key_chain]) * 2,
+        )
+
+    # arrays which would broadcast differently against the stacks aren't fused
+    assert Container._cont_map_fused(fn, (x, ivy.ones((2, 2, 2))), {"scale": 1}) is None
+
+    # the mode is used by the nestable elementwise functions
+    assert not ivy.container_fusion_mode
+    expected = ivy.multiply(x, y)
+    ivy.set_container_fusion_mode(True)
+    try:
+        assert ivy.container_fusion_mode
+        ret = ivy.multiply(x, y)
+    finally:
+        ivy.unset_container_fusion_mode()
+    assert not ivy.container_fusion_mode
+    for key_chain, value in ret.cont_to_iterator():
+        assert np.allclose(ivy.to_numpy(value), ivy.to_numpy(expected[key_chain]))
+
+
 def test_container_has_key(on_device):
     dict_in = {
         "a": ivy.array([1], device=on_device),
@@ -1695,6 +1856,33 @@ def test_container_map(inplace, on_device):
     assert np.allclose(ivy.to_numpy(container_mapped["b"][0]), np.array([3]))
     assert np.allclose(ivy.to_numpy(container_mapped["b"][1]), np.array([4]))
 
+    # the mapped container keeps the config and key order of the original
+    container = Container(
+        {
+            "b": ivy.array([1], device=on_device),
+            "a": {"d": ivy.array([2], device=on_device), "c": None},
+        },
+        alphabetical_keys=False,
+        print_limit=3,
+        types_to_iteratively_nest=[list],
+    )
+    container_mapped = container.cont_map(
+        lambda x, kc: {"x": x} if kc == "a/c" else x, inplace=inplace
+    )
+    assert list(container_mapped.keys()) == ["b", "a"]
+    assert list(container_mapped.a.keys()) == ["d", "c"]
+    assert container_mapped.cont_config == container.cont_config
+    assert container_mapped.a.cont_config == container.cont_config
+    # and has the attributes of a constructed container
+    assert (
+        vars(container_mapped.a).keys()
+        == vars(Container(**container.cont_config)).keys()
+    )
+    if not inplace:
+        # returned dicts are still converted to containers
+        assert isinstance(container_mapped.a.c, Container)
+        assert container_mapped.a.c.cont_config == container.cont_config
+
 
 @pytest.mark.parametrize("inplace", [True, False])
 def test_container_map_sub_conts(inplace, on_device):
@@ -1904,6 +2092,56 @@ def test_container_overwrite_at_key_chains(on_device):
     assert exception_raised
 
 
+def test_container_pack(on_device):
+    container = Container(
+        {
+            "a": ivy.array([[1.0, 2.0], [3.0, 4.0]], device=on_device),
+            "b": {
+                "c": ivy.array([5.0], device=on_device),
+                "d": ivy.array([6, 7], device=on_device),
+            },
+        }
+    )
+    packed = container.cont_pack()
+    buffers = packed.cont_packed_buffers()
+    # one flat buffer per dtype
+    assert len(buffers) == 2
+    assert sorted(ivy.to_numpy(buf).size for buf in buffers.values()) == [2, 5]
+    assert container.cont_packed_buffers() is None
+
+    # elementwise ops run on the buffers and keep the result packed
+    for fn in (
+        lambda x: x * 2 + 1,
+        lambda x: -(x**2),
+        lambda x: ivy.maximum(x, 3),
+        lambda x: 10 - x,
+    ):
+        expected = fn(container)
+        ret = fn(packed)
+        assert ret.cont_packed_buffers() is not None
+        assert ivy.Container.cont_identical_structure([ret, expected])
+        for x, y in zip(
+            ret.cont_to_iterator_values(), expected.cont_to_iterator_values()
+        ):
+            assert x.dtype == y.dtype
+            assert np.allclose(ivy.to_numpy(x), ivy.to_numpy(y))
+    ret = packed + packed
+    assert ret.cont_packed_buffers() is not None
+    assert np.allclose(ivy.to_numpy(ret.a), [[2.0, 4.0], [6.0, 8.0]])
+
+    # replacing a leaf falls back to mapping over the leaves
+    packed.b.c = ivy.array([0.0], device=on_device)
+    assert packed.cont_packed_buffers() is None
+    ret = packed * 2
+    assert ret.cont_packed_buffers() is None
+    assert np.allclose(ivy.to_numpy(ret.b.c), [0.0])
+    assert np.allclose(ivy.to_numpy(ret.a), [[2.0, 4.0], [6.0, 8.0]])
+
+    # only containers of arrays can be packed
+    with pytest.raises(ivy.utils.exceptions.IvyException):
+        Container(a=ivy.array([1.0], device=on_device), b="b").cont_pack()
+
+
 def test_container_pickle(on_device):
     dict_in = {
         "a": ivy.array([np.float32(1.0)], device=on_device),
@@ -2898,6 +3136,42 @@ def test_container_structural_diff(on_device):
     assert container_diff_same_only.cont_to_dict() == container_diff.cont_to_dict()
 
 
+def test_container_tree_def(on_device):
+    container = Container(
+        {
+            "a": ivy.array([1.0], device=on_device),
+            "b": {
+                "c": ivy.array([2.0], device=on_device),
+                "d": ivy.array([3.0], device=on_device),
+            },
+        }
+    )
+    tree_def = container.cont_tree_def()
+    assert tree_def.key_chains == ("a", "b/c", "b/d")
+    assert container.cont_tree_def() is tree_def
+
+    # containers derived from the container share its tree definition
+    mapped = container.cont_map(lambda x, kc: x + 1)
+    assert mapped.cont_tree_def() is tree_def
+    multi_mapped = ivy.Container.cont_multi_map(
+        lambda xs, kc: xs[0] * xs[1], [container, mapped]
+    )
+    assert multi_mapped.cont_tree_def() is tree_def
+    assert np.allclose(ivy.to_numpy(multi_mapped.b.d), [12.0])
+    key_chains = container.cont_map(lambda x, kc: kc)
+    assert key_chains.b.c == "b/c"
+
+    # unflatten builds new containers from the leaves
+    rebuilt = tree_def.unflatten(tree_def.flatten(mapped))
+    assert ivy.Container.cont_identical([rebuilt, mapped])
+
+    # changing the structure drops the cached tree definition
+    container.b.e = ivy.array([4.0], device=on_device)
+    mapped = container.cont_map(lambda x, kc: x + 1)
+    assert np.allclose(ivy.to_numpy(mapped.b.e), [5.0])
+    assert container.cont_tree_def() != tree_def
+
+
 def test_container_to_and_from_disk_as_hdf5(on_device):
     if ivy.current_backend_str() == "tensorflow":
         # container disk saving requires eager execution
@@ -2970,6 +3244,149 @@ def test_container_to_and_from_disk_as_hdf5(on_device):
     os.remove(save_filepath)
 
 
+def test_container_to_and_from_disk_as_hdf5_compressed(on_device):
+    if ivy.current_backend_str() == "tensorflow":
+        # container disk saving requires eager execution
+        pytest.skip()
+    h5py = pytest.importorskip("h5py")
+    save_filepath = "container_on_disk_compressed.hdf5"
+    container = Container(
+        {
+            "a": ivy.array([[1.0, 2.0], [3.0, 4.0], [5.0, 6.0]], device=on_device),
+            "b": {
+                "c": ivy.array([7, 8, 9], device=on_device),
+                "d": ivy.array([[10.0], [11.0], [12.0]], device=on_device),
+            },
+            "e": {},
+        }
+    )
+    container.cont_to_disk_as_hdf5(
+        save_filepath, compression="gzip", compression_opts=4, num_workers=2
+    )
+    with h5py.File(save_filepath, "r") as h5_obj:
+        assert h5_obj["a"].compression == "gzip"
+        assert h5_obj["b/c"].compression == "gzip"
+        assert isinstance(h5_obj["e"], h5py.Group)
+
+    loaded_container = Container.cont_from_disk_as_hdf5(save_filepath)
+    assert np.array_equal(ivy.to_numpy(loaded_container.a), ivy.to_numpy(container.a))
+    assert np.array_equal(
+        ivy.to_numpy(loaded_container.b.c), ivy.to_numpy(container.b.c)
+    )
+    assert np.array_equal(
+        ivy.to_numpy(loaded_container.b.d), ivy.to_numpy(container.b.d)
+    )
+    assert isinstance(loaded_container.e, Container)
+    assert len(loaded_container.e) == 0
+
+    os.remove(save_filepath)
+
+
+def test_container_to_disk_as_hdf5_bounded_conversions(on_device, monkeypatch):
+    if ivy.current_backend_str() == "tensorflow":
+        # container disk saving requires eager execution
+        pytest.skip()
+    pytest.importorskip("h5py")
+    save_filepath = "container_on_disk_bounded.hdf5"
+    container = Container(
+        {str(i): ivy.full((4, 8), float(i), device=on_device) for i in range(24)}
+    )
+
+    # the converted leaves which are still referenced when the next one is converted
+    converted = []
+    max_alive = [0]
+    to_numpy = ivy.to_numpy
+
+    def _to_numpy(x):
+        max_alive[0] = max(max_alive[0], sum(ref() is not None for ref in converted))
+        ret = to_numpy(x)
+        converted.append(weakref.ref(ret))
+        return ret
+
+    monkeypatch.setattr(ivy, "to_numpy", _to_numpy)
+    container.cont_to_disk_as_hdf5(save_filepath, num_workers=2)
+    monkeypatch.undo()
+    assert len(converted) == 24
+    assert max_alive[0] <= 4
+
+    loaded_container = Container.cont_from_disk_as_hdf5(save_filepath)
+    for key, value in container.items():
+        assert np.array_equal(ivy.to_numpy(loaded_container[key]), ivy.to_numpy(value))
+
+    os.remove(save_filepath)
+
+
+def test_container_to_and_from_disk_as_hdf5_lazy(on_device):
+    if ivy.current_backend_str() == "tensorflow":
+        # container disk saving requires eager execution
+        pytest.skip()
+    save_filepath = "container_on_disk_lazy.hdf5"
+    container = Container(
+        {
+            "a": ivy.array([1.0, 2.0, 3.0, 4.0], device=on_device),
+            "b": {
+                "c": ivy.array([[5.0], [6.0], [7.0], [8.0]], device=on_device),
+                "d": ivy.array([9, 10, 11, 12], device=on_device),
+            },
+        }
+    )
+    container.cont_to_disk_as_hdf5(save_filepath)
+
+    loaded_container = Container.cont_from_disk_as_hdf5(
+        save_filepath, lazy=True, max_materialized=1
+    )
+    # nothing is read until accessed
+    store = dict.__getitem__(loaded_container, "a")._store
+    assert len(store.cache) == 0
+
+    # slicing reads only the slices
+    sliced = loaded_container[1:3]
+    assert len(store.cache) == 0
+    assert np.array_equal(ivy.to_numpy(sliced.a), np.array([2.0, 3.0]))
+    assert np.array_equal(ivy.to_numpy(sliced.b.c), np.array([[6.0], [7.0]]))
+    assert np.array_equal(ivy.to_numpy(sliced.b.d), np.array([10, 11]))
+
+    # accessing a leaf materializes it, keeping at most max_materialized leaves
+    assert np.array_equal(ivy.to_numpy(loaded_container.a), ivy.to_numpy(container.a))
+    assert len(store.cache) == 1
+    assert np.array_equal(
+        ivy.to_numpy(loaded_container.b.c), ivy.to_numpy(container.b.c)
+    )
+    assert len(store.cache) == 1
+
+    # mapped functions see the materialized leaves
+    ret = loaded_container + 1
+    assert np.array_equal(ivy.to_numpy(ret.b.d), ivy.to_numpy(container.b.d) + 1)
+    assert ret.b.d.dtype == container.b.d.dtype
+    assert len(store.cache) == 1
+
+    # as do the dict views, conversions and copies
+    assert all(isinstance(v, ivy.Array) for v in loaded_container.b.values())
+    assert all(isinstance(v, ivy.Array) for _, v in loaded_container.b.items())
+    assert isinstance(loaded_container.get("a"), ivy.Array)
+    as_dict = loaded_container.cont_to_dict()
+    assert isinstance(as_dict["a"], ivy.Array)
+    assert isinstance(as_dict["b"]["c"], ivy.Array)
+    copied = loaded_container.cont_copy()
+    assert isinstance(dict.__getitem__(copied, "a"), ivy.Array)
+    assert isinstance(dict.__getitem__(copied.b, "d"), ivy.Array)
+    mapped = ivy.nested_map(lambda x: x + 1, loaded_container, shallow=False)
+    assert np.array_equal(ivy.to_numpy(mapped.b.d), ivy.to_numpy(container.b.d) + 1)
+    mapped = ivy.nested_map(lambda x: x + 1, as_dict, shallow=False)
+    assert np.array_equal(ivy.to_numpy(mapped["a"]), ivy.to_numpy(container.a) + 1)
+    unpickled = pickle.loads(pickle.dumps(loaded_container))
+    assert np.array_equal(ivy.to_numpy(unpickled.b.c), ivy.to_numpy(container.b.c))
+
+    # the file is not kept open between reads, so it can be written to again
+    container.cont_to_disk_as_hdf5(save_filepath, mode="w")
+    assert np.array_equal(
+        ivy.to_numpy(loaded_container.b.d), ivy.to_numpy(container.b.d)
+    )
+
+    del loaded_container, sliced, store, copied, unpickled
+    os.remove(save_filepath)
+
+
 def test_container_to_and_from_disk_as_json(on_device):
     save_filepath = "container_on_disk.json"
     dict_in = {
@@ -3024,6 +3441,62 @@ def test_container_to_and_from_disk_as_pickled(on_device):
     os.remove(save_filepath)
 
 
+def test_container_to_and_from_disk_as_safetensors(on_device):
+    save_filepath = "container_on_disk.safetensors"
+    container = Container(
+        {
+            "a": ivy.array([[1.0, 2.0], [3.0, 4.0]], device=on_device),
+            "b": {
+                "c": ivy.array([5, 6, 7], device=on_device),
+                "d": ivy.array(True, device=on_device),
+            },
+        }
+    )
+
+    # saving
+    container.cont_to_disk_as_safetensors(save_filepath)
+    assert os.path.exists(save_filepath)
+
+    # loading
+    loaded_container = Container.cont_from_disk_as_safetensors(save_filepath)
+    for key_chain, value in container.cont_to_iterator():
+        loaded_value = loaded_container[key_chain]
+        assert loaded_value.dtype == value.dtype
+        assert np.array_equal(ivy.to_numpy(loaded_value), ivy.to_numpy(value))
+
+    # loading by prefix
+    loaded_container = Container.cont_from_disk_as_safetensors(
+        save_filepath, prefix="b/c"
+    )
+    assert list(loaded_container.cont_to_iterator_keys()) == ["b/c"]
+    assert np.array_equal(
+        ivy.to_numpy(loaded_container.b.c), ivy.to_numpy(container.b.c)
+    )
+
+    # saving and loading in shards
+    shards_filepath = "container_on_disk_sharded.safetensors"
+    container.cont_to_disk_as_safetensors(shards_filepath, max_shard_size=1)
+    assert not os.path.exists(shards_filepath)
+    shard_filepaths = [
+        "container_on_disk_sharded-0000{}-of-00003.safetensors".format(i)
+        for i in range(1, 4)
+    ]
+    assert all(os.path.exists(shard_filepath) for shard_filepath in shard_filepaths)
+    loaded_container = Container.cont_from_disk_as_safetensors(
+        shards_filepath, lazy=True, num_workers=2
+    )
+    for key_chain, value in container.cont_to_iterator():
+        assert np.array_equal(
+            ivy.to_numpy(loaded_container[key_chain]), ivy.to_numpy(value)
+        )
+
+    del loaded_container
+    os.remove(save_filepath)
+    os.remove(shards_filepath + ".index.json")
+    for shard_filepath in shard_filepaths:
+        os.remove(shard_filepath)
+
+
 def test_container_to_dict(on_device):
     container0 = Container(
         {
@@ -3080,6 +3553,36 @@ def test_container_to_disk_shuffle_and_from_disk_as_hdf5(on_device):
     os.remove(save_filepath)
 
 
+def test_container_to_disk_shuffle_out_of_core_and_from_disk_as_hdf5(on_device):
+    if ivy.current_backend_str() == "tensorflow":
+        # container disk saving requires eager execution
+        pytest.skip()
+    save_filepath = "container_on_disk_out_of_core.hdf5"
+    a = np.arange(300, dtype=np.float32).reshape((100, 3))
+    b = np.arange(100, dtype=np.int64)
+    container = Container(
+        {
+            "a": ivy.array(a, device=on_device),
+            "b": {"c": ivy.array(b, device=on_device)},
+        }
+    )
+    container.cont_to_disk_as_hdf5(save_filepath)
+
+    # shuffling, with a budget of a few rows at a time
+    Container.shuffle_h5_file(save_filepath, seed_value=1, max_memory=64)
+    container_shuffled = Container.cont_from_disk_as_hdf5(save_filepath)
+
+    # testing
+    permutation = list(range(100))
+    random.seed(1)
+    random.shuffle(permutation)
+
+    assert np.array_equal(ivy.to_numpy(container_shuffled.a), a[permutation])
+    assert np.array_equal(ivy.to_numpy(container_shuffled.b.c), b[permutation])
+
+    os.remove(save_filepath)
+
+
 def test_container_to_flat_list(on_device):
     dict_in = {
         "a": ivy.array([1], device=on_device),
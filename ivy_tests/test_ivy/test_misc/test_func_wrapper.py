@@ -55,6 +55,50 @@ def _jl(x, *args, fn_original, **kwargs):
 # ------------ #
 
 
+def test_fast_path_dispatch(backend_fw):
+    ivy.set_backend(backend_fw)
+    assert getattr(ivy.add, "fast_path_dispatch", False)
+    assert hasattr(ivy.add, "handle_nestable")
+    x = ivy.array([1.0, 2.0])
+    y = ivy.array([3.0, 4.0])
+    # plain arrays take the fast path
+    ret = ivy.add(x, y)
+    assert isinstance(ret, ivy.Array)
+    assert np.allclose(ivy.to_numpy(ret), [4.0, 6.0])
+    assert np.allclose(ivy.to_numpy(ivy.add(x.data, y, alpha=2)), [7.0, 10.0])
+    # containers and out arguments fall back to the full wrapper chain
+    ret = ivy.add(ivy.Container(a=x), y)
+    assert isinstance(ret, ivy.Container)
+    assert np.allclose(ivy.to_numpy(ret.a), [4.0, 6.0])
+    out = ivy.zeros(2)
+    ivy.add(x, y, out=out)
+    assert np.allclose(ivy.to_numpy(out), [4.0, 6.0])
+    # exceptions are still raised as ivy exceptions
+    with pytest.raises(ivy.utils.exceptions.IvyException):
+        ivy.add(x, ivy.array([1.0, 2.0, 3.0]))
+    ivy.previous_backend()
+
+
+def test_fast_path_dispatch_cache(backend_fw):
+    ivy.set_backend(backend_fw)
+    x = ivy.array([1.0, 2.0])
+    y = ivy.array([3.0, 4.0])
+    ivy.concat.dispatch_cache.clear()
+    for _ in range(3):
+        ret = ivy.concat([x, y.data], axis=0)
+        assert isinstance(ret, ivy.Array)
+        assert np.allclose(ivy.to_numpy(ret), [1.0, 2.0, 3.0, 4.0])
+    # repeated calls with the same argument layout share a single cache entry
+    assert len(ivy.concat.dispatch_cache) == 1
+    ivy.concat((x, y, x), axis=0)
+    assert len(ivy.concat.dispatch_cache) == 2
+    # layouts containing containers are never cached
+    ret = ivy.concat([ivy.Container(a=x), y], axis=0)
+    assert isinstance(ret, ivy.Container)
+    assert len(ivy.concat.dispatch_cache) == 2
+    ivy.previous_backend()
+
+
 @pytest.mark.parametrize(
     ("fn", "x", "expected_type"),
     [
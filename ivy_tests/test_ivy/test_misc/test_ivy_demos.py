@@ -1,8 +1,5 @@
 """Collection of tests for the demos."""
 
-# global
-import pytest
-
 # local
 import ivy
 import ivy.functional.backends.numpy
@@ -33,10 +30,6 @@ def test_array(on_device):
 
 # training
 def test_training_demo(on_device, backend_fw):
-    if backend_fw == "numpy":
-        # numpy does not support gradients
-        pytest.skip()
-
     ivy.set_backend(backend_fw)
 
     class MyModel(ivy.Module):
@@ -1112,6 +1112,32 @@ def test_embedding_layer(
     )
 
 
+def test_embedding_layer_sparse_gradients(backend_fw):
+    ivy.set_backend(backend_fw)
+    layer = ivy.Embedding(10, 3, sparse_grad=True)
+    grads = Container(w=ivy.ones((10, 3)))
+
+    # forward passes in evaluation mode are not recorded
+    layer.train(False)
+    for _ in range(5):
+        layer(ivy.array([[1, 2], [3, 4]]))
+    assert layer.sparse_gradients(grads).w.values.shape == (0,)
+    layer.train(True)
+
+    # the unique rows of all the training forward passes since the last call
+    for indices in ([[1, 2], [2, 7]], [[7, 7], [2, 9]], [[1, 1], [1, 1]]):
+        layer(ivy.array(indices))
+    assert layer._looked_up_rows.shape == (4,)
+    dense = ivy.to_numpy(layer.sparse_gradients(grads).w.to_dense_array())
+    assert np.array_equal(np.nonzero(dense.sum(-1))[0], [1, 2, 7, 9])
+
+    # and are cleared by it
+    layer(ivy.array([0]))
+    dense = ivy.to_numpy(layer.sparse_gradients(grads).w.to_dense_array())
+    assert np.array_equal(np.nonzero(dense.sum(-1))[0], [0])
+    ivy.previous_backend()
+
+
 # FFT
 @handle_method(
     method_tree="FFT.__call__",
@@ -182,10 +182,6 @@ def test_module_check_submod_rets(
     batch_shape, input_channels, output_channels, on_device
 ):
     # smoke test
-    if ivy.current_backend_str() == "numpy":
-        # NumPy does not support gradients
-        return
-
     x = ivy.astype(
         ivy.linspace(ivy.zeros(batch_shape), ivy.ones(batch_shape), input_channels),
         "float32",
@@ -274,10 +270,6 @@ def test_module_check_submod_rets(
 )
 def test_module_depth(batch_shape, input_channels, output_channels, on_device):
     # smoke test
-    if ivy.current_backend_str() == "numpy":
-        # NumPy does not support gradients
-        return
-
     module = WithNestedModules(input_channels, output_channels, device=on_device)
 
     # depth 0
@@ -304,10 +296,6 @@ def test_module_depth(batch_shape, input_channels, output_channels, on_device):
 )
 def test_module_height(batch_shape, input_channels, output_channels, on_device):
     # smoke test
-    if ivy.current_backend_str() == "numpy":
-        # NumPy does not support gradients
-        return
-
     module = WithNestedModules(input_channels, output_channels, device=on_device)
 
     # height 2
@@ -337,9 +325,6 @@ def test_module_save_and_load_as_pickled(
     save_filepath = "module.pickled"
 
     # smoke test
-    if ivy.current_backend_str() == "numpy":
-        # NumPy does not support gradients
-        return
     x = ivy.astype(
         ivy.linspace(ivy.zeros(batch_shape), ivy.ones(batch_shape), input_channels),
         "float32",
@@ -373,6 +358,46 @@ def test_module_save_and_load_as_pickled(
     os.remove(save_filepath)
 
 
+@given(
+    input_channels=st.integers(min_value=2, max_value=5),
+    output_channels=st.integers(min_value=2, max_value=5),
+    lazy=st.booleans(),
+)
+def test_module_save_and_load_checkpoint(
+    input_channels, output_channels, lazy, on_device
+):
+    save_filepath = "module.safetensors"
+    x = ivy.astype(
+        ivy.linspace(ivy.zeros((1, 2)), ivy.ones((1, 2)), input_channels), "float32"
+    )
+    module = TrainableModule(input_channels, output_channels, device=on_device)
+    module.register_buffer("step", ivy.array([3], device=on_device))
+
+    module.save_checkpoint(save_filepath, max_shard_size=64)
+    loaded_module = TrainableModule(input_channels, output_channels, device=on_device)
+    loaded_module.load_checkpoint(save_filepath, lazy=lazy)
+
+    # value test
+    assert np.allclose(ivy.to_numpy(loaded_module(x)), ivy.to_numpy(module(x)))
+    assert np.array_equal(ivy.to_numpy(loaded_module.step), np.array([3]))
+
+    # partial loading
+    partially_loaded_module = TrainableModule(
+        input_channels, output_channels, device=on_device
+    )
+    partially_loaded_module.load_checkpoint(save_filepath, prefix="v/linear0")
+    assert np.array_equal(
+        ivy.to_numpy(partially_loaded_module.v.linear0.w),
+        ivy.to_numpy(module.v.linear0.w),
+    )
+    assert not hasattr(partially_loaded_module, "step")
+
+    del loaded_module, partially_loaded_module
+    for filepath in os.listdir("."):
+        if filepath.startswith("module") and "safetensors" in filepath:
+            os.remove(filepath)
+
+
 @given(dummy=st.booleans())
 def test_module_to_device(dummy, on_device):
     model = TrainableModule(5, 5)
@@ -415,10 +440,6 @@ def test_module_track_submod_call_order(
     batch_shape, input_channels, output_channels, on_device
 ):
     # smoke test
-    if ivy.current_backend_str() == "numpy":
-        # NumPy does not support gradients
-        return
-
     x = ivy.astype(
         ivy.linspace(ivy.zeros(batch_shape), ivy.ones(batch_shape), input_channels),
         "float32",
@@ -580,10 +601,6 @@ def test_module_track_submod_rets(
     batch_shape, input_channels, output_channels, on_device
 ):
     # smoke test
-    if ivy.current_backend_str() == "numpy":
-        # NumPy does not support gradients
-        return
-
     x = ivy.astype(
         ivy.linspace(ivy.zeros(batch_shape), ivy.ones(batch_shape), input_channels),
         "float32",
@@ -645,9 +662,6 @@ def test_module_track_submod_rets(
 )
 def test_module_training(batch_shape, input_channels, output_channels, on_device):
     # smoke test
-    if ivy.current_backend_str() == "numpy":
-        # NumPy does not support gradients
-        return
     x = ivy.astype(
         ivy.linspace(ivy.zeros(batch_shape), ivy.ones(batch_shape), input_channels),
         "float32",
@@ -686,6 +700,55 @@ def test_module_training(batch_shape, input_channels, output_channels, on_device
         return
 
 
+# module training with checkpointed activations
+@given(
+    batch_shape=helpers.get_shape(
+        min_num_dims=2, max_num_dims=2, min_dim_size=1, max_dim_size=2
+    ),
+    input_channels=st.integers(min_value=2, max_value=5),
+    output_channels=st.integers(min_value=2, max_value=5),
+)
+def test_module_training_with_checkpointing(
+    batch_shape, input_channels, output_channels, on_device
+):
+    x = ivy.astype(
+        ivy.linspace(ivy.zeros(batch_shape), ivy.ones(batch_shape), input_channels),
+        "float32",
+    )
+    module = ivy.Sequential(
+        ivy.Linear(input_channels, 16, device=on_device),
+        ivy.Sequential(
+            ivy.Linear(16, 16, device=on_device),
+            ivy.GELU(),
+            checkpoint_activations=True,
+        ),
+        ivy.Linear(16, output_channels, device=on_device),
+        device=on_device,
+    )
+
+    def loss_fn(v_):
+        out = module(x, v=v_)
+        return ivy.mean(out**2)
+
+    loss_ckpt, grads_ckpt = ivy.execute_with_gradients(loss_fn, module.v)
+    module.checkpoint_activations = True
+    loss_ckpt_all, grads_ckpt_all = ivy.execute_with_gradients(loss_fn, module.v)
+    module.checkpoint_activations = False
+    module._submodules[1].checkpoint_activations = False
+    loss, grads = ivy.execute_with_gradients(loss_fn, module.v)
+
+    # value test
+    assert np.allclose(ivy.to_numpy(loss_ckpt), ivy.to_numpy(loss))
+    assert np.allclose(ivy.to_numpy(loss_ckpt_all), ivy.to_numpy(loss))
+    assert ivy.max(ivy.abs(grads.submodules.v1.submodules.v0.w)) > 0
+    for grads_ in (grads_ckpt, grads_ckpt_all):
+        assert grads_.cont_identical_structure([grads, grads_], check_types=False)
+        for g_ckpt, g in zip(
+            grads_.cont_to_iterator_values(), grads.cont_to_iterator_values()
+        ):
+            assert np.allclose(ivy.to_numpy(g_ckpt), ivy.to_numpy(g), atol=1e-6)
+
+
 # module training with duplicate
 @given(
     batch_shape=helpers.get_shape(
@@ -696,9 +759,6 @@ def test_module_training(batch_shape, input_channels, output_channels, on_device
 )
 def test_module_training_with_duplicate(batch_shape, channels, same_layer, on_device):
     # smoke test
-    if ivy.current_backend_str() == "numpy":
-        # NumPy does not support gradients
-        return
     x = ivy.astype(
         ivy.linspace(ivy.zeros(batch_shape), ivy.ones(batch_shape), channels), "float32"
     )
@@ -746,9 +806,6 @@ def test_module_w_dict_training(
     batch_shape, input_channels, output_channels, on_device
 ):
     # smoke test
-    if ivy.current_backend_str() == "numpy":
-        # NumPy does not support gradients
-        return
     x = ivy.astype(
         ivy.linspace(ivy.zeros(batch_shape), ivy.ones(batch_shape), input_channels),
         "float32",
@@ -799,9 +856,6 @@ def test_module_w_list_training(
     batch_shape, input_channels, output_channels, on_device
 ):
     # smoke test
-    if ivy.current_backend_str() == "numpy":
-        # NumPy does not support gradients
-        return
     x = ivy.astype(
         ivy.linspace(ivy.zeros(batch_shape), ivy.ones(batch_shape), input_channels),
         "float32",
@@ -852,10 +906,6 @@ def test_module_w_none_attribute(
     batch_shape, input_channels, output_channels, on_device
 ):
     # smoke test
-    if ivy.current_backend_str() == "numpy":
-        # NumPy does not support gradients
-        return
-
     x = ivy.astype(
         ivy.linspace(ivy.zeros(batch_shape), ivy.ones(batch_shape), input_channels),
         "float32",
@@ -943,10 +993,6 @@ def test_module_w_partial_v(batch_shape, input_channels, output_channels, on_dev
 )
 def test_sub_modules(batch_shape, input_channels, output_channels, on_device):
     # smoke test
-    if ivy.current_backend_str() == "numpy":
-        # NumPy does not support gradients
-        return
-
     module = WithNestedModules(input_channels, output_channels, device=on_device)
 
     # depth 0
@@ -979,10 +1025,6 @@ def test_sub_modules(batch_shape, input_channels, output_channels, on_device):
 )
 def test_top_module(batch_shape, input_channels, output_channels, on_device):
     # smoke test
-    if ivy.current_backend_str() == "numpy":
-        # NumPy does not support gradients
-        return
-
     module = WithNestedModules(input_channels, output_channels, device=on_device)
 
     # full depth
@@ -1011,9 +1053,6 @@ def test_top_module(batch_shape, input_channels, output_channels, on_device):
 )
 def test_top_variables(batch_shape, input_channels, output_channels, on_device):
     # smoke test
-    if ivy.current_backend_str() == "numpy":
-        # NumPy does not support gradients
-        return
     module = WithNestedModules(input_channels, output_channels, device=on_device)
     for key_chain in [
         "dl0",
@@ -1063,10 +1102,6 @@ def test_v_with_top_v_key_chains(
     batch_shape, input_channels, output_channels, on_device
 ):
     # smoke test
-    if ivy.current_backend_str() == "numpy":
-        # NumPy does not support gradients
-        return
-
     module = WithNestedModules(input_channels, output_channels, device=on_device)
 
     # full depth
@@ -1129,9 +1164,6 @@ def test_with_custom_var_structure(
     batch_shape, input_channels, output_channels, on_device
 ):
     # smoke test
-    if ivy.current_backend_str() == "numpy":
-        # NumPy does not support gradients
-        return
     module = WithCustomVarStructure(input_channels, output_channels, device=on_device)
     assert "x" in module.v
     assert "y" in module.v
@@ -2,8 +2,11 @@
 
 # global
 from hypothesis import strategies as st
+import numpy as np
+import pytest
 
 # local
+import ivy
 import ivy_tests.test_ivy.helpers as helpers
 from ivy_tests.test_ivy.helpers import handle_method
 from ivy_tests.test_ivy.test_functional.test_core.test_gradients import (
@@ -147,6 +150,119 @@ def test_lamb_optimizer(
     )
 
 
+# compressed moments
+@pytest.mark.parametrize("optimizer", ["Adam", "LAMB"])
+@pytest.mark.parametrize(
+    ("quantize_moments", "factor_second_moments"),
+    [(True, False), (False, True), (True, True)],
+)
+def test_optimizer_compressed_moments(
+    optimizer, quantize_moments, factor_second_moments, backend_fw
+):
+    # ToDo: remove once lamb_update keeps the trust ratio in the weights' dtype
+    if backend_fw == "jax" and optimizer == "LAMB":
+        return
+    ivy.set_backend(backend_fw)
+    v = ivy.Container(
+        w=ivy.reshape(ivy.linspace(-1.0, 1.0, 300), (20, 15)),
+        b=ivy.linspace(0.5, 1.0, 15),
+    )
+    grads = [
+        ivy.Container(w=ivy.sin(v.w * (i + 1)), b=ivy.cos(v.b * (i + 1)))
+        for i in range(4)
+    ]
+    kwargs = dict(
+        quantize_moments=quantize_moments,
+        factor_second_moments=factor_second_moments,
+        quantization_block_size=64,
+    )
+    optimizer_gt = getattr(ivy, optimizer)(lr=1e-3)
+    optimizer_compressed = getattr(ivy, optimizer)(lr=1e-3, **kwargs)
+    v_gt, v_compressed = v, v
+    for dcdw in grads:
+        v_gt = optimizer_gt.step(v_gt, dcdw)
+        v_compressed = optimizer_compressed.step(v_compressed, dcdw)
+
+    # value test, factored second moments only approximate the updates
+    for key in ("w", "b"):
+        delta_gt = np.ravel(ivy.to_numpy(v_gt[key]) - ivy.to_numpy(v[key]))
+        delta = np.ravel(ivy.to_numpy(v_compressed[key]) - ivy.to_numpy(v[key]))
+        cosine = (
+            np.dot(delta, delta_gt) / np.linalg.norm(delta) / np.linalg.norm(delta_gt)
+        )
+        assert cosine > 0.95
+        if not factor_second_moments:
+            assert np.allclose(delta, delta_gt, atol=1e-4)
+
+    # state test
+    state = optimizer_compressed.state
+    if quantize_moments:
+        assert state.mw.w.codes.dtype == "int8"
+        assert state.mw.b.codes.dtype == "int8"
+        assert state.vw.b.codes.dtype == "uint8"
+    if factor_second_moments:
+        assert state.vw.w.row.shape == (20,)
+        assert state.vw.w.col.shape == (15,)
+    assert ivy.to_numpy(state.count).item() == 4
+    optimizer_restored = getattr(ivy, optimizer)(lr=1e-3, **kwargs)
+    optimizer_restored.set_state(state)
+    assert optimizer_restored.state.cont_identical([optimizer_restored.state, state])
+    # the restored optimizer resumes from the same step and compressed moments
+    v_restored = optimizer_restored.step(v_compressed, grads[0])
+    v_compressed = optimizer_compressed.step(v_compressed, grads[0])
+    for key in ("w", "b"):
+        assert np.array_equal(
+            ivy.to_numpy(v_restored[key]), ivy.to_numpy(v_compressed[key])
+        )
+    ivy.previous_backend()
+
+
+# row-sparse gradients
+@pytest.mark.parametrize("optimizer", ["SGD", "Adam"])
+def test_optimizer_row_sparse_gradients(optimizer, backend_fw):
+    ivy.set_backend(backend_fw)
+    v = ivy.Container(
+        w=ivy.reshape(ivy.linspace(-1.0, 1.0, 40), (10, 4)),
+        b=ivy.linspace(0.5, 1.0, 4),
+    )
+    rows = ivy.array([1, 4, 7])
+    mask = ivy.expand_dims(ivy.astype(ivy.arange(10) % 3 == 1, "float32"), axis=-1)
+    grads = [
+        ivy.Container(w=ivy.sin(v.w * (i + 1)) * mask, b=ivy.cos(v.b)) for i in range(3)
+    ]
+    optimizer_dense = getattr(ivy, optimizer)(lr=1e-2)
+    optimizer_sparse = getattr(ivy, optimizer)(lr=1e-2)
+    v_dense, v_sparse = v, v
+    for dcdw in grads:
+        v_dense = optimizer_dense.step(v_dense, dcdw)
+        v_sparse = optimizer_sparse.step(
+            v_sparse,
+            dcdw.cont_set_at_key_chain("w", ivy.to_row_sparse(dcdw.w, rows=rows)),
+        )
+
+    # value test, rows which are updated on every step match the dense update
+    for key in ("w", "b"):
+        assert np.allclose(
+            ivy.to_numpy(v_sparse[key]), ivy.to_numpy(v_dense[key]), atol=1e-6
+        )
+
+    # untouched rows are left unchanged
+    assert np.array_equal(ivy.to_numpy(v_sparse.w)[0], ivy.to_numpy(v.w)[0])
+
+    # state test
+    if optimizer == "Adam":
+        state = optimizer_sparse.state
+        assert np.array_equal(
+            ivy.to_numpy(state.sparse.w.steps), [0, 3, 0, 0, 3, 0, 0, 3, 0, 0]
+        )
+        optimizer_restored = ivy.Adam(lr=1e-2)
+        optimizer_restored.set_state(state)
+        assert optimizer_restored.state.cont_identical(
+            [optimizer_restored.state, state]
+        )
+    ivy.previous_backend()
+
+
 # lars
 @handle_method(
     method_tree="LARS._step",
@@ -0,0 +1,57 @@
+"""
+Micro-benchmark for the latency of switching between backends.
+
+Compares a full rebuild of the wrapped ivy namespace (the behaviour before backend
+snapshots were introduced, emulated by clearing the snapshot cache before every
+switch) against swapping in the snapshot cached for the backend.
+
+Usage: python scripts/backend_switch_benchmark/benchmark.py numpy jax --runs 20
+"""
+
+import argparse
+import time
+
+import ivy
+from ivy.utils.backend import handler
+
+
+def _time_switches(backends, runs, cached):
+    timings = []
+    for _ in range(runs):
+        for backend in backends:
+            if not cached:
+                handler._backend_snapshots.clear()
+            start = time.perf_counter()
+            ivy.set_backend(backend)
+            ivy.previous_backend()
+            timings.append(time.perf_counter() - start)
+    return timings
+
+
+def _report(label, timings):
+    timings = sorted(timings)
+    median = timings[len(timings) // 2] * 1e3
+    print(f"{label:>10}: median {median:9.3f} ms, min {timings[0] * 1e3:9.3f} ms")
+    return median
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("backends", nargs="+", default=["numpy"])
+    parser.add_argument("--runs", type=int, default=10)
+    args = parser.parse_args()
+
+    ivy.unset_backend()
+    # warm up the imports so that neither mode pays for them
+    for backend in args.backends:
+        ivy.set_backend(backend)
+        ivy.previous_backend()
+
+    print(f"set_backend + previous_backend for {args.backends}, {args.runs} runs")
+    rebuild = _report("rebuild", _time_switches(args.backends, args.runs, False))
+    snapshot = _report("snapshot", _time_switches(args.backends, args.runs, True))
+    print(f"{'speed-up':>10}: {rebuild / snapshot:.1f}x")
+
+
+if __name__ == "__main__":
+    main()
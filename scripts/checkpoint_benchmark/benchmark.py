@@ -0,0 +1,79 @@
+"""
+Memory benchmark for activation checkpointing in ivy modules.
+
+Trains a deep MLP built from ``ivy.Sequential`` segments with and without
+``checkpoint_activations`` on the numpy backend, and reports the peak memory allocated
+during one ``ivy.execute_with_gradients`` call together with its run time.
+
+Usage: python scripts/checkpoint_benchmark/benchmark.py --depth 16 --batch 512
+"""
+
+import argparse
+import time
+import tracemalloc
+
+import numpy as np
+
+import ivy
+
+
+def _build_model(depth, width, segment, checkpoint):
+    segments = []
+    for _ in range(0, depth, segment):
+        layers = []
+        for _ in range(segment):
+            layers += [ivy.Linear(width, width), ivy.GELU()]
+        segments.append(ivy.Sequential(*layers, checkpoint_activations=checkpoint))
+    return ivy.Sequential(*segments, ivy.Linear(width, 1))
+
+
+def _measure(model, x, v):
+    def loss_fn(v_):
+        return ivy.mean(model(x, v=v_) ** 2)
+
+    # warm-up, so that caches and lazily created state are not counted
+    ivy.execute_with_gradients(loss_fn, v)
+    tracemalloc.start()
+    start = time.perf_counter()
+    loss, grads = ivy.execute_with_gradients(loss_fn, v)
+    elapsed = time.perf_counter() - start
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return loss, grads, peak / 2**20, elapsed * 1e3
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--depth", type=int, default=16)
+    parser.add_argument("--width", type=int, default=256)
+    parser.add_argument("--batch", type=int, default=512)
+    parser.add_argument("--segment", type=int, default=4)
+    args = parser.parse_args()
+
+    ivy.set_backend("numpy")
+    ivy.seed(seed_value=0)
+    x = ivy.random_normal(shape=(args.batch, args.width))
+    baseline = _build_model(args.depth, args.width, args.segment, False)
+    checkpointed = _build_model(args.depth, args.width, args.segment, True)
+
+    print(f"{'model':>14} {'peak memory':>14} {'time':>12}")
+    results = {}
+    for name, model in (("baseline", baseline), ("checkpointed", checkpointed)):
+        # both models share the same variables, so their gradients can be compared
+        loss, grads, peak, ms = _measure(model, x, baseline.v)
+        results[name] = (loss, grads, peak)
+        print(f"{name:>14} {peak:11.1f} MiB {ms:9.1f} ms")
+
+    (loss, grads, peak), (loss_ckpt, grads_ckpt, peak_ckpt) = results.values()
+    assert np.allclose(ivy.to_numpy(loss), ivy.to_numpy(loss_ckpt))
+    assert all(
+        np.allclose(ivy.to_numpy(g), ivy.to_numpy(g_ckpt), atol=1e-6)
+        for g, g_ckpt in zip(
+            grads.cont_to_iterator_values(), grads_ckpt.cont_to_iterator_values()
+        )
+    )
+    print(f"memory saved: {peak - peak_ckpt:.1f} MiB ({1 - peak_ckpt / peak:.0%})")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,82 @@
+"""
+Memory and convergence benchmark for the compressed optimizer states of Adam and LAMB.
+
+Trains a small MLP regression model on the numpy backend with each optimizer, with
+full precision moments, block-wise 8-bit quantized moments, factored second moments and
+both, and reports the size of the optimizer state, the final loss and the time per step.
+
+Usage: python scripts/optimizer_state_benchmark/benchmark.py --steps 300
+"""
+
+import argparse
+import time
+
+import numpy as np
+
+import ivy
+
+CONFIGS = [
+    ("full", {}),
+    ("8-bit", {"quantize_moments": True}),
+    ("factored", {"factor_second_moments": True}),
+    ("8-bit+factored", {"quantize_moments": True, "factor_second_moments": True}),
+]
+
+
+def _state_nbytes(state):
+    return sum(ivy.to_numpy(x).nbytes for _, x in state.cont_to_iterator())
+
+
+def _train(optimizer, x, y, width, steps):
+    ivy.seed(seed_value=1)
+    model = ivy.Sequential(
+        ivy.Linear(x.shape[-1], width),
+        ivy.GELU(),
+        ivy.Linear(width, width),
+        ivy.GELU(),
+        ivy.Linear(width, 1),
+    )
+
+    def loss_fn(v):
+        return ivy.mean((model(x, v=v) - y) ** 2)
+
+    start = time.perf_counter()
+    for _ in range(steps):
+        loss, grads = ivy.execute_with_gradients(loss_fn, model.v)
+        model.v = optimizer.step(model.v, grads)
+    elapsed = time.perf_counter() - start
+    return float(loss), _state_nbytes(optimizer.state), elapsed / steps * 1e3
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--steps", type=int, default=300)
+    parser.add_argument("--width", type=int, default=128)
+    parser.add_argument("--batch", type=int, default=256)
+    parser.add_argument("--lr", type=float, default=3e-3)
+    args = parser.parse_args()
+
+    ivy.set_backend("numpy")
+    ivy.seed(seed_value=0)
+    x = ivy.random_normal(shape=(args.batch, 32), dtype="float32")
+    y = ivy.sin(ivy.sum(x[:, :4], axis=-1, keepdims=True)) + 0.1 * x[:, 4:5]
+
+    print(
+        f"{'optimizer':>9} {'state':>15} {'state size':>12} {'final loss':>11} "
+        f"{'step time':>10}"
+    )
+    for name in ("Adam", "LAMB"):
+        full_nbytes = None
+        for config, kwargs in CONFIGS:
+            optimizer = getattr(ivy, name)(lr=args.lr, **kwargs)
+            loss, nbytes, ms = _train(optimizer, x, y, args.width, args.steps)
+            full_nbytes = full_nbytes or nbytes
+            print(
+                f"{name:>9} {config:>15} {nbytes / 2**10:8.1f} KiB "
+                f"({nbytes / full_nbytes:4.0%}) {loss:9.5f} {ms:7.2f} ms"
+            )
+    assert np.isfinite(loss)
+
+
+if __name__ == "__main__":
+    main()
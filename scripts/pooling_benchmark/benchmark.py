@@ -0,0 +1,122 @@
+"""
+Micro-benchmark for the pooling kernels of the numpy backend.
+
+Compares ivy's max/avg pooling on typical CNN shapes against the approach used before
+the sliding window engine, i.e. an as_strided view of the padded input in which the
+window axes are reduced together and dilation is applied through a masked filter.
+
+Usage: python scripts/pooling_benchmark/benchmark.py --runs 10
+"""
+
+import argparse
+import importlib
+import math
+import time
+
+import numpy as np
+
+import ivy
+
+# batch, spatial shape, channels, kernel, strides, padding, dilation
+SHAPES = [
+    (32, (112, 112), 64, 3, 2, "SAME", 1),
+    (32, (56, 56), 256, 2, 2, "VALID", 1),
+    (32, (28, 28), 512, 3, 1, "SAME", 2),
+    (8, (256,), 128, 4, 4, "VALID", 1),
+    (4, (16, 32, 32), 32, 2, 2, "VALID", 1),
+]
+
+
+def _reference_pool(x, kernel, strides, padding, dilation, reduce):
+    dims = x.ndim - 2
+    filters = np.ones([kernel] * dims, dtype=bool)
+    for i in range(dims):
+        filters = np.insert(
+            filters, list(range(1, kernel)) * (dilation - 1), False, axis=i
+        )
+    dilated = filters.shape
+    if padding == "SAME":
+        pads = []
+        for i in range(dims):
+            out = math.ceil(x.shape[i + 1] / strides)
+            pad = max((out - 1) * strides + dilated[i] - x.shape[i + 1], 0)
+            pads.append((pad // 2, pad - pad // 2))
+        pad_value = -math.inf if reduce == "max" else 0
+        x = np.pad(x, [(0, 0), *pads, (0, 0)], constant_values=pad_value)
+    out_shape = [(x.shape[i + 1] - dilated[i]) // strides + 1 for i in range(dims)]
+    sub_matrices = np.lib.stride_tricks.as_strided(
+        x,
+        [x.shape[0], *out_shape, *dilated, x.shape[-1]],
+        (
+            x.strides[0],
+            *[x.strides[i + 1] * strides for i in range(dims)],
+            *x.strides[1:],
+        ),
+        writeable=False,
+    )
+    axes = tuple(range(dims + 1, 2 * dims + 1))
+    if reduce == "max":
+        sub_matrices = np.where(
+            filters.reshape([1] * (dims + 1) + list(dilated) + [1]),
+            sub_matrices,
+            -math.inf,
+        )
+        return sub_matrices.max(axis=axes)
+    return sub_matrices.mean(axis=axes)
+
+
+def _time(fn, runs):
+    fn()
+    timings = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        fn()
+        timings.append(time.perf_counter() - start)
+    return sorted(timings)[len(timings) // 2] * 1e3
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--runs", type=int, default=5)
+    args = parser.parse_args()
+
+    ivy.set_backend("numpy")
+    # time the backend kernels themselves, without the ivy function wrappers
+    np_layers = importlib.import_module(
+        "ivy.functional.backends.numpy.experimental.layers"
+    )
+    rng = np.random.default_rng(0)
+    print(
+        f"{'op':>10} {'input shape':>24} {'reference':>12} {'ivy':>12} {'speed-up':>9}"
+    )
+    for batch, spatial, channels, kernel, strides, padding, dilation in SHAPES:
+        x = rng.standard_normal((batch, *spatial, channels)).astype(np.float32)
+        dims = len(spatial)
+        for reduce in ("max", "avg"):
+            if reduce == "avg" and dilation > 1:
+                continue
+            if reduce == "max":
+                pool = getattr(np_layers, f"max_pool{dims}d")
+                kwargs = {"dilation": dilation}
+            else:
+                pool = getattr(np_layers, f"avg_pool{dims}d")
+                kwargs = {"count_include_pad": True}
+            data_format = {1: "NWC", 2: "NHWC", 3: "NDHWC"}[dims]
+            ref_ms = _time(
+                lambda: _reference_pool(x, kernel, strides, padding, dilation, reduce),
+                args.runs,
+            )
+            ivy_ms = _time(
+                lambda: pool(
+                    x, kernel, strides, padding, data_format=data_format, **kwargs
+                ),
+                args.runs,
+            )
+            print(
+                f"{reduce + '_pool' + str(dims) + 'd':>10} {str(x.shape):>24} "
+                f"{ref_ms:9.2f} ms {ivy_ms:9.2f} ms {ref_ms / ivy_ms:8.1f}x"
+            )
+
+
+if __name__ == "__main__":
+    main()